@@ -1,6 +1,6 @@
 import logging
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 
 from fastmcp import FastMCP
 from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
@@ -12,14 +12,17 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 from unique_mcp.monitoring import setup_ops
 
+from backstop_mcp.catalog_warmup import CatalogWarmup, catalog_warmup
 from backstop_mcp.dependencies import (
     get_app_config,
+    get_auth_cache,
     get_auth_config,
     get_auth_provider,
+    get_backstop_config,
     get_engine,
     get_session_factory,
 )
-from backstop_mcp.features.auth import cleanup_lifespan
+from backstop_mcp.features.auth import auth_cache_lifespan, cleanup_lifespan
 from backstop_mcp.logging import configure_logging
 from backstop_mcp.metrics import configure_metrics
 from backstop_mcp.server.instructions import INSTRUCTIONS
@@ -33,7 +36,7 @@ def create_app() -> Starlette:
     """Assemble the ASGI app.
 
     Logging, metrics, FastMCP, TOOLS, setup_ops, /ready /login, middleware, lifespan
-    `close_singletons()`.
+    catalog warm-up and `close_singletons()`.
     """
     config = get_app_config()
     auth_config = get_auth_config()
@@ -44,13 +47,18 @@ def create_app() -> Starlette:
     engine = get_engine()
     session_factory = get_session_factory()
     auth_provider = get_auth_provider()
+    warmup = catalog_warmup(get_backstop_config())
 
     @asynccontextmanager
     async def lifespan(_server: FastMCP) -> AsyncGenerator[None, None]:
-        # Stop background tasks (auth sweep) before disposing the engine — otherwise
-        # `cleanup_lifespan`'s cancel/await runs after the pool is already closed.
+        # Stop background tasks (auth sweep and invalidation listener, catalog warm-up) before
+        # disposing the engine — otherwise their cancel/await runs after the pools are closed.
         try:
-            async with cleanup_lifespan(session_factory, auth_config):
+            async with AsyncExitStack() as background:
+                await background.enter_async_context(cleanup_lifespan(session_factory, auth_config))
+                await background.enter_async_context(auth_cache_lifespan(engine, get_auth_cache()))
+                if warmup is not None:
+                    await background.enter_async_context(warmup.running())
                 yield
         finally:
             await close_singletons()
@@ -71,7 +79,7 @@ def create_app() -> Starlette:
     @mcp.custom_route("/ready", methods=["GET"])
     async def ready(_request: Request) -> JSONResponse:
         """Postgres readiness — stock `setup_ops` `/probe` is process-up only."""
-        return await _ready_response(engine)
+        return await _ready_response(engine, warmup)
 
     @mcp.custom_route(auth_provider.login_path, methods=["GET"])
     async def login_get(request: Request) -> Response:
@@ -89,11 +97,12 @@ def create_app() -> Starlette:
     )
 
 
-async def _ready_response(engine: AsyncEngine) -> JSONResponse:
+async def _ready_response(engine: AsyncEngine, warmup: CatalogWarmup | None) -> JSONResponse:
     """Readiness, reporting the checks it actually ran.
 
     Postgres is a hard dependency — OAuth token validation reads it on every request — so an
-    unreachable database means not ready.
+    unreachable database means not ready. A configured catalog warm-up holds readiness until it
+    ends, which its own budget bounds; without one there is no such check to report.
     """
     database_ok = True
     try:
@@ -104,7 +113,10 @@ async def _ready_response(engine: AsyncEngine) -> JSONResponse:
         logger.warning("ready.database_unreachable", exc_info=True)
 
     checks = {"database": database_ok}
+    if warmup is not None:
+        checks["catalogs_warmed"] = warmup.finished
+    ready = all(checks.values())
     return JSONResponse(
-        {"status": "healthy" if database_ok else "unhealthy", "checks": checks},
-        status_code=200 if database_ok else 503,
+        {"status": "healthy" if ready else "unhealthy", "checks": checks},
+        status_code=200 if ready else 503,
     )
@@ -27,6 +27,7 @@ from backstop_mcp.backstop_client.errors import (
 from backstop_mcp.backstop_client.factory import (
     BackstopClientFactory,
 )
+from backstop_mcp.backstop_client.gates import RequestPriority, SharedGate
 from backstop_mcp.backstop_client.json_api import (
     BackstopApiCollectionDocument,
     BackstopApiResource,
@@ -45,9 +46,17 @@ from backstop_mcp.backstop_client.pagination import (
     SinglePage,
     paginate_all,
     parse_page,
+    parse_page_stream,
 )
+from backstop_mcp.backstop_client.postgres_gate import PostgresSharedGate
 from backstop_mcp.backstop_client.retry import RetryPolicy
 from backstop_mcp.backstop_client.settings import BackstopTransportSettings, RetrySettings
+from backstop_mcp.backstop_client.streaming import (
+    ItemPath,
+    JsonItemSplitter,
+    StreamedDocument,
+    read_document,
+)
 
 __all__ = [
     "BackstopApiCollectionDocument",
@@ -67,11 +76,17 @@ __all__ = [
     "CallerAuthContext",
     "IncludedIndex",
     "IncludedResource",
+    "ItemPath",
+    "JsonItemSplitter",
     "PageResult",
+    "PostgresSharedGate",
     "ResourceRef",
+    "RequestPriority",
     "RetryPolicy",
     "RetrySettings",
+    "SharedGate",
     "SinglePage",
+    "StreamedDocument",
     "follow_included",
     "follow_indexed",
     "included_by_type",
@@ -79,4 +94,6 @@ __all__ = [
     "index_included",
     "paginate_all",
     "parse_page",
+    "parse_page_stream",
+    "read_document",
 ]
@@ -1,35 +1,48 @@
+import asyncio
 import logging
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from concurrent.futures import Executor
 from contextlib import AbstractAsyncContextManager
+from functools import partial
 from typing import cast
 
 import httpx
 
+from backstop_mcp.backstop_client.coalescer import RequestCoalescer
 from backstop_mcp.backstop_client.credential import BackstopCredentialSecret
 from backstop_mcp.backstop_client.errors import (
     BackstopApiError,
     BackstopAuthError,
     BackstopErrorDetail,
+    BackstopRateLimitError,
 )
+from backstop_mcp.backstop_client.gates import GateSlot, RequestPriority
 from backstop_mcp.backstop_client.pagination import (
     PageResult,
     SinglePage,
     paginate_all,
     parse_page,
+    parse_page_stream,
 )
+from backstop_mcp.backstop_client.response_cache import CachedResponse, ResponseCache
 from backstop_mcp.backstop_client.retry import RetryPolicy
 from backstop_mcp.backstop_client.settings import BackstopTransportSettings
+from backstop_mcp.backstop_client.streaming import ItemPath, read_document
 from backstop_mcp.backstop_client.utils import (
     T,
     deserialize,
     metric_route,
+    request_key,
     resolve_request_url,
 )
 from backstop_mcp.metrics import (
     BACKSTOP_CONCURRENCY_WAIT,
+    BACKSTOP_EVENT_LOOP_LAG,
+    BACKSTOP_PARSE_DURATION,
     BACKSTOP_REQUEST_DURATION,
     BACKSTOP_REQUESTS,
+    BACKSTOP_RESPONSE_PEAK,
 )
 
 logger = logging.getLogger(__name__)
@@ -49,8 +62,25 @@ type HttpClientProvider = Callable[[], Awaitable[httpx.AsyncClient]]
 # Acquired around a *single* upstream request (see `BackstopClient.raw_request`), never around a
 # whole tool invocation — Backstop's limit is on concurrent requests, and a caller that holds
 # a slot across an elicitation prompt or a batch of gathered calls either starves itself or
-# breaches the limit. See `BackstopClientFactory`.
-type RequestGate = Callable[[str], AbstractAsyncContextManager[None]]
+# breaches the limit. The priority picks the lane the request queues in; the `GateSlot` it yields
+# is how the request reports its outcome back, for the adaptive window. See `gates.py`.
+type RequestGate = Callable[[str, RequestPriority], AbstractAsyncContextManager[GateSlot]]
+# Reads a successful response's body as it downloads, inside the request's gate slot. See
+# `BackstopClient.raw_request`.
+type BodyReader = Callable[[httpx.Response], Awaitable[None]]
+# The pool response bodies are parsed on, when `parse_worker_threads` asks for one. A provider
+# rather than the pool itself so the factory can build it on first use. See `BackstopClient._parse`.
+type ParseExecutorProvider = Callable[[], Executor]
+
+
+def _timed_parse[S](parse: Callable[[], S], route: str, where: str) -> S:
+    started = time.perf_counter()
+    try:
+        return parse()
+    finally:
+        BACKSTOP_PARSE_DURATION.record(
+            time.perf_counter() - started, {"route": route, "where": where}
+        )
 
 
 class BackstopClient:
@@ -76,6 +106,9 @@ class BackstopClient:
         gate: RequestGate,
         retry_policy: RetryPolicy,
         on_auth_failure: AuthFailureHook | None = None,
+        response_cache: ResponseCache | None = None,
+        coalescer: RequestCoalescer | None = None,
+        parse_executor: ParseExecutorProvider | None = None,
     ) -> None:
         self._credential: BackstopCredentialSecret = credential
         self._settings: BackstopTransportSettings = settings
@@ -83,28 +116,50 @@ class BackstopClient:
         self._gate: RequestGate = gate
         self._retry_policy: RetryPolicy = retry_policy
         self._on_auth_failure: AuthFailureHook | None = on_auth_failure
+        self._response_cache: ResponseCache | None = response_cache
+        self._coalescer: RequestCoalescer | None = coalescer
+        self._parse_executor: ParseExecutorProvider | None = parse_executor
+
+    @property
+    def username(self) -> str:
+        """Whose credential this client sends — what per-user state above the transport keys on."""
+        return self._credential.username
 
     async def get(
-        self, path: str, *, schema: type[T], params: dict[str, object] | None = None
+        self,
+        path: str,
+        *,
+        schema: type[T],
+        params: dict[str, object] | None = None,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
     ) -> T:
-        response = await self.raw_request("GET", path, params=params)
-        return self._deserialize(response.content, schema, path=path)
+        response = await self.raw_request("GET", path, params=params, priority=priority)
+        return await self._deserialize(response.content, schema, path=path)
 
-    async def post(self, path: str, *, schema: type[T], json: dict[str, object] | None = None) -> T:
-        response = await self.raw_request("POST", path, json=json)
-        return self._deserialize(response.content, schema, path=path)
+    async def post(
+        self,
+        path: str,
+        *,
+        schema: type[T],
+        json: dict[str, object] | None = None,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+    ) -> T:
+        """`priority` stays `INTERACTIVE` for writes; a POST that is really a search page (see
+        `fetch_entity_activities`) passes the page lanes `paginate` would."""
+        response = await self.raw_request("POST", path, json=json, priority=priority)
+        return await self._deserialize(response.content, schema, path=path)
 
     async def patch(
         self, path: str, *, schema: type[T], json: dict[str, object] | None = None
     ) -> T:
         response = await self.raw_request("PATCH", path, json=json)
-        return self._deserialize(response.content, schema, path=path)
+        return await self._deserialize(response.content, schema, path=path)
 
     async def delete(self, path: str, *, schema: type[T]) -> T | None:
         response = await self.raw_request("DELETE", path)
         if not response.content:
             return None
-        return self._deserialize(response.content, schema, path=path)
+        return await self._deserialize(response.content, schema, path=path)
 
     async def paginate(
         self,
@@ -115,6 +170,8 @@ class BackstopClient:
         max_records: int | None = 10_000,
         page_size: int | None = None,
         parallel: bool = False,
+        priority: RequestPriority = RequestPriority.FIRST_PAGE,
+        on_page: Callable[[SinglePage[T]], None] | None = None,
     ) -> PageResult[T]:
         """Read a whole collection, applying `params` (plus a default page size and a zero
         offset) to the first page only — every later page is driven entirely by the literal
@@ -135,7 +192,20 @@ class BackstopClient:
         five requests run in the gate where a serial chain runs one. It relies on
         `meta.totalResourceCount` being a true total, so it is off by default and must only be
         set for endpoints where that holds; see `paginate_all` for what goes wrong when it does
-        not.
+        not. With `speculative_prefetch_enabled`, a serial walk instead requests each next page by
+        offset before its link arrives and keeps it only if the link agrees (see `paginate_all`).
+
+        `priority` is the gate lane for the first page only; every later page waits in
+        `LATER_PAGE`, so a long walk never holds up another caller's first page. A lookup that
+        merely happens to be a collection read (party resolution) passes `INTERACTIVE`.
+
+        With `streaming_parse_enabled`, each page is parsed item by item as it downloads (see
+        `parse_page_stream`) rather than buffered whole; the result is the same. Otherwise each
+        buffered page is parsed on the `parse_worker_threads` pool when there is one, so in a
+        parallel walk the pages still downloading are not held up by the ones being parsed.
+
+        `on_page` hands each page to the caller as it is read instead of accumulating it; the
+        result then carries only the counts (see `paginate_all`).
         """
         first_page_params = dict(params) if params is not None else {}
         limit_param = self._settings.page_limit_param
@@ -152,21 +222,43 @@ class BackstopClient:
         if offset_param not in first_page_params:
             first_page_params[offset_param] = 0
 
-        async def fetch_page(
-            page_path: str, page_params: dict[str, object] | None
-        ) -> httpx.Response:
-            return await self.raw_request("GET", page_path, params=page_params)
+        def page_priority(page_params: dict[str, object] | None) -> RequestPriority:
+            # `paginate_all` hands `first_page_params` back only for the first page; serial
+            # pages come with `None` and concurrent ones with their own `offset_params` dict.
+            return priority if page_params is first_page_params else RequestPriority.LATER_PAGE
+
+        async def read_page(page_path: str, page_params: dict[str, object] | None) -> SinglePage[T]:
+            if not self._settings.streaming_parse_enabled:
+                response = await self.raw_request(
+                    "GET", page_path, params=page_params, priority=page_priority(page_params)
+                )
+                self._record_peak(page_path, len(response.content), mode="buffered")
+                return await self._parse(
+                    page_path, partial(parse_page, response.content, schema, path=page_path)
+                )
+
+            async def read(chunks: AsyncIterator[bytes]) -> SinglePage[T]:
+                page, peak = await parse_page_stream(chunks, schema, path=page_path)
+                self._record_peak(page_path, peak, mode="streamed")
+                return page
+
+            return await self._read_streamed(
+                page_path, params=page_params, priority=page_priority(page_params), read=read
+            )
 
         def offset_params(offset: int, page_size: int) -> dict[str, object]:
             return {**first_page_params, limit_param: page_size, offset_param: offset}
 
         return await paginate_all(
-            fetch_page=fetch_page,
             first_path=path,
             schema=schema,
             max_records=max_records,
             first_page_params=first_page_params,
             offset_params=offset_params if parallel else None,
+            read_page=read_page,
+            prefetch_params=offset_params if self._settings.speculative_prefetch_enabled else None,
+            on_page=on_page,
+            base_url=self._settings.base_url,
         )
 
     async def fetch_page(
@@ -177,6 +269,7 @@ class BackstopClient:
         params: dict[str, object] | None = None,
         page_size: int | None = None,
         offset: int = 0,
+        priority: RequestPriority | None = None,
     ) -> SinglePage[T]:
         """Fetch and parse exactly one page — no `links.next` walk.
 
@@ -193,18 +286,112 @@ class BackstopClient:
         The returned `SinglePage.total_count` is `meta.totalResourceCount` verbatim, and is not
         trustworthy on endpoints where a date filter degrades it to a running count rather than
         a true total.
+
+        `priority` defaults to `FIRST_PAGE` at offset zero and `LATER_PAGE` past it, matching the
+        lanes `.paginate()` uses for the pages of a walk.
         """
+        if priority is None:
+            priority = RequestPriority.FIRST_PAGE if offset == 0 else RequestPriority.LATER_PAGE
         page_params = dict(params) if params is not None else {}
         page_params[self._settings.page_limit_param] = (
             page_size if page_size is not None else self._default_page_size(path)
         )
         page_params[self._settings.page_offset_param] = offset
 
-        response = await self.raw_request("GET", path, params=page_params)
-        return parse_page(response.content, schema, path=path)
+        response = await self.raw_request("GET", path, params=page_params, priority=priority)
+        return await self._parse(path, partial(parse_page, response.content, schema, path=path))
+
+    async def get_document[E, I, P](
+        self,
+        path: str,
+        *,
+        envelope: type[E],
+        items_at: ItemPath,
+        items_of: Callable[[E], Iterable[I]],
+        item_schema: type[I],
+        project: Callable[[I], P],
+        params: dict[str, object] | None = None,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+    ) -> tuple[E, list[P]]:
+        """GET a document whose bulk is one array, and project that array's items.
+
+        For endpoints that return everything in one unbounded body, where `.paginate()` has
+        nothing to page. Returns the validated `envelope` and `project` applied to each item of
+        the array at `items_at`, in order.
+
+        With `streaming_parse_enabled`, items are validated and projected as the body downloads
+        and only the projections are kept; `envelope` is then validated with the array emptied,
+        so the returned envelope's copy of it is empty and `items_of` is not called. Without it,
+        the body is read whole as `envelope` and `items_of` picks the items out of it. Callers
+        read the items from the returned list either way, never from the envelope.
+        """
+        if not self._settings.streaming_parse_enabled:
+            response = await self.raw_request("GET", path, params=params, priority=priority)
+            self._record_peak(path, len(response.content), mode="buffered")
+            document = await self._deserialize(response.content, envelope, path=path)
+            return document, [project(item) for item in items_of(document)]
+
+        async def read(chunks: AsyncIterator[bytes]) -> tuple[E, list[P]]:
+            streamed = await read_document(
+                chunks,
+                envelope=envelope,
+                items_at=items_at,
+                item_schema=item_schema,
+                project=project,
+                path=path,
+            )
+            self._record_peak(path, streamed.peak_chars, mode="streamed")
+            return streamed.envelope, streamed.items
+
+        return await self._read_streamed(path, params=params, priority=priority, read=read)
+
+    async def _read_streamed[R](
+        self,
+        path: str,
+        *,
+        params: dict[str, object] | None,
+        priority: RequestPriority,
+        read: Callable[[AsyncIterator[bytes]], Awaitable[R]],
+    ) -> R:
+        """GET `path` and hand its body to `read` chunk by chunk, as it arrives."""
+        results: list[R] = []
+
+        async def consume(response: httpx.Response) -> None:
+            results.append(await read(response.aiter_bytes()))
+
+        _ = await self.raw_request("GET", path, params=params, priority=priority, consume=consume)
+        return results[-1]
+
+    def _record_peak(self, path: str, chars: int, *, mode: str) -> None:
+        BACKSTOP_RESPONSE_PEAK.record(chars, {"route": metric_route(path), "mode": mode})
+
+    async def _deserialize[S](self, content: bytes, schema: type[S], *, path: str) -> S:
+        parsed = await self._parse(path, partial(deserialize, content, schema, path=path))
+        return cast(S, parsed)
+
+    async def _parse[S](self, path: str, parse: Callable[[], S]) -> S:
+        """Run `parse` on the parse pool if there is one, else here on the loop; time both.
+
+        Validation holds the GIL either way, so the pool does not make a parse cheaper — it
+        lets the loop run between the interpreter's switch intervals instead of not at all, so
+        other requests keep moving and the concurrent pages of a parallel walk download while
+        this one is parsed. Whether that is paying off is what the two histograms say: a
+        callback is scheduled just as the parse starts, and how late it runs is the loop lag
+        this parse caused, by route.
+        """
+        loop = asyncio.get_running_loop()
+        route = metric_route(path)
+        scheduled = loop.time()
 
-    def _deserialize(self, content: bytes, schema: type[T], *, path: str) -> T:
-        return cast(T, deserialize(content, schema, path=path))
+        def record_lag() -> None:
+            BACKSTOP_EVENT_LOOP_LAG.record(loop.time() - scheduled, {"route": route})
+
+        _ = loop.call_soon(record_lag)
+        if self._parse_executor is None:
+            return _timed_parse(parse, route, "loop")
+        return await loop.run_in_executor(
+            self._parse_executor(), _timed_parse, parse, route, "thread"
+        )
 
     def _default_page_size(self, path: str) -> int:
         if any(marker in path for marker in _SLOW_ENDPOINT_MARKERS):
@@ -218,6 +405,8 @@ class BackstopClient:
         *,
         json: dict[str, object] | None = None,
         params: dict[str, object] | None = None,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+        consume: BodyReader | None = None,
     ) -> httpx.Response:
         """Issue a request without deserializing the body.
 
@@ -225,6 +414,17 @@ class BackstopClient:
         but returns the raw `httpx.Response`. Do **not** use this for tool/feature code that
         should be type-safe — pass a `schema` to `.get`/`.post`/`.patch`/`.delete`/`.paginate`
         instead. Intended for status-only checks such as credential verification.
+
+        With a `response_cache`, GETs are answered from it where its rules allow (see
+        `response_cache.py`) and conditional otherwise; a `304` comes back as the cached `200`.
+        With a `coalescer`, a GET identical to one already in flight for the same user waits for
+        that one's response rather than sending its own (see `coalescer.py`).
+
+        With `consume`, the body of a successful response is not buffered: `consume` reads it
+        from the open response while the request still holds its gate slot — exactly as long as
+        a buffered read holds it — and the response comes back closed and unread. An error body
+        is read as usual, for the error mapping. Such a request is never cached or coalesced,
+        since neither has a body to keep or share.
         """
         auth = httpx.BasicAuth(
             self._credential.username, self._credential.api_token.get_secret_value()
@@ -239,31 +439,80 @@ class BackstopClient:
         retrying = self._retry_policy.build_retrying()
         route = metric_route(path)
 
+        key = (
+            request_key(self._credential, url, params)
+            if method == "GET" and consume is None
+            else None
+        )
+        cache = self._response_cache if key is not None else None
+        cached: CachedResponse | None = None
+        if cache is not None and key is not None:
+            cached = cache.get(key)
+            if cached is not None and not cached.revalidates:
+                BACKSTOP_REQUESTS.add(
+                    1, {"method": method, "route": route, "status": 200, "cache": "hit"}
+                )
+                return cached.to_response(httpx.Request(method, key[2]))
+        conditional_headers = cached.conditional_headers() if cached is not None else None
+
         async def make_request() -> httpx.Response:
             # The gate is entered per attempt, and released while a rate-limit backoff sleeps
             # — a retry that held its slot would keep blocking the very concurrency it is
             # waiting to free up.
             waiting_since = time.monotonic()
-            async with self._gate(self._credential.username):
+            async with self._gate(self._credential.username, priority) as slot:
                 started = time.monotonic()
                 BACKSTOP_CONCURRENCY_WAIT.record(started - waiting_since, {"route": route})
                 try:
-                    response = await shared_client.request(
-                        method,
-                        url,
-                        json=json,
-                        params=params,  # pyright: ignore[reportArgumentType]
-                        auth=auth,
-                        timeout=timeout,
-                    )
+                    if consume is None:
+                        response = await shared_client.request(
+                            method,
+                            url,
+                            json=json,
+                            params=params,  # pyright: ignore[reportArgumentType]
+                            headers=conditional_headers,
+                            auth=auth,
+                            timeout=timeout,
+                        )
+                    else:
+                        response = await self._send_streamed(
+                            shared_client,
+                            shared_client.build_request(
+                                method,
+                                url,
+                                json=json,
+                                params=params,  # pyright: ignore[reportArgumentType]
+                                timeout=timeout,
+                            ),
+                            auth=auth,
+                            consume=consume,
+                        )
                 finally:
-                    BACKSTOP_REQUEST_DURATION.record(
-                        time.monotonic() - started, {"method": method, "route": route}
-                    )
+                    latency = time.monotonic() - started
+                    BACKSTOP_REQUEST_DURATION.record(latency, {"method": method, "route": route})
+                # Classified while the slot is still held, so the gate sees a concurrency 429
+                # before the next waiter is admitted into the window it just proved too wide.
+                error = (
+                    BackstopApiError.from_response(response)
+                    if response.is_error and response.status_code != 401
+                    else None
+                )
+                slot.settle(
+                    route=route,
+                    latency=latency,
+                    limit_kind=(
+                        error.limit_kind if isinstance(error, BackstopRateLimitError) else None
+                    ),
+                )
 
-            BACKSTOP_REQUESTS.add(
-                1, {"method": method, "route": route, "status": response.status_code}
-            )
+            attributes: dict[str, str | int] = {
+                "method": method,
+                "route": route,
+                "status": response.status_code,
+            }
+            if cache is not None:
+                attributes["cache"] = "revalidated" if response.status_code == 304 else "miss"
+            BACKSTOP_REQUESTS.add(1, attributes)
             if response.status_code == 401:
                 # Always surface BackstopAuthError for 401 — a failing revoke hook must not
                 # mask the credential rejection callers need to handle (reconnect).
@@ -275,44 +524,72 @@ class BackstopClient:
                 raise BackstopAuthError(
                     "Backstop rejected the stored credential — please reconnect."
                 )
-            if response.is_error:
+            if error is not None:
                 # Covers 429 too — BackstopApiError.from_response returns a BackstopRateLimitError
                 # for those, which the retry predicate in retry.py inspects.
-                raise BackstopApiError.from_response(response)
+                raise error
+            return response
+
+        async def send() -> httpx.Response:
+            logger.debug("backstop.request.start", extra={"method": method, "path": path})
+            try:
+                response: httpx.Response = await retrying(make_request)
+            except BackstopAuthError:
+                # A rejected credential is an ordinary outcome rather than a fault — the login form
+                # runs this against every password a user types. Logged without a traceback so a
+                # typo doesn't read like a transport failure in the console.
+                logger.info(
+                    "backstop.request.unauthorized",
+                    extra={"method": method, "path": path},
+                )
+                raise
+            except BackstopApiError as exc:
+                # Expected upstream failures — surface the full JSON:API `errors[]` in the
+                # console without a traceback. Unexpected transport errors still use
+                # `logger.exception` below.
+                logger.error(
+                    "backstop.request.failed",
+                    extra={
+                        "method": method,
+                        "path": path,
+                        "status_code": exc.status_code,
+                        "detail": exc.detail,
+                        "code": exc.code,
+                        "errors": _errors_for_log(exc.errors),
+                    },
+                )
+                raise
+            except Exception:
+                logger.exception(
+                    "backstop.request.failed",
+                    extra={"method": method, "path": path},
+                )
+                raise
+            if cache is not None and key is not None:
+                if response.status_code == 304 and cached is not None:
+                    return cached.to_response(response.request)
+                if response.status_code == 200:
+                    cache.store(key, response)
             return response
 
-        logger.debug("backstop.request.start", extra={"method": method, "path": path})
+        if key is None or self._coalescer is None:
+            return await send()
+        return await self._coalescer.run(key, send, route=route)
+
+    @staticmethod
+    async def _send_streamed(
+        shared_client: httpx.AsyncClient,
+        request: httpx.Request,
+        *,
+        auth: httpx.BasicAuth,
+        consume: BodyReader,
+    ) -> httpx.Response:
+        response = await shared_client.send(request, auth=auth, stream=True)
         try:
-            response: httpx.Response = await retrying(make_request)
-        except BackstopAuthError:
-            # A rejected credential is an ordinary outcome rather than a fault — the login form
-            # runs this against every password a user types. Logged without a traceback so a
-            # typo doesn't read like a transport failure in the console.
-            logger.info(
-                "backstop.request.unauthorized",
-                extra={"method": method, "path": path},
-            )
-            raise
-        except BackstopApiError as exc:
-            # Expected upstream failures — surface the full JSON:API `errors[]` in the
-            # console without a traceback. Unexpected transport errors still use
-            # `logger.exception` below.
-            logger.error(
-                "backstop.request.failed",
-                extra={
-                    "method": method,
-                    "path": path,
-                    "status_code": exc.status_code,
-                    "detail": exc.detail,
-                    "code": exc.code,
-                    "errors": _errors_for_log(exc.errors),
-                },
-            )
-            raise
-        except Exception:
-            logger.exception(
-                "backstop.request.failed",
-                extra={"method": method, "path": path},
-            )
-            raise
+            if response.is_error:
+                _ = await response.aread()
+            else:
+                await consume(response)
+        finally:
+            await response.aclose()
         return response
@@ -0,0 +1,66 @@
+"""Single-flight for identical GETs: concurrent callers share one upstream request.
+
+A model fanning tools out in parallel routinely asks for the same document twice at once —
+`get_person` beside `get_people_for_party`, or several batch items resolving one search string —
+and each copy would take one of the user's five gate slots to fetch the same bytes. Here the
+first caller for a `request_key` owns the request and later callers await its outcome instead;
+the key carries the username and credential fingerprint, so only one credential's own requests
+are ever merged.
+
+Only the response is shared, not its parse: each caller deserializes the body into its own
+schema, so no two callers ever hold the same mutable model. The protocol is `CachedCatalog`'s
+in-flight pin, at request granularity:
+
+- **A cancelled owner does not cancel its waiters.** They get a `RuntimeError` rather than a
+  `CancelledError` that would make them look cancelled themselves.
+- **A cancelled waiter does not cancel the request.** Waiters await the shared future through
+  `asyncio.shield`.
+- **The owner retrieves a stamped failure**, so an uncontended failure does not log "Future
+  exception was never retrieved".
+- **Unpinning cannot be skipped**: it is a synchronous `finally`, with no await to be
+  cancelled at.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+from backstop_mcp.backstop_client.utils import RequestKey
+from backstop_mcp.metrics import BACKSTOP_COALESCED_REQUESTS
+
+
+class RequestCoalescer:
+    """In-flight GETs by `request_key`, one per factory so every client of it shares them."""
+
+    def __init__(self) -> None:
+        self._in_flight: dict[RequestKey, asyncio.Future[httpx.Response]] = {}
+
+    async def run(
+        self,
+        key: RequestKey,
+        send: Callable[[], Awaitable[httpx.Response]],
+        *,
+        route: str,
+    ) -> httpx.Response:
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            BACKSTOP_COALESCED_REQUESTS.add(1, {"route": route})
+            return await asyncio.shield(in_flight)
+
+        in_flight = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = in_flight
+        try:
+            response = await send()
+        except BaseException as error:
+            waiter_error: BaseException = error
+            if isinstance(error, asyncio.CancelledError):
+                waiter_error = RuntimeError("the coalesced Backstop request was cancelled")
+            in_flight.set_exception(waiter_error)
+            _ = in_flight.exception()
+            raise
+        else:
+            in_flight.set_result(response)
+            return response
+        finally:
+            del self._in_flight[key]
@@ -7,6 +7,7 @@ credential at rest, and resolving "which MCP subject is this" — and depends on
 the reverse. Keeping the direction one-way is what `tests/test_layering.py` asserts.
 """
 
+import hashlib
 from typing import ClassVar, Protocol
 
 from pydantic import BaseModel, ConfigDict, SecretStr
@@ -24,6 +25,15 @@ class BackstopCredentialSecret(BaseModel):
     username: str
     api_token: SecretStr
 
+    @property
+    def fingerprint(self) -> str:
+        """A digest of the token: tells two credentials for one username apart, without the token.
+
+        What per-credential state (the response cache, the coalescer) is keyed by, so a revoked
+        or replaced token's answers are never served to the credential that replaced it.
+        """
+        return hashlib.sha256(self.api_token.get_secret_value().encode("utf-8")).hexdigest()
+
 
 class CallerAuthContext(Protocol):
     """Resolves "whose Backstop credential" for the in-flight MCP request.
@@ -7,26 +7,26 @@ re-reads the environment, so what the provider was handed is what every request
 """
 
 import asyncio
-import logging
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 
 import httpx
 from pydantic import SecretStr
 
 from backstop_mcp.backstop_client.client import AuthFailureHook, BackstopClient
+from backstop_mcp.backstop_client.coalescer import RequestCoalescer
 from backstop_mcp.backstop_client.credential import BackstopCredentialSecret, CallerAuthContext
 from backstop_mcp.backstop_client.errors import (
     BackstopApiError,
     BackstopAuthError,
     BackstopUnreachableError,
 )
+from backstop_mcp.backstop_client.gates import GateRegistry, SharedGate
+from backstop_mcp.backstop_client.pool import InstrumentedTransport
+from backstop_mcp.backstop_client.response_cache import ResponseCache
 from backstop_mcp.backstop_client.retry import RetryPolicy
 from backstop_mcp.backstop_client.settings import BackstopTransportSettings, RetrySettings
 
-logger = logging.getLogger(__name__)
-
 # JSON:API content negotiation + the personal-API-token flag are identical for every user,
 # so they're baked in once as shared-client defaults; only `Authorization` varies per call.
 _SHARED_CLIENT_HEADERS = {
@@ -39,63 +39,6 @@ _SHARED_CLIENT_HEADERS = {
 # Backstop call that still requires a valid credential, so it doubles as a login-time check.
 _VERIFICATION_PATH = "/system-info"
 
-# Cap on how many per-username gates are retained. Well above any plausible concurrent user
-# count for one process; exists only so a long-lived process with high user churn can't grow
-# the registry without bound.
-_MAX_TRACKED_USERS = 512
-
-
-@dataclass
-class _Gate:
-    """One user's concurrency gate, plus the in-flight count used to decide evictability."""
-
-    semaphore: asyncio.Semaphore
-    in_flight: int = 0
-
-
-@dataclass
-class _GateRegistry:
-    """Per-username request gates enforcing Backstop's hard 5-concurrent-requests-per-user cap.
-
-    Bounded: once over `max_entries`, idle gates (nothing in flight, so no waiter can be
-    holding one) are dropped. Evicting a gate is always safe — the next request for that
-    username simply creates a fresh one.
-    """
-
-    limit: int
-    max_entries: int = _MAX_TRACKED_USERS
-    _gates: dict[str, _Gate] = field(default_factory=dict)
-    _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
-
-    @asynccontextmanager
-    async def hold(self, username: str) -> AsyncGenerator[None]:
-        gate = await self._gate_for(username)
-        gate.in_flight += 1
-        try:
-            async with gate.semaphore:
-                yield
-        finally:
-            gate.in_flight -= 1
-
-    async def _gate_for(self, username: str) -> _Gate:
-        async with self._lock:
-            gate = self._gates.get(username)
-            if gate is None:
-                if len(self._gates) >= self.max_entries:
-                    self._evict_idle_unlocked()
-                gate = _Gate(semaphore=asyncio.Semaphore(self.limit))
-                self._gates[username] = gate
-            return gate
-
-    def _evict_idle_unlocked(self) -> None:
-        idle = [username for username, gate in self._gates.items() if gate.in_flight == 0]
-        for username in idle:
-            del self._gates[username]
-        logger.debug(
-            "backstop.gates.evicted",
-            extra={"evicted": len(idle), "retained": len(self._gates)},
-        )
-
 
 class BackstopClientFactory:
     """Builds per-caller `BackstopClient`s over one shared pool and one shared set of gates."""
@@ -106,16 +49,40 @@ class BackstopClientFactory:
         retry_settings: RetrySettings,
         *,
         auth: CallerAuthContext | None = None,
+        shared_gate: SharedGate | None = None,
     ) -> None:
         self._settings: BackstopTransportSettings = settings
         self._auth: CallerAuthContext | None = auth
-        self._gates: _GateRegistry = _GateRegistry(limit=settings.max_concurrent_requests_per_user)
+        # `shared_gate` is what makes the per-user cap hold across replicas rather than per
+        # process; without one, slots are only counted here. See `gates.py`.
+        self._gates: GateRegistry = GateRegistry(
+            limit=settings.max_concurrent_requests_per_user,
+            shared=shared_gate,
+            adaptive=settings.adaptive_concurrency_enabled,
+            latency_spike_factor=settings.adaptive_concurrency_latency_factor,
+        )
         # Built once, here, rather than per request: the predicate and wait strategy are pure
         # closures over immutable settings. See `retry.RetryPolicy` for why the `AsyncRetrying`
         # wrapper it hands out is still per-request.
         self._retry_policy: RetryPolicy = RetryPolicy.from_settings(retry_settings)
         self._http_client: httpx.AsyncClient | None = None
         self._http_client_lock: asyncio.Lock = asyncio.Lock()
+        self._coalescer: RequestCoalescer | None = (
+            RequestCoalescer() if settings.request_coalescing_enabled else None
+        )
+        # One cache for every client this factory builds, as with the gates; entries are keyed
+        # by username, so sharing the structure shares no data. See `response_cache.py`.
+        self._response_cache: ResponseCache | None = (
+            ResponseCache(
+                max_bytes=settings.response_cache_max_bytes,
+                ttl=timedelta(seconds=settings.response_cache_ttl_seconds),
+            )
+            if settings.response_cache_enabled
+            else None
+        )
+        # Shared by every client, like the pool above; built on first use and shut down with it.
+        # See `BackstopClient._parse`.
+        self._parse_pool: ThreadPoolExecutor | None = None
 
     @property
     def settings(self) -> BackstopTransportSettings:
@@ -151,8 +118,11 @@ class BackstopClientFactory:
             self._settings,
             http_client=self._shared_http_client,
             gate=self._gates.hold,
+            coalescer=self._coalescer,
             retry_policy=self._retry_policy,
             on_auth_failure=on_auth_failure,
+            response_cache=self._response_cache,
+            parse_executor=self._parse_executor if self._settings.parse_worker_threads else None,
         )
 
     async def for_current_caller(self) -> BackstopClient:
@@ -202,11 +172,24 @@ class BackstopClientFactory:
         return True
 
     async def aclose(self) -> None:
-        """Close the shared connection pool. Wired into the app lifespan."""
+        """Close the shared connection pool and parse pool. Wired into the app lifespan."""
         async with self._http_client_lock:
             if self._http_client is not None and not self._http_client.is_closed:
                 await self._http_client.aclose()
             self._http_client = None
+        if self._parse_pool is not None:
+            # Not waited for: anything still parsing belongs to a request that is being torn
+            # down with the app, and the threads finish their current parse on their own.
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+
+    def _parse_executor(self) -> ThreadPoolExecutor:
+        if self._parse_pool is None:
+            self._parse_pool = ThreadPoolExecutor(
+                max_workers=self._settings.parse_worker_threads,
+                thread_name_prefix="backstop-parse",
+            )
+        return self._parse_pool
 
     async def _shared_http_client(self) -> httpx.AsyncClient:
         # Built lazily rather than in `__init__`: httpx's connection pool binds internal async
@@ -215,9 +198,19 @@ class BackstopClientFactory:
         # serves every user of this process.
         async with self._http_client_lock:
             if self._http_client is None or self._http_client.is_closed:
+                limits = httpx.Limits(
+                    max_connections=self._settings.max_connections,
+                    max_keepalive_connections=self._settings.max_keepalive_connections,
+                    keepalive_expiry=self._settings.keepalive_expiry_seconds,
+                )
+                http2 = self._settings.http2_enabled
                 self._http_client = httpx.AsyncClient(
                     base_url=self._settings.base_url,
                     headers=_SHARED_CLIENT_HEADERS,
-                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                    transport=InstrumentedTransport(http2=http2, limits=limits),
+                    # Also passed to the client itself, which builds any proxy transport from
+                    # the environment with these rather than with the one above.
+                    http2=http2,
+                    limits=limits,
                 )
             return self._http_client
@@ -0,0 +1,288 @@
+"""Per-username request gates enforcing Backstop's hard 5-concurrent-requests-per-user cap.
+
+The registry always counts slots in-process, one gate per username. On its own that only holds
+per replica: with N replicas a busy user can have N times the cap in flight, and the surplus
+comes back as concurrency-kind 429s that `RetryPolicy` then sleeps on. A `SharedGate` closes
+that gap — a request that holds a local slot also takes a lease from it, and the lease is counted
+across every replica sharing the backend.
+
+The local gate stays in front of the shared one on purpose. Queueing in-process is free, while
+every attempt on a shared backend is a round trip; this way a replica never asks for more slots
+than the user could use through it anyway.
+
+**Adaptive windows.** The configured cap is what Backstop documents, not what a given user's
+tenant actually sustains. With `adaptive` on, each gate admits a *window* of requests that
+starts at the cap and moves AIMD-style on what each request reports back through its
+`GateSlot`: a healthy response grows it by `1/window` (about one slot per window's worth of
+successes, never past the cap), a concurrency-kind 429 halves it, and a latency spike — a
+response slower than `latency_spike_factor` times that route's running baseline — trims it.
+One decrease per burst: a signal from a request that started before the last decrease was
+already answered by it, so five 429s from one fan-out halve the window once, not five times.
+
+**Priority lanes.** Waiters queue per `RequestPriority` rather than in one FIFO, and a freed slot
+goes to the highest non-empty lane. Without that, one parallel walk queues dozens of page
+requests for a user and every cheap lookup the same user fires behind it waits for the lot.
+Strict priority can starve a lower lane only for as long as higher lanes stay non-empty, and
+interactive lookups come a handful at a time. Lanes order admission only: the slot count, the
+window and any shared lease are the same whichever lane a request waited in.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import AsyncGenerator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Protocol
+
+from backstop_mcp.backstop_client.errors import LimitKind
+from backstop_mcp.metrics import BACKSTOP_GATE_WAIT, BACKSTOP_GATE_WINDOW
+
+logger = logging.getLogger(__name__)
+
+# Cap on how many per-username gates are retained. Well above any plausible concurrent user
+# count for one process; exists only so a long-lived process with high user churn can't grow
+# the registry without bound.
+_MAX_TRACKED_USERS = 512
+
+# The `backend` label for a registry with no shared gate behind it.
+_IN_PROCESS_BACKEND = "memory"
+
+# Multiplicative decreases. A concurrency 429 is Backstop saying outright that the window is too
+# wide; a latency spike only suggests it, so it costs less.
+_RATE_LIMIT_BACKOFF = 0.5
+_LATENCY_BACKOFF = 0.8
+# Weight of the newest sample in a route's latency baseline. Low enough that one slow page does
+# not drag the baseline up with it; spikes still fold in, so a route that has genuinely slowed
+# stops reading as a spike after a few samples rather than pinning the window at one.
+_LATENCY_BASELINE_ALPHA = 0.2
+
+
+class RequestPriority(StrEnum):
+    """Which lane a request waits in for its slot, highest first.
+
+    Declaration order is admission order. The values double as the `lane` metric label.
+    """
+
+    # Single lookups a caller is blocked on: by-id reads, party resolution, writes.
+    INTERACTIVE = "interactive"
+    # The first page of a collection, which is often all a caller reads.
+    FIRST_PAGE = "first_page"
+    # Page two onwards of a walk — the bulk that would otherwise crowd out the rest.
+    LATER_PAGE = "later_page"
+
+
+class SharedGate(Protocol):
+    """A per-username slot counter shared between replicas. See `PostgresSharedGate`.
+
+    `lease` is entered once per upstream request, already inside that user's local slot, and
+    must not return until the request may run. An implementation that cannot reach its backend
+    should log and let the request through rather than fail it: the local gate still bounds
+    the user per replica, which is exactly where a single-replica deploy already stands.
+    """
+
+    @property
+    def backend(self) -> str:
+        """Bounded label naming the backend, for the wait metrics."""
+        ...
+
+    def lease(self, username: str) -> AbstractAsyncContextManager[None]: ...
+
+
+@dataclass
+class GateSlot:
+    """One admitted request, and what it reports back to its gate once the response is in.
+
+    Left unsettled when the request raised before a response arrived — a transport error says
+    nothing about how wide the window should be.
+    """
+
+    started_at: float = field(default_factory=time.monotonic)
+    route: str | None = None
+    latency: float | None = None
+    limit_kind: LimitKind | None = None
+
+    def settle(self, *, route: str, latency: float, limit_kind: LimitKind | None) -> None:
+        self.route = route
+        self.latency = latency
+        self.limit_kind = limit_kind
+
+
+@dataclass
+class _Gate:
+    """One user's window of admitted requests, plus the in-flight count used for eviction.
+
+    Waiter futures queued per lane rather than an `asyncio.Semaphore`, because the number of
+    permits moves under an adaptive window and a semaphore's cannot, and a semaphore has one
+    queue.
+    """
+
+    limit: int
+    window: float
+    in_flight: int = 0
+    running: int = 0
+    _lanes: dict[RequestPriority, deque[asyncio.Future[None]]] = field(
+        default_factory=lambda: {priority: deque() for priority in RequestPriority}
+    )
+    _baselines: dict[str, float] = field(default_factory=dict)
+    _last_decrease: float = -math.inf
+
+    @property
+    def permits(self) -> int:
+        return max(1, int(self.window))
+
+    async def acquire(self, priority: RequestPriority) -> None:
+        if self.running < self.permits and not any(self._lanes.values()):
+            self.running += 1
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        lane = self._lanes[priority]
+        lane.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted and cancelled in the same tick: the slot was counted for us, so hand
+                # it on.
+                self.release()
+            elif waiter in lane:
+                lane.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        self.running -= 1
+        self._admit()
+
+    def observe(self, slot: GateSlot, *, latency_spike_factor: float) -> None:
+        """Move the window on what one finished request reported. See the module docstring."""
+        if slot.limit_kind == "concurrency":
+            self._decrease(slot, _RATE_LIMIT_BACKOFF)
+            return
+        if slot.limit_kind is not None or slot.route is None or slot.latency is None:
+            return
+        baseline = self._baselines.get(slot.route)
+        self._baselines[slot.route] = (
+            slot.latency
+            if baseline is None
+            else baseline + _LATENCY_BASELINE_ALPHA * (slot.latency - baseline)
+        )
+        if baseline is not None and slot.latency > baseline * latency_spike_factor:
+            self._decrease(slot, _LATENCY_BACKOFF)
+            return
+        self.window = min(float(self.limit), self.window + 1 / self.window)
+        self._admit()
+
+    def _decrease(self, slot: GateSlot, factor: float) -> None:
+        if slot.started_at < self._last_decrease:
+            return
+        self._last_decrease = time.monotonic()
+        self.window = max(1.0, self.window * factor)
+
+    def _admit(self) -> None:
+        for lane in self._lanes.values():
+            while lane and self.running < self.permits:
+                waiter = lane.popleft()
+                # Cancelled but not yet unqueued by its own `acquire`.
+                if waiter.done():
+                    continue
+                self.running += 1
+                waiter.set_result(None)
+
+
+@dataclass
+class GateRegistry:
+    """Per-username request gates, optionally backed by a `SharedGate` across replicas.
+
+    Bounded: once over `max_entries`, idle gates (nothing in flight, so no waiter can be
+    holding one) are dropped. Evicting a gate is always safe — the next request for that
+    username simply creates a fresh one, at the full cap. An adaptive window is forgotten with
+    it, which costs at most one more halving if that user's limit really is lower.
+    """
+
+    limit: int
+    max_entries: int = _MAX_TRACKED_USERS
+    shared: SharedGate | None = None
+    adaptive: bool = False
+    latency_spike_factor: float = 3.0
+    _gates: dict[str, _Gate] = field(default_factory=dict)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    @property
+    def backend(self) -> str:
+        return self.shared.backend if self.shared is not None else _IN_PROCESS_BACKEND
+
+    @asynccontextmanager
+    async def hold(
+        self, username: str, priority: RequestPriority = RequestPriority.INTERACTIVE
+    ) -> AsyncGenerator[GateSlot]:
+        gate = await self._gate_for(username)
+        gate.in_flight += 1
+        waiting_since = time.monotonic()
+        try:
+            await gate.acquire(priority)
+            slot = GateSlot()
+            try:
+                if self.shared is None:
+                    self._record_wait(waiting_since, priority)
+                    yield slot
+                else:
+                    async with self.shared.lease(username):
+                        self._record_wait(waiting_since, priority)
+                        yield slot
+            finally:
+                self._observe(gate, slot)
+                gate.release()
+        finally:
+            gate.in_flight -= 1
+
+    def _observe(self, gate: _Gate, slot: GateSlot) -> None:
+        if not self.adaptive:
+            return
+        permits = gate.permits
+        gate.observe(slot, latency_spike_factor=self.latency_spike_factor)
+        if gate.permits != permits:
+            logger.debug(
+                "backstop.gates.window_changed",
+                extra={"permits_before": permits, "permits_after": gate.permits},
+            )
+            self._record_windows()
+
+    def _record_windows(self) -> None:
+        """Publish the tightest and the average window across tracked users.
+
+        Aggregates rather than a per-user series: usernames stay out of metric labels, and the
+        floor is what says a tenant is being held below its documented cap. Recorded only when
+        a gate's whole-number permit count changes, so it costs nothing per request.
+        """
+        windows = [gate.window for gate in self._gates.values()]
+        if not windows:
+            return
+        BACKSTOP_GATE_WINDOW.set(min(windows), {"stat": "min"})
+        BACKSTOP_GATE_WINDOW.set(sum(windows) / len(windows), {"stat": "mean"})
+
+    def _record_wait(self, waiting_since: float, priority: RequestPriority) -> None:
+        BACKSTOP_GATE_WAIT.record(
+            time.monotonic() - waiting_since, {"backend": self.backend, "lane": priority.value}
+        )
+
+    async def _gate_for(self, username: str) -> _Gate:
+        async with self._lock:
+            gate = self._gates.get(username)
+            if gate is None:
+                if len(self._gates) >= self.max_entries:
+                    self._evict_idle_unlocked()
+                gate = _Gate(limit=self.limit, window=float(self.limit))
+                self._gates[username] = gate
+            return gate
+
+    def _evict_idle_unlocked(self) -> None:
+        idle = [username for username, gate in self._gates.items() if gate.in_flight == 0]
+        for username in idle:
+            del self._gates[username]
+        logger.debug(
+            "backstop.gates.evicted",
+            extra={"evicted": len(idle), "retained": len(self._gates)},
+        )
@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterable, Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import ClassVar, Generic, cast
 
@@ -7,9 +7,15 @@ import httpx
 from pydantic import BaseModel, ConfigDict, Field
 from typing_extensions import TypeVar
 
-from backstop_mcp.backstop_client.utils import deserialize
+from backstop_mcp.backstop_client.errors import BackstopApiError, BackstopResponseSchemaError
+from backstop_mcp.backstop_client.streaming import read_document
+from backstop_mcp.backstop_client.utils import deserialize, metric_route
+from backstop_mcp.metrics import BACKSTOP_PAGE_PREFETCHES
 
 FetchPage = Callable[[str, dict[str, object] | None], Awaitable[httpx.Response]]
+# A page fetched and parsed in one step, in place of `parse_page` over what `FetchPage` returns —
+# how a reader that never holds the whole body (`parse_page_stream`) plugs into the walk.
+type ReadPage[Item] = Callable[[str, dict[str, object] | None], Awaitable[SinglePage[Item]]]
 # Query params for the page at a given offset, using the page size the first page actually
 # returned. Supplied by the caller that owns the limit/offset parameter *names*
 # (`BackstopClient.paginate`), so this module never has to know them: it decides which
@@ -83,6 +89,33 @@ def parse_page(content: bytes, schema: type[T], *, path: str) -> SinglePage[T]:
     )
 
 
+async def parse_page_stream(
+    chunks: AsyncIterable[bytes], schema: type[T], *, path: str
+) -> tuple[SinglePage[T], int]:
+    """`parse_page` for a body read chunk by chunk, plus the most of it held at once.
+
+    Each item is validated as soon as it is complete (see `streaming.py`), and the envelope —
+    `included`, `links`, `meta` — once the body ends, against the same `_Page[schema]`, so a
+    malformed page fails as the same `BackstopResponseSchemaError` either way.
+    """
+    document = await read_document(
+        chunks,
+        envelope=_Page[schema],
+        items_at=("data",),
+        item_schema=schema,
+        project=lambda item: item,
+        path=path,
+    )
+    page = document.envelope
+    single = SinglePage[T].model_construct(
+        items=document.items,
+        included=page.included,
+        total_count=page.meta.total_resource_count if page.meta is not None else None,
+        next_path=page.links.next,
+    )
+    return single, document.peak_chars
+
+
 class PageResult[T](BaseModel):
     """Accumulated result of reading every page of a JSON:API collection.
 
@@ -93,6 +126,13 @@ class PageResult[T](BaseModel):
     caller cannot infer it from `len(items)`: the page size Backstop serves may be below the one
     asked for, the last page is short, and a cap keeps the page that crossed it in full. A tool
     that publishes its request count to the model has to be told, not guess.
+
+    `item_count` is every item read, whether kept in `items` or handed to an `on_page` callback
+    (see `paginate_all`), which leaves `items` and `included` empty.
+
+    `prefetch_hits` / `prefetch_wasted` count the speculative pages (see `paginate_all`) that
+    were used and that were thrown away. A wasted prefetch is counted in `request_count` as the
+    request it may already have been — one discarded before the gate admitted it never was.
     """
 
     items: list[T] = Field(default_factory=list)
@@ -100,6 +140,9 @@ class PageResult[T](BaseModel):
     total_count: int | None = None
     truncated: bool = False
     request_count: int = 0
+    item_count: int = 0
+    prefetch_hits: int = 0
+    prefetch_wasted: int = 0
 
 
 @dataclass
@@ -110,13 +153,21 @@ class _Accumulator(Generic[T]):
     accumulate one without the other. `total_count` is kept from the first page that reports
     one: later pages of the same chain repeat it, and some endpoints omit it after page one.
     One `absorb` is one page fetched, so counting requests here counts them for both strategies.
+    With `on_page`, each page goes there instead and nothing but the counts is kept.
     """
 
     result: PageResult[T]
+    on_page: Callable[[SinglePage[T]], None] | None = None
     _seen_included: set[tuple[str, str]] = field(default_factory=set)
 
     def absorb(self, page: SinglePage[T]) -> None:
         self.result.request_count += 1
+        self.result.item_count += len(page.items)
+        if self.result.total_count is None and page.total_count is not None:
+            self.result.total_count = page.total_count
+        if self.on_page is not None:
+            self.on_page(page)
+            return
         self.result.items.extend(page.items)
         for resource in page.included:
             identity = _resource_identity(resource)
@@ -124,21 +175,23 @@ class _Accumulator(Generic[T]):
                 continue
             self._seen_included.add(identity)
             self.result.included.append(resource)
-        if self.result.total_count is None and page.total_count is not None:
-            self.result.total_count = page.total_count
 
     def filled(self, max_records: int | None) -> bool:
-        return max_records is not None and len(self.result.items) >= max_records
+        return max_records is not None and self.result.item_count >= max_records
 
 
 async def paginate_all(
     *,
-    fetch_page: FetchPage,
+    fetch_page: FetchPage | None = None,
     first_path: str,
     schema: type[T],
     max_records: int | None,
     first_page_params: dict[str, object] | None = None,
     offset_params: OffsetPageParams | None = None,
+    read_page: ReadPage[T] | None = None,
+    prefetch_params: OffsetPageParams | None = None,
+    on_page: Callable[[SinglePage[T]], None] | None = None,
+    base_url: str | None = None,
 ) -> PageResult[T]:
     """Read every page of a JSON:API collection, accumulating `data` from all of them.
 
@@ -167,11 +220,38 @@ async def paginate_all(
     — the limit Backstop actually served, which may be below what was asked. Offsets stride by
     that size and the callback must send it as the limit; Backstop rejects an offset that is not
     a multiple of the limit on the wire.
+
+    `read_page`, when given, fetches and parses each page in one step and `fetch_page` is not
+    needed — that is how `BackstopClient.paginate` parses off the event loop or as the body
+    streams in. Exactly one of the two is required. Page order and params are the same either
+    way.
+
+    `prefetch_params` makes the serial `links.next` walk speculative without giving up on it:
+    while page N is being read, page N+1 is requested by offset, its params built the way
+    `offset_params` builds them. When page N's `links.next` names exactly that request — same
+    path, same query — the prefetched page is the next page; when it names anything else, or
+    nothing, the prefetch is discarded and the link is followed as usual. The answer is always
+    the one `links.next` gives; the prefetch only decides whether it is already on its way, so
+    it is safe where `offset_params` is not, on endpoints whose `totalResourceCount` cannot be
+    trusted. Each discard is a request spent for nothing, and `PageResult` counts both outcomes.
+    Ignored when `offset_params` fans the walk out instead. `base_url` is what the reader joins a
+    relative path onto; a link is compared with the prefetch as both are actually sent, so an
+    absolute link under an API prefix (`/backstop/api/...`) still names a prefetch of `first_path`.
+
+    `on_page`, when given, is handed each page in order as it is read, and the result keeps
+    neither its items nor its `included` — only the counts. A caller that folds each page into
+    a summary (an aggregate) then holds one page at a time rather than the whole collection;
+    each page carries the side-loads its own items reference, so it can be projected alone.
     """
-    accumulator: _Accumulator[T] = _Accumulator(PageResult[T].model_construct())
-    first = parse_page(
-        (await fetch_page(first_path, first_page_params)).content, schema, path=first_path
-    )
+    if read_page is not None:
+        read = read_page
+    elif fetch_page is not None:
+        read = _buffered_reader(fetch_page, schema)
+    else:
+        raise TypeError("paginate_all needs fetch_page or read_page")
+
+    accumulator: _Accumulator[T] = _Accumulator(PageResult[T].model_construct(), on_page=on_page)
+    first = await read(first_path, first_page_params)
     accumulator.absorb(first)
     if accumulator.filled(max_records):
         accumulator.result.truncated = True
@@ -183,10 +263,10 @@ async def paginate_all(
     # falls through to `links.next`.
     if offset_params is not None and first.total_count is not None and first.items:
         page_size = len(first.items)
-        pages = await _fetch_offsets(
-            fetch_page=fetch_page,
+        await _absorb_offsets(
+            read=read,
+            accumulator=accumulator,
             path=first_path,
-            schema=schema,
             page_size=page_size,
             offsets=_offsets(
                 total_count=first.total_count,
@@ -195,14 +275,24 @@ async def paginate_all(
             ),
             offset_params=offset_params,
         )
-        for page in pages:
-            accumulator.absorb(page)
         accumulator.result.truncated = accumulator.filled(max_records)
         return accumulator.result
 
+    if prefetch_params is not None and first.items:
+        await _walk_links_prefetching(
+            read=read,
+            accumulator=accumulator,
+            first=first,
+            first_path=first_path,
+            max_records=max_records,
+            prefetch_params=prefetch_params,
+            base_url=None if base_url is None else httpx.URL(base_url),
+        )
+        return accumulator.result
+
     path = first.next_path
     while path is not None:
-        page = parse_page((await fetch_page(path, None)).content, schema, path=path)
+        page = await read(path, None)
         accumulator.absorb(page)
         if accumulator.filled(max_records):
             accumulator.result.truncated = True
@@ -212,6 +302,114 @@ async def paginate_all(
     return accumulator.result
 
 
+@dataclass
+class _Prefetch(Generic[T]):
+    """A page requested ahead of the link that will or will not name it."""
+
+    request: httpx.URL
+    task: asyncio.Future[SinglePage[T]]
+
+
+def _sent_as(url: httpx.URL, base_url: httpx.URL | None) -> httpx.URL:
+    """`url` as the shared client sends it: a relative path goes under `base_url`'s own path.
+
+    The same join httpx makes, so `/organizations` against `https://h/backstop/api` compares as
+    `/backstop/api/organizations` — the path Backstop's absolute `links.next` spells.
+    """
+    if base_url is None or url.is_absolute_url:
+        return url
+    joined = base_url.raw_path.rstrip(b"/") + b"/" + url.raw_path.lstrip(b"/")
+    return base_url.copy_with(raw_path=joined)
+
+
+def _names(link: str, request: httpx.URL, base_url: httpx.URL | None) -> bool:
+    """Whether `links.next` asks for `request`, however it spells the host and the encoding."""
+    linked = _sent_as(httpx.URL(link), base_url)
+    requested = _sent_as(request, base_url)
+    return linked.path == requested.path and sorted(linked.params.multi_items()) == sorted(
+        requested.params.multi_items()
+    )
+
+
+async def _walk_links_prefetching(
+    *,
+    read: ReadPage[T],
+    accumulator: _Accumulator[T],
+    first: SinglePage[T],
+    first_path: str,
+    max_records: int | None,
+    prefetch_params: OffsetPageParams,
+    base_url: httpx.URL | None,
+) -> None:
+    """The `links.next` walk, with the page after the one being read already requested.
+
+    Offsets stride by the size page one was served, as they do for `offset_params`. A page that
+    comes back another size puts the predictions out of step with the links, and every prefetch
+    after it is wasted rather than wrong. A prefetch that fails proves nothing about the link —
+    the offset may be one Backstop refuses — so it is wasted and the link is read the ordinary
+    way, whose failure is the walk's.
+    """
+    result = accumulator.result
+    route = metric_route(first_path)
+    page_size = len(first.items)
+    offset = page_size
+    path = first.next_path
+    pending: _Prefetch[T] | None = None
+
+    def wasted() -> None:
+        result.prefetch_wasted += 1
+        result.request_count += 1
+        BACKSTOP_PAGE_PREFETCHES.add(1, {"route": route, "outcome": "wasted"})
+
+    async def discard(prefetch: _Prefetch[T]) -> None:
+        wasted()
+        _ = prefetch.task.cancel()
+        _ = await asyncio.gather(prefetch.task, return_exceptions=True)
+
+    try:
+        while path is not None:
+            hit: _Prefetch[T] | None = None
+            if pending is not None and _names(path, pending.request, base_url):
+                hit = pending
+            elif pending is not None:
+                await discard(pending)
+            pending = None
+            current = hit.task if hit is not None else asyncio.ensure_future(read(path, None))
+            offset += page_size
+            # Nothing after the page being read is needed once it would fill the walk.
+            if max_records is None or result.item_count + page_size < max_records:
+                params = prefetch_params(offset, page_size)
+                pending = _Prefetch(
+                    request=httpx.URL(first_path, params=params),
+                    task=asyncio.ensure_future(read(first_path, params)),
+                )
+            if hit is None:
+                page = await current
+            else:
+                try:
+                    page = await current
+                    result.prefetch_hits += 1
+                    BACKSTOP_PAGE_PREFETCHES.add(1, {"route": route, "outcome": "hit"})
+                except (BackstopApiError, BackstopResponseSchemaError):
+                    wasted()
+                    page = await read(path, None)
+            accumulator.absorb(page)
+            if accumulator.filled(max_records):
+                result.truncated = True
+                break
+            path = page.next_path
+    finally:
+        if pending is not None:
+            await discard(pending)
+
+
+def _buffered_reader(fetch_page: FetchPage, schema: type[T]) -> ReadPage[T]:
+    async def read(path: str, params: dict[str, object] | None) -> SinglePage[T]:
+        return parse_page((await fetch_page(path, params)).content, schema, path=path)
+
+    return read
+
+
 def _offsets(*, total_count: int, page_size: int, max_records: int | None) -> range:
     """Offsets of every page after the first.
 
@@ -222,23 +420,31 @@ def _offsets(*, total_count: int, page_size: int, max_records: int | None) -> ra
     return range(page_size, wanted, page_size)
 
 
-async def _fetch_offsets(
+async def _absorb_offsets(
     *,
-    fetch_page: FetchPage,
+    read: ReadPage[T],
+    accumulator: _Accumulator[T],
     path: str,
-    schema: type[T],
     page_size: int,
     offsets: range,
     offset_params: OffsetPageParams,
-) -> list[SinglePage[T]]:
-    """Fetch the given offsets concurrently, parsed, in offset order.
-
-    Concurrency is bounded by whatever gate `fetch_page` holds rather than by anything here —
-    `BackstopClient` acquires the per-user slot around each single request. No
-    `return_exceptions`: one failed page makes the whole collection incomplete, and a caller
-    handed a silently short list has no way to tell.
+) -> None:
+    """Fetch the given offsets concurrently and absorb them, parsed, in offset order.
+
+    Concurrency is bounded by whatever gate `read` holds rather than by anything here —
+    `BackstopClient` acquires the per-user slot around each single request. Each page is
+    absorbed as soon as it and every page before it are in, so an `on_page` walk holds only the
+    pages that arrived ahead of their turn. No partial answer: one failed page makes the whole
+    collection incomplete, and a caller handed a silently short list has no way to tell, so it
+    raises and the pages still in flight are cancelled.
     """
-    responses = await asyncio.gather(
-        *(fetch_page(path, offset_params(offset, page_size)) for offset in offsets)
-    )
-    return [parse_page(response.content, schema, path=path) for response in responses]
+    tasks = [
+        asyncio.ensure_future(read(path, offset_params(offset, page_size))) for offset in offsets
+    ]
+    try:
+        for task in tasks:
+            accumulator.absorb(await task)
+    finally:
+        for task in tasks:
+            _ = task.cancel()
+        _ = await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,77 @@
+"""The transport under the shared `httpx.AsyncClient`, instrumented at the connection pool.
+
+Every user of the process shares one pool, so whether a request found a warm connection or paid
+for a TCP connect and TLS handshake is invisible from any single request's duration. httpcore
+reports those steps through the per-request `trace` extension; this transport attaches one to
+every request and turns it into the `backstop_pool_*` instruments — a request that had to open
+its connection, versus one that reused a pooled one, and how long it took to get to the point
+of sending headers either way.
+
+Under a respx mock no connection is ever made, so no trace events arrive and nothing is
+recorded; the pool gauge still is, and reads zero.
+"""
+
+import time
+from typing import override
+
+import httpx
+
+from backstop_mcp.metrics import (
+    BACKSTOP_POOL_ACQUIRE,
+    BACKSTOP_POOL_CONNECTIONS,
+    BACKSTOP_POOL_REQUESTS,
+)
+
+# httpcore names its events `<module>.<step>.<phase>`, `<module>` being `connection` for the
+# socket and `http11` / `http2` for the protocol spoken over it.
+_CONNECT_STARTED = "connection.connect_tcp.started"
+_HEADERS_STARTED = ".send_request_headers.started"
+
+
+class _ConnectionTrace:
+    """One request's trip through the pool, as httpcore reports it."""
+
+    def __init__(self) -> None:
+        self._started: float = time.monotonic()
+        self._acquired: float | None = None
+        self._opened: bool = False
+        self._http_version: str | None = None
+
+    async def __call__(self, event_name: str, _info: dict[str, object]) -> None:
+        if event_name == _CONNECT_STARTED:
+            self._opened = True
+        elif event_name.endswith(_HEADERS_STARTED) and self._acquired is None:
+            self._acquired = time.monotonic()
+            self._http_version = event_name.split(".", 1)[0]
+
+    def record(self) -> None:
+        # No headers sent means no connection was ever handed over: the connect failed, the
+        # pool timed out, or the transport is mocked. Nothing to say about reuse either way.
+        if self._acquired is None or self._http_version is None:
+            return
+        attributes = {
+            "connection": "opened" if self._opened else "reused",
+            "http_version": self._http_version,
+        }
+        BACKSTOP_POOL_REQUESTS.add(1, attributes)
+        BACKSTOP_POOL_ACQUIRE.record(self._acquired - self._started, attributes)
+
+
+class InstrumentedTransport(httpx.AsyncHTTPTransport):
+    """`httpx.AsyncHTTPTransport`, recording connection reuse and pool occupancy per request."""
+
+    @override
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        trace = _ConnectionTrace()
+        request.extensions = {**request.extensions, "trace": trace}
+        try:
+            return await super().handle_async_request(request)
+        finally:
+            trace.record()
+            self._record_occupancy()
+
+    def _record_occupancy(self) -> None:
+        connections = self._pool.connections
+        idle = sum(1 for connection in connections if connection.is_idle())
+        BACKSTOP_POOL_CONNECTIONS.set(idle, {"state": "idle"})
+        BACKSTOP_POOL_CONNECTIONS.set(len(connections) - idle, {"state": "active"})
@@ -0,0 +1,154 @@
+"""A `SharedGate` over this service's own Postgres, so one user's cap holds across replicas.
+
+Each request in flight holds one `gate_leases` row. Taking one is a short transaction that
+serialises on a per-username advisory lock, drops that user's expired rows, counts the rest and
+inserts only while the count is under the cap — so two replicas can never both take the last
+slot. A request that finds every slot leased polls again after a jittered interval: the wait is
+short queueing on our side instead of a 429 and a backoff on Backstop's.
+
+A lease expires on its own `lease_duration` after it was last renewed, and a held lease is
+renewed every third of that. A replica that crashes mid-request therefore strands its slots for
+at most one lease duration, while a slow report that outlives it is never cut short.
+
+The database clock (`now()`) stamps every expiry, so replicas with skewed clocks still agree on
+which leases are live.
+"""
+
+import asyncio
+import contextlib
+import logging
+import random
+import socket
+import uuid
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from datetime import timedelta
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backstop_mcp.db import GateLease, transaction
+from backstop_mcp.metrics import BACKSTOP_GATE_LEASES
+
+logger = logging.getLogger(__name__)
+
+_BACKEND = "postgres"
+
+# What a lease round trip can fail with when the database is down or unreachable: SQLAlchemy
+# wraps driver errors, but a refused connection can surface as a bare `OSError` first.
+_UNAVAILABLE = (SQLAlchemyError, OSError)
+
+
+class PostgresSharedGate:
+    """Cross-replica per-user slots as lease rows. See the module docstring for the protocol."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        limit: int,
+        lease_duration: timedelta,
+        poll_interval: timedelta,
+    ) -> None:
+        self._session_factory: async_sessionmaker[AsyncSession] = session_factory
+        self._limit: int = limit
+        self._lease_duration: timedelta = lease_duration
+        self._poll_interval: timedelta = poll_interval
+        self._holder: str = socket.gethostname()
+
+    @property
+    def backend(self) -> str:
+        return _BACKEND
+
+    @asynccontextmanager
+    async def lease(self, username: str) -> AsyncGenerator[None]:
+        lease_id = await self._acquire(username)
+        if lease_id is None:
+            yield
+            return
+        renewal = asyncio.create_task(self._renew_until_cancelled(lease_id))
+        try:
+            yield
+        finally:
+            renewal.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await renewal
+            await self._release(lease_id)
+
+    async def _acquire(self, username: str) -> uuid.UUID | None:
+        """Poll until a slot is free. `None` means the database could not be reached."""
+        while True:
+            try:
+                lease_id = await self._try_acquire(username)
+            except _UNAVAILABLE:
+                # Failing the request would turn a database blip into a Backstop outage. The
+                # local gate still bounds this user per replica, which is the single-replica
+                # guarantee, so the request runs under that alone.
+                logger.warning("backstop.gate.lease_unavailable", exc_info=True)
+                BACKSTOP_GATE_LEASES.add(1, {"backend": _BACKEND, "outcome": "unavailable"})
+                return None
+            if lease_id is not None:
+                BACKSTOP_GATE_LEASES.add(1, {"backend": _BACKEND, "outcome": "acquired"})
+                return lease_id
+            BACKSTOP_GATE_LEASES.add(1, {"backend": _BACKEND, "outcome": "busy"})
+            # Full jitter around the interval, so replicas waiting on the same user do not retry
+            # in lockstep and contend for the advisory lock all at once.
+            await asyncio.sleep(random.uniform(0, 2 * self._poll_interval.total_seconds()))
+
+    async def _try_acquire(self, username: str) -> uuid.UUID | None:
+        async with transaction(self._session_factory) as session:
+            # Held until commit: every replica's acquire for this username runs one at a time,
+            # which is what makes the count-then-insert below atomic.
+            await session.execute(
+                select(func.pg_advisory_xact_lock(func.hashtextextended(username, 0)))
+            )
+            await session.execute(
+                delete(GateLease).where(
+                    GateLease.username == username, GateLease.expires_at < func.now()
+                )
+            )
+            held = (
+                await session.execute(
+                    select(func.count())
+                    .select_from(GateLease)
+                    .where(GateLease.username == username)
+                )
+            ).scalar_one()
+            if held >= self._limit:
+                return None
+            lease_id = uuid.uuid4()
+            await session.execute(
+                insert(GateLease).values(
+                    id=lease_id,
+                    username=username,
+                    holder=self._holder,
+                    expires_at=func.now() + self._lease_duration,
+                )
+            )
+            return lease_id
+
+    async def _renew_until_cancelled(self, lease_id: uuid.UUID) -> None:
+        interval = self._lease_duration.total_seconds() / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with transaction(self._session_factory) as session:
+                    await session.execute(
+                        update(GateLease)
+                        .where(GateLease.id == lease_id)
+                        .values(expires_at=func.now() + self._lease_duration)
+                    )
+            except _UNAVAILABLE:
+                # Not fatal: the next renewal may land, and if none does the lease lapses and
+                # another replica may briefly run one request more than the cap — a 429 the
+                # retry policy already handles.
+                logger.warning("backstop.gate.lease_renewal_failed", exc_info=True)
+
+    async def _release(self, lease_id: uuid.UUID) -> None:
+        try:
+            async with transaction(self._session_factory) as session:
+                await session.execute(delete(GateLease).where(GateLease.id == lease_id))
+        except _UNAVAILABLE:
+            # The row expires on its own within one lease duration.
+            logger.warning("backstop.gate.lease_release_failed", exc_info=True)
@@ -0,0 +1,107 @@
+"""Per-user cache of GET response bodies, revalidated with the validators Backstop sends.
+
+Keyed by `request_key` — username and credential fingerprint plus the full request URL with its
+query string — so one user's cached body is never a candidate for another user's request, nor a
+revoked token's for the token that replaced it.
+
+An entry stored with an `ETag` or `Last-Modified` is never served blind: the next request for
+it goes upstream as a conditional GET, and a `304 Not Modified` is answered from the stored
+body. That still costs a gate slot and a round trip, but not the body's bytes. An entry with no
+validators has nothing to revalidate with, so it is served as-is for `ttl` and then dropped —
+the bounded staleness is the price of skipping the request entirely, which is why `ttl` is
+meant to be short.
+
+Bounded by total body bytes and evicted least-recently-used. A single body larger than
+`_MAX_ENTRY_SHARE` of the budget is not stored at all: one report page would otherwise flush
+every small by-id document the cache exists for.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import cast
+
+import httpx
+
+from backstop_mcp.backstop_client.utils import RequestKey
+
+# Largest fraction of `max_bytes` a single body may take.
+_MAX_ENTRY_SHARE = 8
+
+# Describe the bytes as they came off the wire, not the decoded body that is stored: replaying
+# `Content-Encoding: gzip` over it would have httpx try to decompress it a second time.
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """One stored GET response: the body, its headers, and what to revalidate it with."""
+
+    content: bytes
+    headers: tuple[tuple[str, str], ...]
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+
+    @property
+    def revalidates(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        """The stored body as a fresh `200`, whatever status actually came back (`304`)."""
+        return httpx.Response(200, headers=self.headers, content=self.content, request=request)
+
+
+class ResponseCache:
+    """Bounded LRU of `CachedResponse`s. See the module docstring for the serving rules."""
+
+    def __init__(self, *, max_bytes: int, ttl: timedelta) -> None:
+        self._max_bytes: int = max_bytes
+        self._ttl_seconds: float = ttl.total_seconds()
+        self._entries: OrderedDict[RequestKey, CachedResponse] = OrderedDict()
+        self._bytes: int = 0
+
+    def get(self, key: RequestKey) -> CachedResponse | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not entry.revalidates and time.monotonic() - entry.stored_at > self._ttl_seconds:
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def store(self, key: RequestKey, response: httpx.Response) -> None:
+        content = response.content
+        self._drop(key)
+        if len(content) > self._max_bytes // _MAX_ENTRY_SHARE:
+            return
+        self._entries[key] = CachedResponse(
+            content=content,
+            headers=tuple(
+                (name, value)
+                for name, value in response.headers.multi_items()
+                if name.lower() not in _WIRE_HEADERS
+            ),
+            etag=cast("str | None", response.headers.get("ETag")),
+            last_modified=cast("str | None", response.headers.get("Last-Modified")),
+            stored_at=time.monotonic(),
+        )
+        self._bytes += len(content)
+        while self._bytes > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+
+    def _drop(self, key: RequestKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry.content)
@@ -28,6 +28,32 @@ class BackstopTransportSettings(BaseModel):
     # Backstop hard-limits each user token to 5 concurrent connections; the gate registry in
     # `factory.py` enforces it.
     max_concurrent_requests_per_user: int = Field(ge=1)
+    # Whether each user's gate narrows below that cap on concurrency 429s and latency spikes,
+    # and widens back toward it while responses are healthy. See `gates.py`.
+    adaptive_concurrency_enabled: bool
+    adaptive_concurrency_latency_factor: float = Field(gt=1)
+
+    # The shared connection pool every user of the process goes through. See `pool.py`.
+    http2_enabled: bool
+    max_connections: int = Field(ge=1)
+    max_keepalive_connections: int = Field(ge=0)
+    keepalive_expiry_seconds: float = Field(gt=0)
+
+    # Whether identical concurrent GETs for one user share a single request. See `coalescer.py`.
+    request_coalescing_enabled: bool
+
+    # Per-user GET response cache under `raw_request`. See `response_cache.py`.
+    response_cache_enabled: bool
+    response_cache_max_bytes: int = Field(ge=1)
+    response_cache_ttl_seconds: float = Field(gt=0)
+
+    # Whether `.paginate()` and `.get_document()` read bodies incrementally. See `streaming.py`.
+    streaming_parse_enabled: bool
+    # Worker threads response bodies are parsed on; `0` parses on the event loop. See
+    # `BackstopClient._parse`.
+    parse_worker_threads: int = Field(ge=0)
+    # Prefetch the next page of a serial `links.next` walk by offset. See `paginate_all`.
+    speculative_prefetch_enabled: bool
 
     # Default page sizes for `.paginate()`, split the same way as the timeouts.
     default_page_size: int = Field(ge=1)
@@ -0,0 +1,206 @@
+"""Incremental reading of one JSON document whose bulk is a single array.
+
+Every large body Backstop sends is one array wrapped in a small envelope: a collection page's
+`data`, the holdings table's `data[0].attributes.accounts`. Buffering such a body and validating
+it in one `validate_json` call holds the whole body and the whole validated tree at once, and an
+unbounded endpoint makes that unbounded. `JsonItemSplitter` instead takes the body in whatever
+chunks the socket delivers and hands back each element of that one array as soon as it is
+complete, so the element can be validated — and projected — while the rest is downloading, and
+its text dropped once it has been. Everything outside the array, the envelope, is kept with the
+array left empty and validated once the body ends.
+
+The splitter tracks only enough structure to find the array; each element is decoded by the
+stdlib's C scanner and validated by pydantic. It is not a JSON validator, but it cannot turn a
+malformed body into a quietly short answer either: a body that stops mid-array, or an element
+that never decodes, leaves the envelope unclosed, and an unclosed envelope fails validation.
+"""
+
+import codecs
+import json
+import re
+from collections.abc import AsyncIterable, Callable
+from dataclasses import dataclass
+from typing import cast
+
+from backstop_mcp.backstop_client.utils import SchemaInput, deserialize, validate
+
+# Where the array sits in the document: object keys and array indices from the root, so
+# `("data",)` is a collection page's items and `("data", 0, "attributes", "accounts")` the rows
+# of the holdings table.
+type ItemPath = tuple[str | int, ...]
+
+# A whole string is one token, so string contents are skipped in C rather than walked here; a
+# lone quote is a string the buffer ends inside of.
+_ENVELOPE_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}:,]|"', re.DOTALL)
+_SEPARATORS = " \t\r\n,"
+_NEXT_CHAR = re.compile(r"\S")
+_ELEMENT_ENDS = (",", "]")
+
+
+@dataclass
+class _Frame:
+    """One open object or array between the root and the scan position.
+
+    `key` is the member being read (object) or the index of the current element (array), so
+    the frames together spell the path of whatever value comes next.
+    """
+
+    is_object: bool
+    key: str | int | None
+    awaiting_key: bool = False
+
+
+class JsonItemSplitter:
+    """Splits a JSON document, fed in chunks, into the elements of the array at `items_at`.
+
+    `feed` returns the elements that chunk completed, decoded; `envelope` returns the rest of
+    the document once it has all arrived, with the array emptied. Only the envelope, the
+    element being read and the unread tail of the latest chunk are ever held, and `peak_chars`
+    is the most of that held at once — the number to set against the body's length, which is
+    what reading it whole holds.
+    """
+
+    def __init__(self, items_at: ItemPath) -> None:
+        self._items_at: ItemPath = items_at
+        self._decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder("utf-8")()
+        self._elements: json.JSONDecoder = json.JSONDecoder()
+        self._buffer: str = ""
+        self._envelope: list[str] = []
+        self._envelope_chars: int = 0
+        self._pos: int = 0
+        self._stack: list[_Frame] = []
+        self._in_items: bool = False
+        self._found: bool = False
+        self.peak_chars: int = 0
+
+    def feed(self, chunk: bytes) -> list[object]:
+        self._buffer += self._decoder.decode(chunk)
+        elements: list[object] = []
+        while self._scan_items(elements) if self._in_items else self._scan_envelope():
+            pass
+        self.peak_chars = max(self.peak_chars, len(self._buffer) + self._envelope_chars)
+        if self._in_items:
+            self._drop()
+        else:
+            self._commit()
+        return elements
+
+    def envelope(self) -> str:
+        self._buffer += self._decoder.decode(b"", final=True)
+        self._pos = len(self._buffer)
+        self._commit()
+        return "".join(self._envelope)
+
+    def _scan_envelope(self) -> bool:
+        """Advance past one envelope token; `False` once the buffer ends mid-token."""
+        match = _ENVELOPE_TOKEN.search(self._buffer, self._pos)
+        if match is None:
+            self._pos = len(self._buffer)
+            return False
+        token = match.group()
+        if token == '"':
+            self._pos = match.start()
+            return False
+        self._pos = match.end()
+        top = self._stack[-1] if self._stack else None
+        if token.startswith('"'):
+            if top is not None and top.is_object and top.awaiting_key:
+                top.key = cast(str, json.loads(token))
+                top.awaiting_key = False
+        elif token == "{":
+            self._stack.append(_Frame(is_object=True, key=None, awaiting_key=True))
+        elif token == "[":
+            is_items = not self._found and self._path() == self._items_at
+            self._stack.append(_Frame(is_object=False, key=0))
+            if is_items:
+                self._found = True
+                self._in_items = True
+                self._commit()
+        elif token in ("}", "]"):
+            if self._stack:
+                _ = self._stack.pop()
+        elif token == "," and top is not None:
+            if top.is_object:
+                top.awaiting_key = True
+            elif isinstance(top.key, int):
+                top.key += 1
+        return True
+
+    def _scan_items(self, elements: list[object]) -> bool:
+        """Decode the next element, or leave the array; `False` until more arrives."""
+        while self._pos < len(self._buffer) and self._buffer[self._pos] in _SEPARATORS:
+            self._pos += 1
+        if self._pos >= len(self._buffer):
+            return False
+        if self._buffer[self._pos] == "]":
+            # The elements are not the envelope's; the closing bracket is, so it reads `[]`.
+            self._drop()
+            self._in_items = False
+            return True
+        try:
+            element, end = cast(
+                tuple[object, int], self._elements.raw_decode(self._buffer, self._pos)
+            )
+        except json.JSONDecodeError:
+            return False
+        follows = _NEXT_CHAR.search(self._buffer, end)
+        if follows is None or follows.group() not in _ELEMENT_ENDS:
+            # Only `,` or `]` proves the element complete: until one arrives, a number may yet
+            # gain digits (`-15` of `-1500.5`). Decoded again once the next chunk shows more.
+            return False
+        elements.append(element)
+        self._pos = end
+        return True
+
+    def _path(self) -> tuple[str | int | None, ...]:
+        return tuple(frame.key for frame in self._stack)
+
+    def _commit(self) -> None:
+        """Move everything scanned so far into the envelope."""
+        self._envelope.append(self._buffer[: self._pos])
+        self._envelope_chars += self._pos
+        self._drop()
+
+    def _drop(self) -> None:
+        """Forget everything scanned so far."""
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+
+
+@dataclass(frozen=True)
+class StreamedDocument[E, P]:
+    """A document read by `read_document`: its envelope, and its array's projected elements.
+
+    `peak_chars` is `JsonItemSplitter.peak_chars` for the read.
+    """
+
+    envelope: E
+    items: list[P]
+    peak_chars: int
+
+
+async def read_document[E, I, P](
+    chunks: AsyncIterable[bytes],
+    *,
+    envelope: type[E],
+    items_at: ItemPath,
+    item_schema: type[I],
+    project: Callable[[I], P],
+    path: str,
+) -> StreamedDocument[E, P]:
+    """Read a body chunk by chunk, validating and projecting each element as it completes.
+
+    `envelope` is validated last, against the document with its array emptied, so a required
+    field there fails the same way it would have on the whole body. `project` runs on each
+    validated element before the next chunk is read; only what it returns is kept, which is
+    what bounds memory when the projection is narrower than the wire shape.
+    """
+    splitter = JsonItemSplitter(items_at)
+    items: list[P] = []
+    async for chunk in chunks:
+        for element in splitter.feed(chunk):
+            item = cast(I, validate(element, cast(SchemaInput, item_schema), path=path))
+            items.append(project(item))
+    body = splitter.envelope().encode()
+    document = cast(E, deserialize(body, cast(SchemaInput, envelope), path=path))
+    return StreamedDocument(envelope=document, items=items, peak_chars=splitter.peak_chars)
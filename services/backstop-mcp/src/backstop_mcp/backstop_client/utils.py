@@ -15,6 +15,7 @@ import httpx
 from pydantic import TypeAdapter, ValidationError
 from typing_extensions import TypeVar
 
+from backstop_mcp.backstop_client.credential import BackstopCredentialSecret
 from backstop_mcp.backstop_client.errors import (
     BackstopResponseSchemaError,
     BackstopUntrustedUrlError,
@@ -71,12 +72,45 @@ def deserialize(content: bytes, schema: SchemaInput, *, path: str) -> object:
     try:
         return adapter_for(schema).validate_json(content)
     except ValidationError as exc:
-        name = schema_label(schema)
-        logger.error(
-            "backstop.response.schema_error",
-            extra={"path": path, "schema": name},
-        )
-        raise BackstopResponseSchemaError(path, name, exc) from exc
+        raise _schema_error(exc, schema, path=path) from exc
+
+
+def validate(value: object, schema: SchemaInput, *, path: str) -> object:
+    """`deserialize` for a value already decoded from JSON — one element of a streamed body."""
+    try:
+        return adapter_for(schema).validate_python(value)
+    except ValidationError as exc:
+        raise _schema_error(exc, schema, path=path) from exc
+
+
+def _schema_error(
+    exc: ValidationError, schema: SchemaInput, *, path: str
+) -> BackstopResponseSchemaError:
+    name = schema_label(schema)
+    logger.error(
+        "backstop.response.schema_error",
+        extra={"path": path, "schema": name},
+    )
+    return BackstopResponseSchemaError(path, name, exc)
+
+
+# Who is asking, with which credential, and exactly what for: (username, credential
+# fingerprint, URL). See `request_key`.
+type RequestKey = tuple[str, str, str]
+
+
+def request_key(
+    credential: BackstopCredentialSecret, url: str, params: dict[str, object] | None
+) -> RequestKey:
+    """Identify a GET by credential plus the URL as it goes out, query string included.
+
+    httpx's own query encoding, so `{"a": [1, 2]}` and a URL already carrying `a=1&a=2` key the
+    same way. The username is part of the key because two users asking for the same URL may be
+    entitled to different answers; nothing keyed by it is ever shared between them. The
+    credential's fingerprint is too, so once a token is revoked or replaced, what was read with
+    it is never served again — not even to the same username.
+    """
+    return credential.username, credential.fingerprint, str(httpx.URL(url, params=params))
 
 
 def resolve_request_url(base_url: str, path: str) -> str:
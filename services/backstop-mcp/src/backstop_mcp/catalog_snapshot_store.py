@@ -0,0 +1,199 @@
+"""The Postgres tier under `CachedCatalog`: the last good catalog, shared across replicas.
+
+Without it every replica walks every catalog on its first read after a start, so a rolling
+deploy of N pods is N walks of each one at once, and the walk count follows replicas × restarts
+rather than the TTL. With it, the first replica to walk writes what it got to
+`catalog_snapshots`, keyed by tenant (the Backstop base URL) and catalog name, and a replica
+starting cold serves that copy as long as it is inside the TTL — no walk at all.
+
+When the copy ages out, replicas agree on one to walk: `claim_refresh` stamps a lease on the
+row that only one of them can take at a time, and the others `await_refresh` — polling for the
+claimant's result — instead of walking too. A claimant that dies or fails lets its lease lapse
+or releases it, and the waiters then walk for themselves, so a stuck claim costs one lease of
+latency and never a missing catalog.
+
+Sharing a catalog between users here is no wider than sharing it in memory, which every
+`CachedCatalog` already does within a process: the four catalogs are instance-wide vocabularies,
+not per-user answers. Like the cross-replica gate, losing the database degrades to what a
+replica does alone — a load finds nothing, a claim is granted, a save is dropped — rather than
+failing the read.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backstop_mcp.db import CatalogSnapshot, read_session, transaction
+
+logger = logging.getLogger(__name__)
+
+# What a snapshot round trip can fail with when the database is down or unreachable — see
+# `postgres_gate.py`, which degrades the same way.
+_UNAVAILABLE = (SQLAlchemyError, OSError)
+
+
+@dataclass(frozen=True)
+class StoredCatalog:
+    """One catalog as a replica last wrote it: the `{id: dto}` map as JSON, and when."""
+
+    payload: dict[str, object]
+    fetched_at: datetime
+
+
+class CatalogSnapshotStore:
+    """Reads and writes `catalog_snapshots` for one tenant. See the module docstring."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        tenant: str,
+        refresh_lease: timedelta,
+        poll_interval: timedelta = timedelta(milliseconds=250),
+    ) -> None:
+        self._session_factory: async_sessionmaker[AsyncSession] = session_factory
+        self._tenant: str = tenant
+        self._refresh_lease: timedelta = refresh_lease
+        self._poll_interval: timedelta = poll_interval
+
+    async def load(self, catalog: str, *, schema_version: str) -> StoredCatalog | None:
+        """The stored catalog, or `None` when there is none in `schema_version`'s shape."""
+        try:
+            async with read_session(self._session_factory) as session:
+                row = (
+                    (
+                        await session.execute(
+                            select(CatalogSnapshot.payload, CatalogSnapshot.fetched_at).where(
+                                CatalogSnapshot.tenant == self._tenant,
+                                CatalogSnapshot.catalog == catalog,
+                                CatalogSnapshot.schema_version == schema_version,
+                                CatalogSnapshot.payload.is_not(None),
+                            )
+                        )
+                    )
+                    .tuples()
+                    .first()
+                )
+        except _UNAVAILABLE:
+            logger.warning("catalog_snapshot.load_unavailable", exc_info=True)
+            return None
+        if row is None:
+            return None
+        payload, fetched_at = row
+        if payload is None or fetched_at is None:
+            return None
+        return StoredCatalog(payload=payload, fetched_at=fetched_at)
+
+    async def claim_refresh(self, catalog: str) -> bool:
+        """Take the one refresh of `catalog` replicas may run at a time; `False` if held.
+
+        Granted when the database cannot be asked: a replica that cannot coordinate walks for
+        itself, which is what it would do with no snapshot tier at all.
+        """
+        statement = insert(CatalogSnapshot).values(
+            tenant=self._tenant,
+            catalog=catalog,
+            refresh_claimed_until=func.now() + self._refresh_lease,
+        )
+        claimable = or_(
+            CatalogSnapshot.refresh_claimed_until.is_(None),
+            CatalogSnapshot.refresh_claimed_until < func.now(),
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[CatalogSnapshot.tenant, CatalogSnapshot.catalog],
+            set_={"refresh_claimed_until": statement.excluded.refresh_claimed_until},
+            where=claimable,
+        ).returning(CatalogSnapshot.catalog)
+        try:
+            async with transaction(self._session_factory) as session:
+                return (await session.execute(statement)).first() is not None
+        except _UNAVAILABLE:
+            logger.warning("catalog_snapshot.claim_unavailable", exc_info=True)
+            return True
+
+    async def await_refresh(
+        self, catalog: str, *, schema_version: str, newer_than: datetime | None
+    ) -> StoredCatalog | None:
+        """Wait while another replica's claim is live; its result, or `None` if it produced none.
+
+        Polls only the row's timestamps, and reads the payload once, when it has changed. Bounded
+        by the claim itself: a claimant that dies never saves or releases, so its lease lapses
+        and this returns. Times are the database clock's, as in `postgres_gate.py`, so replicas
+        with skewed clocks still agree on whose claim is live and which snapshot is newer.
+        """
+        while True:
+            try:
+                async with read_session(self._session_factory) as session:
+                    row = (
+                        (
+                            await session.execute(
+                                select(
+                                    CatalogSnapshot.fetched_at,
+                                    CatalogSnapshot.refresh_claimed_until > func.now(),
+                                ).where(
+                                    CatalogSnapshot.tenant == self._tenant,
+                                    CatalogSnapshot.catalog == catalog,
+                                )
+                            )
+                        )
+                        .tuples()
+                        .first()
+                    )
+            except _UNAVAILABLE:
+                logger.warning("catalog_snapshot.await_unavailable", exc_info=True)
+                return None
+            if row is None:
+                return None
+            fetched_at, claimed = row
+            if fetched_at is not None and (newer_than is None or fetched_at > newer_than):
+                return await self.load(catalog, schema_version=schema_version)
+            if not claimed:
+                return None
+            await asyncio.sleep(self._poll_interval.total_seconds())
+
+    async def save(self, catalog: str, payload: dict[str, object], *, schema_version: str) -> None:
+        """Store a freshly walked catalog and release the refresh claim on it."""
+        statement = insert(CatalogSnapshot).values(
+            tenant=self._tenant,
+            catalog=catalog,
+            schema_version=schema_version,
+            payload=payload,
+            fetched_at=func.now(),
+            refresh_claimed_until=None,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[CatalogSnapshot.tenant, CatalogSnapshot.catalog],
+            set_={
+                "schema_version": statement.excluded.schema_version,
+                "payload": statement.excluded.payload,
+                "fetched_at": statement.excluded.fetched_at,
+                "refresh_claimed_until": None,
+            },
+        )
+        try:
+            async with transaction(self._session_factory) as session:
+                _ = await session.execute(statement)
+        except _UNAVAILABLE:
+            # The next replica to find the snapshot aged out walks again; nothing is lost.
+            logger.warning("catalog_snapshot.save_unavailable", exc_info=True)
+
+    async def release_claim(self, catalog: str) -> None:
+        """Give the claim up after a failed walk, so waiters walk now rather than at expiry."""
+        try:
+            async with transaction(self._session_factory) as session:
+                _ = await session.execute(
+                    update(CatalogSnapshot)
+                    .where(
+                        CatalogSnapshot.tenant == self._tenant,
+                        CatalogSnapshot.catalog == catalog,
+                    )
+                    .values(refresh_claimed_until=None)
+                )
+        except _UNAVAILABLE:
+            logger.warning("catalog_snapshot.release_unavailable", exc_info=True)
@@ -0,0 +1,161 @@
+"""Filling the catalogs at startup, before the first tool call has to.
+
+A catalog fills on first use, so after a deploy the first `get_person` or `list_custom_fields`
+pays for the custom-field walk — the slowest call of the day, on every replica. With a service
+credential configured, `CatalogWarmup` walks the cached catalogs in the app lifespan instead, all
+at once, under one time budget. Whatever is still walking when the budget runs out is cancelled
+and left to fill on first use as before; a catalog that fails is logged and left the same way.
+
+`/ready` answers 503 until warm-up has ended, so a replica joins rotation warm — but never later
+than the budget, which is the whole of what warm-up can cost a rollout. Each catalog's time lands
+in `catalog_warmup_duration_seconds{catalog, outcome}`.
+
+A root module rather than a feature, for the reason `teardown.py` is: it reaches the
+feature-owned providers, and nothing under `features/` imports it back.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable, Mapping
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import Literal
+
+from backstop_mcp.backstop_client import BackstopClient, BackstopCredentialSecret
+from backstop_mcp.config import BackstopConfig
+from backstop_mcp.dependencies import get_backstop_client_factory
+from backstop_mcp.features.activity_tags import get_activity_tags_service
+from backstop_mcp.features.custom_fields import (
+    get_custom_field_groups_service,
+    get_custom_fields_service,
+)
+from backstop_mcp.features.opportunities import get_opportunity_stages_service
+from backstop_mcp.features.system_users import get_system_users_service
+from backstop_mcp.metrics import CATALOG_WARMUP_DURATION
+
+logger = logging.getLogger(__name__)
+
+# One catalog's load, whatever shape its `get` returns — warm-up only wants it to have run.
+type WarmCatalog = Callable[[BackstopClient], Awaitable[object]]
+type WarmupOutcome = Literal["ok", "error", "timeout", "cancelled"]
+
+
+class CatalogWarmup:
+    """Loads `catalogs` once, concurrently, within `budget`. See the module docstring."""
+
+    def __init__(
+        self,
+        *,
+        catalogs: Mapping[str, WarmCatalog],
+        client: Callable[[], BackstopClient],
+        budget: timedelta,
+    ) -> None:
+        self._catalogs: Mapping[str, WarmCatalog] = catalogs
+        self._client: Callable[[], BackstopClient] = client
+        self._budget: timedelta = budget
+        self._budget_spent: bool = False
+        self._finished: bool = False
+
+    @property
+    def finished(self) -> bool:
+        """Whether warm-up has ended, however it went. `/ready` waits on this."""
+        return self._finished
+
+    @asynccontextmanager
+    async def running(self) -> AsyncGenerator[None]:
+        """Warm in the background for the lifespan, cancelling whatever is left at shutdown."""
+        task = asyncio.create_task(self.run(), name="catalog_warmup")
+        try:
+            yield
+        finally:
+            _ = task.cancel()
+            # Await so the cancelled task can't outlive the app or go unretrieved.
+            _ = await asyncio.gather(task, return_exceptions=True)
+
+    async def run(self) -> dict[str, WarmupOutcome]:
+        """Warm every catalog; each one's outcome, also logged once all have ended."""
+        outcomes: dict[str, WarmupOutcome] = {}
+        tasks: list[asyncio.Task[None]] = []
+        try:
+            client = self._client()
+            tasks = [
+                asyncio.create_task(self._warm(name, warm, client, outcomes))
+                for name, warm in self._catalogs.items()
+            ]
+            if tasks:
+                _done, pending = await asyncio.wait(tasks, timeout=self._budget.total_seconds())
+                self._budget_spent = bool(pending)
+                for task in pending:
+                    _ = task.cancel()
+                _ = await asyncio.gather(*pending, return_exceptions=True)
+            logger.info("catalog_warmup.finished", extra={"outcomes": outcomes})
+            return outcomes
+        except Exception:
+            # Nothing may keep `/ready` at 503: a warm-up that cannot even start is over too.
+            logger.warning("catalog_warmup.failed", exc_info=True)
+            return outcomes
+        finally:
+            # Shut down mid-walk: the catalogs still walking must not outlive the run.
+            for task in tasks:
+                _ = task.cancel()
+            _ = await asyncio.gather(*tasks, return_exceptions=True)
+            self._finished = True
+
+    async def _warm(
+        self,
+        name: str,
+        warm: WarmCatalog,
+        client: BackstopClient,
+        outcomes: dict[str, WarmupOutcome],
+    ) -> None:
+        started = time.monotonic()
+        outcome: WarmupOutcome = "cancelled"
+        try:
+            _ = await warm(client)
+        except asyncio.CancelledError:
+            if self._budget_spent:
+                outcome = "timeout"
+            raise
+        except Exception:
+            outcome = "error"
+            logger.warning("catalog_warmup.catalog_failed", extra={"catalog": name}, exc_info=True)
+        else:
+            outcome = "ok"
+        finally:
+            outcomes[name] = outcome
+            CATALOG_WARMUP_DURATION.record(
+                time.monotonic() - started, {"catalog": name, "outcome": outcome}
+            )
+
+
+def catalog_warmup(config: BackstopConfig) -> CatalogWarmup | None:
+    """The warm-up `create_app` runs in its lifespan, or `None` without a service credential.
+
+    Decides which catalogs are worth loading from the providers themselves, so it is built after
+    configuration is read and sees the same flags the tools will.
+    """
+    if config.catalog_warmup_username is None or config.catalog_warmup_api_token is None:
+        return None
+    credential = BackstopCredentialSecret(
+        username=config.catalog_warmup_username, api_token=config.catalog_warmup_api_token
+    )
+    catalogs: dict[str, WarmCatalog] = {}
+    custom_fields = get_custom_fields_service()
+    if custom_fields.caching_enabled:
+        catalogs["custom-field"] = custom_fields.get
+    custom_field_groups = get_custom_field_groups_service()
+    if custom_field_groups.caching_enabled:
+        catalogs["custom-field group"] = custom_field_groups.get
+    activity_tags = get_activity_tags_service()
+    if activity_tags.caching_enabled:
+        catalogs["activity-tag"] = activity_tags.get
+    system_users = get_system_users_service()
+    if system_users.caching_enabled:
+        catalogs["system-user"] = system_users.get
+    catalogs["opportunity-stage"] = get_opportunity_stages_service().get
+    return CatalogWarmup(
+        catalogs=catalogs,
+        client=lambda: get_backstop_client_factory().for_credential(credential),
+        budget=timedelta(seconds=config.catalog_warmup_budget_seconds),
+    )
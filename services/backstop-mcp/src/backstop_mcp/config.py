@@ -121,6 +121,13 @@ class AppEnv(StrEnum):
 _NON_PUBLIC_HOSTS = frozenset({"localhost", "127.0.0.1", "::1", "[::1]", "0.0.0.0", "::"})
 
 
+class GateBackend(StrEnum):
+    """Where the per-user concurrency cap is counted. See `backstop_client/gates.py`."""
+
+    MEMORY = "memory"
+    POSTGRES = "postgres"
+
+
 class LogLevel(StrEnum):
     """Matches `unique_mcp.logging.configure_logging` accepted names (case-insensitive)."""
 
@@ -208,6 +215,85 @@ class BackstopConfig(BaseSettings):
     # Backstop hard-limits each user token to 5 concurrent connections.
     max_concurrent_requests_per_user: int = Field(default=5, ge=1)
 
+    # Where that cap is counted. `memory` counts in-process, so with N replicas one user can have
+    # N times the cap in flight and the surplus comes back as concurrency 429s. `postgres` also
+    # takes a lease row per request in this service's own database, so the cap holds across
+    # every replica sharing it; see `backstop_client/postgres_gate.py`. The
+    # `backstop_gate_wait_seconds` histogram shows what each costs in queueing.
+    concurrency_gate_backend: GateBackend = GateBackend.MEMORY
+    # How long a `postgres` lease survives without renewal: the longest a crashed replica can
+    # strand a slot. A held lease is renewed every third of this, so a slow report is never cut
+    # short by it.
+    concurrency_gate_lease_seconds: float = Field(default=30.0, gt=0)
+    # Mean pause between lease attempts while every slot is held elsewhere. Jittered per poll.
+    concurrency_gate_poll_ms: int = Field(default=50, ge=1)
+    # Let each user's window float below the cap instead of holding it fixed: halved on a
+    # concurrency 429, trimmed when a response takes more than
+    # `adaptive_concurrency_latency_factor` times that route's recent baseline, and grown back by
+    # about one slot per window of healthy responses, never past the cap. Off by default — the
+    # fixed cap is what Backstop documents; turn this on where concurrency 429s show up in
+    # `backstop_rate_limited_total` anyway, and watch `backstop_gate_window` to see where each
+    # tenant settles.
+    adaptive_concurrency_enabled: bool = False
+    adaptive_concurrency_latency_factor: float = Field(default=3.0, gt=1)
+
+    # The one connection pool shared by every user of this process. HTTP/2 multiplexes the
+    # requests a fan-out puts in flight over a few connections instead of one handshake each;
+    # off by default until it is measured against Backstop, via the `backstop_pool_*` metrics
+    # (`backstop_pool_requests_total{connection="opened"}` is what it should bring down).
+    http2_enabled: bool = False
+    # Sized well above the per-user gate because the pool serves every user at once. A request
+    # finding all `max_connections` busy waits for one; `max_keepalive_connections` idle ones are
+    # kept for reuse, each for at most `keepalive_expiry_seconds` (httpx's default is 5s).
+    max_connections: int = Field(default=100, ge=1)
+    max_keepalive_connections: int = Field(default=20, ge=0)
+    keepalive_expiry_seconds: float = Field(default=5.0, gt=0)
+
+    # Let a GET that is identical (same user, URL and params) to one already in flight wait for
+    # that one's response instead of taking a gate slot of its own. Parallel tool calls and batch
+    # items asking for the same document are the common case. Off by default like the caches;
+    # `backstop_coalesced_requests_total` counts the slots it saves.
+    request_coalescing_enabled: bool = False
+
+    # Keep GET response bodies per user and revalidate them with `If-None-Match` /
+    # `If-Modified-Since` where Backstop sent an `ETag` / `Last-Modified`, so a repeat by-id read
+    # that has not changed comes back as a bodiless 304. A response without validators is served
+    # from the cache for `response_cache_ttl_seconds` without asking at all — keep that short,
+    # since nothing tells the cache the record changed. Bounded by total body bytes, LRU. Off by
+    # default; `backstop_requests_total{cache=...}` splits hits, misses and revalidations.
+    response_cache_enabled: bool = False
+    response_cache_max_bytes: int = Field(default=32 * 1024 * 1024, ge=1)
+    response_cache_ttl_seconds: float = Field(default=30.0, gt=0)
+
+    # Read collection pages and the holdings table as they download — validating each item once
+    # it is complete and dropping its text — rather than buffering the whole body and validating
+    # it in one pass. Bounds what one response holds to about one item plus its envelope, which
+    # matters on the unbounded `/bsg-account-table-data` and on 500-row activity pages with
+    # descriptions. Costs more CPU per byte than one `validate_json` call and bypasses the
+    # response cache and coalescing for those reads, so off by default until
+    # `backstop_response_peak_chars` (split by `mode`) shows it earns that.
+    streaming_parse_enabled: bool = False
+
+    # Parse response bodies (pydantic validation of every page and document) on this many worker
+    # threads instead of on the event loop. A 500-row page takes long enough to validate that
+    # every other user's requests on the worker stall behind it; on a thread, the loop gets the
+    # GIL back at least every switch interval and stays free to send and receive, so the
+    # concurrent pages of a parallel walk download while earlier ones are still being parsed.
+    # `0` keeps parsing on the loop, which is the default until the two histograms it is judged
+    # by — `backstop_parse_duration_seconds{where=...}` and `backstop_event_loop_lag_seconds`,
+    # both by route — say otherwise. Ignored for reads `streaming_parse_enabled` streams.
+    parse_worker_threads: int = Field(default=0, ge=0)
+
+    # Serial pagination walks (`links.next`, one page at a time — every `paginate` call not made
+    # with `parallel=True`, which is every collection whose `totalResourceCount` is not a true
+    # total) request page N+1 by offset while page N is still being read, and use it only if
+    # page N's `links.next` then names exactly that request. The answer is unchanged either way;
+    # a hit saves the round trip the link would have cost, a miss costs one request for nothing,
+    # and `backstop_page_prefetches_total{outcome=...}` counts both by route. Off until that
+    # counter says the hits are worth the misses: a walk holds two of the user's gate slots
+    # rather than one, which matters to whoever is waiting behind it.
+    speculative_prefetch_enabled: bool = False
+
     # Retry tuning for 429 (rate-limit) responses.
     max_retry_attempts: int = Field(default=5, ge=1)
     max_retry_wait_ms: int = Field(default=30_000, ge=0)
@@ -254,6 +340,14 @@ class BackstopConfig(BaseSettings):
     # much smaller group walk does not, splitting this flag is the next step.
     custom_field_schema_cache_enabled: bool = False
 
+    # Refresh a held custom-field schema from only the definitions modified since the last load,
+    # merged in, instead of re-walking all of them. Checked against the collection's total count
+    # and replaced by a full walk whenever it does not add up, and at least daily; see
+    # `CustomFieldsService`. Only meaningful with `custom_field_schema_cache_enabled`, since with
+    # nothing held every load is a full walk. `custom_field_schema_loads_total{source="delta"}`
+    # counts the walks it saved.
+    custom_field_delta_refresh_enabled: bool = False
+
     # How long a fetched opportunity-stage vocabulary stays usable. Seven rows on the instance
     # this was built against, and a stage is added about as often as a custom field, so the same
     # one-hour default and 24-hour cap apply. No cache flag: `OpportunityStagesService` does not
@@ -283,6 +377,81 @@ class BackstopConfig(BaseSettings):
     # `BACKSTOP_SYSTEM_USER_CACHE_ENABLED=true`.
     system_user_cache_enabled: bool = False
 
+    # Whether enabled catalog caches also keep their last good catalog in Postgres
+    # (`catalog_snapshots`), so a replica starting cold serves another's walk instead of making
+    # its own, and an aged catalog is re-walked by one replica rather than all of them. Only
+    # catalogs whose `*_cache_enabled` flag is on consult it. Off by default, like those flags,
+    # until `catalog_fetch_duration_seconds` says walks after restarts are worth saving.
+    catalog_snapshot_enabled: bool = False
+    # How long one replica's claim on re-walking an aged catalog holds off the others. They wait
+    # on it for at most this long, so it should cover a walk: a claimant that dies costs the
+    # waiters one lease before they walk for themselves.
+    catalog_snapshot_refresh_lease_seconds: float = Field(default=60.0, gt=0)
+
+    # How long past its TTL an enabled catalog cache is still served while a background task
+    # refreshes it (stale-while-revalidate). Inside the window no caller waits on a walk; past
+    # TTL + window the catalog is too old and the caller walks inline, as with the default of 0,
+    # which turns background refresh off. Applies to every catalog whose cache flag is on.
+    catalog_revalidate_window_minutes: int = Field(default=0, ge=0, le=24 * 60)
+
+    # A service credential to fill the catalogs with at startup, so the first tool call after a
+    # deploy does not pay for the walks. The one exception to "credentials are not configured
+    # here": it is read by the warm-up alone, never for a tool call, and should be a user who can
+    # see every custom field, tag and colleague. Warm-up is off unless both are set. Only
+    # catalogs whose cache is enabled are warmed, plus the opportunity stages, which always
+    # cache — warming a catalog that keeps nothing would be a walk thrown away.
+    catalog_warmup_username: str | None = None
+    catalog_warmup_api_token: SecretStr | None = None
+    # How long warm-up may run before what is still walking is cancelled. `/ready` answers 503
+    # until warm-up ends, so this is also the longest it can hold a new replica out of rotation.
+    catalog_warmup_budget_seconds: float = Field(default=30.0, gt=0)
+
+    # How long a party search's outcome (one match, or the candidates to choose from) is reused
+    # for the same user's same search, so a name repeated across tool calls skips quick-search
+    # and the `like` fallback. 0, the default, turns the cache off. Capped at an hour: this is
+    # also how long a renamed or merged party can still resolve the old way.
+    party_resolution_cache_ttl_seconds: float = Field(default=0.0, ge=0, le=60 * 60)
+    # How many outcomes the cache holds across all users before evicting least-recently-used.
+    party_resolution_cache_max_entries: int = Field(default=10_000, ge=1)
+
+    # Whether organization and people names are swept into a local trigram index, consulted in
+    # place of the `like` collection read when quick-search (prefix-anchored) finds nothing. Hits
+    # are re-read by id as the caller before they are offered, so the index never shows a user a
+    # party they cannot see. Off by default until `party_name_index_lookups_total` is measured
+    # against how often the `like` fallback runs.
+    party_name_index_enabled: bool = False
+    # How many names the index holds before evicting the least recently seen. A tenant with more
+    # organizations or people than this never completes a sweep, and so never uses the index.
+    party_name_index_max_names: int = Field(default=50_000, ge=1)
+    # How long a sweep keeps the index authoritative. Also how long a new party can go unseen by
+    # a search quick-search misses.
+    party_name_index_sweep_minutes: int = Field(default=360, ge=1)
+
+    # How long `get_people_for_party` keeps an organization's walked `entityRelationships`, per
+    # user, before walking them again (see
+    # `features/org_people/organization_relationships_cache.py`). Inside it, a listing first
+    # makes two one-row reads — any relationship modified after the newest one kept, and the
+    # relationship count — and only walks again when either moved. 0, the default, turns the
+    # cache off. Capped at a day: it is also how long an edit those reads cannot see, such as a
+    # renamed relationship type, can go unnoticed.
+    org_relationships_cache_ttl_seconds: float = Field(default=0.0, ge=0, le=24 * 60 * 60)
+    # How many (user, organization) walks the cache holds before evicting least-recently-used.
+    org_relationships_cache_max_entries: int = Field(default=1_000, ge=1)
+
+    # `get_accounts_for_party`'s documented fallback — the `/accounts` walk plus two series reads
+    # per owned account, run when the account-table endpoint fails (see
+    # `features/accounts/fetch_holdings.py`). The series reads go through a fixed pool of
+    # `max_concurrent_requests_per_user` workers, balances before shares, and stop at this many
+    # per call: a party with more accounts than that gets the remaining figures as
+    # `figure_errors` rather than a call that runs past the client's timeout.
+    holdings_fallback_series_budget: int = Field(default=400, ge=1)
+    # How long each account's latest series figure is reused, per user, by that fallback. 0, the
+    # default, turns it off. Nothing checks a kept figure before reuse, so it is capped at 15
+    # minutes: this is how long a newly posted balance can go unseen.
+    holding_figures_cache_ttl_seconds: float = Field(default=0.0, ge=0, le=15 * 60)
+    # How many (user, account, series) figures that cache holds before evicting least-recently-used.
+    holding_figures_cache_max_entries: int = Field(default=20_000, ge=1)
+
     # Which entity-relationship types mean employment, and which of those mean it has ended,
     # for departed-contact detection (UN-23678). Comma-separated env values. Ids match a type id
     # exactly; markers match case-insensitively as substrings of the type's name.
@@ -348,6 +517,26 @@ class ActivityHistoryConfig(BaseSettings):
     page_size: int = Field(default=10, gt=0)
     gist_chars: int = Field(default=300, gt=0)
 
+    # `get_activity_detail` bodies, kept converted by the record's `modifiedTimestamp` (see
+    # `features/activity_history/activity_body_cache.py`). A repeat open then costs one sparse
+    # version read as the caller — which is also the permission check — instead of the whole
+    # detail record plus a markdownify run. `detail_cache_max_bytes` bounds this process's copy
+    # and 0 (the default) turns the cache off, the Postgres tier included. The Postgres tier
+    # (`activity_bodies`) is shared by replicas and survives restarts; it is off unless
+    # `detail_store_enabled`, and `detail_store_max_bytes` bounds it per Backstop tenant.
+    detail_cache_max_bytes: int = Field(default=0, ge=0)
+    detail_store_enabled: bool = False
+    detail_store_max_bytes: int = Field(default=256 * 1024 * 1024, gt=0)
+
+    # How many effective-date sub-windows a `search_activities` aggregate may be read as (see
+    # `features/activity_history/scan_entity_activities.py`). `POST /entity-activities` stops at
+    # 10000 rows per search, so a window at that wall is halved and each half searched on its
+    # own, until every piece is under it or this many are planned. Above 1 this also lets an
+    # aggregate run as a wide sweep (no party, tag or author), which is otherwise refused as
+    # sure to hit the wall. It bounds memory too: up to this × 10000 rows are held at once.
+    # 1, the default, never splits.
+    search_max_windows: int = Field(default=1, ge=1, le=64)
+
 
 class DatabaseConfig(BaseSettings):
     """Where backstop-mcp stores OAuth clients/tokens and encrypted Backstop credentials.
@@ -453,6 +642,19 @@ class AuthConfig(BaseSettings):
     # makes it a credential-testing oracle for anyone who can start an OAuth flow.
     login_max_attempts: int = Field(default=10, ge=1)
     login_attempt_window_minutes: int = Field(default=15, ge=1)
+    # The limit counts failures in compact per-username buckets; this additionally keeps a raw
+    # `login_attempts` row per failure, with its source IP, for diagnosis. Off by default: during
+    # a spraying burst it is the one write whose volume follows the attack.
+    login_attempt_audit_enabled: bool = False
+
+    # In-process cache of validated access tokens and decrypted Backstop credentials (see
+    # `auth/auth_cache.py`), so a repeat tool call skips the two Postgres reads and the decrypt
+    # on its auth path. Revokes, refresh rotations and logins invalidate it at once, on every
+    # replica through Postgres LISTEN/NOTIFY; the TTL bounds what a lost notification can cost,
+    # which is why it is capped well under the 15-minute access-token lifetime. 0 (the
+    # default) is off.
+    access_cache_ttl_seconds: float = Field(default=0.0, ge=0, le=300)
+    access_cache_max_entries: int = Field(default=10_000, ge=1)
 
     @property
     def token_retention(self) -> timedelta:
@@ -470,6 +672,10 @@ class AuthConfig(BaseSettings):
     def login_attempt_window(self) -> timedelta:
         return timedelta(minutes=self.login_attempt_window_minutes)
 
+    @property
+    def access_cache_ttl(self) -> timedelta:
+        return timedelta(seconds=self.access_cache_ttl_seconds)
+
 
 class EncryptionConfig(BaseSettings):
     """Key used to encrypt Backstop credentials (username + personal API token) at rest."""
@@ -12,18 +12,26 @@ from backstop_mcp.db.engine import (
     transaction,
 )
 from backstop_mcp.db.models import (
+    ActivityBody,
     AuthorizationCode,
     BackstopCredential,
+    CatalogSnapshot,
+    GateLease,
     LoginAttempt,
+    LoginFailureBucket,
     OAuthClient,
     OAuthToken,
     PendingAuthorization,
 )
 
 __all__ = [
+    "ActivityBody",
     "AuthorizationCode",
     "BackstopCredential",
+    "CatalogSnapshot",
+    "GateLease",
     "LoginAttempt",
+    "LoginFailureBucket",
     "OAuthClient",
     "OAuthToken",
     "PendingAuthorization",
@@ -0,0 +1,37 @@
+"""add login failure buckets
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "a7b8c9d0e1f2"
+down_revision: str | Sequence[str] | None = "f6a7b8c9d0e1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "login_failure_buckets",
+        sa.Column("username", sa.String(), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("failures", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("username", "bucket_start"),
+    )
+    # The primary key serves the throttle's `username = ? AND bucket_start > ?` sum and the
+    # upsert's conflict target; `bucket_start` alone serves the cleanup sweep's range delete.
+    op.create_index(
+        "ix_login_failure_buckets_bucket_start", "login_failure_buckets", ["bucket_start"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_login_failure_buckets_bucket_start", table_name="login_failure_buckets")
+    op.drop_table("login_failure_buckets")
@@ -0,0 +1,46 @@
+"""add activity bodies
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "b8c9d0e1f2a3"
+down_revision: str | Sequence[str] | None = "a7b8c9d0e1f2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "activity_bodies",
+        sa.Column("tenant", sa.String(), nullable=False),
+        sa.Column("resource_id", sa.String(), nullable=False),
+        sa.Column("version", sa.String(), nullable=False),
+        sa.Column("format_version", sa.String(), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("size_bytes", sa.Integer(), nullable=False),
+        sa.Column(
+            "last_used_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("tenant", "resource_id", "version"),
+    )
+    # Serves eviction's running total of `size_bytes`, most recently used first, per tenant.
+    op.create_index(
+        "ix_activity_bodies_tenant_last_used_at", "activity_bodies", ["tenant", "last_used_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_activity_bodies_tenant_last_used_at", table_name="activity_bodies")
+    op.drop_table("activity_bodies")
@@ -0,0 +1,46 @@
+"""add gate leases
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "e5f6a7b8c9d0"
+down_revision: str | Sequence[str] | None = "d4e5f6a7b8c9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "gate_leases",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("username", sa.String(), nullable=False),
+        sa.Column("holder", sa.String(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "acquired_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    # An acquire counts one username's live leases after purging its expired ones, so both
+    # statements are served by this one composite.
+    op.create_index(
+        "ix_gate_leases_username_expires_at",
+        "gate_leases",
+        ["username", "expires_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_gate_leases_username_expires_at", table_name="gate_leases")
+    op.drop_table("gate_leases")
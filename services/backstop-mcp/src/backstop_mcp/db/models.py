@@ -8,6 +8,7 @@ from sqlalchemy import (
     Float,
     ForeignKey,
     Index,
+    Integer,
     LargeBinary,
     String,
     func,
@@ -135,9 +136,9 @@ class LoginAttempt(Base):
     Only failures are recorded, and a successful login deletes the username's rows — so a
     legitimate user who mistypes twice and then succeeds carries no penalty.
 
-    Rows rather than a counter column: a counter needs a window boundary baked in at write time,
-    while rows let the window be a pure read (`attempted_at >= now - window`) and make the limit
-    hold across replicas without any coordination. `auth/cleanup.py` purges old rows.
+    No longer what the throttle counts — that is `LoginFailureBucket`, which stays a handful of
+    rows however many attempts arrive. These rows are the optional raw audit trail, written only
+    when `AUTH_LOGIN_ATTEMPT_AUDIT_ENABLED` is set. `auth/cleanup.py` purges old rows.
 
     `source_ip` is recorded for diagnosis only and is deliberately *not* rate-limited on — see
     `auth/throttle.py` for why.
@@ -158,3 +159,109 @@ class LoginAttempt(Base):
     username: Mapped[str] = mapped_column(String)
     source_ip: Mapped[str | None] = mapped_column(String, nullable=True)
     attempted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+class LoginFailureBucket(Base):
+    """Failed Backstop login submissions for one username within one slice of time.
+
+    What the login throttle counts (see `auth/throttle.py`). A failure is an upsert that bumps
+    its bucket's `failures`, so an attack's volume grows a counter rather than the table, and
+    the window check sums a bounded handful of rows under the primary key whatever that volume
+    is. `bucket_start` alone is indexed for `auth/cleanup.py`'s range delete.
+
+    `LoginAttempt` rows are now only written when the raw audit trail is switched on.
+    """
+
+    __tablename__: str = "login_failure_buckets"
+
+    # Kept in step with `migrations/versions/a7b8c9d0e1f2_add_login_failure_buckets.py`.
+    __table_args__: tuple[Index, ...] = (
+        Index("ix_login_failure_buckets_bucket_start", "bucket_start"),
+    )
+
+    username: Mapped[str] = mapped_column(String, primary_key=True)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    failures: Mapped[int] = mapped_column(Integer)
+
+
+class GateLease(Base):
+    """One in-flight Backstop request holding one of a user's concurrency slots.
+
+    The cross-replica half of the per-user gate (see `backstop_client/postgres_gate.py`): a
+    user's live leases are their requests in flight across every replica, so a new one is only
+    inserted while fewer than the cap exist. `expires_at` is what keeps a crashed replica from
+    stranding slots — the holder renews it while the request runs, and an acquire deletes the
+    user's expired rows before counting. `holder` is the replica's hostname, for diagnosis.
+    """
+
+    __tablename__: str = "gate_leases"
+
+    # Kept in step with the index created in
+    # `migrations/versions/e5f6a7b8c9d0_add_gate_leases.py`: both the count and the expiry purge
+    # an acquire runs are `username = ?`, the latter narrowed by `expires_at`.
+    __table_args__: tuple[Index, ...] = (
+        Index("ix_gate_leases_username_expires_at", "username", "expires_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    username: Mapped[str] = mapped_column(String)
+    holder: Mapped[str] = mapped_column(String)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    acquired_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+
+class CatalogSnapshot(Base):
+    """The last good copy of one `CachedCatalog`, per Backstop tenant, shared by every replica.
+
+    See `catalog_snapshot_store.py`. `payload` is the catalog's `{id: dto}` map as JSON, written
+    only by a successful walk, so a row with a payload is always a complete catalog;
+    `schema_version` fingerprints the DTO it was dumped from, and a reader expecting another one
+    ignores the row rather than misreading it. `refresh_claimed_until` is how replicas agree on
+    which of them walks when the snapshot ages out — a row can carry a claim before it has ever
+    carried a payload, which is why those columns are nullable.
+    """
+
+    __tablename__: str = "catalog_snapshots"
+
+    tenant: Mapped[str] = mapped_column(String, primary_key=True)
+    catalog: Mapped[str] = mapped_column(String, primary_key=True)
+    schema_version: Mapped[str | None] = mapped_column(String, nullable=True)
+    payload: Mapped[dict[str, object] | None] = mapped_column(JSONB, nullable=True)
+    fetched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    refresh_claimed_until: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+class ActivityBody(Base):
+    """One activity's converted detail record, at one version, per Backstop tenant.
+
+    The Postgres tier under `ActivityBodyCache` (see `activity_body_store.py` in the
+    activity-history feature). Keyed by what identifies the content rather than who read it —
+    the record's resource id and its `modifiedTimestamp` in ISO form — so an edit is a new key
+    and a row never needs invalidating; every caller re-reads the version themselves before a
+    row is served. `format_version` fingerprints the DTO `payload` was dumped from.
+    `size_bytes` and `last_used_at` are what eviction sums and orders by.
+    """
+
+    __tablename__: str = "activity_bodies"
+
+    # Kept in step with `migrations/versions/b8c9d0e1f2a3_add_activity_bodies.py`.
+    __table_args__: tuple[Index, ...] = (
+        Index("ix_activity_bodies_tenant_last_used_at", "tenant", "last_used_at"),
+    )
+
+    tenant: Mapped[str] = mapped_column(String, primary_key=True)
+    resource_id: Mapped[str] = mapped_column(String, primary_key=True)
+    version: Mapped[str] = mapped_column(String, primary_key=True)
+    format_version: Mapped[str] = mapped_column(String)
+    payload: Mapped[dict[str, object]] = mapped_column(JSONB)
+    size_bytes: Mapped[int] = mapped_column(Integer)
+    last_used_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
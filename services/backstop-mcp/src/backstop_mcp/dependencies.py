@@ -4,6 +4,7 @@ Releasing them is `teardown.close_singletons()`, which lives in its own module s
 the feature-owned providers without this one importing `features/` back.
 """
 
+from datetime import timedelta
 from functools import lru_cache
 
 from fastmcp.dependencies import Depends
@@ -13,8 +14,11 @@ from backstop_mcp.backstop_client import (
     BackstopClient,
     BackstopClientFactory,
     BackstopTransportSettings,
+    PostgresSharedGate,
     RetrySettings,
+    SharedGate,
 )
+from backstop_mcp.catalog_snapshot_store import CatalogSnapshotStore
 from backstop_mcp.config import (
     ActivityHistoryConfig,
     AppConfig,
@@ -22,9 +26,11 @@ from backstop_mcp.config import (
     BackstopConfig,
     DatabaseConfig,
     EncryptionConfig,
+    GateBackend,
 )
 from backstop_mcp.db import create_engine, create_session_factory
 from backstop_mcp.features.auth import (
+    AuthCache,
     BackstopAuthContext,
     BackstopOAuthProvider,
     ThrottleConfig,
@@ -77,10 +83,19 @@ def get_encryption_key() -> bytes:
     return load_key(get_encryption_config())
 
 
+@lru_cache(maxsize=1)
+def get_auth_cache() -> AuthCache | None:
+    config = get_auth_config()
+    if config.access_cache_ttl_seconds == 0:
+        return None
+    return AuthCache(ttl=config.access_cache_ttl, max_entries=config.access_cache_max_entries)
+
+
 @lru_cache(maxsize=1)
 def get_backstop_client_factory() -> BackstopClientFactory:
+    config = get_backstop_config()
     factory = BackstopClientFactory(
-        transport_settings(get_backstop_config()), retry_settings(get_backstop_config())
+        transport_settings(config), retry_settings(config), shared_gate=shared_gate(config)
     )
     factory.attach_auth(
         BackstopAuthContext(
@@ -89,6 +104,7 @@ def get_backstop_client_factory() -> BackstopClientFactory:
             # Deferred: get_auth_provider() needs this factory, so the hook looks the
             # provider up only when a mid-session 401 fires, after both caches are warm.
             revoke_tokens_for_subject=_revoke_subject_tokens,
+            cache=get_auth_cache(),
         )
     )
     return factory
@@ -111,7 +127,9 @@ def get_auth_provider() -> BackstopOAuthProvider:
         throttle=ThrottleConfig(
             max_attempts=auth_config.login_max_attempts,
             window=auth_config.login_attempt_window,
+            audit_attempts=auth_config.login_attempt_audit_enabled,
         ),
+        auth_cache=get_auth_cache(),
     )
 
 
@@ -133,6 +151,19 @@ def transport_settings(config: BackstopConfig) -> BackstopTransportSettings:
         default_timeout_seconds=config.default_timeout_seconds,
         reports_timeout_seconds=config.reports_timeout_seconds,
         max_concurrent_requests_per_user=config.max_concurrent_requests_per_user,
+        adaptive_concurrency_enabled=config.adaptive_concurrency_enabled,
+        adaptive_concurrency_latency_factor=config.adaptive_concurrency_latency_factor,
+        http2_enabled=config.http2_enabled,
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry_seconds=config.keepalive_expiry_seconds,
+        request_coalescing_enabled=config.request_coalescing_enabled,
+        response_cache_enabled=config.response_cache_enabled,
+        response_cache_max_bytes=config.response_cache_max_bytes,
+        response_cache_ttl_seconds=config.response_cache_ttl_seconds,
+        streaming_parse_enabled=config.streaming_parse_enabled,
+        parse_worker_threads=config.parse_worker_threads,
+        speculative_prefetch_enabled=config.speculative_prefetch_enabled,
         default_page_size=config.default_page_size,
         report_page_size=config.report_page_size,
         page_limit_param=config.page_limit_param,
@@ -140,6 +171,37 @@ def transport_settings(config: BackstopConfig) -> BackstopTransportSettings:
     )
 
 
+def shared_gate(config: BackstopConfig) -> SharedGate | None:
+    """The cross-replica half of the per-user gate, or `None` to count slots in-process only.
+
+    Built here rather than by the factory because the Postgres backend needs the session
+    factory, which the transport has no business constructing from config.
+    """
+    if config.concurrency_gate_backend is GateBackend.MEMORY:
+        return None
+    return PostgresSharedGate(
+        get_session_factory(),
+        limit=config.max_concurrent_requests_per_user,
+        lease_duration=timedelta(seconds=config.concurrency_gate_lease_seconds),
+        poll_interval=timedelta(milliseconds=config.concurrency_gate_poll_ms),
+    )
+
+
+def catalog_snapshot_store(config: BackstopConfig) -> CatalogSnapshotStore | None:
+    """The Postgres tier each `CachedCatalog` provider hands its catalog, or `None` for none.
+
+    Keyed by `base_url`, the tenant the in-memory catalogs are already scoped to. Not cached:
+    the store holds nothing but the session factory, and each provider asking builds its own.
+    """
+    if not config.catalog_snapshot_enabled:
+        return None
+    return CatalogSnapshotStore(
+        get_session_factory(),
+        tenant=config.base_url,
+        refresh_lease=timedelta(seconds=config.catalog_snapshot_refresh_lease_seconds),
+    )
+
+
 def retry_settings(config: BackstopConfig) -> RetrySettings:
     return RetrySettings(
         max_attempts=config.max_retry_attempts, max_wait_ms=config.max_retry_wait_ms
@@ -5,9 +5,17 @@ It does not use `resolve_party`: that path is `/quick-search`, which misses shor
 Account listing walks `/accounts` with `include=owner,investorType` (and `product` by party).
 Figures are `sort=-date` (first 10 rows) then `max(date)` — not a `filter[date][ge]` window —
 except `get_time_series`, which paginates the dated series.
+
+`fetch_holdings` reads the account-table endpoint and falls back to the documented walk, whose
+per-account series reads run through a bounded worker pool under a request budget
+(`HoldingsSettings`) and, when enabled, `HoldingFiguresCache`.
 """
 
 from backstop_mcp.features.accounts.api_responses import AccountApiResponse
+from backstop_mcp.features.accounts.dependencies import (
+    get_holding_figures_cache,
+    get_holdings_settings,
+)
 from backstop_mcp.features.accounts.fetch_accounts_for_party import fetch_accounts_for_party
 from backstop_mcp.features.accounts.fetch_accounts_for_product import fetch_accounts_for_product
 from backstop_mcp.features.accounts.fetch_capital_flows import (
@@ -31,6 +39,7 @@ from backstop_mcp.features.accounts.fetch_time_series import (
     fetch_time_series,
     require_series_for_entity,
 )
+from backstop_mcp.features.accounts.holding_figures_cache import HoldingFiguresCache
 from backstop_mcp.features.accounts.internal_dto import (
     ACCOUNT_SERIES,
     PRODUCT_SERIES,
@@ -42,6 +51,7 @@ from backstop_mcp.features.accounts.internal_dto import (
     HoldingFigureErrorDto,
     HoldingListingDto,
     HoldingRowDto,
+    HoldingsFallbackProgressDto,
     HoldingsSource,
     InvestorTypeDto,
     MoneyDto,
@@ -59,6 +69,7 @@ from backstop_mcp.features.accounts.responses import (
     AccountRowResponse,
     HoldingFigureErrorResponse,
     HoldingRowResponse,
+    HoldingsFallbackProgressResponse,
     MoneyResponse,
     PartyAccountsResolvedResponse,
     ProductAmbiguousResponse,
@@ -66,6 +77,7 @@ from backstop_mcp.features.accounts.responses import (
     ShareResponse,
     TimeSeriesResolvedResponse,
 )
+from backstop_mcp.features.accounts.settings import HoldingsSettings
 from backstop_mcp.features.accounts.split_open import split_open
 
 __all__ = [
@@ -80,9 +92,13 @@ __all__ = [
     "FALLBACK_OMITTED_FIELDS",
     "HoldingFigureErrorDto",
     "HoldingFigureErrorResponse",
+    "HoldingFiguresCache",
     "HoldingListingDto",
     "HoldingRowDto",
     "HoldingRowResponse",
+    "HoldingsFallbackProgressDto",
+    "HoldingsFallbackProgressResponse",
+    "HoldingsSettings",
     "HoldingsSource",
     "HoldingsTableShapeError",
     "InvestorTypeDto",
@@ -112,6 +128,8 @@ __all__ = [
     "fetch_product",
     "fetch_product_catalog",
     "fetch_time_series",
+    "get_holding_figures_cache",
+    "get_holdings_settings",
     "require_series_for_entity",
     "resolve_product",
     "resolve_product_query",
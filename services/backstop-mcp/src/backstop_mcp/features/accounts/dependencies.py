@@ -0,0 +1,26 @@
+from datetime import timedelta
+from functools import lru_cache
+
+from backstop_mcp.dependencies import get_backstop_config
+from backstop_mcp.features.accounts.holding_figures_cache import HoldingFiguresCache
+from backstop_mcp.features.accounts.settings import HoldingsSettings
+
+
+def get_holdings_settings() -> HoldingsSettings:
+    config = get_backstop_config()
+    return HoldingsSettings(
+        fallback_series_workers=config.max_concurrent_requests_per_user,
+        fallback_series_budget=config.holdings_fallback_series_budget,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_holding_figures_cache() -> HoldingFiguresCache | None:
+    """The process-wide fallback figure cache, or `None` while its TTL is 0 (the default)."""
+    config = get_backstop_config()
+    if not config.holding_figures_cache_ttl_seconds:
+        return None
+    return HoldingFiguresCache(
+        max_entries=config.holding_figures_cache_max_entries,
+        ttl=timedelta(seconds=config.holding_figures_cache_ttl_seconds),
+    )
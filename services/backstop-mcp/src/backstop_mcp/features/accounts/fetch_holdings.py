@@ -22,13 +22,21 @@ and are named in `omitted_fields` so the answer cannot be read as "this party ha
 `fundedDate` rather than the same field.
 
 **Cost.** Table-data is 1 request. The fallback is ~9 parallel pages (measured: 9.1s/4.3 MiB for
-this instance's 815 accounts) plus 2 series requests per *owned* account — which is affordable
-only because a party owns a handful of them. It is never run product-wide.
+this instance's 815 accounts) plus 2 series requests per *owned* account. Those series reads are
+one 10-row page each, so there is no total to page in parallel by; they go through a fixed pool of
+`fallback_series_workers` instead of a task per read — more would only queue at the per-user gate
+— and stop at `fallback_series_budget` requests. They run a figure at a time, every balance before
+any share-of-product, so a party with hundreds of accounts that hits the budget still gets the
+figure it was most likely asked about. What was left unread is a `figure_errors` entry on its row
+and a count in `fallback_progress`. `HoldingFiguresCache`, when enabled, serves a figure read
+moments ago without a request at all. The fallback is never run product-wide.
 """
 
 import asyncio
 import logging
-from collections.abc import Sequence
+from collections import deque
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 
 from backstop_mcp.backstop_client import (
     BackstopAuthError,
@@ -38,24 +46,31 @@ from backstop_mcp.backstop_client import (
 from backstop_mcp.features.accounts.fetch_accounts_for_party import fetch_accounts_for_party
 from backstop_mcp.features.accounts.fetch_holdings_table import fetch_holdings_table
 from backstop_mcp.features.accounts.fetch_series import fetch_series
+from backstop_mcp.features.accounts.holding_figures_cache import HoldingFiguresCache
 from backstop_mcp.features.accounts.internal_dto import (
     AccountRecordDto,
     HoldingFigureErrorDto,
     HoldingListingDto,
     HoldingRowDto,
+    HoldingsFallbackProgressDto,
     MoneyDto,
     SeriesFigureDto,
     ShareDto,
 )
+from backstop_mcp.features.accounts.settings import HoldingsSettings
 
 logger = logging.getLogger(__name__)
 
-_BALANCE_SERIES = "values"
-_SHARE_SERIES = "percentageOfFundHistory"
+_BALANCE = "balance"
+_SHARE = "percentage_of_product"
 
 # The row field each fallback series fills, used for both the request and the error label so a
-# failure names what the caller is missing rather than the upstream series.
-_FALLBACK_FIGURES: tuple[str, ...] = ("balance", "percentage_of_product")
+# failure names what the caller is missing rather than the upstream series. In read order: every
+# account's balance is read before any account's share-of-product.
+_FALLBACK_SERIES: tuple[tuple[str, str], ...] = (
+    (_BALANCE, "values"),
+    (_SHARE, "percentageOfFundHistory"),
+)
 
 # Carried on every fallback answer so a missing figure reads as "not available on this path"
 # rather than as "zero". These are field names, not prose: the response layer turns them into the
@@ -78,11 +93,14 @@ async def fetch_holdings(
     *,
     owner_id: str,
     include_closed: bool = False,
+    settings: HoldingsSettings | None = None,
+    figures_cache: HoldingFiguresCache | None = None,
 ) -> HoldingListingDto:
     """A party's holdings with figures, from whichever path is available.
 
     `owner_id` should be a resolved party id; an unresolved one returns "owns nothing" rather
-    than an error, and neither path can tell the difference. See the module docstring.
+    than an error, and neither path can tell the difference. `settings` and `figures_cache` only
+    shape the fallback's series reads. See the module docstring.
     """
     try:
         return await fetch_holdings_table(client, entity_id=owner_id, include_closed=include_closed)
@@ -101,7 +119,11 @@ async def fetch_holdings(
             extra={"owner_id": owner_id, "error": f"{type(exc).__name__}: {exc}"},
         )
     return await _fetch_documented_holdings(
-        client, owner_id=owner_id, include_closed=include_closed
+        client,
+        owner_id=owner_id,
+        include_closed=include_closed,
+        settings=settings or HoldingsSettings(),
+        figures_cache=figures_cache,
     )
 
 
@@ -110,29 +132,31 @@ async def _fetch_documented_holdings(
     *,
     owner_id: str,
     include_closed: bool,
+    settings: HoldingsSettings,
+    figures_cache: HoldingFiguresCache | None,
 ) -> HoldingListingDto:
     listing = await fetch_accounts_for_party(
         client, owner_id=owner_id, include_closed=include_closed
     )
-    # `return_exceptions` so one row raising does not leave its siblings unawaited; the first
-    # failure is then re-raised deliberately.
-    settled = await asyncio.gather(
-        *(_row_with_figures(client, account) for account in listing.accounts),
-        return_exceptions=True,
+    outcomes, progress = await _read_series_figures(
+        client, listing.accounts, settings=settings, cache=figures_cache
+    )
+    logger.info(
+        "accounts.holdings.fallback_series_read",
+        extra={"owner_id": owner_id, **progress.model_dump()},
     )
-    rows: list[HoldingRowDto] = []
-    for result in settled:
-        if isinstance(result, BaseException):
-            raise result
-        rows.append(result)
     return HoldingListingDto(
-        rows=tuple(rows),
+        rows=tuple(
+            _row_with_figures(account, outcomes, budget=progress.budget)
+            for account in listing.accounts
+        ),
         closed_omitted=listing.closed_omitted,
         open_count=sum(1 for account in listing.accounts if account.is_open),
         all_count=len(listing.accounts) + listing.closed_omitted,
         closed_count=_closed_count(listing.accounts, closed_omitted=listing.closed_omitted),
         source="accounts-api",
         omitted_fields=FALLBACK_OMITTED_FIELDS,
+        fallback_progress=progress,
     )
 
 
@@ -146,32 +170,120 @@ def _closed_count(accounts: Sequence[AccountRecordDto], *, closed_omitted: int)
     return closed_omitted + sum(1 for account in accounts if not account.is_open)
 
 
-async def _row_with_figures(client: BackstopClient, account: AccountRecordDto) -> HoldingRowDto:
-    """One documented row. A failed series omits that figure; a failed auth aborts the fan-out."""
-    results = await asyncio.gather(
-        _series_figure(client, account.id, _BALANCE_SERIES),
-        _series_figure(client, account.id, _SHARE_SERIES),
-        return_exceptions=True,
+type _Outcome = SeriesFigureDto | None | Exception
+
+
+@dataclass(frozen=True, slots=True)
+class _SeriesRead:
+    account_id: str
+    figure: str
+    series: str
+
+
+async def _read_series_figures(
+    client: BackstopClient,
+    accounts: Sequence[AccountRecordDto],
+    *,
+    settings: HoldingsSettings,
+    cache: HoldingFiguresCache | None,
+) -> tuple[dict[tuple[str, str], _Outcome], HoldingsFallbackProgressDto]:
+    """Every account's fallback figures by (account id, figure), read through a worker pool.
+
+    A figure absent from the result was skipped for the budget. A failed read is kept as its
+    exception so the row can say why the figure is missing; a failed auth aborts every worker.
+    """
+    outcomes: dict[tuple[str, str], _Outcome] = {}
+    queue: deque[_SeriesRead] = deque()
+    for figure, series in _FALLBACK_SERIES:
+        for account in accounts:
+            kept = cache.get(client, account_id=account.id, series=series) if cache else None
+            if kept is not None:
+                outcomes[account.id, figure] = kept
+            else:
+                queue.append(_SeriesRead(account_id=account.id, figure=figure, series=series))
+    cached = len(outcomes)
+    skipped = max(0, len(queue) - settings.fallback_series_budget)
+    for _ in range(skipped):
+        _ = queue.pop()
+    requested = len(queue)
+    failed = 0
+
+    async def worker() -> None:
+        nonlocal failed
+        while queue:
+            read = queue.popleft()
+            try:
+                figure = await _series_figure(client, read.account_id, read.series)
+            except BackstopAuthError:
+                raise
+            except Exception as exc:
+                # One series failing costs that figure, not the row: an account with a balance
+                # and no share-of-fund is still the answer to "what do they hold".
+                failed += 1
+                outcomes[read.account_id, read.figure] = exc
+                continue
+            if cache is not None:
+                cache.remember(
+                    client, account_id=read.account_id, series=read.series, figure=figure
+                )
+            outcomes[read.account_id, read.figure] = figure
+
+    workers = [
+        asyncio.create_task(worker())
+        for _ in range(min(settings.fallback_series_workers, requested))
+    ]
+    try:
+        _ = await asyncio.gather(*workers)
+    finally:
+        # An auth failure ends the call; the other workers' reads in flight are cancelled and
+        # awaited so none is left running for it.
+        for task in workers:
+            _ = task.cancel()
+        _ = await asyncio.gather(*workers, return_exceptions=True)
+    return outcomes, HoldingsFallbackProgressDto(
+        figures=len(_FALLBACK_SERIES) * len(accounts),
+        requested=requested,
+        cached=cached,
+        failed=failed,
+        skipped=skipped,
+        budget=settings.fallback_series_budget,
     )
-    figures: list[SeriesFigureDto | None] = []
+
+
+def _row_with_figures(
+    account: AccountRecordDto,
+    outcomes: Mapping[tuple[str, str], _Outcome],
+    *,
+    budget: int,
+) -> HoldingRowDto:
+    """One documented row. A failed or skipped series omits that figure and says why."""
+    figures: dict[str, SeriesFigureDto | None] = {}
     errors: list[HoldingFigureErrorDto] = []
-    for figure_name, result in zip(_FALLBACK_FIGURES, results, strict=True):
-        if isinstance(result, BackstopAuthError):
-            raise result
-        if isinstance(result, BaseException):
-            # One series failing costs that figure, not the row: an account with a balance and no
-            # share-of-fund is still the answer to "what do they hold". The reason is carried so
-            # the omission does not read as "Backstop publishes no number".
+    for figure_name, _ in _FALLBACK_SERIES:
+        key = (account.id, figure_name)
+        if key not in outcomes:
+            errors.append(
+                HoldingFigureErrorDto(
+                    figure=figure_name,
+                    message=f"not read: this call's budget of {budget} series requests was spent",
+                )
+            )
+            figures[figure_name] = None
+            continue
+        result = outcomes[key]
+        if isinstance(result, Exception):
+            # The reason is carried so the omission does not read as "Backstop publishes no
+            # number".
             message = f"{type(result).__name__}: {result}"
             logger.warning(
                 "accounts.holdings.fallback_series_failed",
                 extra={"account_id": account.id, "figure": figure_name, "error": message},
             )
             errors.append(HoldingFigureErrorDto(figure=figure_name, message=message))
-            figures.append(None)
+            figures[figure_name] = None
             continue
-        figures.append(result)
-    balance, share = figures
+        figures[figure_name] = result
+    balance, share = figures[_BALANCE], figures[_SHARE]
     return HoldingRowDto(
         account_id=account.id,
         product_id=account.product.id if account.product else None,
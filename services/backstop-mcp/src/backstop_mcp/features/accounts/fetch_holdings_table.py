@@ -32,7 +32,9 @@ lenient scalars in `api_responses.py` are what keep a renamed field from becomin
   came back — none of the JSON:API envelope carries meaning, so `AccountTableDataDocument` models
   the body directly.
 - **Paging params are ignored.** `page[limit]=2` still returned all 12 rows. The whole table
-  arrives in one unbounded payload; there is nothing to page and no way to bound it.
+  arrives in one unbounded payload; there is nothing to page and no way to bound it — except on
+  our side, which is why it is read through `get_document`: with streaming parse on, each row is
+  projected as it downloads and the payload is never held whole.
 - **Row order is not stable** across hosts, and there is no `sort` param. Order carries no
   meaning, so callers must sort in the projection rather than trusting position.
 - **`entityId` is polymorphic** — an organization id and a person id both work, and the row's
@@ -60,6 +62,7 @@ from backstop_mcp.backstop_client import BackstopClient
 from backstop_mcp.features.accounts.api_responses import (
     AccountTableDataAttributes,
     AccountTableDataDocument,
+    AccountTableRowAttributes,
 )
 from backstop_mcp.features.accounts.internal_dto import HoldingListingDto, HoldingRowDto
 
@@ -67,6 +70,7 @@ logger = logging.getLogger(__name__)
 
 _TABLE_DATA_PATH = "/bsg-account-table-data"
 _ENTITY_ID = "entityId"
+_ROWS_AT = ("data", 0, "attributes", "accounts")
 
 
 class HoldingsTableShapeError(Exception):
@@ -80,7 +84,18 @@ class HoldingsTableShapeError(Exception):
     """
 
 
-def _reject_contradictory_counts(table: AccountTableDataAttributes, *, entity_id: str) -> None:
+# A row as `fetch_holdings_table` keeps it: its projection, and the `closed` flag the counts
+# check needs. Kept instead of the wire row so a streamed table never holds the wire rows at all.
+type _ProjectedRow = tuple[bool, HoldingRowDto | None]
+
+
+def _project(row: AccountTableRowAttributes) -> _ProjectedRow:
+    return bool(row.closed), HoldingRowDto.from_attributes(row)
+
+
+def _reject_contradictory_counts(
+    table: AccountTableDataAttributes, projected: list[_ProjectedRow], *, entity_id: str
+) -> None:
     """Fail when the counts and the rows cannot both be true.
 
     Two shape changes this catches, both of which otherwise produce a confident wrong answer:
@@ -88,12 +103,12 @@ def _reject_contradictory_counts(table: AccountTableDataAttributes, *, entity_id
     (`closedCount` says 9, every row claims to be open). Counts are only compared when Backstop
     sent them; an endpoint that stops sending counts loses the checksum, not the answer.
     """
-    rows = len(table.accounts)
+    rows = len(projected)
     if table.all_count is not None and table.all_count != rows:
         raise HoldingsTableShapeError(
             f"table reported allCount={table.all_count} but sent {rows} rows for {entity_id}"
         )
-    closed_rows = sum(1 for row in table.accounts if row.closed)
+    closed_rows = sum(1 for closed, _ in projected if closed)
     if table.closed_count is not None and table.closed_count != closed_rows:
         raise HoldingsTableShapeError(
             f"table reported closedCount={table.closed_count}, "
@@ -117,15 +132,18 @@ async def fetch_holdings_table(
     whatever `BackstopClient` raises, plus `HoldingsTableShapeError`; the caller decides whether
     to fall back to the documented walk.
     """
-    document = await client.get(
+    document, projected = await client.get_document(
         _TABLE_DATA_PATH,
-        schema=AccountTableDataDocument,
+        envelope=AccountTableDataDocument,
+        items_at=_ROWS_AT,
+        items_of=lambda document: document.table.accounts,
+        item_schema=AccountTableRowAttributes,
+        project=_project,
         params={_ENTITY_ID: entity_id},
     )
     table = document.table
-    _reject_contradictory_counts(table, entity_id=entity_id)
-    projected = tuple(HoldingRowDto.from_attributes(row) for row in table.accounts)
-    rows = tuple(row for row in projected if row is not None)
+    _reject_contradictory_counts(table, projected, entity_id=entity_id)
+    rows = tuple(row for _, row in projected if row is not None)
     rows_dropped = len(projected) - len(rows)
     if rows_dropped:
         logger.warning(
@@ -0,0 +1,70 @@
+"""A short per-user memory of each account's latest series figure, for the holdings fallback.
+
+`fetch_holdings`' documented walk reads two series per owned account, and for a party with
+hundreds of accounts those reads are nearly all of the call. The same party asked about twice in
+a conversation would read every one of them again, although month-end figures do not move between
+two questions a minute apart. `HoldingFiguresCache` keeps each (account, series) latest figure for
+a short `ttl` so the repeat is served without them.
+
+Nothing here checks whether a kept figure has changed — a series read *is* the check — so the
+TTL is the whole staleness bound and is kept short. Only a figure that carries a dated point is
+kept: an empty series is exactly the one whose first number is about to land. Keyed by username
+first, as `PartyResolutionCache` explains.
+"""
+
+import time
+from collections import OrderedDict
+from datetime import timedelta
+
+from backstop_mcp.backstop_client import BackstopClient
+from backstop_mcp.features.accounts.internal_dto import SeriesFigureDto
+from backstop_mcp.metrics import HOLDING_FIGURES_CACHE_LOOKUPS
+
+type _Key = tuple[str, str, str]
+
+
+class HoldingFiguresCache:
+    """Bounded LRU of latest series figures by (user, account, series). See the module docstring."""
+
+    def __init__(self, *, max_entries: int, ttl: timedelta) -> None:
+        self._max_entries: int = max_entries
+        self._ttl_seconds: float = ttl.total_seconds()
+        self._entries: OrderedDict[_Key, tuple[float, SeriesFigureDto]] = OrderedDict()
+
+    def get(
+        self, client: BackstopClient, *, account_id: str, series: str
+    ) -> SeriesFigureDto | None:
+        """The kept figure while it is younger than `ttl`; else `None`."""
+        key = (client.username, account_id, series)
+        entry = self._entries.get(key)
+        if entry is None:
+            HOLDING_FIGURES_CACHE_LOOKUPS.add(1, {"outcome": "miss"})
+            return None
+        stored_at, figure = entry
+        if time.monotonic() - stored_at > self._ttl_seconds:
+            del self._entries[key]
+            HOLDING_FIGURES_CACHE_LOOKUPS.add(1, {"outcome": "expired"})
+            return None
+        self._entries.move_to_end(key)
+        HOLDING_FIGURES_CACHE_LOOKUPS.add(1, {"outcome": "hit"})
+        return figure
+
+    def remember(
+        self,
+        client: BackstopClient,
+        *,
+        account_id: str,
+        series: str,
+        figure: SeriesFigureDto | None,
+    ) -> None:
+        """Keep a freshly read figure — unless the series had no point to keep."""
+        if figure is None:
+            return
+        key = (client.username, account_id, series)
+        self._entries[key] = (time.monotonic(), figure)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            _ = self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
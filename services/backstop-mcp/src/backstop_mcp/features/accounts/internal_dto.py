@@ -36,6 +36,7 @@ __all__ = [
     "HoldingFigureErrorDto",
     "HoldingListingDto",
     "HoldingRowDto",
+    "HoldingsFallbackProgressDto",
     "HoldingsSource",
     "InvestorTypeDto",
     "MoneyDto",
@@ -455,6 +456,25 @@ class HoldingRowDto(BaseModel):
         )
 
 
+class HoldingsFallbackProgressDto(BaseModel):
+    """How far the documented walk's series reads got, against the budget they were given.
+
+    `figures` is every series figure the listing needed, two per account. Each is then exactly one
+    of `cached` (served from `HoldingFiguresCache`), `requested` (read — `failed` of those raised),
+    or `skipped` (left unread once `budget` requests were spent), so a caller can tell a complete
+    listing from a truncated one without counting `figure_errors`.
+    """
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True)
+
+    figures: int
+    requested: int
+    cached: int = 0
+    failed: int = 0
+    skipped: int = 0
+    budget: int
+
+
 class HoldingListingDto(BaseModel):
     """A party's holdings after the open/closed split.
 
@@ -466,6 +486,7 @@ class HoldingListingDto(BaseModel):
     `source` and `omitted_fields` are facts about which path produced this, not the sentence a
     caller reads: the response layer turns them into the caveat the model is shown. `omitted_fields`
     is empty on the table path and names what the documented walk cannot produce on the other.
+    `fallback_progress` is set only on the documented walk.
     """
 
     model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True)
@@ -478,6 +499,7 @@ class HoldingListingDto(BaseModel):
     open_count: int | None = None
     all_count: int | None = None
     closed_count: int | None = None
+    fallback_progress: HoldingsFallbackProgressDto | None = None
 
 
 class SeriesPointDto(BaseModel):
@@ -8,6 +8,7 @@ resolution, and the closed-account hint; `party_accounts`, `product_investors`,
 from backstop_mcp.features.accounts.responses.party_accounts import (
     HoldingFigureErrorResponse,
     HoldingRowResponse,
+    HoldingsFallbackProgressResponse,
     MoneyResponse,
     PartyAccountsResolvedResponse,
     ShareResponse,
@@ -34,6 +35,7 @@ __all__ = [
     "AccountRowResponse",
     "HoldingFigureErrorResponse",
     "HoldingRowResponse",
+    "HoldingsFallbackProgressResponse",
     "InvestorQualificationResponse",
     "InvestorTypeResponse",
     "MoneyResponse",
@@ -14,6 +14,7 @@ from pydantic import Field
 from backstop_mcp.features.accounts.internal_dto import (
     HoldingListingDto,
     HoldingRowDto,
+    HoldingsFallbackProgressDto,
     MoneyDto,
     ShareDto,
 )
@@ -86,8 +87,45 @@ class ShareResponse(OmitNoneModel):
 class HoldingFigureErrorResponse(OmitNoneModel):
     """A figure that could not be fetched, and why."""
 
-    figure: str = Field(description="Which field is missing because its request failed.")
-    message: str = Field(description="The upstream failure, for the caller to relay or retry.")
+    figure: str = Field(
+        description="Which field is missing because its request failed or was never sent."
+    )
+    message: str = Field(
+        description=(
+            "The upstream failure, for the caller to relay or retry — or `not read`, when this "
+            "call's series budget ran out before this figure was reached."
+        )
+    )
+
+
+class HoldingsFallbackProgressResponse(OmitNoneModel):
+    """How much of the documented fallback's per-account series reading was done."""
+
+    figures: int = Field(description="Series figures the listing needed: two per account.")
+    requested: int = Field(description="Series requests this call sent to Backstop.")
+    cached: int = Field(description="Figures served from a read made moments earlier.")
+    failed: int = Field(description="Requests that failed; each is in its row's `figure_errors`.")
+    skipped: int = Field(
+        description=(
+            "Figures left unread because `budget` was spent — balances are read before shares, "
+            "so shares go first. Non-zero means the listing is incomplete: ask about fewer "
+            "accounts, or read one account's figures with `get_time_series`."
+        )
+    )
+    budget: int = Field(description="The most series requests one call may send.")
+
+    @classmethod
+    def from_dto(cls, progress: HoldingsFallbackProgressDto | None) -> Self | None:
+        if progress is None:
+            return None
+        return cls(
+            figures=progress.figures,
+            requested=progress.requested,
+            cached=progress.cached,
+            failed=progress.failed,
+            skipped=progress.skipped,
+            budget=progress.budget,
+        )
 
 
 class HoldingRowResponse(OmitNoneModel):
@@ -263,6 +301,13 @@ class PartyAccountsResolvedResponse(OmitNoneModel):
             "skipped. Non-zero means its shape has moved and this listing is incomplete."
         ),
     )
+    fallback_progress: HoldingsFallbackProgressResponse | None = Field(
+        default=None,
+        description=(
+            "Only when `source` is `accounts-api`: the per-account series reads against this "
+            "call's request budget. Check `skipped` before treating a missing figure as absent."
+        ),
+    )
 
     @classmethod
     def from_holdings(cls, listing: HoldingListingDto, *, resolved: ResolvedPartyResponse) -> Self:
@@ -285,4 +330,5 @@ class PartyAccountsResolvedResponse(OmitNoneModel):
                 subject="party",
             ),
             rows_dropped=listing.rows_dropped or None,
+            fallback_progress=HoldingsFallbackProgressResponse.from_dto(listing.fallback_progress),
         )
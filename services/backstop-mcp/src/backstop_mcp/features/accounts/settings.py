@@ -0,0 +1,19 @@
+"""What the holdings fallback needs to know, as its own type.
+
+`config.BackstopConfig` is the env-parsing shape; `get_holdings_settings` translates it into this,
+so the feature takes a domain type rather than the env-parsing shape.
+"""
+
+from typing import ClassVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class HoldingsSettings(BaseModel):
+    """How many fallback series reads run at once, and how many one call may make."""
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True)
+
+    # More workers than the per-user gate admits would only queue at the gate.
+    fallback_series_workers: int = Field(default=5, ge=1)
+    fallback_series_budget: int = Field(default=400, ge=1)
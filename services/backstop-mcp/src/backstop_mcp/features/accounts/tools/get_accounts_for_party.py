@@ -26,15 +26,23 @@ from pydantic import Field
 from backstop_mcp.backstop_client import BackstopApiError, BackstopClient
 from backstop_mcp.dependencies import get_backstop_client
 from backstop_mcp.features.accounts import (
+    HoldingFiguresCache,
+    HoldingsSettings,
     PartyAccountsResolvedResponse,
     fetch_holdings,
+    get_holding_figures_cache,
+    get_holdings_settings,
 )
 from backstop_mcp.features.entity_types import SearchType
 from backstop_mcp.features.party_resolver import (
     PartyAmbiguousResponse,
+    PartyNameIndex,
+    PartyResolutionCache,
     ResolvedPartyDto,
     ResolvedPartyResponse,
     fetch_party_name,
+    get_party_name_index,
+    get_party_resolution_cache,
     resolve_party,
     unresolved_party_response,
 )
@@ -100,6 +108,10 @@ async def get_accounts_for_party(
         ),
     ] = False,
     client: BackstopClient = Depends(get_backstop_client),
+    party_resolutions: PartyResolutionCache | None = Depends(get_party_resolution_cache),
+    party_names: PartyNameIndex | None = Depends(get_party_name_index),
+    holdings: HoldingsSettings = Depends(get_holdings_settings),
+    figures_cache: HoldingFiguresCache | None = Depends(get_holding_figures_cache),
 ) -> GetAccountsForPartyResponse:
     """What a person or organization holds: their accounts, with balances, across products.
 
@@ -122,7 +134,9 @@ async def get_accounts_for_party(
     `values`, not this listing.
 
     A missing figure is omitted, never zeroed. `figure_errors` on a row distinguishes "the request
-    failed" from "Backstop publishes no number".
+    failed" from "Backstop publishes no number". On the fallback, `fallback_progress` counts the
+    per-account series reads against this call's request budget; non-zero `skipped` means some
+    figures were never read.
 
     Tenants may call a product a fund, vehicle, or share class; the Backstop name is still
     `product`. An empty list with `closed_omitted>0` means every owned account is closed — pass
@@ -134,6 +148,8 @@ async def get_accounts_for_party(
         search_type=search_type,
         party_id=party_id,
         search=search,
+        cache=party_resolutions,
+        names=party_names,
     )
     if not isinstance(result, Resolved):
         return unresolved_party_response(result)
@@ -147,7 +163,13 @@ async def get_accounts_for_party(
             "include_closed": include_closed,
         },
     )
-    listing = await fetch_holdings(client, owner_id=party.id, include_closed=include_closed)
+    listing = await fetch_holdings(
+        client,
+        owner_id=party.id,
+        include_closed=include_closed,
+        settings=holdings,
+        figures_cache=figures_cache,
+    )
     if _would_report_owns_nothing(listing.rows, listing.closed_omitted) and party.name is None:
         confirmed = await _confirm_party(client, party)
         if confirmed is None:
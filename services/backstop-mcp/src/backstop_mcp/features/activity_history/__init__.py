@@ -13,6 +13,9 @@ docstring for the Backstop quirks this layer absorbs.
 `group_activity_page`: computes one stream page's `date_range` (min/max `occurred_at` among this
 page's items) and `next` continuation (`None` once that stream is exhausted). Items pass through
 in fetch order — no client-side re-sort. See `group_activity_page.py`.
+`merge_activity_streams`: the merged alternative — a k-way merge of the newest-first streams
+into one page of `limit` records, reading further pages only from the stream that ran dry, with
+one `ActivityTimelineContinuationResponse` for all of them. See `merge_activity_streams.py`.
 
 `ActivityRecordResponse`/`EmailRecordResponse`/`TimelineRecord`/`to_timeline_record`: the wire
 shape of one fetched item and the union conversion into it. `ActivityHistoryResolvedResponse`/
@@ -28,21 +31,36 @@ composite. A search id waits on the detail record's `type`. See `fetch_activity_
 `ActivityDetailResponse`/`AttendeeResponse`: that tool's wire shape
 and the pure conversion into it. See `responses.py`.
 
+`ActivityBodyCache`/`ActivityBodyDto`: converted detail bodies kept by (resource id,
+`modifiedTimestamp`) in memory and, optionally, in Postgres (`ActivityBodyStore`), so a repeat
+`get_activity_detail` reads only the version (`fetch_activity_version`) as the caller. See
+`activity_body_cache.py`.
+
 `fetch_entity_activities`: `POST /entity-activities` pageNum loop for `search_activities`.
-`aggregate_entity_activities`: counts grouped by type, tag, party, or period.
+`scan_entity_activities`: the same search cut into effective-date sub-windows, to read past its
+10000-row wall. See `scan_entity_activities.py`.
+`aggregate_entity_activities`: counts grouped by type, tag, party, or period;
+`entity_activities_tally` counts the same buckets page by page, several groupings at once.
 
-`ActivityHistorySettings`: the per-stream page size and gist truncation budget, translated from
-`config.ActivityHistoryConfig` by `get_activity_history_settings`. See `settings.py`.
+`ActivityHistorySettings`: the per-stream page size, gist truncation budget and search
+sub-window budget, translated from `config.ActivityHistoryConfig` by
+`get_activity_history_settings`. See `settings.py`.
 
 The MCP tools live in `features/activity_history/tools/`.
 """
 
+from backstop_mcp.features.activity_history.activity_body_cache import ActivityBodyCache
+from backstop_mcp.features.activity_history.activity_body_store import ActivityBodyStore
 from backstop_mcp.features.activity_history.aggregate_entity_activities import (
     ActivityAggregateBy,
     aggregate_entity_activities,
+    entity_activities_tally,
 )
 from backstop_mcp.features.activity_history.api_responses import ActivityAttributes
-from backstop_mcp.features.activity_history.dependencies import get_activity_history_settings
+from backstop_mcp.features.activity_history.dependencies import (
+    get_activity_body_cache,
+    get_activity_history_settings,
+)
 from backstop_mcp.features.activity_history.extract_gist_from_html import (
     Gist,
     extract_gist_from_html,
@@ -57,6 +75,7 @@ from backstop_mcp.features.activity_history.fetch_activities_page import (
 )
 from backstop_mcp.features.activity_history.fetch_activity_detail import (
     fetch_activity_detail,
+    fetch_activity_version,
     fetch_attendees,
     fetch_meeting_specifics,
 )
@@ -70,6 +89,7 @@ from backstop_mcp.features.activity_history.fetch_entity_activities import (
 )
 from backstop_mcp.features.activity_history.group_activity_page import group_activity_page
 from backstop_mcp.features.activity_history.internal_dto import (
+    ActivityBodyDto,
     ActivityDetailDto,
     ActivityItemDto,
     ActivityPageDto,
@@ -84,14 +104,20 @@ from backstop_mcp.features.activity_history.internal_dto import (
     MeetingSpecificsDto,
     ResourceIdentifierDto,
 )
+from backstop_mcp.features.activity_history.merge_activity_streams import (
+    merge_activity_streams,
+)
 from backstop_mcp.features.activity_history.responses import (
     ActivityContinuationResponse,
     ActivityDetailResponse,
     ActivityGroupResponse,
     ActivityHistoryResolvedResponse,
+    ActivityHistoryTimelineResponse,
     ActivityRecordResponse,
     ActivityRegardingResponse,
     ActivityTagChipResponse,
+    ActivityTimelineContinuationResponse,
+    ActivityTimelineResponse,
     AttendeeResponse,
     DateRangeResponse,
     EmailRecordResponse,
@@ -102,8 +128,12 @@ from backstop_mcp.features.activity_history.responses import (
     SearchActivitiesRowResponse,
     SearchActivitiesUnavailableResponse,
     TimelineRecord,
+    activity_body,
     to_timeline_record,
 )
+from backstop_mcp.features.activity_history.scan_entity_activities import (
+    scan_entity_activities,
+)
 from backstop_mcp.features.activity_history.settings import ActivityHistorySettings
 from backstop_mcp.features.collection_scan import (
     AggregateBucketDto,
@@ -113,12 +143,16 @@ from backstop_mcp.features.collection_scan import (
 __all__ = [
     "ActivityAggregateBy",
     "ActivityAttributes",
+    "ActivityBodyCache",
+    "ActivityBodyDto",
+    "ActivityBodyStore",
     "ActivityContinuationResponse",
     "ActivityDetailDto",
     "ActivityDetailResponse",
     "ActivityGroupResponse",
     "ActivityHistoryResolvedResponse",
     "ActivityHistorySettings",
+    "ActivityHistoryTimelineResponse",
     "ActivityItemDto",
     "ActivityPageDto",
     "ActivityRecordResponse",
@@ -126,6 +160,8 @@ __all__ = [
     "ActivityRegardingResponse",
     "ActivityTagChipDto",
     "ActivityTagChipResponse",
+    "ActivityTimelineContinuationResponse",
+    "ActivityTimelineResponse",
     "ActivityType",
     "AggregateBucketDto",
     "AttendeeChipDto",
@@ -153,18 +189,24 @@ __all__ = [
     "SearchActivitiesUnavailableResponse",
     "Segment",
     "TimelineRecord",
+    "activity_body",
     "aggregate_entity_activities",
     "entity_activities_request_body",
+    "entity_activities_tally",
     "extract_gist_from_html",
     "fetch_activity_detail",
+    "fetch_activity_version",
     "fetch_activity_page",
     "fetch_activities_page",
     "fetch_attendees",
     "fetch_email_page",
     "fetch_entity_activities",
     "fetch_meeting_specifics",
+    "get_activity_body_cache",
     "get_activity_history_settings",
     "group_activity_page",
+    "merge_activity_streams",
     "party_bean",
+    "scan_entity_activities",
     "to_timeline_record",
 ]
@@ -0,0 +1,98 @@
+"""Converted activity-detail bodies, kept by version: a repeat open skips the read and conversion.
+
+A meeting note is written once and then read many times, and every `get_activity_detail` of it
+used to re-read the whole `/entity-activity-details` record — the HTML body is most of its
+weight — and run it through `markdownify` again. `ActivityBodyCache` keeps the converted
+`ActivityBodyDto` keyed by the record's resource id and its `modifiedTimestamp`: the pair names
+one version of the content, so an edit is simply a new key, and nothing here ever needs
+invalidating or a TTL.
+
+Shared by every caller, because it is keyed by content — which is why it never decides access.
+Before asking, the tool has the caller read the version from the record's own collection
+(`fetch_activity_version`), so a body is only served to someone Backstop has just let see that
+version; a 403 or 404 there raises exactly as the full read would have.
+
+Two tiers, both bounded by bytes and evicted least-recently-used: this process's memory, and
+optionally `ActivityBodyStore` in Postgres, which survives restarts and is shared by replicas.
+A body found in Postgres is promoted to memory. A record that answers without a timestamp has
+no version to key by, and is read and converted every time, as before.
+"""
+
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+
+from backstop_mcp.features.activity_history.activity_body_store import ActivityBodyStore
+from backstop_mcp.features.activity_history.internal_dto import ActivityBodyDto
+from backstop_mcp.metrics import ACTIVITY_BODY_CACHE_LOOKUPS
+
+logger = logging.getLogger(__name__)
+
+type _Key = tuple[str, str]
+
+
+class ActivityBodyCache:
+    """Bounded LRU of converted bodies by (resource id, version). See the module docstring."""
+
+    def __init__(self, *, max_bytes: int, store: ActivityBodyStore | None = None) -> None:
+        self._max_bytes: int = max_bytes
+        self._store: ActivityBodyStore | None = store
+        self._entries: OrderedDict[_Key, tuple[int, ActivityBodyDto]] = OrderedDict()
+        self._bytes: int = 0
+
+    async def body(
+        self,
+        *,
+        resource_id: str,
+        modified: datetime | None,
+        load_upstream: Callable[[], Awaitable[ActivityBodyDto]],
+    ) -> ActivityBodyDto:
+        """The kept body at `modified`, or `load_upstream()`'s — kept at every tier."""
+        if modified is None:
+            ACTIVITY_BODY_CACHE_LOOKUPS.add(1, {"outcome": "unversioned"})
+            return await load_upstream()
+        key = (resource_id, modified.isoformat())
+        kept = self._get(key)
+        if kept is not None:
+            ACTIVITY_BODY_CACHE_LOOKUPS.add(1, {"outcome": "memory"})
+            return kept
+        if self._store is not None:
+            stored = await self._store.load(*key)
+            if stored is not None:
+                ACTIVITY_BODY_CACHE_LOOKUPS.add(1, {"outcome": "store"})
+                self._put(key, stored)
+                return stored
+        ACTIVITY_BODY_CACHE_LOOKUPS.add(1, {"outcome": "miss"})
+        body = await load_upstream()
+        self._put(key, body)
+        if self._store is not None:
+            await self._store.save(*key, body)
+        return body
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: _Key) -> ActivityBodyDto | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def _put(self, key: _Key, body: ActivityBodyDto) -> None:
+        size = len(body.body.encode()) + len((body.title or "").encode())
+        if size > self._max_bytes:
+            logger.debug(
+                "activity_history.body_cache.too_large",
+                extra={"resource_id": key[0], "size": size},
+            )
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous[0]
+        self._entries[key] = (size, body)
+        self._bytes += size
+        while self._bytes > self._max_bytes:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self._bytes -= evicted
@@ -0,0 +1,133 @@
+"""The Postgres tier under `ActivityBodyCache`: converted detail bodies, shared across replicas.
+
+The in-memory tier is lost on every restart and is per replica, so without this a rolling
+deploy re-reads and re-converts every heavy note the first time each replica is asked for it.
+Rows live in `activity_bodies`, keyed by tenant (the Backstop base URL), resource id and version
+— content, not caller — and nothing here decides who may see one: `get_activity_detail` has the
+caller read the version themselves before it asks.
+
+Bounded by `max_bytes` per tenant. A save drops the least recently used rows past that total,
+and any other version of the same record, which can no longer be asked for. Losing the database
+degrades to the in-memory tier alone — a load finds nothing, a save is dropped — rather than
+failing the read, as in `catalog_snapshot_store.py`.
+"""
+
+import logging
+
+from pydantic import ValidationError
+from sqlalchemy import Delete, delete, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backstop_mcp.db import ActivityBody, transaction
+from backstop_mcp.features.activity_history.internal_dto import ActivityBodyDto
+
+logger = logging.getLogger(__name__)
+
+# What a round trip can fail with when the database is down or unreachable — see
+# `catalog_snapshot_store.py`, which degrades the same way.
+_UNAVAILABLE = (SQLAlchemyError, OSError)
+
+# Bump when `ActivityBodyDto` or the conversion behind it changes shape: rows written in another
+# format are then ignored and, as they stop being used, evicted.
+_FORMAT_VERSION = "1"
+
+
+class ActivityBodyStore:
+    """Reads and writes `activity_bodies` for one tenant. See the module docstring."""
+
+    def __init__(
+        self, session_factory: async_sessionmaker[AsyncSession], *, tenant: str, max_bytes: int
+    ) -> None:
+        self._session_factory: async_sessionmaker[AsyncSession] = session_factory
+        self._tenant: str = tenant
+        self._max_bytes: int = max_bytes
+
+    async def load(self, resource_id: str, version: str) -> ActivityBodyDto | None:
+        """The stored body at `version`, marked as used, or `None` when there is none."""
+        statement = (
+            update(ActivityBody)
+            .where(
+                ActivityBody.tenant == self._tenant,
+                ActivityBody.resource_id == resource_id,
+                ActivityBody.version == version,
+                ActivityBody.format_version == _FORMAT_VERSION,
+            )
+            .values(last_used_at=func.now())
+            .returning(ActivityBody.payload)
+        )
+        try:
+            async with transaction(self._session_factory) as session:
+                payload = (await session.execute(statement)).scalar_one_or_none()
+        except _UNAVAILABLE:
+            logger.warning("activity_body_store.load_unavailable", exc_info=True)
+            return None
+        if payload is None:
+            return None
+        try:
+            return ActivityBodyDto.model_validate(payload)
+        except ValidationError:
+            logger.warning("activity_body_store.unreadable", extra={"resource_id": resource_id})
+            return None
+
+    async def save(self, resource_id: str, version: str, body: ActivityBodyDto) -> None:
+        """Store `body` at `version`, then evict down to `max_bytes`."""
+        payload = body.model_dump(mode="json")
+        size_bytes = len(body.model_dump_json().encode())
+        if size_bytes > self._max_bytes:
+            return
+        statement = insert(ActivityBody).values(
+            tenant=self._tenant,
+            resource_id=resource_id,
+            version=version,
+            format_version=_FORMAT_VERSION,
+            payload=payload,
+            size_bytes=size_bytes,
+            last_used_at=func.now(),
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[ActivityBody.tenant, ActivityBody.resource_id, ActivityBody.version],
+            set_={
+                "format_version": statement.excluded.format_version,
+                "payload": statement.excluded.payload,
+                "size_bytes": statement.excluded.size_bytes,
+                "last_used_at": statement.excluded.last_used_at,
+            },
+        )
+        try:
+            async with transaction(self._session_factory) as session:
+                _ = await session.execute(statement)
+                _ = await session.execute(
+                    delete(ActivityBody).where(
+                        ActivityBody.tenant == self._tenant,
+                        ActivityBody.resource_id == resource_id,
+                        ActivityBody.version != version,
+                    )
+                )
+                _ = await session.execute(self._evict())
+        except _UNAVAILABLE:
+            # The next open converts again; nothing is lost.
+            logger.warning("activity_body_store.save_unavailable", exc_info=True)
+
+    def _evict(self) -> Delete:
+        """Delete this tenant's rows past `max_bytes`, counting from the most recently used."""
+        ranked = (
+            select(
+                ActivityBody.resource_id,
+                ActivityBody.version,
+                func.sum(ActivityBody.size_bytes)
+                .over(order_by=(ActivityBody.last_used_at.desc(), ActivityBody.resource_id))
+                .label("running_bytes"),
+            )
+            .where(ActivityBody.tenant == self._tenant)
+            .subquery()
+        )
+        return delete(ActivityBody).where(
+            ActivityBody.tenant == self._tenant,
+            tuple_(ActivityBody.resource_id, ActivityBody.version).in_(
+                select(ranked.c.resource_id, ranked.c.version).where(
+                    ranked.c.running_bytes > self._max_bytes
+                )
+            ),
+        )
@@ -1,13 +1,17 @@
-"""Group scanned entity-activities rows so a counting question never pays for row bodies."""
+"""Group scanned entity-activities rows so a counting question never pays for row bodies.
 
-from collections import Counter
-from collections.abc import Sequence
+`entity_activities_tally` is the streaming form: the search hands it each page as it is read,
+for one or several `group_by` dimensions at once. `aggregate_entity_activities` counts rows
+already held, one dimension, through the same buckets.
+"""
+
+from collections.abc import Iterable, Sequence
 from typing import Literal
 
 from backstop_mcp.features.activity_history.internal_dto import EntityActivityDto
-from backstop_mcp.features.collection_scan import AggregateBucketDto
+from backstop_mcp.features.collection_scan import AggregateBucketDto, BucketKey, BucketTally
 
-__all__ = ["ActivityAggregateBy", "aggregate_entity_activities"]
+__all__ = ["ActivityAggregateBy", "aggregate_entity_activities", "entity_activities_tally"]
 
 type ActivityAggregateBy = Literal["type", "tag", "party", "period"]
 
@@ -17,40 +21,39 @@ _UNDATED = "(undated)"
 _UNKNOWN = "(unknown)"
 
 
-def aggregate_entity_activities(
-    rows: Sequence[EntityActivityDto], *, group_by: ActivityAggregateBy
-) -> tuple[AggregateBucketDto, ...]:
-    counts: Counter[tuple[str, str]] = Counter()
-    if group_by == "type":
-        for row in rows:
+def _buckets(row: EntityActivityDto, group_by: ActivityAggregateBy) -> Iterable[BucketKey]:
+    match group_by:
+        case "type":
             key = row.type or _UNKNOWN
-            counts[(key, key)] += 1
-    elif group_by == "tag":
-        for row in rows:
+            return ((key, key),)
+        case "tag":
             if not row.tags:
-                counts[(_UNTAGGED, _UNTAGGED)] += 1
-                continue
-            for tag in row.tags:
-                counts[(tag.id, tag.name)] += 1
-    elif group_by == "party":
-        for row in rows:
+                return ((_UNTAGGED, _UNTAGGED),)
+            return tuple((tag.id, tag.name) for tag in row.tags)
+        case "party":
             if not row.associated_with:
-                counts[(_UNATTRIBUTED, _UNATTRIBUTED)] += 1
-                continue
-            for party in row.associated_with:
-                label = party.resource_type or party.id
-                counts[(party.id, f"{label}:{party.id}")] += 1
-    else:
-        for row in rows:
+                return ((_UNATTRIBUTED, _UNATTRIBUTED),)
+            return tuple(
+                (party.id, f"{party.resource_type or party.id}:{party.id}")
+                for party in row.associated_with
+            )
+        case "period":
             if row.effective_date is None:
-                counts[(_UNDATED, _UNDATED)] += 1
-                continue
+                return ((_UNDATED, _UNDATED),)
             period = row.effective_date.strftime("%Y-%m")
-            counts[(period, period)] += 1
-    # Sorted, not `most_common()`: that breaks count ties by insertion order, which here is
-    # page order from an endpoint whose row order is not stable across hosts. Same key as
-    # `aggregate_search_opportunities`, so the two aggregate paths agree.
-    return tuple(
-        AggregateBucketDto(key=key, label=label, count=count)
-        for (key, label), count in sorted(counts.items(), key=lambda item: (-item[1], item[0][1]))
-    )
+            return ((period, period),)
+
+
+def entity_activities_tally(
+    group_by: Iterable[ActivityAggregateBy],
+) -> BucketTally[EntityActivityDto, ActivityAggregateBy]:
+    """An empty tally counting activities by each of `group_by`; feed it pages with `add`."""
+    return BucketTally(group_by, buckets=_buckets)
+
+
+def aggregate_entity_activities(
+    rows: Sequence[EntityActivityDto], *, group_by: ActivityAggregateBy
+) -> tuple[AggregateBucketDto, ...]:
+    tally = entity_activities_tally((group_by,))
+    tally.add(rows)
+    return tally.buckets(group_by)
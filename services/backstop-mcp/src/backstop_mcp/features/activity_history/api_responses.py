@@ -8,6 +8,7 @@ from backstop_mcp.lenient import LenientBool, LenientInt
 __all__ = [
     "ActivityAttributes",
     "ActivityDetailAttributes",
+    "ActivityVersionAttributes",
     "AttendeeAttributes",
     "EmailAttributes",
     "EntityActivitiesDocument",
@@ -116,6 +117,14 @@ class ActivityDetailAttributes(BaseModel):
     attachments: object = None
 
 
+class ActivityVersionAttributes(BaseModel):
+    model_config: ClassVar[ConfigDict] = ConfigDict(extra="ignore")
+
+    modified_timestamp: LenientDatetime = Field(
+        default=None, validation_alias=AliasChoices("modifiedTimestamp", "modified_timestamp")
+    )
+
+
 class MeetingSpecificAttributes(BaseModel):
     model_config: ClassVar[ConfigDict] = ConfigDict(extra="ignore", populate_by_name=True)
 
@@ -123,6 +132,7 @@ class MeetingSpecificAttributes(BaseModel):
     stop: LenientDatetime = Field(default=None, validation_alias="stopTimestamp")
     location: str | None = None
     time_zone: str | None = Field(default=None, validation_alias="timeZone")
+    modified_timestamp: LenientDatetime = Field(default=None, validation_alias="modifiedTimestamp")
 
 
 class AttendeeAttributes(BaseModel):
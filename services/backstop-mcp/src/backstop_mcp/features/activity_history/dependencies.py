@@ -1,6 +1,12 @@
 from functools import lru_cache
 
-from backstop_mcp.dependencies import get_activity_history_config
+from backstop_mcp.dependencies import (
+    get_activity_history_config,
+    get_backstop_config,
+    get_session_factory,
+)
+from backstop_mcp.features.activity_history.activity_body_cache import ActivityBodyCache
+from backstop_mcp.features.activity_history.activity_body_store import ActivityBodyStore
 from backstop_mcp.features.activity_history.settings import ActivityHistorySettings
 
 
@@ -10,4 +16,22 @@ def get_activity_history_settings() -> ActivityHistorySettings:
     return ActivityHistorySettings(
         page_size=config.page_size,
         gist_max_chars=config.gist_chars,
+        search_max_windows=config.search_max_windows,
     )
+
+
+@lru_cache(maxsize=1)
+def get_activity_body_cache() -> ActivityBodyCache | None:
+    """The process-wide detail-body cache, or `None` while its byte budget is 0 (the default)."""
+    config = get_activity_history_config()
+    if not config.detail_cache_max_bytes:
+        return None
+    store = None
+    if config.detail_store_enabled:
+        # Keyed by `base_url`, the tenant whose resource ids these are.
+        store = ActivityBodyStore(
+            get_session_factory(),
+            tenant=get_backstop_config().base_url,
+            max_bytes=config.detail_store_max_bytes,
+        )
+    return ActivityBodyCache(max_bytes=config.detail_cache_max_bytes, store=store)
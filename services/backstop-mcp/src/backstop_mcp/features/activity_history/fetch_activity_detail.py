@@ -10,10 +10,16 @@ Three endpoints, all keyed by the **bare** `ResourceIdentifierDto.resource_id` 
   `fbId` is unused; a document also carries `attachedTo`.
 - `/meeting-or-calls/{resource_id}` — `startTimestamp`, `stopTimestamp`, `location` and
   `timeZone`. These live here and NOT on the detail record, which is why they are a separate
-  fetch; a sparse `fields=` works, so only those four are requested.
+  fetch; a sparse `fields=` works, so only those four are requested, plus `modifiedTimestamp`
+  — the record's version, so a meeting/call needs no separate version read.
 - `/meeting-or-calls/{resource_id}/attendees` — the trimmed attendee list.
 
-The latter two are valid only for a `meeting-or-calls` handle — both 404 for a note's or a
+- `/{resource_type}/{resource_id}?fields=modifiedTimestamp` — a note's or document's own
+  collection, read for nothing but its version. `fetch_activity_version` is how
+  `ActivityBodyCache` learns which converted body is current, and, being the caller's own read,
+  whether they may see it.
+
+The meeting-or-calls two are valid only for a `meeting-or-calls` handle — both 404 for a note's or a
 document's resource id — so `ResourceIdentifierDto.is_meeting_or_call` gates them.
 
 Known Backstop imprecision, deliberately passed through rather than papered over: the detail
@@ -24,6 +30,7 @@ request it.
 """
 
 import logging
+from datetime import datetime
 from urllib.parse import quote
 
 from backstop_mcp.backstop_client import (
@@ -33,6 +40,7 @@ from backstop_mcp.backstop_client import (
 )
 from backstop_mcp.features.activity_history.api_responses import (
     ActivityDetailAttributes,
+    ActivityVersionAttributes,
     AttendeeAttributes,
     MeetingSpecificAttributes,
 )
@@ -50,16 +58,19 @@ __all__ = [
     "AttendeeDto",
     "MeetingSpecificsDto",
     "fetch_activity_detail",
+    "fetch_activity_version",
     "fetch_attendees",
     "fetch_meeting_specifics",
 ]
 
 _ATTENDEE_FIELDS = "name,firstName,lastName"
-_MEETING_SPECIFIC_FIELDS = "startTimestamp,stopTimestamp,location,timeZone"
+_MEETING_SPECIFIC_FIELDS = "startTimestamp,stopTimestamp,location,timeZone,modifiedTimestamp"
+_VERSION_FIELDS = "modifiedTimestamp"
 
 
 _ActivityDetailDocument = BackstopApiResourceDocument[ActivityDetailAttributes]
 _MeetingSpecificDocument = BackstopApiResourceDocument[MeetingSpecificAttributes]
+_ActivityVersionDocument = BackstopApiResourceDocument[ActivityVersionAttributes]
 
 
 async def fetch_activity_detail(client: BackstopClient, *, resource_id: str) -> ActivityDetailDto:
@@ -93,6 +104,28 @@ async def fetch_activity_detail(client: BackstopClient, *, resource_id: str) ->
     return detail
 
 
+async def fetch_activity_version(
+    client: BackstopClient, *, resource_type: str, resource_id: str
+) -> datetime | None:
+    """When one activity was last modified, read from its own collection as the caller.
+
+    `resource_type` is a composite handle's collection (`notes` or `documents` — a meeting/call
+    takes its version from `fetch_meeting_specifics`), checked by
+    `ResourceIdentifierDto.has_known_collection` before it is put in a path. Raises like
+    `fetch_activity_detail` for an id the caller cannot read; `None` means the record answered
+    without a timestamp, so there is no version to key a cached body by.
+    """
+    logger.debug(
+        "activity_history.version.fetch",
+        extra={"resource_type": resource_type, "resource_id": resource_id},
+    )
+    path = f"/{quote(resource_type, safe='')}/{quote(resource_id, safe='')}"
+    document = await client.get(
+        path, params={"fields": _VERSION_FIELDS}, schema=_ActivityVersionDocument
+    )
+    return document.require_data(path=path).attributes.modified_timestamp
+
+
 async def fetch_meeting_specifics(
     client: BackstopClient, *, resource_id: str
 ) -> MeetingSpecificsDto:
@@ -110,6 +143,7 @@ async def fetch_meeting_specifics(
         stop=attributes.stop,
         location=attributes.location,
         time_zone=attributes.time_zone,
+        modified=attributes.modified_timestamp,
     )
     logger.info(
         "activity_history.meeting_specifics.fetched",
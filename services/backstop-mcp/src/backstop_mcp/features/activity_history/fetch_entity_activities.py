@@ -39,8 +39,10 @@ permission-filtered: `totalCount` is visible-to-this-credential, not a firm-wide
 saturates at 10000.
 """
 
+import asyncio
 import logging
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Literal
 
@@ -51,9 +53,11 @@ from backstop_mcp.backstop_client import (
     BackstopClient,
     BackstopRateLimitError,
     BackstopResponseSchemaError,
+    RequestPriority,
 )
 from backstop_mcp.features.activity_history.api_responses import (
     EntityActivitiesDocument,
+    EntityActivitiesPageAttributes,
     EntityActivityAttributes,
 )
 from backstop_mcp.features.activity_history.internal_dto import (
@@ -66,9 +70,11 @@ logger = logging.getLogger(__name__)
 __all__ = [
     "ENTITY_ACTIVITY_TYPES",
     "MAX_RETRIEVABLE",
+    "PAGE_SIZE",
     "EntityActivityType",
     "entity_activities_request_body",
     "fetch_entity_activities",
+    "fetch_entity_activities_page",
     "party_bean",
 ]
 
@@ -85,7 +91,7 @@ ENTITY_ACTIVITY_TYPES: tuple[EntityActivityType, ...] = (
 _PATH = "/entity-activities"
 _RESOURCE_TYPE = "entity-activities"
 MAX_RETRIEVABLE = 10_000
-_PAGE_SIZE = 500
+PAGE_SIZE = 500
 _INCLUDE_ASSOCIATED_WITH = "associatedWith"
 _INCLUDE_DESCRIPTION = "description"
 
@@ -163,6 +169,89 @@ def _project_rows(
     return tuple(projected), dropped
 
 
+async def fetch_entity_activities_page(
+    client: BackstopClient,
+    *,
+    page_num: int,
+    page_size: int,
+    start_date: date,
+    end_date: date,
+    types: Sequence[EntityActivityType] = ENTITY_ACTIVITY_TYPES,
+    associated_withs: Sequence[str] = (),
+    activity_tags: Sequence[str] = (),
+    authors: Sequence[str] = (),
+    include_description: bool = False,
+    priority: RequestPriority = RequestPriority.FIRST_PAGE,
+) -> EntityActivitiesPageAttributes:
+    """One `pageNum` of the search, as read. No clamp — the caller keeps under the wall."""
+    document = await client.post(
+        _PATH,
+        schema=EntityActivitiesDocument,
+        priority=priority,
+        json=entity_activities_request_body(
+            page_num=page_num,
+            page_size=page_size,
+            start_date=start_date,
+            end_date=end_date,
+            types=types,
+            associated_withs=associated_withs,
+            activity_tags=activity_tags,
+            authors=authors,
+            include_description=include_description,
+        ),
+    )
+    return document.data.attributes
+
+
+@dataclass
+class _Scan:
+    """What a walk has read so far; one `absorb` per page, in `pageNum` order."""
+
+    page_size: int
+    max_rows: int | None
+    on_rows: Callable[[Sequence[EntityActivityDto]], None] | None = None
+    collected: list[EntityActivityDto] = field(default_factory=list)
+    rows_read: int = 0
+    dropped: int = 0
+    rows_received: int = 0
+    pages_fetched: int = 0
+    total_count: int | None = None
+    exhausted: bool = False
+
+    def absorb(self, page: EntityActivitiesPageAttributes) -> None:
+        self.pages_fetched += 1
+        if self.total_count is None:
+            self.total_count = page.total_count
+        rows, page_dropped = _project_rows(page.results)
+        self.dropped += page_dropped
+        self.rows_received += len(page.results)
+        self.rows_read += len(rows)
+        if self.on_rows is not None:
+            self.on_rows(rows)
+        else:
+            self.collected.extend(rows)
+        # A short page, or every visible row accounted for, read or dropped.
+        short = len(page.results) < self.page_size
+        counted = self.rows_read + self.dropped
+        self.exhausted = short or (self.total_count is not None and counted >= self.total_count)
+
+    def done(self) -> bool:
+        """No later page is needed: the set ran out, or `max_rows` is already held."""
+        return self.exhausted or (self.max_rows is not None and self.rows_read >= self.max_rows)
+
+    def planned_pages(self, *, after: int, max_retrievable: int) -> range:
+        """The `pageNum`s `totalCount` says are still to come, clamped to the 10000 wall.
+
+        Planned from what page one reported, so it can fall short — rows dropped in projection
+        do not count toward `max_rows` — and the serial walk picks up from the end of it.
+        """
+        if self.total_count is None:
+            return range(0)
+        wanted = self.total_count if self.max_rows is None else min(self.total_count, self.max_rows)
+        last = min(-(-wanted // self.page_size), max_retrievable // self.page_size)
+        return range(after + 1, last + 1)
+
+
 async def fetch_entity_activities(
     client: BackstopClient,
     *,
@@ -174,100 +263,146 @@ async def fetch_entity_activities(
     authors: Sequence[str] = (),
     include_description: bool = False,
     max_rows: int | None = None,
-    page_size: int = _PAGE_SIZE,
+    page_size: int = PAGE_SIZE,
     max_retrievable: int = MAX_RETRIEVABLE,
+    parallel: bool = False,
+    on_rows: Callable[[Sequence[EntityActivityDto]], None] | None = None,
+    priority: RequestPriority = RequestPriority.FIRST_PAGE,
+    first_page: EntityActivitiesPageAttributes | None = None,
 ) -> EntityActivitiesFetchDto:
     """Walk `POST /entity-activities` until the set is exhausted, `max_rows`, or the 10000 wall.
 
     The endpoint is an undocumented UI search — read the module docstring before changing this,
     including for what "verified" has to mean here.
+
+    `parallel=True` reads page one, then requests every later page its `totalCount` accounts
+    for at once, since `pageNum` makes each one addressable up front — the per-user gate still
+    bounds how many are on the wire. The pages are taken in `pageNum` order exactly as the
+    serial walk takes them: the same clamp, and a failed page ends the answer there, keeping
+    the pages before it and discarding any after, so a partial result is still the newest rows
+    rather than a set with a hole in it. `pages_in_flight` on the result is how many pages were
+    requested at once. Each page is taken as soon as it and the pages before it are in, and a
+    failure cancels the pages still in flight after it.
+
+    `on_rows` is handed each page's rows, in the same order, instead of the result keeping
+    them, so a caller that only counts (aggregate mode) holds a page at a time rather than up
+    to 10000 rows; `rows` on the result is then empty. It streams the whole walk, so it takes
+    no `max_rows`.
+
+    `priority` is the gate lane for page one only, as in `BackstopClient.paginate`; every later
+    page waits in `LATER_PAGE`, so a wide fan-out never crowds out another caller's lookup.
+
+    `first_page` is page one already read with these same arguments — `scan_entity_activities`
+    probes a window with it — and is taken as read: the walk requests from page two.
     """
+    if on_rows is not None and max_rows is not None:
+        raise ValueError("on_rows streams the whole walk; max_rows does not apply")
     effective_page_size = page_size if max_rows is None else min(page_size, max_rows)
-    collected: list[EntityActivityDto] = []
-    dropped = 0
-    rows_received = 0
-    pages_fetched = 0
+    scan = _Scan(page_size=effective_page_size, max_rows=max_rows, on_rows=on_rows)
     ceiling_clamped = False
-    exhausted = False
     partial_due_to_error = False
-    total_count: int | None = None
-    page_num = 1
+    pages_in_flight = 0
 
-    while True:
-        if page_num * effective_page_size > max_retrievable:
-            ceiling_clamped = True
-            break
-        if max_rows is not None and len(collected) >= max_rows:
-            break
+    async def fetch(page_num: int) -> EntityActivitiesPageAttributes:
+        return await fetch_entity_activities_page(
+            client,
+            page_num=page_num,
+            page_size=effective_page_size,
+            start_date=start_date,
+            end_date=end_date,
+            types=types,
+            associated_withs=associated_withs,
+            activity_tags=activity_tags,
+            authors=authors,
+            include_description=include_description,
+            priority=priority if page_num == 1 else RequestPriority.LATER_PAGE,
+        )
+
+    async def fetch_later(page_num: int) -> EntityActivitiesPageAttributes | None:
+        """A page after the first; `None` if it failed in a way that keeps what came before."""
         try:
-            document = await client.post(
-                _PATH,
-                schema=EntityActivitiesDocument,
-                json=entity_activities_request_body(
-                    page_num=page_num,
-                    page_size=effective_page_size,
-                    start_date=start_date,
-                    end_date=end_date,
-                    types=types,
-                    associated_withs=associated_withs,
-                    activity_tags=activity_tags,
-                    authors=authors,
-                    include_description=include_description,
-                ),
-            )
+            return await fetch(page_num)
         except BackstopRateLimitError:
             raise
         except (BackstopApiError, BackstopResponseSchemaError):
-            if pages_fetched == 0:
-                raise
             logger.warning(
                 "activity_history.entity_activities.later_page_failed_returning_partial",
-                extra={"page_num": page_num, "pages_fetched": pages_fetched},
+                extra={"page_num": page_num, "pages_fetched": scan.pages_fetched},
             )
-            partial_due_to_error = True
-            break
-        pages_fetched += 1
-        page = document.data.attributes
-        if total_count is None:
-            total_count = page.total_count
-        rows, page_dropped = _project_rows(page.results)
-        dropped += page_dropped
-        rows_received += len(page.results)
-        collected.extend(rows)
-        if len(page.results) < effective_page_size:
-            exhausted = True
+            return None
+
+    page_num = 1
+    if first_page is not None:
+        scan.absorb(first_page)
+        page_num = 2
+    # Exhaustion is checked before the clamp, so a set that ends exactly at the wall is
+    # exhausted rather than clamped.
+    while not scan.exhausted:
+        if page_num * effective_page_size > max_retrievable:
+            ceiling_clamped = True
             break
-        if total_count is not None and len(collected) + dropped >= total_count:
-            exhausted = True
+        if scan.done():
             break
+        planned = scan.planned_pages(after=page_num - 1, max_retrievable=max_retrievable)
+        if parallel and scan.pages_fetched and len(planned) > 1:
+            pages_in_flight = max(pages_in_flight, len(planned))
+            tasks = [asyncio.ensure_future(fetch_later(number)) for number in planned]
+            try:
+                for task in tasks:
+                    page = await task
+                    if page is None:
+                        partial_due_to_error = True
+                        break
+                    scan.absorb(page)
+                    if scan.done():
+                        break
+            finally:
+                for task in tasks:
+                    _ = task.cancel()
+                _ = await asyncio.gather(*tasks, return_exceptions=True)
+            if partial_due_to_error:
+                break
+            page_num = planned[-1] + 1
+            continue
+        pages_in_flight = max(pages_in_flight, 1)
+        if scan.pages_fetched == 0:
+            page = await fetch(page_num)
+        else:
+            page = await fetch_later(page_num)
+            if page is None:
+                partial_due_to_error = True
+                break
+        scan.absorb(page)
         page_num += 1
 
-    kept = tuple(collected)
+    kept = tuple(scan.collected)
     truncated_by_row_cap = False
     if max_rows is not None and len(kept) > max_rows:
         kept = kept[:max_rows]
         truncated_by_row_cap = True
-    elif max_rows is not None and not exhausted and not partial_due_to_error:
+    elif max_rows is not None and not scan.exhausted and not partial_due_to_error:
         truncated_by_row_cap = True
 
     logger.info(
         "activity_history.entity_activities.fetched",
         extra={
-            "pages": pages_fetched,
-            "returned": len(kept),
-            "dropped": dropped,
-            "received": rows_received,
-            "total_count": total_count,
+            "pages": scan.pages_fetched,
+            "pages_in_flight": pages_in_flight,
+            "returned": scan.rows_read if on_rows is not None else len(kept),
+            "dropped": scan.dropped,
+            "received": scan.rows_received,
+            "total_count": scan.total_count,
             "ceiling_clamped": ceiling_clamped,
             "partial_due_to_error": partial_due_to_error,
         },
     )
     return EntityActivitiesFetchDto(
         rows=kept,
-        total_count=total_count,
-        rows_dropped=dropped,
-        rows_received=rows_received,
-        pages_fetched=pages_fetched,
+        total_count=scan.total_count,
+        rows_dropped=scan.dropped,
+        rows_received=scan.rows_received,
+        pages_fetched=scan.pages_fetched,
+        pages_in_flight=pages_in_flight,
         ceiling_clamped=ceiling_clamped,
         truncated_by_row_cap=truncated_by_row_cap,
         partial_due_to_error=partial_due_to_error,
@@ -22,10 +22,11 @@ from backstop_mcp.features.activity_history.responses import (
     DateRangeResponse,
 )
 
-__all__ = ["group_activity_page"]
+__all__ = ["group_activity_page", "occurred_date", "occurred_date_range"]
 
 
-def _occurred_date(item: ActivityItemDto | EmailItemDto) -> date | None:
+def occurred_date(item: ActivityItemDto | EmailItemDto) -> date | None:
+    """The day an item happened: an activity's effective date, an email's UTC send date."""
     if isinstance(item, EmailItemDto):
         sent = item.sent_timestamp
         if sent is None:
@@ -35,8 +36,10 @@ def _occurred_date(item: ActivityItemDto | EmailItemDto) -> date | None:
     return item.effective_date
 
 
-def _date_range(items: Sequence[ActivityItemDto | EmailItemDto]) -> DateRangeResponse | None:
-    dates = [occurred for item in items if (occurred := _occurred_date(item)) is not None]
+def occurred_date_range(
+    items: Sequence[ActivityItemDto | EmailItemDto],
+) -> DateRangeResponse | None:
+    dates = [occurred for item in items if (occurred := occurred_date(item)) is not None]
     if not dates:
         return None
     return DateRangeResponse(start=min(dates), end=max(dates))
@@ -58,7 +61,7 @@ def group_activity_page(
     return ActivityGroupResponse(
         activity_type=activity_type,
         items=grouped,
-        date_range=_date_range(grouped),
+        date_range=occurred_date_range(grouped),
         next=(
             None
             if end_of_stream
@@ -36,6 +36,7 @@ __all__ = [
 
 _MEETING_OR_CALL_RESOURCE_TYPE = "meeting-or-calls"
 _EMAIL_RESOURCE_TYPES = frozenset({"email", "emails"})
+_KNOWN_RESOURCE_TYPES = frozenset({"notes", "documents", _MEETING_OR_CALL_RESOURCE_TYPE})
 
 BackstopActivityType = Literal["meeting", "call", "note", "document"]
 
@@ -217,6 +218,22 @@ class ActivityDetailDto(BaseModel):
     attachments: tuple[ActivityAttachmentDto, ...] = ()
 
 
+class ActivityBodyDto(BaseModel):
+    """A detail record with its HTML description already converted to Markdown.
+
+    What `ActivityBodyCache` keeps: everything `get_activity_detail` shows from
+    `/entity-activity-details`, in the shape it shows it, so a repeat open neither re-reads the
+    record nor re-runs the conversion.
+    """
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True)
+
+    type: str | None = None
+    title: str | None = None
+    body: str
+    attachments: tuple[ActivityAttachmentDto, ...] = ()
+
+
 class MeetingSpecificsDto(BaseModel):
     model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True)
 
@@ -224,6 +241,9 @@ class MeetingSpecificsDto(BaseModel):
     stop: datetime | None = None
     location: str | None = None
     time_zone: str | None = None
+    # The record's version, read in the same request — what `ActivityBodyCache` keys a
+    # meeting/call body by, so the cached path needs no separate version read.
+    modified: datetime | None = None
 
 
 class AttendeeDto(BaseModel):
@@ -299,6 +319,11 @@ class ResourceIdentifierDto(BaseModel):
     def is_meeting_or_call(self) -> bool:
         return self.resource_type == _MEETING_OR_CALL_RESOURCE_TYPE
 
+    @property
+    def has_known_collection(self) -> bool:
+        """Whether `resource_type` is a collection the timeline is known to hand out."""
+        return self.resource_type in _KNOWN_RESOURCE_TYPES
+
 
 class EntityActivityDto(BaseModel):
     """One projected entity-activities row. A row without `id` is dropped by the fetch."""
@@ -387,3 +412,7 @@ class EntityActivitiesFetchDto(BaseModel):
     ceiling_clamped: bool
     truncated_by_row_cap: bool
     partial_due_to_error: bool = False
+    # The most pages requested at once: 1 for a serial walk, the fan-out under `parallel=True`.
+    pages_in_flight: int = 1
+    # Sub-window walks merged into this result by `scan_entity_activities`; 1 for one walk.
+    windows: int = 1
@@ -0,0 +1,188 @@
+"""Merged timeline: a k-way merge over the newest-first streams, one interleaved page.
+
+Each stream is already sorted newest-first by Backstop, so the merge only compares stream heads
+(a heap of at most one entry per stream) and reads another page only from a stream that ran dry,
+and only once its next record could be the newest left. The page holds exactly `limit` records
+unless every stream runs out first.
+
+Backstop requires `page[offset]` to be a multiple of `page[limit]`, so each stream is read in
+fixed pages of `ceil(limit / streams)` — one such page per stream usually covers the whole
+answer. The continuation records how many records each stream has given; a resumed stream
+re-reads from the page boundary below that count and skips the records already returned.
+"""
+
+import asyncio
+import heapq
+import logging
+import math
+from collections import deque
+from dataclasses import dataclass, field
+
+from backstop_mcp.backstop_client import BackstopApiError, BackstopClient
+from backstop_mcp.features.activity_history.fetch_activities_page import (
+    ActivityType,
+    Segment,
+    fetch_activities_page,
+)
+from backstop_mcp.features.activity_history.group_activity_page import (
+    occurred_date,
+    occurred_date_range,
+)
+from backstop_mcp.features.activity_history.internal_dto import (
+    ActivityItemDto,
+    EmailItemDto,
+)
+from backstop_mcp.features.activity_history.responses import (
+    ActivityTimelineContinuationResponse,
+    ActivityTimelineResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["merge_activity_streams"]
+
+
+@dataclass(slots=True)
+class _Stream:
+    activity_type: ActivityType
+    returned: int
+    fetch_offset: int
+    skip: int
+    buffer: deque[ActivityItemDto | EmailItemDto] = field(default_factory=deque)
+    exhausted: bool = False
+    error: str | None = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.error is None and (bool(self.buffer) or not self.exhausted)
+
+
+def _newest_first(item: ActivityItemDto | EmailItemDto) -> tuple[int, int]:
+    occurred = occurred_date(item)
+    if occurred is None:
+        return (1, 0)
+    return (0, -occurred.toordinal())
+
+
+async def merge_activity_streams(
+    client: BackstopClient,
+    *,
+    segment: Segment,
+    entity_id: str,
+    continuation: ActivityTimelineContinuationResponse,
+) -> ActivityTimelineResponse[ActivityItemDto | EmailItemDto]:
+    """Merge the streams in `continuation.offsets` into one newest-first page of `limit` records.
+
+    A 403 on a stream drops that stream into `errors` and the merge carries on without it; any
+    other failure propagates.
+    """
+    page_size = math.ceil(continuation.limit / len(continuation.offsets))
+    streams = [
+        _Stream(
+            activity_type=activity_type,
+            returned=returned,
+            fetch_offset=returned - returned % page_size,
+            skip=returned % page_size,
+        )
+        for activity_type, returned in continuation.offsets.items()
+    ]
+    pages_read = 0
+
+    async def read_page(stream: _Stream) -> None:
+        nonlocal pages_read
+        try:
+            page = await fetch_activities_page(
+                client,
+                activity_type=stream.activity_type,
+                segment=segment,
+                entity_id=entity_id,
+                limit=page_size,
+                offset=stream.fetch_offset,
+                since=continuation.since,
+                until=continuation.until,
+                activity_tag_ids=continuation.activity_tag_ids or (),
+            )
+        except BackstopApiError as exc:
+            if exc.status_code != 403:
+                raise
+            logger.warning(
+                "activity_history.merge.stream_forbidden",
+                extra={
+                    "segment": segment,
+                    "entity_id": entity_id,
+                    "stream": stream.activity_type,
+                    "detail": exc.detail,
+                },
+            )
+            stream.error = exc.detail
+            stream.buffer.clear()
+            return
+        pages_read += 1
+        stream.buffer.extend(page.items[stream.skip :])
+        stream.skip = 0
+        stream.fetch_offset += page_size
+        stream.exhausted = page.end_of_stream
+
+    async def refill(stream: _Stream) -> None:
+        while not stream.buffer and stream.has_more:
+            await read_page(stream)
+
+    await asyncio.gather(*(refill(stream) for stream in streams))
+
+    heads = [
+        (_newest_first(stream.buffer[0]), index)
+        for index, stream in enumerate(streams)
+        if stream.buffer
+    ]
+    heapq.heapify(heads)
+    merged: list[ActivityItemDto | EmailItemDto] = []
+    while heads and len(merged) < continuation.limit:
+        key, index = heapq.heappop(heads)
+        stream = streams[index]
+        if not stream.buffer:
+            # A dry stream waits in the heap under its last key — its next record cannot be
+            # newer — so its next page is read only once that record is actually needed.
+            await refill(stream)
+        else:
+            merged.append(stream.buffer.popleft())
+            stream.returned += 1
+        if stream.buffer:
+            heapq.heappush(heads, (_newest_first(stream.buffer[0]), index))
+        elif stream.has_more:
+            heapq.heappush(heads, (key, index))
+
+    offsets: dict[ActivityType, int] = {
+        stream.activity_type: stream.returned for stream in streams if stream.has_more
+    }
+    errors: dict[ActivityType, str] = {
+        stream.activity_type: stream.error for stream in streams if stream.error is not None
+    }
+    logger.info(
+        "activity_history.merge.completed",
+        extra={
+            "segment": segment,
+            "entity_id": entity_id,
+            "limit": continuation.limit,
+            "page_size": page_size,
+            "pages_read": pages_read,
+            "items": len(merged),
+            "open_streams": list(offsets),
+        },
+    )
+    items = tuple(merged)
+    return ActivityTimelineResponse(
+        items=items,
+        date_range=occurred_date_range(items),
+        next=(
+            ActivityTimelineContinuationResponse(
+                limit=continuation.limit,
+                offsets=offsets,
+                since=continuation.since,
+                until=continuation.until,
+                activity_tag_ids=continuation.activity_tag_ids,
+            )
+            if offsets
+            else None
+        ),
+        errors=errors or None,
+    )
@@ -32,6 +32,7 @@ from backstop_mcp.features.activity_history.fetch_activities_page import (
     BackstopActivityType,
 )
 from backstop_mcp.features.activity_history.internal_dto import (
+    ActivityBodyDto,
     ActivityDetailDto,
     ActivityItemDto,
     ActivityRegardingDto,
@@ -44,6 +45,8 @@ from backstop_mcp.features.activity_history.internal_dto import (
     MeetingSpecificsDto,
 )
 from backstop_mcp.features.collection_scan import (
+    AggregateBreakdownDto,
+    AggregateBreakdownResponse,
     AggregateBucketDto,
     AggregateBucketResponse,
     ScanCoverageResponse,
@@ -69,6 +72,9 @@ __all__ = [
     "ActivityContinuationResponse",
     "ActivityGroupResponse",
     "ActivityHistoryResolvedResponse",
+    "ActivityHistoryTimelineResponse",
+    "ActivityTimelineContinuationResponse",
+    "ActivityTimelineResponse",
     "ActivityAttachmentResponse",
     "ActivityDetailResponse",
     "ActivityRegardingResponse",
@@ -84,6 +90,7 @@ __all__ = [
     "SearchActivitiesRowResponse",
     "SearchActivitiesUnavailableResponse",
     "TimelineRecord",
+    "activity_body",
     "to_timeline_record",
 ]
 
@@ -229,6 +236,108 @@ class ActivityGroupResponse[ItemT](OmitNoneModel):
     ] = None
 
 
+class ActivityTimelineContinuationResponse(OmitNoneModel):
+    """Params to fetch a merged timeline's next page. Echo from a prior `timeline.next`."""
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True)
+
+    limit: Annotated[
+        int,
+        Field(gt=0, description="Records per merged page. Copy from the prior `timeline.next`."),
+    ]
+    offsets: Annotated[
+        dict[ActivityType, Annotated[int, Field(ge=0)]],
+        Field(
+            min_length=1,
+            description=(
+                "Records already returned from each stream that still has more. Exhausted "
+                "streams are absent. Copy from the prior `timeline.next`; never edit it."
+            ),
+        ),
+    ]
+    since: Annotated[
+        date | None,
+        Field(
+            default=None,
+            description=(
+                "Lower date bound, copied from the prior `timeline.next`. Omitted (or null) "
+                "when the timeline has no lower bound — do not invent one."
+            ),
+        ),
+    ] = None
+    until: Annotated[
+        date | None,
+        Field(
+            default=None,
+            description=(
+                "Upper date bound, copied from the prior `timeline.next`. Omitted (or null) "
+                "when the timeline has no upper bound — do not invent one."
+            ),
+        ),
+    ] = None
+    activity_tag_ids: Annotated[
+        tuple[str, ...] | None,
+        Field(
+            default=None,
+            description=(
+                "Tag ids the timeline is filtered to, copied from the prior `timeline.next`. "
+                "Omitted (or null) when unfiltered. Echo them; never invent."
+            ),
+        ),
+    ] = None
+
+    @model_validator(mode="after")
+    def _since_not_after_until(self) -> Self:
+        _require_since_not_after_until(self.since, self.until)
+        return self
+
+
+class ActivityTimelineResponse[ItemT](OmitNoneModel):
+    """Every stream's records interleaved newest-first, with one continuation for all of them."""
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True)
+
+    items: Annotated[
+        tuple[ItemT, ...],
+        Field(
+            description=(
+                "Up to `limit` records across the streams, newest `occurred_at` first. Undated "
+                "records sort after dated ones; same-day records keep stream order."
+            ),
+        ),
+    ]
+    date_range: Annotated[
+        DateRangeResponse | None,
+        Field(
+            description=(
+                "Oldest and newest `occurred_at` dates among this page's dated items. Omitted "
+                "(or null) when the page is empty or every item lacks a date."
+            ),
+        ),
+    ] = None
+    next: Annotated[
+        ActivityTimelineContinuationResponse | None,
+        Field(
+            description=(
+                "Params to fetch the next merged page. Omitted (or null) once every stream is "
+                "exhausted. To continue, copy this object into a `type=timeline_next` "
+                "request's `next`."
+            ),
+        ),
+    ] = None
+    errors: Annotated[
+        dict[ActivityType, str] | None,
+        Field(
+            description=(
+                "Streams that could not be read (Backstop 403 on a linked entity the caller "
+                "cannot operate), keyed by activity type. Their records are missing from "
+                "`items` and they are dropped from `next` — that is not an empty stream. "
+                "Retry those activity types on search_activities (the primary)."
+            ),
+        ),
+    ] = None
+
+
 class ActivityRegardingResponse(OmitNoneModel):
     """The party or resource an activity is about, from Backstop's inline `regarding` value."""
 
@@ -560,8 +669,32 @@ class ActivityHistoryResolvedResponse(OmitNoneModel):
     )
 
 
+class ActivityHistoryTimelineResponse(OmitNoneModel):
+    """`get_activity_history` in merged mode: one interleaved timeline instead of groups."""
+
+    status: Literal["resolved"] = Field(
+        default="resolved",
+        description="Always 'resolved': the party was found and its timeline fetched.",
+    )
+    resolved: ResolvedPartyAsOfResponse = Field(
+        description=(
+            "The party identity this call settled on, plus `as_of` provenance. Echo "
+            "`id` / `search_type` / `name` as `party_id` later."
+        )
+    )
+    timeline: ActivityTimelineResponse[TimelineRecord] = Field(
+        description=(
+            "The requested streams merged newest-first into one page of exactly `limit` "
+            "records, fewer only once every stream is exhausted."
+        )
+    )
+
+
 type GetActivityHistoryResponse = (
-    PartyAmbiguousResponse | NotFoundResponse | ActivityHistoryResolvedResponse
+    PartyAmbiguousResponse
+    | NotFoundResponse
+    | ActivityHistoryResolvedResponse
+    | ActivityHistoryTimelineResponse
 )
 
 
@@ -639,24 +772,47 @@ class ActivityDetailResponse(OmitNoneModel):
         `detail.resource_id`, so what comes back is byte-identical to what went in — and stays
         a handle the model can pass straight back to this tool.
         """
-        gist = extract_gist_from_html(detail.description or "", max_chars=_FULL_BODY_MAX_CHARS)
+        return cls.from_body(
+            activity_id=activity_id,
+            body=activity_body(detail),
+            specifics=specifics,
+            attendees=attendees,
+        )
+
+    @classmethod
+    def from_body(
+        cls,
+        *,
+        activity_id: str,
+        body: ActivityBodyDto,
+        specifics: MeetingSpecificsDto | None,
+        attendees: tuple[AttendeeDto, ...],
+    ) -> Self:
+        """As `from_detail`, for a record whose description is already converted."""
         return cls(
             activity_id=activity_id,
-            type=detail.type,
-            title=detail.title,
-            body=gist.text,
+            type=body.type,
+            title=body.title,
+            body=body.body,
             start=None if specifics is None else specifics.start,
             stop=None if specifics is None else specifics.stop,
             location=None if specifics is None else specifics.location,
             time_zone=None if specifics is None else specifics.time_zone,
             attendees=[AttendeeResponse(name=attendee.name) for attendee in attendees],
             attachments=tuple(
-                ActivityAttachmentResponse(id=item.id, name=item.name)
-                for item in detail.attachments
+                ActivityAttachmentResponse(id=item.id, name=item.name) for item in body.attachments
             ),
         )
 
 
+def activity_body(detail: ActivityDetailDto) -> ActivityBodyDto:
+    """Convert a detail record's full HTML description to Markdown — no truncation budget."""
+    gist = extract_gist_from_html(detail.description or "", max_chars=_FULL_BODY_MAX_CHARS)
+    return ActivityBodyDto(
+        type=detail.type, title=detail.title, body=gist.text, attachments=detail.attachments
+    )
+
+
 class SearchActivitiesUnavailableResponse(OmitNoneModel):
     """The undocumented search endpoint did not answer. Not 'there is no activity'."""
 
@@ -857,7 +1013,17 @@ class SearchActivitiesResolvedResponse(OmitNoneModel):
     )
     aggregates: tuple[AggregateBucketResponse, ...] = Field(
         default=(),
-        description="Count buckets in aggregate mode. Empty in rows mode.",
+        description=(
+            "Count buckets in aggregate mode, for the first `group_by` when several were "
+            "given. Empty in rows mode."
+        ),
+    )
+    breakdowns: tuple[AggregateBreakdownResponse, ...] = Field(
+        default=(),
+        description=(
+            "One set of count buckets per `group_by`, in the order given, when several were "
+            "given. All come from the same scan, so their counts agree."
+        ),
     )
 
     @classmethod
@@ -870,6 +1036,7 @@ class SearchActivitiesResolvedResponse(OmitNoneModel):
         resolved: ResolvedPartyResponse | None,
         ceiling: int,
         aggregates: tuple[AggregateBucketDto, ...] = (),
+        breakdowns: tuple[AggregateBreakdownDto, ...] = (),
         description_row_capped: bool = False,
     ) -> Self:
         extra = (_DESCRIPTION_ROW_CAP_DISCLAIMER,) if description_row_capped else ()
@@ -894,6 +1061,9 @@ class SearchActivitiesResolvedResponse(OmitNoneModel):
             coverage=coverage,
             rows=rows,
             aggregates=tuple(AggregateBucketResponse.from_dto(bucket) for bucket in aggregates),
+            breakdowns=tuple(
+                AggregateBreakdownResponse.from_dto(breakdown) for breakdown in breakdowns
+            ),
         )
 
 
@@ -0,0 +1,250 @@
+"""Read an effective-date window past the 10000 wall by cutting it into sub-windows.
+
+`fetch_entity_activities` stops at `MAX_RETRIEVABLE`: `pageNum × pageSize > 10000` is a 500, and
+`totalCount` saturates at 10000, so a busy firm-year can only ever be answered as a floor. The
+wall is per search, though, not per window — a narrower `effectiveDate` filter is a fresh 10000.
+`scan_entity_activities` plans from that:
+
+- each window's page one is read first, at the walk's own page size, for its `totalCount`;
+- a window under the wall is one leaf: `fetch_entity_activities` takes that page as read and
+  walks on from page two, so planning a leaf costs no request of its own;
+- a window at the wall is halved by days, its page one discarded, and each half read again.
+  `totalCount` no longer says by how much it overflows, so halving is as well-sized as any
+  split can be from here.
+
+Windows are all started at once; the per-user gate, not this module, bounds how many are on the
+wire. Only the scan's first page waits in the `FIRST_PAGE` lane — every later page is bulk, in
+`LATER_PAGE`, behind other callers' lookups. A failing window fails the scan, and the rest of the
+scan is cancelled and awaited first, so nothing keeps reading (or handing rows to `on_rows`) for
+a call that has already failed. The leaves' rows are merged newest window first and
+deduplicated by activity id, which is what keeps a row on a boundary from counting twice.
+
+Bounded by `max_windows` leaves, and so by `max_windows × MAX_RETRIEVABLE` rows held at once.
+With `on_rows` the leaves' pages go straight to the caller instead, and only the ids already
+handed over are kept, for the deduplication. A window that still saturates once the budget is
+spent, or that is a single day and cannot be halved, is fetched as a leaf anyway and reported
+`ceiling_clamped` — the answer is then a floor again, and says so, rather than a guess.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from backstop_mcp.backstop_client import BackstopClient, RequestPriority
+from backstop_mcp.features.activity_history.api_responses import EntityActivitiesPageAttributes
+from backstop_mcp.features.activity_history.fetch_entity_activities import (
+    ENTITY_ACTIVITY_TYPES,
+    MAX_RETRIEVABLE,
+    PAGE_SIZE,
+    EntityActivityType,
+    fetch_entity_activities,
+    fetch_entity_activities_page,
+)
+from backstop_mcp.features.activity_history.internal_dto import (
+    EntityActivitiesFetchDto,
+    EntityActivityDto,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["scan_entity_activities"]
+
+
+@dataclass(frozen=True)
+class _Filters:
+    types: Sequence[EntityActivityType]
+    associated_withs: Sequence[str]
+    activity_tags: Sequence[str]
+    authors: Sequence[str]
+    page_size: int
+    max_retrievable: int
+    on_rows: Callable[[Sequence[EntityActivityDto]], None] | None = None
+
+
+@dataclass
+class _Unseen:
+    """Forwards each row to `on_rows` once, however many windows answer it."""
+
+    on_rows: Callable[[Sequence[EntityActivityDto]], None]
+    seen: set[str] = field(default_factory=set)
+    duplicates: int = 0
+
+    def __call__(self, rows: Sequence[EntityActivityDto]) -> None:
+        fresh: list[EntityActivityDto] = []
+        for row in rows:
+            if row.id in self.seen:
+                self.duplicates += 1
+                continue
+            self.seen.add(row.id)
+            fresh.append(row)
+        self.on_rows(fresh)
+
+
+@dataclass
+class _Budget:
+    """Leaves still allowed; a split spends one per extra window it creates."""
+
+    remaining: int
+
+    def split(self) -> bool:
+        if self.remaining < 2:
+            return False
+        self.remaining -= 1
+        return True
+
+
+async def scan_entity_activities(
+    client: BackstopClient,
+    *,
+    start_date: date,
+    end_date: date,
+    types: Sequence[EntityActivityType] = ENTITY_ACTIVITY_TYPES,
+    associated_withs: Sequence[str] = (),
+    activity_tags: Sequence[str] = (),
+    authors: Sequence[str] = (),
+    max_windows: int,
+    page_size: int = PAGE_SIZE,
+    max_retrievable: int = MAX_RETRIEVABLE,
+    on_rows: Callable[[Sequence[EntityActivityDto]], None] | None = None,
+) -> EntityActivitiesFetchDto:
+    """Every visible row in the window, read as at most `max_windows` sub-window walks.
+
+    Row bodies only — no descriptions — since this exists for counting over windows far wider
+    than any row listing would ask for. See the module docstring for the plan. With `on_rows`,
+    rows are handed over page by page, each once, and `rows` on the result is empty.
+    """
+    unseen = None if on_rows is None else _Unseen(on_rows)
+    filters = _Filters(
+        types=types,
+        associated_withs=associated_withs,
+        activity_tags=activity_tags,
+        authors=authors,
+        page_size=page_size,
+        max_retrievable=max_retrievable,
+        on_rows=unseen,
+    )
+    budget = _Budget(remaining=max_windows)
+    leaves, split_pages = await _scan(
+        client,
+        start_date,
+        end_date,
+        filters=filters,
+        budget=budget,
+        priority=RequestPriority.FIRST_PAGE,
+    )
+
+    rows: dict[str, EntityActivityDto] = {}
+    for leaf in leaves:
+        for row in leaf.rows:
+            _ = rows.setdefault(row.id, row)
+    if unseen is None:
+        returned = len(rows)
+        duplicates = sum(len(leaf.rows) for leaf in leaves) - returned
+    else:
+        returned, duplicates = len(unseen.seen), unseen.duplicates
+    totals = [leaf.total_count for leaf in leaves]
+    merged = EntityActivitiesFetchDto(
+        rows=tuple(rows.values()),
+        total_count=None if None in totals else sum(total or 0 for total in totals),
+        rows_dropped=sum(leaf.rows_dropped for leaf in leaves),
+        rows_received=sum(leaf.rows_received for leaf in leaves),
+        pages_fetched=split_pages + sum(leaf.pages_fetched for leaf in leaves),
+        pages_in_flight=sum(leaf.pages_in_flight for leaf in leaves),
+        # A leaf at the wall is a floor even when its walk read exactly that many rows.
+        ceiling_clamped=any(
+            leaf.ceiling_clamped or (leaf.total_count or 0) >= max_retrievable for leaf in leaves
+        ),
+        truncated_by_row_cap=False,
+        partial_due_to_error=any(leaf.partial_due_to_error for leaf in leaves),
+        windows=len(leaves),
+    )
+    logger.info(
+        "activity_history.entity_activities.windowed",
+        extra={
+            "windows": merged.windows,
+            "split_pages": split_pages,
+            "returned": returned,
+            "duplicates": duplicates,
+            "total_count": merged.total_count,
+            "ceiling_clamped": merged.ceiling_clamped,
+        },
+    )
+    return merged
+
+
+async def _scan(
+    client: BackstopClient,
+    start_date: date,
+    end_date: date,
+    *,
+    filters: _Filters,
+    budget: _Budget,
+    priority: RequestPriority = RequestPriority.LATER_PAGE,
+) -> tuple[list[EntityActivitiesFetchDto], int]:
+    """The leaf walks covering the window, newest first, and how many pages splitting discarded.
+
+    `priority` is the lane for this window's page one only; the rest of its walk is bulk.
+    """
+    probe = await fetch_entity_activities_page(
+        client,
+        page_num=1,
+        page_size=filters.page_size,
+        start_date=start_date,
+        end_date=end_date,
+        types=filters.types,
+        associated_withs=filters.associated_withs,
+        activity_tags=filters.activity_tags,
+        authors=filters.authors,
+        priority=priority,
+    )
+    days = (end_date - start_date).days + 1
+    saturated = probe.total_count is not None and probe.total_count >= filters.max_retrievable
+    if not saturated or days < 2 or not budget.split():
+        if saturated:
+            logger.warning(
+                "activity_history.entity_activities.window_unsplittable",
+                extra={"start_date": start_date.isoformat(), "days": days},
+            )
+        return [await _walk(client, start_date, end_date, filters=filters, first_page=probe)], 0
+    middle = start_date + timedelta(days=days // 2)
+    halves = [
+        asyncio.ensure_future(_scan(client, middle, end_date, filters=filters, budget=budget)),
+        asyncio.ensure_future(
+            _scan(client, start_date, middle - timedelta(days=1), filters=filters, budget=budget)
+        ),
+    ]
+    try:
+        (newer, newer_split), (older, older_split) = await asyncio.gather(*halves)
+    finally:
+        # A failed half fails the scan: the other one, with every window under it, stops too.
+        for half in halves:
+            _ = half.cancel()
+        _ = await asyncio.gather(*halves, return_exceptions=True)
+    return [*newer, *older], 1 + newer_split + older_split
+
+
+async def _walk(
+    client: BackstopClient,
+    start_date: date,
+    end_date: date,
+    *,
+    filters: _Filters,
+    first_page: EntityActivitiesPageAttributes,
+) -> EntityActivitiesFetchDto:
+    return await fetch_entity_activities(
+        client,
+        start_date=start_date,
+        end_date=end_date,
+        types=filters.types,
+        associated_withs=filters.associated_withs,
+        activity_tags=filters.activity_tags,
+        authors=filters.authors,
+        page_size=filters.page_size,
+        max_retrievable=filters.max_retrievable,
+        parallel=True,
+        on_rows=filters.on_rows,
+        priority=RequestPriority.LATER_PAGE,
+        first_page=first_page,
+    )
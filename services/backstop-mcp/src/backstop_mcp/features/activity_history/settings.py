@@ -13,9 +13,11 @@ from pydantic import BaseModel, ConfigDict, Field
 
 
 class ActivityHistorySettings(BaseModel):
-    """Per-stream page size and gist truncation budget for activity history."""
+    """Per-stream page size, gist truncation budget, and the search's sub-window budget."""
 
     model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True)
 
     page_size: int = Field(gt=0)
     gist_max_chars: int = Field(gt=0)
+    # How many sub-windows `search_activities` may cut an aggregate scan into; 1 never splits.
+    search_max_windows: int = Field(default=1, ge=1)
@@ -19,6 +19,7 @@ from pydantic import (
 from backstop_mcp.backstop_client import BackstopClient
 from backstop_mcp.features.activity_history import (
     ActivityContinuationResponse,
+    ActivityTimelineContinuationResponse,
     ActivityType,
     Segment,
 )
@@ -26,6 +27,8 @@ from backstop_mcp.features.data_hygiene import ProvenanceAttributes
 from backstop_mcp.features.entity_types import SearchType
 from backstop_mcp.features.party_resolver import (
     PartyAmbiguousResponse,
+    PartyNameIndex,
+    PartyResolutionCache,
     ResolvedPartyDto,
     resolve_party,
     unresolved_party_response,
@@ -127,10 +130,21 @@ class ActivityHistoryFirstPageInput(BaseModel):
             gt=0,
             description=(
                 "Page size per stream (not a total cap — a response can carry up to `limit` "
-                "records per active stream). Defaults to this server's configured page size."
+                "records per active stream). With `merged`, the total records in the one "
+                "merged page instead. Defaults to this server's configured page size."
             ),
         ),
     ] = None
+    merged: Annotated[
+        bool,
+        Field(
+            description=(
+                "Return one `timeline` of `limit` records interleaved newest-first across the "
+                "requested streams, with a single `next`, instead of one group per stream. "
+                "Continue it with `type=timeline_next`."
+            ),
+        ),
+    ] = False
 
     @field_validator("party_id", "search", mode="before")
     @classmethod
@@ -210,8 +224,48 @@ class ActivityHistoryNextPageInput(BaseModel):
         return self
 
 
+class ActivityHistoryTimelineNextPageInput(BaseModel):
+    """Fetch the next page of a merged timeline already in progress."""
+
+    type: Literal["timeline_next"]
+    search_type: Annotated[
+        SearchType,
+        Field(
+            description=(
+                "Trusted `search_type` copied from a prior `get_activity_history` response's "
+                "`resolved.search_type`. Never invent or guess."
+            ),
+        ),
+    ]
+    entity_id: Annotated[
+        _NonEmptyStr,
+        Field(
+            description=(
+                "Trusted Backstop entity id copied from a prior `get_activity_history` "
+                "response's `resolved.id`. Never invent or guess."
+            ),
+        ),
+    ]
+    next: Annotated[
+        ActivityTimelineContinuationResponse,
+        Field(
+            description=(
+                "A prior response's `timeline.next`, copied whole. Never edit, invent, or guess."
+            ),
+        ),
+    ]
+
+    @model_validator(mode="after")
+    def _entity_id_is_a_path_segment(self) -> Self:
+        if "/" in self.entity_id:
+            raise ValueError(f"entity_id {self.entity_id!r} must not contain '/'")
+        return self
+
+
 type ActivityHistoryPageInput = Annotated[
-    ActivityHistoryFirstPageInput | ActivityHistoryNextPageInput,
+    ActivityHistoryFirstPageInput
+    | ActivityHistoryNextPageInput
+    | ActivityHistoryTimelineNextPageInput,
     Field(discriminator="type"),
 ]
 
@@ -244,7 +298,8 @@ class FetchArgs(BaseModel):
     segment: Segment
     entity_id: str
     party: ResolvedPartyDto
-    continuations: Mapping[ActivityType, ActivityContinuationResponse]
+    continuations: Mapping[ActivityType, ActivityContinuationResponse] = {}
+    timeline: ActivityTimelineContinuationResponse | None = None
 
 
 def effective_activity_types(
@@ -261,17 +316,42 @@ def effective_activity_types(
 async def extract_fetch_activity_history_args(
     ctx: Context,
     client: BackstopClient,
-    request: ActivityHistoryFirstPageInput | ActivityHistoryNextPageInput,
+    request: (
+        ActivityHistoryFirstPageInput
+        | ActivityHistoryNextPageInput
+        | ActivityHistoryTimelineNextPageInput
+    ),
     *,
     page_size: int,
+    cache: PartyResolutionCache | None = None,
+    names: PartyNameIndex | None = None,
 ) -> FetchArgs | PartyAmbiguousResponse | NotFoundResponse:
     """Turn a first/next page input into shared fetch inputs, or an unresolved party response.
 
     Pydantic already validates/discriminates the wire shape (`ActivityHistoryPageInput`). This
-    step is separate because it does async I/O: party resolve on `first`. `next` copies
-    `search_type` / `entity_id` / continuations from the request with no HTTP.
+    step is separate because it does async I/O: party resolve on `first`. `next` and
+    `timeline_next` copy `search_type` / `entity_id` / continuations from the request with no
+    HTTP. A merged request carries `timeline` instead of per-stream `continuations`.
     """
     match request:
+        case ActivityHistoryTimelineNextPageInput(
+            search_type=search_type, entity_id=entity_id, next=timeline
+        ):
+            args = FetchArgs(
+                segment=search_type,
+                entity_id=entity_id,
+                party=ResolvedPartyDto(id=entity_id, search_type=search_type, name=None),
+                timeline=timeline,
+            )
+            logger.info(
+                "activity_history.args.timeline_next",
+                extra={
+                    "segment": args.segment,
+                    "entity_id": args.entity_id,
+                    "activity_types": list(timeline.offsets),
+                },
+            )
+            return args
         case ActivityHistoryNextPageInput(
             search_type=search_type, entity_id=entity_id, next=continuations
         ):
@@ -299,6 +379,7 @@ async def extract_fetch_activity_history_args(
             until=until,
             limit=limit,
             activity_tag_ids=activity_tag_ids,
+            merged=merged,
         ):
             result = await resolve_party(
                 ctx,
@@ -306,6 +387,8 @@ async def extract_fetch_activity_history_args(
                 search_type=search_type,
                 party_id=party_id,
                 search=search,
+                cache=cache,
+                names=names,
             )
             if not isinstance(result, Resolved):
                 logger.info(
@@ -326,27 +409,42 @@ async def extract_fetch_activity_history_args(
             effective_page_size = limit if limit is not None else page_size
             # Person quick-search uses shared PERSON_* types, so a hit may be contacts/
             # employees — follow `party.search_type` like `get_person`, not the requested one.
-            args = FetchArgs(
-                segment=party.search_type,
-                entity_id=party.id,
-                party=party,
-                continuations={
-                    activity_type: ActivityContinuationResponse(
+            if merged:
+                args = FetchArgs(
+                    segment=party.search_type,
+                    entity_id=party.id,
+                    party=party,
+                    timeline=ActivityTimelineContinuationResponse(
                         limit=effective_page_size,
-                        offset=0,
+                        offsets=dict.fromkeys(effective_types, 0),
                         since=since,
                         until=until,
                         activity_tag_ids=tag_ids,
-                    )
-                    for activity_type in effective_types
-                },
-            )
+                    ),
+                )
+            else:
+                args = FetchArgs(
+                    segment=party.search_type,
+                    entity_id=party.id,
+                    party=party,
+                    continuations={
+                        activity_type: ActivityContinuationResponse(
+                            limit=effective_page_size,
+                            offset=0,
+                            since=since,
+                            until=until,
+                            activity_tag_ids=tag_ids,
+                        )
+                        for activity_type in effective_types
+                    },
+                )
             logger.info(
                 "activity_history.args.first",
                 extra={
                     "segment": args.segment,
                     "entity_id": args.entity_id,
-                    "activity_types": list(args.continuations),
+                    "activity_types": list(effective_types),
+                    "merged": merged,
                 },
             )
             return args
@@ -14,6 +14,14 @@ one request: both `/meeting-or-calls` paths 404 for a resource id that is not a
 A bare id fetches detail first, then the two meeting endpoints only when `type` is meeting
 or call.
 
+With `ActivityBodyCache` on, a composite handle's detail record is not read at all when the
+cache already holds its current version: the caller reads only `modifiedTimestamp` from the
+record's own collection — for a meeting/call, as one more field of the specifics read it makes
+anyway — and the converted body kept for that version is served. That version read is the
+caller's own permission check. A bare id has no collection to read a version from, and a handle
+naming a collection other than `notes`, `documents` or `meeting-or-calls` is not put in a path,
+so both always take the full path.
+
 A stale or invented `activity_id` raises rather than returning a bespoke not-found response.
 An empty handle fails locally as a `ToolError`; one that is well-formed but unknown becomes
 a 404 `BackstopApiError` (`/entity-activity-details` answers 200 with null primary data for
@@ -33,11 +41,18 @@ from pydantic import Field
 from backstop_mcp.backstop_client import BackstopClient
 from backstop_mcp.dependencies import get_backstop_client
 from backstop_mcp.features.activity_history import (
+    ActivityBodyCache,
+    ActivityBodyDto,
     ActivityDetailResponse,
+    AttendeeDto,
+    MeetingSpecificsDto,
     ResourceIdentifierDto,
+    activity_body,
     fetch_activity_detail,
+    fetch_activity_version,
     fetch_attendees,
     fetch_meeting_specifics,
+    get_activity_body_cache,
 )
 from backstop_mcp.models import published_output_schema
 
@@ -74,6 +89,7 @@ async def get_activity_detail(
         ),
     ],
     client: BackstopClient = Depends(get_backstop_client),
+    bodies: ActivityBodyCache | None = Depends(get_activity_body_cache),
 ) -> ActivityDetailResponse:
     """Fetch one activity's full body, meeting specifics, attendees, and attachment list.
 
@@ -102,6 +118,22 @@ async def get_activity_detail(
             "meeting_or_call": handle.is_meeting_or_call,
         },
     )
+    if bodies is not None and handle.resource_type is not None and handle.has_known_collection:
+        body, specifics, attendees = await _versioned_detail(
+            client, bodies, handle, resource_type=handle.resource_type
+        )
+        logger.info(
+            "activity_history.detail.get.completed",
+            extra={
+                "activity_id": activity_id,
+                "type": body.type,
+                "attendees": len(attendees),
+                "has_body": bool(body.body),
+            },
+        )
+        return ActivityDetailResponse.from_body(
+            activity_id=activity_id, body=body, specifics=specifics, attendees=attendees
+        )
     if handle.is_meeting_or_call:
         detail, specifics, attendees = await asyncio.gather(
             fetch_activity_detail(client, resource_id=resource_id),
@@ -141,3 +173,31 @@ async def get_activity_detail(
     return ActivityDetailResponse.from_detail(
         activity_id=activity_id, detail=detail, specifics=specifics, attendees=attendees
     )
+
+
+async def _versioned_detail(
+    client: BackstopClient,
+    bodies: ActivityBodyCache,
+    handle: ResourceIdentifierDto,
+    *,
+    resource_type: str,
+) -> tuple[ActivityBodyDto, MeetingSpecificsDto | None, tuple[AttendeeDto, ...]]:
+    """A composite handle's parts, with the body taken from `bodies` by the record's version."""
+    resource_id = handle.resource_id
+
+    async def read_body() -> ActivityBodyDto:
+        return activity_body(await fetch_activity_detail(client, resource_id=resource_id))
+
+    if handle.is_meeting_or_call:
+        specifics, attendees = await asyncio.gather(
+            fetch_meeting_specifics(client, resource_id=resource_id),
+            fetch_attendees(client, resource_id=resource_id),
+        )
+        modified = specifics.modified
+    else:
+        modified = await fetch_activity_version(
+            client, resource_type=resource_type, resource_id=resource_id
+        )
+        specifics, attendees = None, ()
+    body = await bodies.body(resource_id=resource_id, modified=modified, load_upstream=read_body)
+    return body, specifics, attendees
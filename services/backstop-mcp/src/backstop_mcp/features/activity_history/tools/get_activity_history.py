@@ -4,7 +4,8 @@ On a `type="first"` request, resolves the party (`search_type` + `party_id`/`sea
 `get_person`/`get_organization`), then fetches the party record and every requested stream's first
 page. On a `type="next"` request, `search_type` / `entity_id` / per-stream continuations are echoed
 from a prior response — no resolve, no `/quick-search` round trip — and only those streams are
-re-fetched.
+re-fetched. A `merged` first page, and its `type="timeline_next"` follow-ups, hand the streams to
+`merge_activity_streams` instead and return one interleaved `timeline`.
 
 The party record is fetched first (name + `as_of` provenance). Active stream fetches then go
 through one `asyncio.gather` call. A 5xx or transport failure still fails the whole call.
@@ -32,7 +33,9 @@ from backstop_mcp.features.activity_history import (
     ActivityGroupResponse,
     ActivityHistoryResolvedResponse,
     ActivityHistorySettings,
+    ActivityHistoryTimelineResponse,
     ActivityPageDto,
+    ActivityTimelineResponse,
     ActivityType,
     EmailPageDto,
     GetActivityHistoryResponse,
@@ -41,14 +44,22 @@ from backstop_mcp.features.activity_history import (
     fetch_activities_page,
     get_activity_history_settings,
     group_activity_page,
+    merge_activity_streams,
     to_timeline_record,
 )
+from backstop_mcp.features.party_resolver import (
+    PartyNameIndex,
+    PartyResolutionCache,
+    get_party_name_index,
+    get_party_resolution_cache,
+)
 from backstop_mcp.models import published_output_schema
 
 from ._page_input import (
     ActivityHistoryFirstPageInput,
     ActivityHistoryNextPageInput,
     ActivityHistoryPageInput,
+    ActivityHistoryTimelineNextPageInput,
     FetchArgs,
     PartyRecordResponse,
     extract_fetch_activity_history_args,
@@ -60,6 +71,7 @@ __all__ = [
     "ActivityHistoryFirstPageInput",
     "ActivityHistoryNextPageInput",
     "ActivityHistoryPageInput",
+    "ActivityHistoryTimelineNextPageInput",
     "get_activity_history",
 ]
 
@@ -78,6 +90,8 @@ async def get_activity_history(
     request: ActivityHistoryPageInput,
     client: BackstopClient = Depends(get_backstop_client),
     activity_history: ActivityHistorySettings = Depends(get_activity_history_settings),
+    party_resolutions: PartyResolutionCache | None = Depends(get_party_resolution_cache),
+    party_names: PartyNameIndex | None = Depends(get_party_name_index),
 ) -> GetActivityHistoryResponse:
     """Party-scoped stream pages. Do not start here — always use `search_activities` first.
 
@@ -101,6 +115,12 @@ async def get_activity_history(
     present. Drop exhausted streams (`next` omitted, or null). A one-entry map deepens a
     single stream; several entries continue those streams together.
 
+    For one timeline across streams instead, pass `merged=true` on the first page: the response
+    is `timeline`, exactly `limit` records newest-first across every requested stream (fewer only
+    once all are exhausted), with one `timeline.next`. Continue with `request.type=
+    "timeline_next"`, echoing `resolved.search_type`, `resolved.id` as `entity_id`, and
+    `timeline.next` whole as `next`. Streams Backstop refuses are listed in `timeline.errors`.
+
     Future-dated meetings and calls are included, not filtered — Backstop schedules carry real
     future `effectiveDate`s, so an upcoming meeting can appear at the top of its stream.
 
@@ -123,7 +143,12 @@ async def get_activity_history(
     use the same argument.
     """
     args = await extract_fetch_activity_history_args(
-        ctx, client, request, page_size=activity_history.page_size
+        ctx,
+        client,
+        request,
+        page_size=activity_history.page_size,
+        cache=party_resolutions,
+        names=party_names,
     )
     if not isinstance(args, FetchArgs):
         return args
@@ -133,7 +158,7 @@ async def get_activity_history(
         extra={
             "segment": args.segment,
             "entity_id": args.entity_id,
-            "streams": list(args.continuations),
+            "streams": list(args.continuations if args.timeline is None else args.timeline.offsets),
         },
     )
     party_path = f"/{args.segment}/{quote(args.entity_id, safe='')}"
@@ -141,6 +166,27 @@ async def get_activity_history(
         party_path,
         schema=BackstopApiResourceDocument[PartyRecordResponse],
     )
+    gist_max_chars = activity_history.gist_max_chars
+    if args.timeline is not None:
+        timeline = await merge_activity_streams(
+            client,
+            segment=args.segment,
+            entity_id=args.entity_id,
+            continuation=args.timeline,
+        )
+        attributes = document.require_data(path=party_path).attributes
+        return ActivityHistoryTimelineResponse(
+            resolved=ResolvedPartyAsOfResponse.from_party(args.party, attributes=attributes),
+            timeline=ActivityTimelineResponse(
+                items=tuple(
+                    to_timeline_record(item, gist_max_chars=gist_max_chars)
+                    for item in timeline.items
+                ),
+                date_range=timeline.date_range,
+                next=timeline.next,
+                errors=timeline.errors,
+            ),
+        )
     page_calls: dict[ActivityType, Coroutine[None, None, ActivityPageDto | EmailPageDto]] = {
         activity_type: fetch_activities_page(
             client,
@@ -157,7 +203,6 @@ async def get_activity_history(
     }
     settled = await asyncio.gather(*page_calls.values(), return_exceptions=True)
 
-    gist_max_chars = activity_history.gist_max_chars
     groups: dict[ActivityType, ActivityGroupResponse[TimelineRecord]] = {}
     for (activity_type, continuation), result in zip(
         args.continuations.items(), settled, strict=True
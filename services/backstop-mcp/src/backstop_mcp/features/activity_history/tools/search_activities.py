@@ -26,17 +26,24 @@ from backstop_mcp.features.activity_history import (
     ENTITY_ACTIVITY_TYPES,
     MAX_RETRIEVABLE,
     ActivityAggregateBy,
+    ActivityHistorySettings,
     EntityActivityType,
     GetSearchActivitiesResponse,
     SearchActivitiesResolvedResponse,
     SearchActivitiesUnavailableResponse,
-    aggregate_entity_activities,
+    entity_activities_tally,
     fetch_entity_activities,
+    get_activity_history_settings,
     party_bean,
+    scan_entity_activities,
 )
 from backstop_mcp.features.entity_types import SearchType
 from backstop_mcp.features.party_resolver import (
+    PartyNameIndex,
+    PartyResolutionCache,
     ResolvedPartyResponse,
+    get_party_name_index,
+    get_party_resolution_cache,
     resolve_party,
     unresolved_party_response,
 )
@@ -104,6 +111,16 @@ def _is_wide_sweep(
     return not associated_withs and not activity_tags and not authors
 
 
+def _dimensions(
+    group_by: ActivityAggregateBy | Sequence[ActivityAggregateBy] | None,
+) -> tuple[ActivityAggregateBy, ...]:
+    if group_by is None:
+        return ()
+    if isinstance(group_by, str):
+        return (group_by,)
+    return tuple(dict.fromkeys(group_by))
+
+
 def _add_years(day: date, years: int) -> date:
     try:
         return day.replace(year=day.year + years)
@@ -238,12 +255,13 @@ async def search_activities(
         ),
     ] = "rows",
     group_by: Annotated[
-        ActivityAggregateBy | None,
+        ActivityAggregateBy | list[ActivityAggregateBy] | None,
         Field(
             default=None,
             description=(
-                "Required when `mode=aggregate`: type, tag, party, or period (YYYY-MM). "
-                "Must be omitted in rows mode."
+                "Required when `mode=aggregate`: type, tag, party, or period (YYYY-MM) — or a "
+                "list of them, counted in one scan and returned as `breakdowns`. Must be "
+                "omitted in rows mode."
             ),
         ),
     ] = None,
@@ -255,8 +273,9 @@ async def search_activities(
             le=_MAX_ROWS,
             description=(
                 f"Maximum row bodies to return in rows mode. Aggregate mode scans up to the "
-                f"{MAX_RETRIEVABLE} ceiling on a scoped search and is refused on a wide sweep. "
-                "include_description caps this at 50 and is refused in aggregate mode."
+                f"{MAX_RETRIEVABLE} ceiling per effective-date window, and is refused on a wide "
+                "sweep unless this deployment splits the window. include_description caps "
+                "this at 50 and is refused in aggregate mode."
             ),
         ),
     ] = _DEFAULT_MAX_ROWS,
@@ -273,6 +292,9 @@ async def search_activities(
         ),
     ] = None,
     client: BackstopClient = Depends(get_backstop_client),
+    party_resolutions: PartyResolutionCache | None = Depends(get_party_resolution_cache),
+    party_names: PartyNameIndex | None = Depends(get_party_name_index),
+    activity_history: ActivityHistorySettings = Depends(get_activity_history_settings),
 ) -> GetSearchActivitiesResponse:
     """Search activities firm-wide or for one party: meetings, calls, notes, emails, documents.
 
@@ -290,15 +312,19 @@ async def search_activities(
     `pageNum × pageSize` before requesting so it never provokes that 500, and returns the
     partial set with a disclaimer. Tag filters here are OR; REST tag filters are AND.
 
-    `mode=aggregate` with `group_by` answers a counting question without row bodies. Aggregate
-    and `include_description` are refused on a wide sweep (no party, no tags, no authors) —
-    that walk hits the 10000 ceiling. `include_description` is opt-in, capped, and refused in
-    aggregate mode. `attachments_count` is a count only — pass the row `activity_id` (or `id`)
+    `mode=aggregate` with `group_by` answers a counting question without row bodies; a list of
+    `group_by` values answers several breakdowns from the same scan. Where this deployment
+    allows it, an aggregate is read as several effective-date sub-windows, so its counts are
+    exact past 10000; otherwise aggregate is refused on a wide sweep (no party, no
+    tags, no authors) — that walk hits the 10000 ceiling. `include_description` is always
+    refused on a wide sweep; it is opt-in, capped, and refused in aggregate mode.
+    `attachments_count` is a count only — pass the row `activity_id` (or `id`)
     to `get_activity_detail` for the file list. Meeting, call, note, and document rows from
     `get_activity_history` use the same argument; history email ids do not.
     """
     start_date, end_date = _date_window(start_date, end_date, today=date.today())
-    if mode == "aggregate" and group_by is None:
+    dimensions = _dimensions(group_by)
+    if mode == "aggregate" and not dimensions:
         raise ValueError("group_by is required when mode is aggregate")
     if mode == "rows" and group_by is not None:
         raise ValueError("group_by is only used when mode is aggregate")
@@ -316,7 +342,13 @@ async def search_activities(
     associated_withs: tuple[str, ...] = ()
     if search_type is not None:
         outcome = await resolve_party(
-            ctx, client, search_type=search_type, party_id=party_id, search=search
+            ctx,
+            client,
+            search_type=search_type,
+            party_id=party_id,
+            search=search,
+            cache=party_resolutions,
+            names=party_names,
         )
         if not isinstance(outcome, Resolved):
             return unresolved_party_response(outcome)
@@ -336,7 +368,8 @@ async def search_activities(
             "include_description is refused on a wide sweep; pass a party, "
             + "activity_tag_ids, or authors, or leave include_description false"
         )
-    if mode == "aggregate" and wide:
+    windowed = mode == "aggregate" and activity_history.search_max_windows > 1
+    if mode == "aggregate" and wide and not windowed:
         raise ValueError(
             "mode=aggregate is refused on a wide sweep; pass a party, activity_tag_ids, "
             + "or authors, or use mode=rows"
@@ -360,18 +393,38 @@ async def search_activities(
             "party": None if resolved_party is None else resolved_party.id,
         },
     )
+    # Aggregate mode counts each page as it arrives and keeps no rows.
+    tally = entity_activities_tally(dimensions) if mode == "aggregate" else None
+    on_rows = None if tally is None else tally.add
     try:
-        fetch = await fetch_entity_activities(
-            client,
-            start_date=start_date,
-            end_date=end_date,
-            types=selected_types,
-            associated_withs=associated_withs,
-            activity_tags=tag_ids,
-            authors=author_emails,
-            include_description=include_description,
-            max_rows=None if mode == "aggregate" else row_cap,
-        )
+        if windowed:
+            fetch = await scan_entity_activities(
+                client,
+                start_date=start_date,
+                end_date=end_date,
+                types=selected_types,
+                associated_withs=associated_withs,
+                activity_tags=tag_ids,
+                authors=author_emails,
+                max_windows=activity_history.search_max_windows,
+                on_rows=on_rows,
+            )
+        else:
+            fetch = await fetch_entity_activities(
+                client,
+                start_date=start_date,
+                end_date=end_date,
+                types=selected_types,
+                associated_withs=associated_withs,
+                activity_tags=tag_ids,
+                authors=author_emails,
+                include_description=include_description,
+                max_rows=None if mode == "aggregate" else row_cap,
+                # `totalCount` is a true visible-to-this-credential count here, which is what the
+                # fan-out plans from; an aggregate scan of a busy party is up to 20 pages.
+                parallel=True,
+                on_rows=on_rows,
+            )
     except (BackstopAuthError, BackstopRateLimitError):
         # Neither is "this endpoint is unavailable". A dead credential fails the documented
         # fallback the same way, and a rate limit is a "slow down" that naming a second tool
@@ -391,15 +444,19 @@ async def search_activities(
         return SearchActivitiesUnavailableResponse(message=_FALLBACK_MESSAGE)
 
     aggregates = ()
-    if mode == "aggregate":
-        assert group_by is not None
-        aggregates = aggregate_entity_activities(fetch.rows, group_by=group_by)
+    breakdowns = ()
+    if tally is not None:
+        aggregates = tally.buckets(dimensions[0])
+        if len(dimensions) > 1:
+            breakdowns = tally.breakdowns()
     return SearchActivitiesResolvedResponse.from_fetch(
         fetch,
         mode=mode,
         fields=selected_fields,
         resolved=resolved_party,
         aggregates=aggregates,
+        breakdowns=breakdowns,
         description_row_capped=include_description and max_rows > _DESCRIPTION_MAX_ROWS,
-        ceiling=MAX_RETRIEVABLE,
+        # Each sub-window has a wall of its own, so a windowed scan reads at most this many.
+        ceiling=MAX_RETRIEVABLE * (activity_history.search_max_windows if windowed else 1),
     )
@@ -1,6 +1,7 @@
 from datetime import timedelta
 from typing import Self
 
+from backstop_mcp.catalog_snapshot_store import CatalogSnapshotStore
 from backstop_mcp.features.activity_tags.fetch_activity_tags import fetch_activity_tags
 from backstop_mcp.features.activity_tags.internal_dto import ActivityTagDto
 from backstop_mcp.features.cached_catalog import CachedCatalog
@@ -16,15 +17,37 @@ class ActivityTagsService(CachedCatalog[ActivityTagDto]):
     The TTL, single-flight and serve-stale protocol behind `get` is `CachedCatalog`.
     """
 
-    def __init__(self, *, ttl: timedelta, caching_enabled: bool = True) -> None:
+    def __init__(
+        self,
+        *,
+        ttl: timedelta,
+        caching_enabled: bool = True,
+        snapshots: CatalogSnapshotStore | None = None,
+        revalidate_window: timedelta = timedelta(0),
+    ) -> None:
         super().__init__(
             ttl=ttl,
             fetch=fetch_activity_tags,
+            item_type=ActivityTagDto,
             log_prefix="activity_tags",
             subject="activity-tag",
             caching_enabled=caching_enabled,
+            snapshots=snapshots,
+            revalidate_window=revalidate_window,
         )
 
     @classmethod
-    def with_ttl_minutes(cls, *, ttl_minutes: int, caching_enabled: bool = True) -> Self:
-        return cls(ttl=timedelta(minutes=ttl_minutes), caching_enabled=caching_enabled)
+    def with_ttl_minutes(
+        cls,
+        *,
+        ttl_minutes: int,
+        caching_enabled: bool = True,
+        snapshots: CatalogSnapshotStore | None = None,
+        revalidate_window_minutes: int = 0,
+    ) -> Self:
+        return cls(
+            ttl=timedelta(minutes=ttl_minutes),
+            caching_enabled=caching_enabled,
+            snapshots=snapshots,
+            revalidate_window=timedelta(minutes=revalidate_window_minutes),
+        )
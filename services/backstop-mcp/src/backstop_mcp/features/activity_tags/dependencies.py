@@ -1,6 +1,6 @@
 from functools import lru_cache
 
-from backstop_mcp.dependencies import get_backstop_config
+from backstop_mcp.dependencies import catalog_snapshot_store, get_backstop_config
 from backstop_mcp.features.activity_tags.activity_tags_service import ActivityTagsService
 
 
@@ -14,4 +14,6 @@ def get_activity_tags_service() -> ActivityTagsService:
     return ActivityTagsService.with_ttl_minutes(
         ttl_minutes=config.activity_tag_ttl_minutes,
         caching_enabled=config.activity_tag_cache_enabled,
+        snapshots=catalog_snapshot_store(config),
+        revalidate_window_minutes=config.catalog_revalidate_window_minutes,
     )
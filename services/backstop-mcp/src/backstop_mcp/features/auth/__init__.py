@@ -10,6 +10,7 @@ the absent re-export kept that from being a package cycle. Those types now live
 `backstop_client/credential.py`, so the direction is one-way and this file can do its job.
 """
 
+from backstop_mcp.features.auth.auth_cache import AuthCache, auth_cache_lifespan
 from backstop_mcp.features.auth.cleanup import cleanup_lifespan
 from backstop_mcp.features.auth.context import (
     BackstopAuthContext,
@@ -21,10 +22,12 @@ from backstop_mcp.features.auth.provider import BackstopOAuthProvider
 from backstop_mcp.features.auth.throttle import ThrottleConfig
 
 __all__ = [
+    "AuthCache",
     "BackstopAuthContext",
     "BackstopOAuthProvider",
     "NotConnectedError",
     "ThrottleConfig",
+    "auth_cache_lifespan",
     "cleanup_lifespan",
     "current_subject",
     "load_key",
@@ -0,0 +1,259 @@
+"""An in-process memory of validated access tokens and decrypted credentials.
+
+Every tool call pays two Postgres reads before its first Backstop request:
+`BackstopOAuthProvider.load_access_token` selects the token row by hash, and
+`BackstopAuthContext.current_credential` selects the credential row and Fernet-decrypts it. Both
+answers change only when this service changes them — a revoke, a refresh rotation, a fresh login
+— so `AuthCache` keeps them for `ttl`, keyed by token hash and by subject, and the hot path of a
+repeat call touches neither the database nor the key.
+
+Whatever changes a row drops the matching entry here, and — inside the same transaction, so it is
+delivered only once the change is visible — sends a `NOTIFY` on `AUTH_INVALIDATION_CHANNEL` that
+every replica's `auth_cache_lifespan` listener applies too. While that listener is not
+connected the cache answers nothing and keeps nothing, since a revoke on another replica would go
+unheard; each (re)connect starts from empty for the same reason. `ttl` is the backstop under all
+of this, and why it is meant to be a minute or two, well under `ACCESS_TOKEN_TTL`.
+
+A token is never served past its own `expires_at`, and misses are not kept: an unknown or revoked
+token costs the same read it always did.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Callable
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import Protocol, cast
+
+from fastmcp.server.auth import AccessToken
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from backstop_mcp.backstop_client import BackstopCredentialSecret
+from backstop_mcp.metrics import AUTH_CACHE_INVALIDATIONS, AUTH_CACHE_LOOKUPS
+
+logger = logging.getLogger(__name__)
+
+AUTH_INVALIDATION_CHANNEL = "backstop_auth_invalidation"
+
+# How often an idle listener proves its connection is alive. A half-open TCP connection never
+# fires asyncpg's termination callback, and until it is noticed, other replicas' revokes are lost.
+_HEARTBEAT = timedelta(seconds=30)
+_RECONNECT_DELAY = timedelta(seconds=5)
+
+_TOKEN_PREFIX = "token:"
+_SUBJECT_PREFIX = "subject:"
+
+
+class _Listener(Protocol):
+    """The slice of `asyncpg.Connection` the listener uses; its own stubs leave these untyped."""
+
+    def add_termination_listener(self, callback: Callable[[object], None]) -> None: ...
+
+    async def add_listener(
+        self, channel: str, callback: Callable[[object, int, str, object], None]
+    ) -> None: ...
+
+    async def execute(self, query: str, *, timeout: float | None = None) -> str: ...
+
+
+class _Entries[T]:
+    """Bounded LRU of `key -> value` with a TTL, as in `PartyResolutionCache`."""
+
+    def __init__(self, *, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries: int = max_entries
+        self._ttl_seconds: float = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, T]] = OrderedDict()
+
+    def get(self, key: str) -> T | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self._ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: T) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            _ = self._entries.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        _ = self._entries.pop(key, None)
+
+    def items(self) -> list[tuple[str, T]]:
+        return [(key, value) for key, (_, value) in self._entries.items()]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class AuthCache:
+    """Access tokens by hash and credentials by subject. See the module docstring."""
+
+    def __init__(self, *, ttl: timedelta, max_entries: int) -> None:
+        ttl_seconds = ttl.total_seconds()
+        self._tokens: _Entries[AccessToken] = _Entries(
+            max_entries=max_entries, ttl_seconds=ttl_seconds
+        )
+        self._credentials: _Entries[BackstopCredentialSecret] = _Entries(
+            max_entries=max_entries, ttl_seconds=ttl_seconds
+        )
+        self._serving: bool = True
+        # Bumped by every invalidation. A read that started before one must not store what it
+        # read: the row may have changed underneath it.
+        self._generation: int = 0
+
+    @property
+    def serving(self) -> bool:
+        """Whether lookups are answered — false while the listener is not connected."""
+        return self._serving
+
+    def stamp(self) -> int:
+        """Taken before a database read; hand it back to `remember_*` with what was read."""
+        return self._generation
+
+    def access_token(self, token_hash: str) -> AccessToken | None:
+        token = self._lookup(self._tokens, token_hash, kind="token")
+        if token is not None and token.expires_at is not None and token.expires_at <= time.time():
+            self._tokens.pop(token_hash)
+            return None
+        return token
+
+    def remember_access_token(self, token_hash: str, token: AccessToken, *, stamp: int) -> None:
+        if self._serving and stamp == self._generation:
+            self._tokens.put(token_hash, token)
+
+    def credential(self, subject: str) -> BackstopCredentialSecret | None:
+        return self._lookup(self._credentials, subject, kind="credential")
+
+    def remember_credential(
+        self, subject: str, credential: BackstopCredentialSecret, *, stamp: int
+    ) -> None:
+        if self._serving and stamp == self._generation:
+            self._credentials.put(subject, credential)
+
+    async def forget_access_token(self, session: AsyncSession, token_hash: str) -> None:
+        """Drop one access token here, and on every replica once `session` commits."""
+        self._drop_token(token_hash)
+        AUTH_CACHE_INVALIDATIONS.add(1, {"origin": "local"})
+        await _notify(session, f"{_TOKEN_PREFIX}{token_hash}")
+
+    async def forget_subject(self, session: AsyncSession, subject: str) -> None:
+        """Drop a subject's credential and every token it holds, here and on every replica."""
+        self._drop_subject(subject)
+        AUTH_CACHE_INVALIDATIONS.add(1, {"origin": "local"})
+        await _notify(session, f"{_SUBJECT_PREFIX}{subject}")
+
+    def apply(self, payload: str) -> None:
+        """Apply one `NOTIFY` payload. Anything unrecognised drops everything, to be safe."""
+        AUTH_CACHE_INVALIDATIONS.add(1, {"origin": "notify"})
+        if payload.startswith(_TOKEN_PREFIX):
+            self._drop_token(payload.removeprefix(_TOKEN_PREFIX))
+        elif payload.startswith(_SUBJECT_PREFIX):
+            self._drop_subject(payload.removeprefix(_SUBJECT_PREFIX))
+        else:
+            logger.warning("auth.cache.unknown_invalidation")
+            self._reset(serving=self._serving)
+
+    def suspend(self) -> None:
+        """Stop answering: invalidations can no longer be heard."""
+        self._reset(serving=False)
+
+    def resume(self) -> None:
+        """Answer again, from empty — whatever was kept may have missed an invalidation."""
+        AUTH_CACHE_INVALIDATIONS.add(1, {"origin": "resync"})
+        self._reset(serving=True)
+
+    def _lookup[T](self, entries: _Entries[T], key: str, *, kind: str) -> T | None:
+        if not self._serving:
+            AUTH_CACHE_LOOKUPS.add(1, {"kind": kind, "outcome": "bypass"})
+            return None
+        value = entries.get(key)
+        AUTH_CACHE_LOOKUPS.add(1, {"kind": kind, "outcome": "miss" if value is None else "hit"})
+        return value
+
+    def _drop_token(self, token_hash: str) -> None:
+        self._generation += 1
+        self._tokens.pop(token_hash)
+
+    def _drop_subject(self, subject: str) -> None:
+        self._generation += 1
+        self._credentials.pop(subject)
+        for token_hash, token in self._tokens.items():
+            if token.subject == subject:
+                self._tokens.pop(token_hash)
+
+    def _reset(self, *, serving: bool) -> None:
+        self._generation += 1
+        self._serving = serving
+        self._tokens.clear()
+        self._credentials.clear()
+
+
+async def _notify(session: AsyncSession, payload: str) -> None:
+    # `pg_notify` is transactional: listeners hear it on commit, and never for a rollback.
+    _ = await session.execute(select(func.pg_notify(AUTH_INVALIDATION_CHANNEL, payload)))
+
+
+async def _listen(engine: AsyncEngine, cache: AuthCache) -> None:
+    """Hold one connection LISTENing until it is lost. Raises when it cannot connect or dies."""
+    lost = asyncio.Event()
+
+    def on_notification(_connection: object, _pid: int, _channel: str, payload: object) -> None:
+        cache.apply(str(payload))
+
+    def on_termination(_connection: object) -> None:
+        lost.set()
+
+    async with engine.connect() as connection:
+        raw = await connection.get_raw_connection()
+        listener = cast("_Listener", raw.driver_connection)
+        try:
+            listener.add_termination_listener(on_termination)
+            await listener.add_listener(AUTH_INVALIDATION_CHANNEL, on_notification)
+            cache.resume()
+            logger.info("auth.cache.listening")
+            while not lost.is_set():
+                try:
+                    _ = await asyncio.wait_for(lost.wait(), timeout=_HEARTBEAT.total_seconds())
+                except TimeoutError:
+                    _ = await listener.execute("SELECT 1", timeout=_HEARTBEAT.total_seconds())
+        finally:
+            cache.suspend()
+            # Never hand a LISTENing connection back to the pool a session would draw from.
+            await connection.invalidate()
+
+
+async def _listen_forever(engine: AsyncEngine, cache: AuthCache) -> None:
+    """Keep a listener connected, suspending the cache for as long as it is not."""
+    while True:
+        try:
+            await _listen(engine, cache)
+        except Exception:
+            logger.exception("auth.cache.listener_failed")
+        await asyncio.sleep(_RECONNECT_DELAY.total_seconds())
+
+
+@asynccontextmanager
+async def auth_cache_lifespan(
+    engine: AsyncEngine, cache: AuthCache | None
+) -> AsyncGenerator[None, None]:
+    """Listen for other replicas' invalidations for the lifetime of the app. No-op when off."""
+    if cache is None:
+        yield
+        return
+    # Suspended until the listener is connected: nothing is kept that it might not hear about.
+    cache.suspend()
+    task = asyncio.create_task(_listen_forever(engine, cache))
+    try:
+        yield
+    finally:
+        _ = task.cancel()
+        _ = await asyncio.gather(task, return_exceptions=True)
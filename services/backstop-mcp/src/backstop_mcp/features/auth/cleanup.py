@@ -5,8 +5,9 @@ rows, unexchanged codes leave `authorization_codes` rows, dynamic client registr
 `oauth_clients` rows, and — the one that actually accumulates — every refresh rotation adds an
 `oauth_tokens` row that is never removed. With a 15-minute access-token TTL that is roughly
 2,900 rows per active user per month, all of them in the table `load_access_token` queries on
-every single MCP request. (`login_attempts` is swept too, but it is the throttle's own storage
-rather than something the OAuth flow leaves behind.)
+every single MCP request. (`login_failure_buckets` and the optional `login_attempts` audit rows
+are swept too, but they are the throttle's own storage rather than something the OAuth flow
+leaves behind.)
 
 Sweep order matters: `oauth_clients` is only removable once nothing references it, so the client
 sweep runs last, after the three child tables have given up their expired rows in the same
@@ -28,6 +29,7 @@ from backstop_mcp.config import AuthConfig
 from backstop_mcp.db import (
     AuthorizationCode,
     LoginAttempt,
+    LoginFailureBucket,
     OAuthClient,
     OAuthToken,
     PendingAuthorization,
@@ -83,16 +85,23 @@ async def _delete_old_token_families(session: AsyncSession, cutoff: datetime) ->
 
 
 async def _delete_old_login_attempts(session: AsyncSession, cutoff: datetime) -> int:
-    """Drop failed-login records older than any throttling window still cares about.
+    """Drop failed-login audit records older than the throttling window they were written in.
 
-    `auth/throttle.py` only ever reads attempts inside its window, so anything older is dead
-    weight — and the table takes a row per failed attempt, which is the one place an attacker
-    can drive row growth.
+    Only written when the audit trail is on (see `auth/throttle.py`), and then the table takes a
+    row per failed attempt — the one place an attacker can drive row growth.
     """
     result = await session.execute(delete(LoginAttempt).where(LoginAttempt.attempted_at < cutoff))
     return _deleted(result)
 
 
+async def _delete_old_failure_buckets(session: AsyncSession, cutoff: datetime) -> int:
+    """Drop throttle counters for slices no window still reaches. See `auth/throttle.py`."""
+    result = await session.execute(
+        delete(LoginFailureBucket).where(LoginFailureBucket.bucket_start < cutoff)
+    )
+    return _deleted(result)
+
+
 async def _delete_unreferenced_clients(session: AsyncSession, cutoff: datetime) -> int:
     """Drop registered clients that nothing references any more.
 
@@ -136,12 +145,13 @@ async def purge_expired_auth_rows(
         # Kept for a couple of windows rather than exactly one, so a sweep landing mid-window
         # can't shorten anyone's effective limit.
         attempts = await _delete_old_login_attempts(session, now - 2 * login_attempt_window)
+        buckets = await _delete_old_failure_buckets(session, now - 2 * login_attempt_window)
         # Last: the three deletes above are what make a client unreferenced, and doing this in
         # the same transaction means one sweep reclaims a client whose final token just expired
         # rather than leaving it for the next one.
         clients = await _delete_unreferenced_clients(session, now - unused_client_retention)
 
-    if pending or codes or tokens or attempts or clients:
+    if pending or codes or tokens or attempts or buckets or clients:
         logger.info(
             "auth.cleanup.purged",
             extra={
@@ -149,6 +159,7 @@ async def purge_expired_auth_rows(
                 "authorization_codes": codes,
                 "oauth_tokens": tokens,
                 "login_attempts": attempts,
+                "login_failure_buckets": buckets,
                 "oauth_clients": clients,
             },
         )
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from backstop_mcp.backstop_client import BackstopCredentialSecret
 from backstop_mcp.db import read_session
+from backstop_mcp.features.auth.auth_cache import AuthCache
 from backstop_mcp.features.auth.credential_store import get_credential
 
 
@@ -39,6 +40,9 @@ class BackstopAuthContext(BaseModel):
     session_factory: async_sessionmaker[AsyncSession]
     encryption_key: bytes
     revoke_tokens_for_subject: Callable[[str], Awaitable[None]]
+    # Shared with `BackstopOAuthProvider`, which drops a subject here whenever it saves a new
+    # credential for it or revokes its tokens. `None` reads and decrypts on every call.
+    cache: AuthCache | None = None
 
     async def current_credential(self) -> BackstopCredentialSecret:
         """Resolve the calling MCP user's stored Backstop credential.
@@ -56,6 +60,12 @@ class BackstopAuthContext(BaseModel):
                 + "complete the login flow first."
             )
 
+        if self.cache is not None:
+            cached = self.cache.credential(subject)
+            if cached is not None:
+                return cached
+        stamp = self.cache.stamp() if self.cache is not None else 0
+
         async with read_session(self.session_factory) as session:
             credential = await get_credential(session, subject, self.encryption_key)
 
@@ -64,6 +74,8 @@ class BackstopAuthContext(BaseModel):
                 "No Backstop credential on file for this connection — please reconnect."
             )
 
+        if self.cache is not None:
+            self.cache.remember_credential(subject, credential, stamp=stamp)
         return credential
 
     async def revoke_current_subject_tokens(self) -> None:
@@ -32,6 +32,7 @@ from backstop_mcp.db import AuthorizationCode as AuthorizationCodeRow
 from backstop_mcp.db import OAuthClient as OAuthClientRow
 from backstop_mcp.db import OAuthToken as OAuthTokenRow
 from backstop_mcp.db import PendingAuthorization, read_session, transaction
+from backstop_mcp.features.auth.auth_cache import AuthCache
 from backstop_mcp.features.auth.credential_store import save_credential
 from backstop_mcp.features.auth.login_csrf import (
     clear_csrf_cookie,
@@ -136,6 +137,7 @@ class BackstopOAuthProvider(OAuthProvider):
     _encryption_key: bytes
     _backstop_clients: BackstopClientFactory
     _throttle: ThrottleConfig
+    _auth_cache: AuthCache | None
     login_path: str
 
     def __init__(
@@ -147,6 +149,7 @@ class BackstopOAuthProvider(OAuthProvider):
         encryption_key: bytes,
         backstop_clients: BackstopClientFactory,
         throttle: ThrottleConfig,
+        auth_cache: AuthCache | None = None,
         login_path: str = "/backstop/login",
     ) -> None:
         super().__init__(
@@ -160,6 +163,9 @@ class BackstopOAuthProvider(OAuthProvider):
         # same connection pool, base URL and timeout profile as every tool call.
         self._backstop_clients = backstop_clients
         self._throttle = throttle
+        # Shared with `BackstopAuthContext`; every write below that changes what a token or a
+        # credential resolves to drops it there, on this replica and through NOTIFY on the rest.
+        self._auth_cache = auth_cache
         self.login_path = login_path
         # `base_url` arrives already validated and trailing-slash-free (`AppConfig.issuer`), so
         # it is kept verbatim rather than read back off `self.base_url` — the SDK re-parses it
@@ -344,7 +350,12 @@ class BackstopOAuthProvider(OAuthProvider):
             )
 
         if not valid:
-            await record_failure(self._session_factory, username, source_ip=_source_ip(request))
+            await record_failure(
+                self._session_factory,
+                username,
+                source_ip=_source_ip(request),
+                config=self._throttle,
+            )
             return self._form_response(
                 request_id,
                 username=username,
@@ -379,6 +390,8 @@ class BackstopOAuthProvider(OAuthProvider):
                     BackstopCredentialSecret(username=username, api_token=SecretStr(api_token)),
                     self._encryption_key,
                 )
+                # A reconnect replaces the credential: nothing may keep decrypting the old one.
+                await self._forget_subject(session, user_id)
                 session.add(
                     AuthorizationCodeRow(
                         code=code,
@@ -570,7 +583,7 @@ class BackstopOAuthProvider(OAuthProvider):
             if row.revoked_at is not None:
                 # This refresh token was already rotated away once — someone is replaying a
                 # stolen/leaked token. Revoke every token descending from the same grant.
-                await self._revoke_family(session, family_id=row.family_id, now=now)
+                await self._revoke_family(session, row, now=now)
                 return _REUSED_TOKEN
 
             if row.refresh_token_expires_at is not None and row.refresh_token_expires_at < now:
@@ -598,9 +611,12 @@ class BackstopOAuthProvider(OAuthProvider):
             if claim.rowcount == 0:  # pyright: ignore[reportUnknownMemberType, reportAttributeAccessIssue]
                 # Lost the race to another concurrent refresh of the same token — treat exactly
                 # like replaying an already-rotated token.
-                await self._revoke_family(session, family_id=row.family_id, now=now)
+                await self._revoke_family(session, row, now=now)
                 return _REUSED_TOKEN
 
+            # The rotated-away row's access token is revoked with it.
+            await self._forget_access_token(session, row.access_token_hash)
+
             access_token = secrets.token_urlsafe(32)
             new_refresh_token = secrets.token_urlsafe(32)
             effective_scopes = scopes or row.scopes
@@ -625,23 +641,33 @@ class BackstopOAuthProvider(OAuthProvider):
                 scopes=effective_scopes,
             )
 
-    @staticmethod
-    async def _revoke_family(session: AsyncSession, *, family_id: uuid.UUID, now: datetime) -> None:
-        """Revoke every still-live token descending from one grant."""
+    async def _revoke_family(
+        self, session: AsyncSession, row: OAuthTokenRow, *, now: datetime
+    ) -> None:
+        """Revoke every still-live token descending from `row`'s grant."""
         await session.execute(
             update(OAuthTokenRow)
             .where(
-                OAuthTokenRow.family_id == family_id,
+                OAuthTokenRow.family_id == row.family_id,
                 OAuthTokenRow.revoked_at.is_(None),
             )
             .values(revoked_at=now)
         )
+        # The cache does not know families, only subjects; dropping the subject's every token
+        # costs its other grants one read each, which a reuse alarm can afford.
+        await self._forget_subject(session, row.subject)
 
     # -- Access token verification / revocation ------------------------------------------------
 
     @override
     async def load_access_token(self, token: str) -> AccessToken | None:
         token_hash = _hash_token(token)
+        stamp = 0
+        if self._auth_cache is not None:
+            cached = self._auth_cache.access_token(token_hash)
+            if cached is not None:
+                return cached
+            stamp = self._auth_cache.stamp()
         async with read_session(self._session_factory) as session:
             result = await session.execute(
                 select(OAuthTokenRow).where(OAuthTokenRow.access_token_hash == token_hash)
@@ -653,7 +679,7 @@ class BackstopOAuthProvider(OAuthProvider):
         if row.access_token_expires_at < datetime.now(UTC):
             return None
 
-        return AccessToken(
+        access_token = AccessToken(
             token=token,
             client_id=row.client_id,
             scopes=row.scopes,
@@ -661,6 +687,9 @@ class BackstopOAuthProvider(OAuthProvider):
             resource=row.resource,
             subject=row.subject,
         )
+        if self._auth_cache is not None:
+            self._auth_cache.remember_access_token(token_hash, access_token, stamp=stamp)
+        return access_token
 
     @override
     async def revoke_token(self, token: AccessToken | RefreshToken) -> None:
@@ -675,6 +704,7 @@ class BackstopOAuthProvider(OAuthProvider):
             row = result.scalar_one_or_none()
             if row is not None:
                 row.revoked_at = datetime.now(UTC)
+                await self._forget_access_token(session, row.access_token_hash)
 
     async def revoke_all_tokens_for_subject(self, subject: str) -> None:
         """Revoke every non-revoked token belonging to `subject`.
@@ -692,3 +722,12 @@ class BackstopOAuthProvider(OAuthProvider):
                 )
                 .values(revoked_at=datetime.now(UTC))
             )
+            await self._forget_subject(session, subject)
+
+    async def _forget_access_token(self, session: AsyncSession, token_hash: str) -> None:
+        if self._auth_cache is not None:
+            await self._auth_cache.forget_access_token(session, token_hash)
+
+    async def _forget_subject(self, session: AsyncSession, subject: str | None) -> None:
+        if self._auth_cache is not None and subject is not None:
+            await self._auth_cache.forget_subject(session, subject)
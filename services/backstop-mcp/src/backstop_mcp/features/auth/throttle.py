@@ -12,10 +12,17 @@ one that actually binds, because the attacker cannot choose a different username
 attacking the same account. Spraying across many usernames stays possible, but each account gets
 at most `max_attempts` guesses per window, which is the property that matters.
 
-Storage is a row per failed attempt (see `db/models.LoginAttempt`) so the sliding window is
-shared across replicas with no coordination. The check-then-insert path is not atomic, so a
-concurrent burst can briefly exceed `max_attempts` by a few; that is acceptable for a
-credential-guessing bound, not a hard quota.
+Storage is a counter per username per slice of the window (see `db/models.LoginFailureBucket`),
+shared across replicas with no coordination. A failure is one `INSERT ... ON CONFLICT DO UPDATE`
+on its slice, and the check sums at most `_BUCKETS_PER_WINDOW + 1` rows under the primary key —
+so a spraying burst costs the database the same per submit whether it is ten attempts or ten
+million, where a row per attempt made every check a `COUNT(*)` over the attack itself. The window
+slides a slice at a time: a failure keeps counting for up to one slice past `window`, which only
+ever makes the limit stricter. A row per attempt, with its source IP, is still written to
+`login_attempts` when `ThrottleConfig.audit_attempts` asks for the raw audit trail.
+
+The check-then-upsert path is not atomic, so a concurrent burst can briefly exceed
+`max_attempts` by a few; that is acceptable for a credential-guessing bound, not a hard quota.
 """
 
 import logging
@@ -24,9 +31,10 @@ from typing import ClassVar
 
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from backstop_mcp.db import LoginAttempt, read_session, transaction
+from backstop_mcp.db import LoginAttempt, LoginFailureBucket, read_session, transaction
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +43,10 @@ logger = logging.getLogger(__name__)
 # it can be stored, so the throttle table can't be used to write unbounded rows.
 MAX_USERNAME_LENGTH = 320
 
+# Slices per window. More is a tighter slide and a longer sum; ten puts a failure's overhang at
+# 90 seconds of the default 15-minute window.
+_BUCKETS_PER_WINDOW = 10
+
 
 class ThrottleConfig(BaseModel):
     """The limit to apply. Derived from `AuthConfig` at the composition root."""
@@ -43,6 +55,15 @@ class ThrottleConfig(BaseModel):
 
     max_attempts: int
     window: timedelta
+    # Also write a `login_attempts` row per failure, with its source IP, for diagnosis. The
+    # limit never reads them.
+    audit_attempts: bool = False
+
+
+def failure_bucket(at: datetime, window: timedelta) -> datetime:
+    """The start of the slice of `window` a failure at `at` is counted in."""
+    width = (window / _BUCKETS_PER_WINDOW).total_seconds()
+    return datetime.fromtimestamp(at.timestamp() // width * width, UTC)
 
 
 async def count_recent_failures(
@@ -51,14 +72,15 @@ async def count_recent_failures(
     *,
     window: timedelta,
 ) -> int:
-    since = datetime.now(UTC) - window
+    since = failure_bucket(datetime.now(UTC) - window, window)
     async with read_session(session_factory) as session:
         result = await session.execute(
-            select(func.count())
-            .select_from(LoginAttempt)
-            .where(LoginAttempt.username == username, LoginAttempt.attempted_at >= since)
+            select(func.coalesce(func.sum(LoginFailureBucket.failures), 0)).where(
+                LoginFailureBucket.username == username,
+                LoginFailureBucket.bucket_start >= since,
+            )
         )
-        return result.scalar_one()
+        return int(result.scalar_one())
 
 
 async def is_throttled(
@@ -87,12 +109,22 @@ async def record_failure(
     username: str,
     *,
     source_ip: str | None,
+    config: ThrottleConfig,
 ) -> None:
-    """Record one failed attempt. `source_ip` is stored for diagnosis, never rate-limited on."""
-    async with transaction(session_factory) as session:
-        session.add(
-            LoginAttempt(username=username, source_ip=source_ip, attempted_at=datetime.now(UTC))
+    """Count one failed attempt. `source_ip` is audited when enabled, never rate-limited on."""
+    now = datetime.now(UTC)
+    statement = (
+        pg_insert(LoginFailureBucket)
+        .values(username=username, bucket_start=failure_bucket(now, config.window), failures=1)
+        .on_conflict_do_update(
+            index_elements=[LoginFailureBucket.username, LoginFailureBucket.bucket_start],
+            set_={"failures": LoginFailureBucket.failures + 1},
         )
+    )
+    async with transaction(session_factory) as session:
+        _ = await session.execute(statement)
+        if config.audit_attempts:
+            session.add(LoginAttempt(username=username, source_ip=source_ip, attempted_at=now))
 
 
 async def clear_failures(session_factory: async_sessionmaker[AsyncSession], username: str) -> None:
@@ -102,4 +134,7 @@ async def clear_failures(session_factory: async_sessionmaker[AsyncSession], user
     guessing, not to punish a user who eventually got in.
     """
     async with transaction(session_factory) as session:
+        await session.execute(
+            delete(LoginFailureBucket).where(LoginFailureBucket.username == username)
+        )
         await session.execute(delete(LoginAttempt).where(LoginAttempt.username == username))
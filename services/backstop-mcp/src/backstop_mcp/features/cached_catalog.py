@@ -57,18 +57,39 @@ catalog this mode never kept. Request coalescing is deliberately *not* disabled
 collapsing concurrent callers onto one walk is deduplication, not caching, and turning it off
 would multiply exactly the load this is trying to measure.
 
+**The shared tier under it.** With `BACKSTOP_CATALOG_SNAPSHOT_ENABLED` the owner of a walk asks
+`CatalogSnapshotStore` first: a snapshot another replica wrote inside the TTL is adopted instead
+of walked (`served="snapshot"`), an aged one is re-walked by exactly one replica while the others
+wait for its result, and a cold replica whose own walk fails serves the aged one as stale rather
+than nothing. Only consulted with caching on — a mode that keeps nothing in memory has no
+business reading a copy from the database. What it buys is read off the same pair: walks leave
+`catalog_fetch_duration_seconds` while demand on `catalog_get_duration_seconds` does not move.
+
+**Revalidating in the background.** By default the first caller past the TTL waits out the walk,
+and so does everyone coalesced onto it — tens of seconds for the custom-field schema. With
+`BACKSTOP_CATALOG_REVALIDATE_WINDOW_MINUTES` the TTL becomes a soft one: for that long past it the
+held catalog is still served at once (`served="revalidating"`) while one supervised task walks
+for the next, through the same in-flight pin, so a caller arriving mid-walk still coalesces onto
+it. Past TTL + window the catalog is too old to serve unrefreshed and the caller walks inline as
+before. `aclose` cancels the task; `teardown.close_singletons` calls it before the pools close.
+
 `OpportunityStagesService` deliberately does *not* use this; see its own docstring for why a
 seven-row vocabulary wants a failure to propagate rather than be softened.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
 import time
 from collections.abc import Awaitable, Callable
-from datetime import timedelta
+from datetime import UTC, datetime, timedelta
 from typing import Literal
 
+from pydantic import TypeAdapter, ValidationError
+
 from backstop_mcp.backstop_client import BackstopClient
+from backstop_mcp.catalog_snapshot_store import CatalogSnapshotStore, StoredCatalog
 from backstop_mcp.metrics import CATALOG_FETCH_DURATION, CATALOG_GET_DURATION
 from backstop_mcp.timed_gate import TimedGate
 
@@ -80,15 +101,19 @@ logger = logging.getLogger(__name__)
 # refresh failed. A caller publishes this so a stale answer is never read as a current one.
 type CatalogFreshness = Literal["ok", "stale"]
 # Where a completed load's contents came from, for a catalog that meters its loads.
-type CatalogSource = Literal["backstop", "stale"]
+type CatalogSource = Literal["backstop", "delta", "snapshot", "stale"]
 type CatalogResult[T] = tuple[dict[str, T], CatalogFreshness]
 # Outcome label on `catalog_fetch_duration_seconds`. "cancelled" is its own value rather than
 # folded into "error": a cancelled walk's duration says nothing about how long one takes.
 type CatalogFetchOutcome = Literal["ok", "error", "cancelled"]
 # `served` label on `catalog_get_duration_seconds`: what answered one `get`, one value per call.
 # The three that are not a walk of this caller's own are the ones a caching decision reads —
-# `cache` is what a TTL bought, `coalesced` what the in-flight pin bought without one.
-type CatalogServed = Literal["cache", "coalesced", "backstop", "stale", "error", "cancelled"]
+# `cache` is what a TTL bought, `coalesced` what the in-flight pin bought without one,
+# `snapshot` a walk another replica made, and `revalidating` the held catalog past its soft TTL
+# while a background walk replaces it.
+type CatalogServed = Literal[
+    "cache", "coalesced", "snapshot", "revalidating", "backstop", "stale", "error", "cancelled"
+]
 
 
 class CachedCatalog[T]:
@@ -106,25 +131,43 @@ class CachedCatalog[T]:
         *,
         ttl: timedelta,
         fetch: Callable[[BackstopClient], Awaitable[dict[str, T]]],
+        item_type: type[T],
         log_prefix: str,
         subject: str,
         caching_enabled: bool = True,
+        snapshots: CatalogSnapshotStore | None = None,
+        revalidate_window: timedelta = timedelta(0),
     ) -> None:
         self._fetch_items: Callable[[BackstopClient], Awaitable[dict[str, T]]] = fetch
         self._log_prefix: str = log_prefix
         self._subject: str = subject
         self._caching_enabled: bool = caching_enabled
+        self._snapshots: CatalogSnapshotStore | None = snapshots
+        self._item_adapter: TypeAdapter[T] = TypeAdapter(item_type)
+        # A snapshot written by a replica with a different DTO is not read back: the digest of the
+        # DTO's JSON schema is its key, so a deploy that changes the shape starts from a walk.
+        self._schema_version: str = hashlib.sha256(
+            json.dumps(self._item_adapter.json_schema(), sort_keys=True).encode()
+        ).hexdigest()[:16]
         self._items: dict[str, T] | None = None
         self._freshness: TimedGate = TimedGate(duration=ttl)
         self._lock: asyncio.Lock = asyncio.Lock()
         self._in_flight: asyncio.Future[CatalogResult[T]] | None = None
+        self._revalidate_window: timedelta = revalidate_window
+        self._revalidation: asyncio.Task[object] | None = None
+
+    @property
+    def caching_enabled(self) -> bool:
+        """Whether a loaded catalog is kept — and so whether loading one ahead of need helps."""
+        return self._caching_enabled
 
     async def get(self, client: BackstopClient, *, refresh: bool = False) -> CatalogResult[T]:
         """The catalog, fetching it when cold, past its TTL, or `refresh` was asked for.
 
         Returns a copy, so a caller cannot mutate the shared map. `"stale"` means the refresh
         failed and this is the previous catalog. With caching disabled every call fetches and
-        `"stale"` is never returned.
+        `"stale"` is never returned. Past the TTL but inside the revalidate window, the held
+        catalog is returned as `"ok"` without waiting and a background task refreshes it.
 
         Every call records once into `catalog_get_duration_seconds`, so its `_count` is demand
         rather than walks — see the module docstring for the pair this forms with the walk
@@ -153,7 +196,27 @@ class CachedCatalog[T]:
         cached = self._servable(refresh=refresh)
         if cached is not None:
             return (dict(cached), "ok"), "cache"
-
+        revalidating = self._revalidatable(refresh=refresh)
+        if revalidating is not None:
+            self._start_revalidation(client)
+            return (dict(revalidating), "ok"), "revalidating"
+        return await self._load(client, refresh=refresh)
+
+    async def aclose(self) -> None:
+        """Cancel a background revalidation, if one is running, and wait for it to unwind."""
+        task = self._revalidation
+        self._revalidation = None
+        if task is None or task.done():
+            return
+        _ = task.cancel()
+        # `wait` rather than `await`: the task's own outcome is the done callback's to log, and a
+        # cancellation of this caller must still reach it.
+        _ = await asyncio.wait({task})
+
+    async def _load(
+        self, client: BackstopClient, *, refresh: bool
+    ) -> tuple[CatalogResult[T], CatalogServed]:
+        """Serve from the held catalog, or walk for it — once, however many callers are asking."""
         async with self._lock:
             cached = self._servable(refresh=refresh)
             if cached is not None:
@@ -173,8 +236,7 @@ class CachedCatalog[T]:
             return (dict(items), status), "coalesced"
 
         try:
-            result = await self._fetch(client, in_flight)
-            return result, ("stale" if result[1] == "stale" else "backstop")
+            return await self._fetch(client, in_flight, refresh=refresh)
         except BaseException as error:
             if not in_flight.done():
                 # Don't stamp CancelledError onto the shared future — waiters would then
@@ -194,6 +256,17 @@ class CachedCatalog[T]:
         """Called once per completed load. Override in a catalog that meters them."""
         _ = source
 
+    async def load_from_backstop(
+        self, client: BackstopClient, held: dict[str, T] | None
+    ) -> tuple[dict[str, T], CatalogSource]:
+        """One load of the catalog, and whether it was a full walk or a `delta` onto `held`.
+
+        The default always walks in full. Override in a catalog that can refresh from only what
+        changed; `held` is the catalog this one replaces, `None` when there is none to build on.
+        """
+        _ = held
+        return await self._fetch_items(client), "backstop"
+
     def _servable(self, *, refresh: bool) -> dict[str, T] | None:
         """The held catalog when it may be served, else `None` — cold, past TTL, or caching off.
 
@@ -207,6 +280,47 @@ class CachedCatalog[T]:
             return None
         return cached
 
+    def _revalidatable(self, *, refresh: bool) -> dict[str, T] | None:
+        """The held catalog when it is past its TTL but still inside the revalidate window."""
+        if not self._caching_enabled or refresh or not self._revalidate_window:
+            return None
+        cached = self._items
+        marked_at = self._freshness.marked_at
+        if cached is None or marked_at is None:
+            return None
+        if datetime.now(UTC) - marked_at >= self._freshness.duration + self._revalidate_window:
+            return None
+        return cached
+
+    def _start_revalidation(self, client: BackstopClient) -> None:
+        """Walk for the next catalog in the background, unless a revalidation already is.
+
+        The task goes through `_load`, so it takes the in-flight pin like any owner: a caller
+        past the window arriving meanwhile joins it rather than starting a second walk, and a
+        failure serves stale and re-stamps the TTL exactly as an inline refresh would.
+        """
+        if self._revalidation is not None and not self._revalidation.done():
+            return
+        task: asyncio.Task[object] = asyncio.create_task(
+            self._load(client, refresh=False), name=f"{self._log_prefix}.revalidate"
+        )
+        task.add_done_callback(self._revalidated)
+        self._revalidation = task
+
+    def _revalidated(self, task: asyncio.Task[object]) -> None:
+        # The supervision: nothing awaits this task, so its failure is logged here or nowhere.
+        if self._revalidation is task:
+            self._revalidation = None
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.warning(
+                f"{self._log_prefix}.revalidation_failed",
+                extra={"catalog": self._subject},
+                exc_info=error,
+            )
+
     def _mark_in_flight_exception_retrieved(
         self, in_flight: asyncio.Future[CatalogResult[T]]
     ) -> None:
@@ -220,7 +334,7 @@ class CachedCatalog[T]:
             if self._in_flight is in_flight:
                 self._in_flight = None
 
-    async def _metered_fetch(self, client: BackstopClient) -> dict[str, T]:
+    async def _metered_fetch(self, client: BackstopClient) -> tuple[dict[str, T], CatalogSource]:
         """The walk itself, timed into `catalog_fetch_duration_seconds`.
 
         Recorded in both modes and on every exit — a cancelled walk is labelled as such rather
@@ -229,13 +343,13 @@ class CachedCatalog[T]:
         started = time.monotonic()
         outcome: CatalogFetchOutcome = "cancelled"
         try:
-            items = await self._fetch_items(client)
+            loaded = await self.load_from_backstop(client, self._items)
         except Exception:
             outcome = "error"
             raise
         else:
             outcome = "ok"
-            return items
+            return loaded
         finally:
             CATALOG_FETCH_DURATION.record(
                 time.monotonic() - started,
@@ -243,11 +357,36 @@ class CachedCatalog[T]:
             )
 
     async def _fetch(
-        self, client: BackstopClient, in_flight: asyncio.Future[CatalogResult[T]]
-    ) -> CatalogResult[T]:
+        self,
+        client: BackstopClient,
+        in_flight: asyncio.Future[CatalogResult[T]],
+        *,
+        refresh: bool,
+    ) -> tuple[CatalogResult[T], CatalogServed]:
+        shared: dict[str, T] | None = None
+        fallback: dict[str, T] | None = None
+        claimed = False
+        if self._snapshots is not None and self._caching_enabled:
+            shared, fallback, claimed = await self._consult_snapshots(
+                self._snapshots, refresh=refresh
+            )
+        if shared is not None:
+            result: CatalogResult[T] = (dict(shared), "ok")
+            in_flight.set_result(result)
+            return result, "snapshot"
+
         try:
-            items = await self._metered_fetch(client)
-        except Exception as error:
+            items, source = await self._metered_fetch(client)
+        except BaseException as error:
+            # Cancelled walks too (teardown, a disconnected caller): peers waiting on the claim
+            # walk now rather than at its expiry.
+            if claimed and self._snapshots is not None:
+                await self._snapshots.release_claim(self._subject)
+            if not isinstance(error, Exception):
+                raise
+            if self._items is None:
+                # A replica that never held this catalog still has the aged snapshot to offer.
+                self._items = fallback
             if self._items is not None:
                 logger.warning(
                     f"{self._log_prefix}.refresh_failed_serving_stale",
@@ -263,9 +402,9 @@ class CachedCatalog[T]:
                 )
                 self.record_load("stale")
                 self._freshness.mark()
-                result: CatalogResult[T] = (dict(self._items), "stale")
+                result = (dict(self._items), "stale")
                 in_flight.set_result(result)
-                return result
+                return result, "stale"
             in_flight.set_exception(error)
             raise
 
@@ -274,11 +413,81 @@ class CachedCatalog[T]:
             # branch above unreachable in that mode rather than needing its own guard.
             self._items = items
             self._freshness.mark()
-        self.record_load("backstop")
+            if self._snapshots is not None:
+                await self._snapshots.save(
+                    self._subject,
+                    {
+                        item_id: self._item_adapter.dump_python(item, mode="json")
+                        for item_id, item in items.items()
+                    },
+                    schema_version=self._schema_version,
+                )
+        self.record_load(source)
         logger.info(
             f"{self._log_prefix}.refreshed",
-            extra={"catalog": self._subject, "items": len(items)},
+            extra={"catalog": self._subject, "items": len(items), "source": source},
         )
         result = (dict(items), "ok")
         in_flight.set_result(result)
-        return result
+        return result, "backstop"
+
+    async def _consult_snapshots(
+        self, snapshots: CatalogSnapshotStore, *, refresh: bool
+    ) -> tuple[dict[str, T] | None, dict[str, T] | None, bool]:
+        """`(adopted, aged, claimed)`: a catalog to serve without walking, else whether to walk.
+
+        A snapshot inside the TTL is adopted unless `refresh` asked for a newer one. Otherwise
+        this replica walks if it wins the claim; if a peer holds it, the peer's result is
+        adopted once saved, and a peer that fails leaves this replica to walk after all. `aged`
+        is the expired snapshot, kept for a cold walk that fails.
+        """
+        stored = await snapshots.load(self._subject, schema_version=self._schema_version)
+        aged = self._decoded(stored)
+        if (
+            stored is not None
+            and aged is not None
+            and not refresh
+            and datetime.now(UTC) - stored.fetched_at < self._freshness.duration
+        ):
+            self._adopt(aged, stored.fetched_at)
+            return aged, None, False
+        if await snapshots.claim_refresh(self._subject):
+            return None, aged, True
+        peer = await snapshots.await_refresh(
+            self._subject,
+            schema_version=self._schema_version,
+            newer_than=stored.fetched_at if stored is not None else None,
+        )
+        refreshed = self._decoded(peer)
+        if peer is not None and refreshed is not None:
+            self._adopt(refreshed, peer.fetched_at)
+            return refreshed, None, False
+        return None, aged, False
+
+    def _decoded(self, stored: StoredCatalog | None) -> dict[str, T] | None:
+        if stored is None:
+            return None
+        try:
+            return {
+                item_id: self._item_adapter.validate_python(item)
+                for item_id, item in stored.payload.items()
+            }
+        except ValidationError:
+            # Same schema digest, unreadable rows: walk rather than serve a half-decoded map.
+            logger.warning(
+                f"{self._log_prefix}.snapshot_unreadable",
+                extra={"catalog": self._subject},
+                exc_info=True,
+            )
+            return None
+
+    def _adopt(self, items: dict[str, T], fetched_at: datetime) -> None:
+        # Stamped with the walk's own time, not now, so a snapshot ages out on the replica that
+        # adopted it exactly when it does on the one that wrote it.
+        self._items = items
+        self._freshness.mark(fetched_at)
+        self.record_load("snapshot")
+        logger.info(
+            f"{self._log_prefix}.adopted_snapshot",
+            extra={"catalog": self._subject, "items": len(items)},
+        )
@@ -2,13 +2,21 @@
 
 `search_activities` settles this shape; `search_opportunities` reuses it. Counts are
 visible-to-this-credential, not firm-wide, and a truncated or failed walk must say so.
-`project_fields` is the sparse-row projection both tools publish rows through.
+`project_fields` is the sparse-row projection both tools publish rows through, and
+`BucketTally` the page-at-a-time counter both aggregate modes fold their walks into.
 """
 
-from backstop_mcp.features.collection_scan.internal_dto import AggregateBucketDto
+from backstop_mcp.features.collection_scan.bucket_tally import BucketKey, BucketTally, MeasureValue
+from backstop_mcp.features.collection_scan.internal_dto import (
+    AggregateBreakdownDto,
+    AggregateBucketDto,
+    AggregateMeasureDto,
+)
 from backstop_mcp.features.collection_scan.project_fields import project_fields
 from backstop_mcp.features.collection_scan.responses import (
+    AggregateBreakdownResponse,
     AggregateBucketResponse,
+    AggregateMeasureResponse,
     ScanCoverageResponse,
 )
 from backstop_mcp.features.collection_scan.scan_coverage import (
@@ -18,9 +26,16 @@ from backstop_mcp.features.collection_scan.scan_coverage import (
 )
 
 __all__ = [
+    "AggregateBreakdownDto",
+    "AggregateBreakdownResponse",
     "AggregateBucketDto",
     "AggregateBucketResponse",
+    "AggregateMeasureDto",
+    "AggregateMeasureResponse",
+    "BucketKey",
+    "BucketTally",
     "ERROR_DISCLAIMER",
+    "MeasureValue",
     "ROW_CAP_DISCLAIMER",
     "ScanCoverageResponse",
     "project_fields",
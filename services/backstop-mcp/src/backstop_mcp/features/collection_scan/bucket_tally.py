@@ -0,0 +1,162 @@
+"""Fold scanned rows into aggregate buckets a page at a time, for several groupings at once.
+
+Both collection-scanning tools used to hold every row of a walk — up to 10,000 activities or
+20,000 deals — only to count them once at the end. A `BucketTally` is handed each page as it
+is read and keeps nothing of it but `Counter` increments, so an aggregate holds one page plus
+its buckets, and one walk answers every `group_by` asked for. What a row counts toward is the
+feature's `buckets` function; a row may count toward several keys (an activity with two tags)
+or none.
+
+A grouping is one dimension or a tuple of them. A tuple is a compound key — stage × period —
+whose buckets are every combination of the keys the row has in each part. With `measures`, each
+bucket also keeps a running count, sum, min and max of the amounts its rows carry, per measure
+and per currency: amounts in different currencies are never added together, and nothing but
+those four numbers is kept per bucket, so the cost stays O(buckets) however long the walk.
+"""
+
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from itertools import product
+
+from backstop_mcp.features.collection_scan.internal_dto import (
+    AggregateBreakdownDto,
+    AggregateBucketDto,
+    AggregateMeasureDto,
+)
+
+__all__ = ["BucketKey", "BucketTally", "MeasureValue"]
+
+# `(key, label)`: the stable identity a bucket is counted under and the name it is shown with.
+type BucketKey = tuple[str, str]
+# `(measure, currency, amount)`: one amount a row adds to the statistics of each of its buckets.
+type MeasureValue = tuple[str, str | None, float]
+
+_KEY_SEPARATOR = "|"
+_LABEL_SEPARATOR = " × "
+_GROUP_BY_SEPARATOR = "×"
+
+
+@dataclass(slots=True)
+class _Running:
+    count: int
+    total: float
+    minimum: float
+    maximum: float
+
+    def add(self, amount: float) -> None:
+        self.count += 1
+        self.total += amount
+        self.minimum = min(self.minimum, amount)
+        self.maximum = max(self.maximum, amount)
+
+
+class BucketTally[Row, Dimension: str]:
+    """Running bucket counts, and optionally amounts, per grouping. See the module docstring."""
+
+    def __init__(
+        self,
+        groupings: Iterable[Dimension | tuple[Dimension, ...]],
+        *,
+        buckets: Callable[[Row, Dimension], Iterable[BucketKey]],
+        measures: Callable[[Row], Iterable[MeasureValue]] | None = None,
+    ) -> None:
+        # A grouping named twice is counted once.
+        self._counts: dict[tuple[Dimension, ...], Counter[BucketKey]] = {
+            _parts(grouping): Counter() for grouping in groupings
+        }
+        self._amounts: dict[
+            tuple[Dimension, ...], dict[BucketKey, dict[tuple[str, str | None], _Running]]
+        ] = {grouping: {} for grouping in self._counts}
+        self._buckets: Callable[[Row, Dimension], Iterable[BucketKey]] = buckets
+        self._measures: Callable[[Row], Iterable[MeasureValue]] | None = measures
+        self.rows_counted: int = 0
+
+    @property
+    def groupings(self) -> tuple[tuple[Dimension, ...], ...]:
+        return tuple(self._counts)
+
+    def add(self, rows: Iterable[Row]) -> None:
+        for row in rows:
+            self.rows_counted += 1
+            amounts = tuple(self._measures(row)) if self._measures is not None else ()
+            for grouping, counts in self._counts.items():
+                for key in self._keys(row, grouping):
+                    counts[key] += 1
+                    if amounts:
+                        self._add_amounts(self._amounts[grouping].setdefault(key, {}), amounts)
+
+    def buckets(
+        self, grouping: Dimension | tuple[Dimension, ...]
+    ) -> tuple[AggregateBucketDto, ...]:
+        """The buckets for `grouping`, largest first."""
+        parts = _parts(grouping)
+        amounts = self._amounts[parts]
+        # Sorted, not `most_common()`: that breaks count ties by insertion order, which here is
+        # page order from endpoints whose row order is not stable across hosts.
+        return tuple(
+            AggregateBucketDto(
+                key=key, label=label, count=count, measures=_measures(amounts.get((key, label)))
+            )
+            for (key, label), count in sorted(
+                self._counts[parts].items(), key=lambda item: (-item[1], item[0][1])
+            )
+        )
+
+    def breakdowns(self) -> tuple[AggregateBreakdownDto, ...]:
+        """Every grouping's buckets, in the order the groupings were asked for."""
+        return tuple(
+            AggregateBreakdownDto(
+                group_by=_GROUP_BY_SEPARATOR.join(grouping), buckets=self.buckets(grouping)
+            )
+            for grouping in self._counts
+        )
+
+    def _keys(self, row: Row, grouping: tuple[Dimension, ...]) -> Iterable[BucketKey]:
+        if len(grouping) == 1:
+            return self._buckets(row, grouping[0])
+        return (
+            (
+                _KEY_SEPARATOR.join(key for key, _ in combination),
+                _LABEL_SEPARATOR.join(label for _, label in combination),
+            )
+            for combination in product(*(tuple(self._buckets(row, part)) for part in grouping))
+        )
+
+    @staticmethod
+    def _add_amounts(
+        running: dict[tuple[str, str | None], _Running], amounts: tuple[MeasureValue, ...]
+    ) -> None:
+        for measure, currency, amount in amounts:
+            stats = running.get((measure, currency))
+            if stats is None:
+                running[(measure, currency)] = _Running(1, amount, amount, amount)
+            else:
+                stats.add(amount)
+
+
+def _parts[Dimension: str](grouping: Dimension | tuple[Dimension, ...]) -> tuple[Dimension, ...]:
+    if isinstance(grouping, tuple):
+        return tuple(dict.fromkeys(grouping))
+    return (grouping,)
+
+
+def _measures(
+    running: dict[tuple[str, str | None], _Running] | None,
+) -> tuple[AggregateMeasureDto, ...]:
+    if not running:
+        return ()
+    return tuple(
+        AggregateMeasureDto(
+            measure=measure,
+            currency=currency,
+            count=stats.count,
+            total=stats.total,
+            mean=stats.total / stats.count,
+            minimum=stats.minimum,
+            maximum=stats.maximum,
+        )
+        for (measure, currency), stats in sorted(
+            running.items(), key=lambda item: (item[0][0], item[0][1] or "")
+        )
+    )
@@ -2,7 +2,21 @@ from typing import ClassVar
 
 from pydantic import BaseModel, ConfigDict
 
-__all__ = ["AggregateBucketDto"]
+__all__ = ["AggregateBreakdownDto", "AggregateBucketDto", "AggregateMeasureDto"]
+
+
+class AggregateMeasureDto(BaseModel):
+    """Statistics of one amount over a bucket's rows that carry it, in one currency."""
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True)
+
+    measure: str
+    currency: str | None
+    count: int
+    total: float
+    mean: float
+    minimum: float
+    maximum: float
 
 
 class AggregateBucketDto(BaseModel):
@@ -11,3 +25,13 @@ class AggregateBucketDto(BaseModel):
     key: str
     label: str
     count: int
+    measures: tuple[AggregateMeasureDto, ...] = ()
+
+
+class AggregateBreakdownDto(BaseModel):
+    """One `group_by` dimension's buckets, largest first."""
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True)
+
+    group_by: str
+    buckets: tuple[AggregateBucketDto, ...]
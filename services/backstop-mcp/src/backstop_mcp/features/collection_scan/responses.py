@@ -2,10 +2,19 @@ from typing import ClassVar, Self
 
 from pydantic import ConfigDict, Field
 
-from backstop_mcp.features.collection_scan.internal_dto import AggregateBucketDto
+from backstop_mcp.features.collection_scan.internal_dto import (
+    AggregateBreakdownDto,
+    AggregateBucketDto,
+    AggregateMeasureDto,
+)
 from backstop_mcp.models import OmitNoneModel
 
-__all__ = ["AggregateBucketResponse", "ScanCoverageResponse"]
+__all__ = [
+    "AggregateBreakdownResponse",
+    "AggregateBucketResponse",
+    "AggregateMeasureResponse",
+    "ScanCoverageResponse",
+]
 
 
 class ScanCoverageResponse(OmitNoneModel):
@@ -66,6 +75,36 @@ class ScanCoverageResponse(OmitNoneModel):
     )
 
 
+class AggregateMeasureResponse(OmitNoneModel):
+    """One amount's statistics over a bucket's rows, in one currency — never across two."""
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True)
+
+    measure: str = Field(description="The amount field these statistics are over.")
+    currency: str | None = Field(
+        default=None, description="ISO currency of every amount here. Omitted when none was set."
+    )
+    count: int = Field(
+        description="How many of the bucket's rows carried this amount in this currency."
+    )
+    total: float = Field(description="Sum of the amounts.")
+    mean: float = Field(description="Mean of the amounts: `total` over `count`.")
+    minimum: float = Field(description="Smallest amount.")
+    maximum: float = Field(description="Largest amount.")
+
+    @classmethod
+    def from_dto(cls, measure: AggregateMeasureDto) -> Self:
+        return cls(
+            measure=measure.measure,
+            currency=measure.currency,
+            count=measure.count,
+            total=measure.total,
+            mean=measure.mean,
+            minimum=measure.minimum,
+            maximum=measure.maximum,
+        )
+
+
 class AggregateBucketResponse(OmitNoneModel):
     """One group in aggregate mode: the key, a label, and how many scanned rows fell in it."""
 
@@ -81,7 +120,43 @@ class AggregateBucketResponse(OmitNoneModel):
             "tags or parties increments each of those buckets."
         )
     )
+    measures: tuple[AggregateMeasureResponse, ...] | None = Field(
+        default=None,
+        description=(
+            "Amount statistics over this bucket's rows, one entry per measure and currency. "
+            "Omitted unless measures were asked for."
+        ),
+    )
 
     @classmethod
     def from_dto(cls, bucket: AggregateBucketDto) -> Self:
-        return cls(key=bucket.key, label=bucket.label, count=bucket.count)
+        return cls(
+            key=bucket.key,
+            label=bucket.label,
+            count=bucket.count,
+            measures=tuple(AggregateMeasureResponse.from_dto(item) for item in bucket.measures)
+            or None,
+        )
+
+
+class AggregateBreakdownResponse(OmitNoneModel):
+    """One `group_by` dimension of a multi-dimension aggregate, counted in the same walk."""
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True)
+
+    group_by: str = Field(
+        description=(
+            "The dimension these buckets group by, or a compound one such as `stage×period`, "
+            "whose keys and labels join each part's."
+        )
+    )
+    buckets: tuple[AggregateBucketResponse, ...] = Field(
+        description="Count buckets for this dimension, largest first."
+    )
+
+    @classmethod
+    def from_dto(cls, breakdown: AggregateBreakdownDto) -> Self:
+        return cls(
+            group_by=breakdown.group_by,
+            buckets=tuple(AggregateBucketResponse.from_dto(bucket) for bucket in breakdown.buckets),
+        )
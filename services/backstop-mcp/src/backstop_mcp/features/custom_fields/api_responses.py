@@ -3,6 +3,7 @@ from typing import Annotated, ClassVar, cast
 
 from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, StringConstraints
 
+from backstop_mcp.dates import LenientDatetime
 from backstop_mcp.lenient import LenientBool, LenientInt
 
 __all__ = [
@@ -64,6 +65,7 @@ class CustomFieldDefinitionAttributes(BaseModel):
     required: LenientBool = None
     client_required: LenientBool = Field(default=None, alias="clientRequired")
     system_defined: LenientBool = Field(default=None, alias="systemDefined")
+    modified_timestamp: LenientDatetime = Field(default=None, alias="modifiedTimestamp")
 
 
 class CustomFieldValueAttributes(BaseModel):
@@ -1,6 +1,7 @@
 from datetime import timedelta
 from typing import Self
 
+from backstop_mcp.catalog_snapshot_store import CatalogSnapshotStore
 from backstop_mcp.features.cached_catalog import CachedCatalog
 from backstop_mcp.features.custom_fields.fetch_custom_field_groups import fetch_custom_field_groups
 from backstop_mcp.features.custom_fields.internal_dto import CustomFieldGroupDto
@@ -16,15 +17,37 @@ class CustomFieldGroupsService(CachedCatalog[CustomFieldGroupDto]):
     The TTL, single-flight and serve-stale protocol behind `get` is `CachedCatalog`.
     """
 
-    def __init__(self, *, ttl: timedelta, caching_enabled: bool = True) -> None:
+    def __init__(
+        self,
+        *,
+        ttl: timedelta,
+        caching_enabled: bool = True,
+        snapshots: CatalogSnapshotStore | None = None,
+        revalidate_window: timedelta = timedelta(0),
+    ) -> None:
         super().__init__(
             ttl=ttl,
             fetch=fetch_custom_field_groups,
+            item_type=CustomFieldGroupDto,
             log_prefix="custom_fields.groups",
             subject="custom-field group",
             caching_enabled=caching_enabled,
+            snapshots=snapshots,
+            revalidate_window=revalidate_window,
         )
 
     @classmethod
-    def with_ttl_minutes(cls, *, ttl_minutes: int, caching_enabled: bool = True) -> Self:
-        return cls(ttl=timedelta(minutes=ttl_minutes), caching_enabled=caching_enabled)
+    def with_ttl_minutes(
+        cls,
+        *,
+        ttl_minutes: int,
+        caching_enabled: bool = True,
+        snapshots: CatalogSnapshotStore | None = None,
+        revalidate_window_minutes: int = 0,
+    ) -> Self:
+        return cls(
+            ttl=timedelta(minutes=ttl_minutes),
+            caching_enabled=caching_enabled,
+            snapshots=snapshots,
+            revalidate_window=timedelta(minutes=revalidate_window_minutes),
+        )
@@ -1,15 +1,18 @@
 import logging
 from collections.abc import Mapping, Sequence
-from datetime import timedelta
+from datetime import UTC, datetime, timedelta
 from typing import Self, cast, override
 
 from pydantic import ValidationError
 
-from backstop_mcp.backstop_client import BackstopClient, ResourceRef
+from backstop_mcp.backstop_client import BackstopApiError, BackstopClient, ResourceRef
+from backstop_mcp.catalog_snapshot_store import CatalogSnapshotStore
 from backstop_mcp.features.cached_catalog import CachedCatalog, CatalogSource
 from backstop_mcp.features.custom_fields.api_responses import CustomFieldValueAttributes
 from backstop_mcp.features.custom_fields.fetch_custom_field_definitions import (
+    count_custom_field_definitions,
     fetch_custom_field_definitions,
+    walk_custom_field_definitions,
 )
 from backstop_mcp.features.custom_fields.internal_dto import (
     CustomFieldDefinitionDto,
@@ -32,6 +35,19 @@ class CustomFieldsService(CachedCatalog[CustomFieldDefinitionDto]):
 
     The TTL, single-flight and serve-stale protocol behind `get` is `CachedCatalog`; this is the
     one catalog that meters its loads, so it overrides `record_load`.
+
+    With `delta_refresh`, a refresh of a held schema asks only for definitions modified since the
+    last load and merges them in (`source="delta"`), instead of re-walking ~1000 definitions that
+    almost never change. Nothing documents a modified-time filter on this collection, so the
+    delta is trusted only when it checks out, and is otherwise replaced by a full walk:
+
+    - The held schema plus the delta must account for exactly `meta.totalResourceCount`, read off
+      a one-row page. That catches deletions, which a delta cannot carry.
+    - A 400 for the filter, or a "delta" carrying a row not modified after the cut-off (the filter
+      ignored, as Backstop ignores `sort=` on some collections), turns deltas off for the life of
+      the process. A small schema whose every definition was just edited is still a valid delta.
+    - The last full walk must be younger than `_FULL_WALK_INTERVAL`, so an edit a delta missed
+      cannot outlive a day.
     """
 
     _STORED_VALUE_KEYS: frozenset[str] = frozenset(
@@ -39,24 +55,124 @@ class CustomFieldsService(CachedCatalog[CustomFieldDefinitionDto]):
     )
     _ENTITY_FIELD_TYPE: str = "entity"
     _OPTION_TEXT_KEYS: tuple[str, ...] = ("label", "value", "name", "id")
+    # How far back past the last load a delta asks from, so a definition saved while that load
+    # was in flight — or stamped by a Backstop clock running behind ours — is not missed.
+    _DELTA_OVERLAP: timedelta = timedelta(minutes=5)
+    _FULL_WALK_INTERVAL: timedelta = timedelta(hours=24)
 
-    def __init__(self, *, ttl: timedelta, caching_enabled: bool = True) -> None:
+    def __init__(
+        self,
+        *,
+        ttl: timedelta,
+        caching_enabled: bool = True,
+        snapshots: CatalogSnapshotStore | None = None,
+        revalidate_window: timedelta = timedelta(0),
+        delta_refresh: bool = False,
+    ) -> None:
         super().__init__(
             ttl=ttl,
             fetch=fetch_custom_field_definitions,
+            item_type=CustomFieldDefinitionDto,
             log_prefix="custom_fields.schema",
             subject="custom-field",
             caching_enabled=caching_enabled,
+            snapshots=snapshots,
+            revalidate_window=revalidate_window,
         )
+        self._delta_refresh: bool = delta_refresh
+        # What a delta builds on: when the last load started, when the last full walk did, and
+        # every row id the schema had then. All `None` until a load of this process's own.
+        self._loaded_at: datetime | None = None
+        self._walked_at: datetime | None = None
+        self._row_ids: frozenset[str] = frozenset()
 
     @classmethod
-    def with_ttl_minutes(cls, *, ttl_minutes: int, caching_enabled: bool = True) -> Self:
-        return cls(ttl=timedelta(minutes=ttl_minutes), caching_enabled=caching_enabled)
+    def with_ttl_minutes(
+        cls,
+        *,
+        ttl_minutes: int,
+        caching_enabled: bool = True,
+        snapshots: CatalogSnapshotStore | None = None,
+        revalidate_window_minutes: int = 0,
+        delta_refresh: bool = False,
+    ) -> Self:
+        return cls(
+            ttl=timedelta(minutes=ttl_minutes),
+            caching_enabled=caching_enabled,
+            snapshots=snapshots,
+            revalidate_window=timedelta(minutes=revalidate_window_minutes),
+            delta_refresh=delta_refresh,
+        )
 
     @override
     def record_load(self, source: CatalogSource) -> None:
         CUSTOM_FIELD_SCHEMA_LOADS.add(1, {"source": source})
 
+    @override
+    async def load_from_backstop(
+        self, client: BackstopClient, held: dict[str, CustomFieldDefinitionDto] | None
+    ) -> tuple[dict[str, CustomFieldDefinitionDto], CatalogSource]:
+        started = datetime.now(UTC)
+        if held is not None and self._delta_due(started):
+            merged = await self._merged_delta(client, held)
+            if merged is not None:
+                self._loaded_at = started
+                return merged, "delta"
+        walk = await walk_custom_field_definitions(client)
+        self._loaded_at = started
+        self._walked_at = started
+        self._row_ids = walk.row_ids
+        return walk.definitions, "backstop"
+
+    def _delta_due(self, now: datetime) -> bool:
+        return (
+            self._delta_refresh
+            and self._loaded_at is not None
+            and self._walked_at is not None
+            and now - self._walked_at < self._FULL_WALK_INTERVAL
+        )
+
+    async def _merged_delta(
+        self, client: BackstopClient, held: dict[str, CustomFieldDefinitionDto]
+    ) -> dict[str, CustomFieldDefinitionDto] | None:
+        """`held` with what changed since the last load merged in, or `None` to walk in full."""
+        assert self._loaded_at is not None
+        total = await count_custom_field_definitions(client)
+        if total is None:
+            return None
+        try:
+            delta = await walk_custom_field_definitions(
+                client, modified_since=self._loaded_at - self._DELTA_OVERLAP
+            )
+        except BackstopApiError as error:
+            if error.status_code != 400:
+                raise
+            self._give_up_deltas("filter_rejected")
+            return None
+        if delta.stale_row_count:
+            self._give_up_deltas("filter_ignored")
+            return None
+        row_ids = self._row_ids | delta.row_ids
+        if len(row_ids) != total:
+            logger.info(
+                "custom_fields.schema.delta_untrusted",
+                extra={"expected": total, "accounted": len(row_ids)},
+            )
+            return None
+        self._row_ids = row_ids
+        # A changed row the projection now drops must leave the catalog, not keep its old shape.
+        merged = {
+            definition_id: definition
+            for definition_id, definition in held.items()
+            if definition_id not in delta.row_ids
+        }
+        merged.update(delta.definitions)
+        return merged
+
+    def _give_up_deltas(self, reason: str) -> None:
+        self._delta_refresh = False
+        logger.warning("custom_fields.schema.delta_unsupported", extra={"reason": reason})
+
     def take_stored_values(
         self, attributes: Mapping[str, object]
     ) -> tuple[dict[str, object], object]:
@@ -1,6 +1,6 @@
 from functools import lru_cache
 
-from backstop_mcp.dependencies import get_backstop_config
+from backstop_mcp.dependencies import catalog_snapshot_store, get_backstop_config
 from backstop_mcp.features.custom_fields.custom_field_groups_service import CustomFieldGroupsService
 from backstop_mcp.features.custom_fields.custom_fields_service import CustomFieldsService
 
@@ -17,6 +17,9 @@ def get_custom_fields_service() -> CustomFieldsService:
     return CustomFieldsService.with_ttl_minutes(
         ttl_minutes=config.custom_field_schema_ttl_minutes,
         caching_enabled=config.custom_field_schema_cache_enabled,
+        snapshots=catalog_snapshot_store(config),
+        revalidate_window_minutes=config.catalog_revalidate_window_minutes,
+        delta_refresh=config.custom_field_delta_refresh_enabled,
     )
 
 
@@ -32,4 +35,6 @@ def get_custom_field_groups_service() -> CustomFieldGroupsService:
     return CustomFieldGroupsService.with_ttl_minutes(
         ttl_minutes=config.custom_field_schema_ttl_minutes,
         caching_enabled=config.custom_field_schema_cache_enabled,
+        snapshots=catalog_snapshot_store(config),
+        revalidate_window_minutes=config.catalog_revalidate_window_minutes,
     )
@@ -1,13 +1,20 @@
 import logging
+from datetime import UTC, datetime
 
 from backstop_mcp.backstop_client import BackstopApiResource, BackstopClient
 from backstop_mcp.features.custom_fields.api_responses import CustomFieldDefinitionAttributes
-from backstop_mcp.features.custom_fields.internal_dto import CustomFieldDefinitionDto
+from backstop_mcp.features.custom_fields.internal_dto import (
+    CustomFieldDefinitionDto,
+    CustomFieldDefinitionsFetchDto,
+)
 
 logger = logging.getLogger(__name__)
 
 _DEFINITIONS_PATH = "/custom-field-definitions"
 _DEFINITIONS_PAGE_SIZE = 1000
+# Not a filter this collection is documented to take — see `CustomFieldsService` for how a
+# 400 or an ignored filter is detected and falls back to a full walk.
+_MODIFIED_SINCE_PARAM = "filter[modifiedTimestamp][gt]"
 _DUPLICATE_DEFINITION_WARNING = (
     "Conflicting custom-field definitions for duplicate id %r; retaining first definition"
 )
@@ -17,9 +24,20 @@ async def fetch_custom_field_definitions(
     client: BackstopClient,
 ) -> dict[str, CustomFieldDefinitionDto]:
     """Fetch Backstop's full custom-field schema in one paginated walk, keyed by definition id."""
+    return (await walk_custom_field_definitions(client)).definitions
+
+
+async def walk_custom_field_definitions(
+    client: BackstopClient, *, modified_since: datetime | None = None
+) -> CustomFieldDefinitionsFetchDto:
+    """Walk the schema — all of it, or only what changed after `modified_since`."""
+    params: dict[str, object] | None = None
+    if modified_since is not None:
+        params = {_MODIFIED_SINCE_PARAM: modified_since.isoformat()}
     page = await client.paginate(
         _DEFINITIONS_PATH,
         schema=BackstopApiResource[CustomFieldDefinitionAttributes],
+        params=params,
         max_records=None,
         page_size=_DEFINITIONS_PAGE_SIZE,
     )
@@ -34,4 +52,34 @@ async def fetch_custom_field_definitions(
             definitions_by_id[definition.id] = definition
         elif existing != definition:
             logger.warning(_DUPLICATE_DEFINITION_WARNING, definition.id)
-    return definitions_by_id
+    return CustomFieldDefinitionsFetchDto(
+        definitions=definitions_by_id,
+        row_ids=frozenset(resource.id for resource in page.items),
+        total_count=page.total_count,
+        stale_row_count=0
+        if modified_since is None
+        else sum(
+            1
+            for resource in page.items
+            if not _modified_after(resource.attributes.modified_timestamp, modified_since)
+        ),
+    )
+
+
+def _modified_after(modified: datetime | None, cutoff: datetime) -> bool:
+    if modified is None:
+        return False
+    if modified.tzinfo is None:
+        modified = modified.replace(tzinfo=UTC)
+    return modified > cutoff
+
+
+async def count_custom_field_definitions(client: BackstopClient) -> int | None:
+    """`meta.totalResourceCount` for the whole schema, read off a one-row page."""
+    page = await client.paginate(
+        _DEFINITIONS_PATH,
+        schema=BackstopApiResource[CustomFieldDefinitionAttributes],
+        max_records=1,
+        page_size=1,
+    )
+    return page.total_count
@@ -14,6 +14,7 @@ from backstop_mcp.features.entity_types import SearchType
 
 __all__ = [
     "CustomFieldDefinitionDto",
+    "CustomFieldDefinitionsFetchDto",
     "CustomFieldEntityReferenceDto",
     "CustomFieldGroupDto",
     "CustomFieldGroupParentDto",
@@ -184,6 +185,21 @@ class CustomFieldGroupDto(BaseModel):
         )
 
 
+class CustomFieldDefinitionsFetchDto(BaseModel):
+    """One walk of `/custom-field-definitions`, whole or filtered to recent changes."""
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True)
+
+    definitions: dict[str, CustomFieldDefinitionDto]
+    # Every row id the walk saw, including rows the projection dropped — what a delta's count
+    # check compares against `meta.totalResourceCount`, which counts those rows too.
+    row_ids: frozenset[str]
+    total_count: int | None
+    # Rows a `modified_since` walk returned without a `modifiedTimestamp` after the cut-off —
+    # rows the filter should have excluded, so any at all means Backstop ignored it.
+    stale_row_count: int = 0
+
+
 class CustomFieldEntityReferenceDto(BaseModel):
     """An ENTITY-typed custom-field value parsed from Backstop's inline resource ref."""
 
@@ -14,7 +14,9 @@ here. See `opportunity_stages_service.py`.
 
 from backstop_mcp.features.opportunities.aggregate_search_opportunities import (
     OpportunityGroupBy,
+    OpportunityMeasure,
     aggregate_search_opportunities,
+    search_opportunities_tally,
 )
 from backstop_mcp.features.opportunities.api_responses import OpportunityStageAttributes
 from backstop_mcp.features.opportunities.dependencies import get_opportunity_stages_service
@@ -42,6 +44,7 @@ __all__ = [
     "MAX_OPPORTUNITY_SCAN_RECORDS",
     "OpportunityFetchResponse",
     "OpportunityGroupBy",
+    "OpportunityMeasure",
     "OpportunityResponse",
     "OpportunityStageDto",
     "OpportunityStageAttributes",
@@ -54,4 +57,5 @@ __all__ = [
     "fetch_opportunities",
     "fetch_search_opportunities",
     "get_opportunity_stages_service",
+    "search_opportunities_tally",
 ]
@@ -1,28 +1,46 @@
-from collections import Counter
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Sequence
 from datetime import date
 from typing import Literal
 
-from backstop_mcp.features.collection_scan import AggregateBucketDto
+from backstop_mcp.features.collection_scan import (
+    AggregateBucketDto,
+    BucketKey,
+    BucketTally,
+    MeasureValue,
+)
 from backstop_mcp.features.opportunities.internal_dto import SearchOpportunityDto
 
-__all__ = ["OpportunityGroupBy", "aggregate_search_opportunities"]
+__all__ = [
+    "OpportunityGroupBy",
+    "OpportunityMeasure",
+    "aggregate_search_opportunities",
+    "search_opportunities_tally",
+]
 
-type OpportunityGroupBy = Literal["stage", "product", "period", "party"]
+type OpportunityGroupBy = Literal["stage", "product", "period", "quarter", "party"]
+# Amounts a bucket can sum, average and bound, always within one `currency`.
+type OpportunityMeasure = Literal["requested_amount", "allocated_amount", "weighted_value"]
 
 _UNKNOWN = "(unknown)"
 _UNATTRIBUTED = "(unattributed)"
 _UNDATED = "(undated)"
 
 
-def _month_key(value: date | None) -> tuple[str, str]:
+def _month_key(value: date | None) -> BucketKey:
     if value is None:
         return (_UNDATED, _UNDATED)
     stamp = f"{value.year:04d}-{value.month:02d}"
     return (stamp, stamp)
 
 
-def _bucket(row: SearchOpportunityDto, group_by: OpportunityGroupBy) -> tuple[str, str]:
+def _quarter_key(value: date | None) -> BucketKey:
+    if value is None:
+        return (_UNDATED, _UNDATED)
+    stamp = f"{value.year:04d}-Q{(value.month - 1) // 3 + 1}"
+    return (stamp, stamp)
+
+
+def _bucket(row: SearchOpportunityDto, group_by: OpportunityGroupBy) -> BucketKey:
     match group_by:
         case "stage":
             if row.stage_id and row.stage:
@@ -34,20 +52,56 @@ def _bucket(row: SearchOpportunityDto, group_by: OpportunityGroupBy) -> tuple[st
             return (row.product.id, row.product.name or row.product.id)
         case "period":
             return _month_key(row.expected_investment_date or row.date_entered_current_stage)
+        case "quarter":
+            return _quarter_key(row.expected_investment_date or row.date_entered_current_stage)
         case "party":
             if row.investor is None:
                 return (_UNATTRIBUTED, _UNATTRIBUTED)
             return (row.investor.id, row.investor.name or row.investor.id)
 
 
+def _buckets(row: SearchOpportunityDto, group_by: OpportunityGroupBy) -> Iterable[BucketKey]:
+    return (_bucket(row, group_by),)
+
+
+def _amount(row: SearchOpportunityDto, measure: OpportunityMeasure) -> float | None:
+    match measure:
+        case "requested_amount":
+            return row.requested_amount
+        case "allocated_amount":
+            return row.allocated_amount
+        case "weighted_value":
+            return row.weighted_value
+
+
+def _amounts(
+    measures: Sequence[OpportunityMeasure],
+) -> Callable[[SearchOpportunityDto], Iterable[MeasureValue]]:
+    def amounts(row: SearchOpportunityDto) -> Iterable[MeasureValue]:
+        for measure in measures:
+            amount = _amount(row, measure)
+            if amount is not None:
+                yield (measure, row.currency, amount)
+
+    return amounts
+
+
+def search_opportunities_tally(
+    group_by: Iterable[OpportunityGroupBy | tuple[OpportunityGroupBy, ...]],
+    *,
+    measures: Sequence[OpportunityMeasure] = (),
+) -> BucketTally[SearchOpportunityDto, OpportunityGroupBy]:
+    """An empty tally counting deals by each of `group_by` — a tuple is one compound key — and
+    keeping `measures` per bucket and currency; feed it pages with `add`."""
+    return BucketTally(
+        group_by, buckets=_buckets, measures=_amounts(measures) if measures else None
+    )
+
+
 def aggregate_search_opportunities(
     rows: Sequence[SearchOpportunityDto], *, group_by: OpportunityGroupBy
 ) -> tuple[AggregateBucketDto, ...]:
     """Count matching deals per `group_by` key, largest buckets first."""
-    counts: Counter[tuple[str, str]] = Counter()
-    for row in rows:
-        counts[_bucket(row, group_by)] += 1
-    return tuple(
-        AggregateBucketDto(key=key, label=label, count=count)
-        for (key, label), count in sorted(counts.items(), key=lambda item: (-item[1], item[0][1]))
-    )
+    tally = search_opportunities_tally((group_by,))
+    tally.add(rows)
+    return tally.buckets(group_by)
@@ -5,11 +5,17 @@
 `filter[product.name]`, and `filter[isOpen]` are `400 Invalid filter field` — those stay
 client-side after this walk. The investor include arrives as a `contacts` resource, so the
 sparse key is `fields[contacts]`, not `fields[organizations]`.
+
+With `on_rows`, each page is projected as it is read and handed over rather than kept, so an
+aggregate over the whole ceiling holds one page at a time. Every page carries the side-loads
+its own deals reference, so it projects alone; a page read before the stage vocabulary is in
+waits for it.
 """
 
 import asyncio
 import logging
-from collections.abc import Awaitable, Mapping, Sequence
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass, field
 
 from pydantic import ValidationError
 
@@ -18,6 +24,7 @@ from backstop_mcp.backstop_client import (
     BackstopClient,
     IncludedIndex,
     IncludedResource,
+    SinglePage,
     follow_indexed,
     included_resource,
     index_included,
@@ -172,6 +179,28 @@ def _project(
     return tuple(projected), dropped
 
 
+@dataclass
+class _Stream:
+    """Projects each page for `on_rows` once the vocabulary is in; earlier pages wait for it."""
+
+    on_rows: Callable[[Sequence[SearchOpportunityDto]], None]
+    vocabulary: asyncio.Future[dict[str, OpportunityStageDto]]
+    waiting: list[SinglePage[OpportunityResource]] = field(default_factory=list)
+    dropped: int = 0
+
+    def __call__(self, page: SinglePage[OpportunityResource]) -> None:
+        self.waiting.append(page)
+        if self.vocabulary.done():
+            self.flush(self.vocabulary.result())
+
+    def flush(self, vocabulary: Mapping[str, OpportunityStageDto]) -> None:
+        for page in self.waiting:
+            rows, dropped = _project(page.items, included=page.included, vocabulary=vocabulary)
+            self.dropped += dropped
+            self.on_rows(rows)
+        self.waiting.clear()
+
+
 def _params(*, representative: str | None) -> dict[str, object]:
     params: dict[str, object] = {
         "include": _INCLUDE,
@@ -190,8 +219,16 @@ async def fetch_search_opportunities(
     *,
     representative: str | None = None,
     vocabulary: Mapping[str, OpportunityStageDto] | Awaitable[Mapping[str, OpportunityStageDto]],
+    on_rows: Callable[[Sequence[SearchOpportunityDto]], None] | None = None,
 ) -> SearchOpportunitiesFetchDto:
-    """Walk the firm-wide opportunities collection, optionally filtered by login."""
+    """Walk the firm-wide opportunities collection, optionally filtered by login.
+
+    With `on_rows`, projected deals go there page by page and `rows` on the result is empty.
+    """
+    if on_rows is not None:
+        return await _stream_search_opportunities(
+            client, representative=representative, vocabulary=vocabulary, on_rows=on_rows
+        )
     page, vocabulary_rows = await asyncio.gather(
         client.paginate(
             _PATH,
@@ -211,3 +248,35 @@ async def fetch_search_opportunities(
         total_count=page.total_count,
         truncated=page.truncated,
     )
+
+
+async def _stream_search_opportunities(
+    client: BackstopClient,
+    *,
+    representative: str | None,
+    vocabulary: Mapping[str, OpportunityStageDto] | Awaitable[Mapping[str, OpportunityStageDto]],
+    on_rows: Callable[[Sequence[SearchOpportunityDto]], None],
+) -> SearchOpportunitiesFetchDto:
+    vocabulary_rows = asyncio.ensure_future(await_vocabulary(vocabulary))
+    stream = _Stream(on_rows=on_rows, vocabulary=vocabulary_rows)
+    try:
+        page = await client.paginate(
+            _PATH,
+            schema=BackstopApiResource[dict[str, object]],
+            params=_params(representative=representative),
+            max_records=MAX_OPPORTUNITY_SCAN_RECORDS,
+            page_size=_PAGE_SIZE,
+            parallel=True,
+            on_page=stream,
+        )
+        stream.flush(await vocabulary_rows)
+    finally:
+        _ = vocabulary_rows.cancel()
+        _ = await asyncio.gather(vocabulary_rows, return_exceptions=True)
+    return SearchOpportunitiesFetchDto(
+        rows=(),
+        rows_received=page.item_count,
+        rows_dropped=stream.dropped,
+        total_count=page.total_count,
+        truncated=page.truncated,
+    )
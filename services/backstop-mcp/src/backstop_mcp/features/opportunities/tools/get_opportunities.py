@@ -33,7 +33,11 @@ from backstop_mcp.features.opportunities import (
 )
 from backstop_mcp.features.party_resolver import (
     PartyAmbiguousResponse,
+    PartyNameIndex,
+    PartyResolutionCache,
     ResolvedPartyResponse,
+    get_party_name_index,
+    get_party_resolution_cache,
     resolve_party,
     unresolved_party_response,
 )
@@ -154,6 +158,8 @@ async def get_opportunities(
     ] = "all",
     client: BackstopClient = Depends(get_backstop_client),
     opportunity_stages: OpportunityStagesService = Depends(get_opportunity_stages_service),
+    party_resolutions: PartyResolutionCache | None = Depends(get_party_resolution_cache),
+    party_names: PartyNameIndex | None = Depends(get_party_name_index),
 ) -> GetOpportunitiesResponse:
     """Fetch a party's opportunities: stage, stage timing, and how each deal got there.
 
@@ -180,6 +186,8 @@ async def get_opportunities(
         search_type=search_type,
         party_id=party_id,
         search=search,
+        cache=party_resolutions,
+        names=party_names,
     )
     if not isinstance(result, Resolved):
         return unresolved_party_response(result)
@@ -5,6 +5,7 @@ from `list_system_users`, not a display name. Stage, product, and open/closed ar
 """
 
 import logging
+from collections.abc import Sequence
 from datetime import date
 from typing import Annotated, Literal, Self
 
@@ -16,7 +17,9 @@ from pydantic import Field
 from backstop_mcp.backstop_client import BackstopClient
 from backstop_mcp.dependencies import get_backstop_client
 from backstop_mcp.features.collection_scan import (
+    AggregateBreakdownResponse,
     AggregateBucketResponse,
+    BucketTally,
     ScanCoverageResponse,
     project_fields,
     scan_coverage,
@@ -24,12 +27,13 @@ from backstop_mcp.features.collection_scan import (
 from backstop_mcp.features.opportunities import (
     MAX_OPPORTUNITY_SCAN_RECORDS,
     OpportunityGroupBy,
+    OpportunityMeasure,
     OpportunityStagesService,
     SearchOpportunitiesFetchDto,
     SearchOpportunityDto,
-    aggregate_search_opportunities,
     fetch_search_opportunities,
     get_opportunity_stages_service,
+    search_opportunities_tally,
 )
 from backstop_mcp.models import OmitNoneModel, published_output_schema
 
@@ -154,7 +158,17 @@ class SearchOpportunitiesResolvedResponse(OmitNoneModel):
     )
     aggregates: tuple[AggregateBucketResponse, ...] = Field(
         default=(),
-        description="Count buckets in aggregate mode. Empty in rows mode.",
+        description=(
+            "Count buckets in aggregate mode, for the first `group_by` when several were "
+            "given. Empty in rows mode."
+        ),
+    )
+    breakdowns: tuple[AggregateBreakdownResponse, ...] = Field(
+        default=(),
+        description=(
+            "One set of count buckets per `group_by`, in the order given, when several were "
+            "given. All come from the same walk, so their counts agree."
+        ),
     )
 
 
@@ -178,6 +192,16 @@ def _matches(
     return True
 
 
+def _dimensions(
+    group_by: OpportunityGroupBy | Sequence[OpportunityGroupBy] | None,
+) -> tuple[OpportunityGroupBy, ...]:
+    if group_by is None:
+        return ()
+    if isinstance(group_by, str):
+        return (group_by,)
+    return tuple(dict.fromkeys(group_by))
+
+
 def _resolved(
     fetch: SearchOpportunitiesFetchDto,
     *,
@@ -185,7 +209,7 @@ def _resolved(
     mode: SearchMode,
     fields: frozenset[str],
     max_rows: int,
-    group_by: OpportunityGroupBy | None,
+    tally: BucketTally[SearchOpportunityDto, OpportunityGroupBy] | None,
 ) -> SearchOpportunitiesResolvedResponse:
     truncated_by_row_cap = mode == "rows" and len(matching) > max_rows
     visible = fetch.total_count
@@ -202,21 +226,25 @@ def _resolved(
     )
     rows: tuple[SearchOpportunityRowResponse, ...] = ()
     aggregates: tuple[AggregateBucketResponse, ...] = ()
-    if mode == "rows":
+    breakdowns: tuple[AggregateBreakdownResponse, ...] = ()
+    if tally is None:
         rows = tuple(
             SearchOpportunityRowResponse.from_dto(row, fields=fields) for row in matching[:max_rows]
         )
     else:
-        assert group_by is not None
         aggregates = tuple(
-            AggregateBucketResponse.from_dto(bucket)
-            for bucket in aggregate_search_opportunities(matching, group_by=group_by)
+            AggregateBucketResponse.from_dto(bucket) for bucket in tally.buckets(tally.groupings[0])
         )
+        if len(tally.groupings) > 1:
+            breakdowns = tuple(
+                AggregateBreakdownResponse.from_dto(breakdown) for breakdown in tally.breakdowns()
+            )
     return SearchOpportunitiesResolvedResponse(
         mode=mode,
         coverage=coverage,
         rows=rows,
         aggregates=aggregates,
+        breakdowns=breakdowns,
     )
 
 
@@ -268,8 +296,33 @@ async def search_opportunities(
         Field(description="`rows` (default) or `aggregate` for counts without row bodies."),
     ] = "rows",
     group_by: Annotated[
-        OpportunityGroupBy | None,
-        Field(description="Required when mode is aggregate: stage, product, period, or party."),
+        OpportunityGroupBy | list[OpportunityGroupBy] | None,
+        Field(
+            description=(
+                "Required when mode is aggregate: stage, product, period (YYYY-MM), quarter "
+                "(YYYY-Qn), or party — or a list of them, counted in one walk and returned as "
+                "`breakdowns`, or crossed into one compound key with `cross_group_by`."
+            )
+        ),
+    ] = None,
+    cross_group_by: Annotated[
+        bool,
+        Field(
+            description=(
+                "Aggregate mode only. Count the `group_by` list as one compound key — "
+                "['stage', 'quarter'] gives a bucket per stage × quarter — rather than one "
+                "breakdown per entry."
+            )
+        ),
+    ] = False,
+    measures: Annotated[
+        list[OpportunityMeasure] | None,
+        Field(
+            description=(
+                "Aggregate mode only. Amounts to total, average and bound in every bucket, "
+                "partitioned by currency — amounts in different currencies are never added."
+            )
+        ),
     ] = None,
     max_rows: Annotated[
         int,
@@ -299,21 +352,38 @@ async def search_opportunities(
 
     For one party's deals, call get_opportunities instead — that is one cheap sub-collection,
     not this walk. `mode=aggregate` with `group_by` answers a counting question without row
-    bodies. Investor geography is on the `investor` chip (the include is a contacts resource).
+    bodies, and a list of `group_by` values answers several breakdowns from the same walk.
+    `cross_group_by` crosses the list into one compound key, and `measures` adds per-currency
+    sum, mean, min and max of the amounts to each bucket — "pipeline value by stage per
+    quarter" is one call. Investor geography is on the `investor` chip (the include is a
+    contacts resource).
     """
-    if mode == "aggregate" and group_by is None:
+    dimensions = _dimensions(group_by)
+    if mode == "aggregate" and not dimensions:
         raise ValueError("group_by is required when mode is aggregate")
-    if mode == "rows" and group_by is not None:
-        raise ValueError("group_by is only used when mode is aggregate")
+    if mode == "rows" and (group_by is not None or measures or cross_group_by):
+        raise ValueError("group_by, cross_group_by and measures are only used in aggregate mode")
 
     logger.info(
         "opportunities.search.start",
         extra={"representative": representative, "mode": mode, "stage": stage, "product": product},
     )
+    # Aggregate mode counts each page as it arrives and keeps no rows.
+    groupings = (dimensions,) if cross_group_by else dimensions
+    tally = (
+        search_opportunities_tally(groupings, measures=tuple(dict.fromkeys(measures or ())))
+        if mode == "aggregate"
+        else None
+    )
     fetch = await fetch_search_opportunities(
         client,
         representative=representative,
         vocabulary=opportunity_stages.get(client),
+        on_rows=None
+        if tally is None
+        else lambda rows: tally.add(
+            row for row in rows if _matches(row, is_open=is_open, stage=stage, product=product)
+        ),
     )
     matching = tuple(
         row for row in fetch.rows if _matches(row, is_open=is_open, stage=stage, product=product)
@@ -325,5 +395,5 @@ async def search_opportunities(
         mode=mode,
         fields=selected_fields,
         max_rows=max_rows,
-        group_by=group_by,
+        tally=tally,
     )
@@ -9,9 +9,11 @@ paginated walk of `GET /organizations/{id}/employees` with
 `get_person` uses, built from those side-loads. `/employees` is current staff only, so the
 organization's `entityRelationships` are always walked as well — former people live there,
 and `former_omitted` needs that walk. `include_former` only controls whether they are
-returned.
+returned. With `OrganizationRelationshipsCache` on, that walk is kept per user and
+organization, and skipped while two one-row reads show no relationship changed.
 """
 
+from backstop_mcp.features.org_people.dependencies import get_organization_relationships_cache
 from backstop_mcp.features.org_people.fetch_organization import fetch_organization
 from backstop_mcp.features.org_people.fetch_people_for_organization import (
     MAX_ORG_PEOPLE,
@@ -19,9 +21,13 @@ from backstop_mcp.features.org_people.fetch_people_for_organization import (
 )
 from backstop_mcp.features.org_people.fetch_person import fetch_person
 from backstop_mcp.features.org_people.internal_dto import (
+    OrganizationRelationshipsDto,
     OrgPeopleListingDto,
     PersonAtOrganizationDto,
 )
+from backstop_mcp.features.org_people.organization_relationships_cache import (
+    OrganizationRelationshipsCache,
+)
 from backstop_mcp.features.org_people.responses import (
     OrganizationRecordResponse,
     OrgPeopleResolvedResponse,
@@ -31,6 +37,8 @@ from backstop_mcp.features.org_people.responses import (
 
 __all__ = [
     "MAX_ORG_PEOPLE",
+    "OrganizationRelationshipsCache",
+    "OrganizationRelationshipsDto",
     "OrganizationRecordResponse",
     "OrgPeopleListingDto",
     "OrgPeopleResolvedResponse",
@@ -40,4 +48,5 @@ __all__ = [
     "fetch_organization",
     "fetch_people_for_organization",
     "fetch_person",
+    "get_organization_relationships_cache",
 ]
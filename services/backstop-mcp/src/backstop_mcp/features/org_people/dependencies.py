@@ -0,0 +1,19 @@
+from datetime import timedelta
+from functools import lru_cache
+
+from backstop_mcp.dependencies import get_backstop_config
+from backstop_mcp.features.org_people.organization_relationships_cache import (
+    OrganizationRelationshipsCache,
+)
+
+
+@lru_cache(maxsize=1)
+def get_organization_relationships_cache() -> OrganizationRelationshipsCache | None:
+    """The process-wide relationship-walk cache, or `None` while its TTL is 0 (the default)."""
+    config = get_backstop_config()
+    if not config.org_relationships_cache_ttl_seconds:
+        return None
+    return OrganizationRelationshipsCache(
+        max_entries=config.org_relationships_cache_max_entries,
+        ttl=timedelta(seconds=config.org_relationships_cache_ttl_seconds),
+    )
@@ -19,9 +19,13 @@ from backstop_mcp.features.data_hygiene import (
 )
 from backstop_mcp.features.includes import ContactCardResponse
 from backstop_mcp.features.org_people.internal_dto import (
+    OrganizationRelationshipsDto,
     OrgPeopleListingDto,
     PersonAtOrganizationDto,
 )
+from backstop_mcp.features.org_people.organization_relationships_cache import (
+    OrganizationRelationshipsCache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +44,7 @@ async def fetch_people_for_organization(
     *,
     organization_id: str,
     include_former: bool,
+    relationships_cache: OrganizationRelationshipsCache | None = None,
 ) -> OrgPeopleListingDto:
     """People the employment index ties to `organization_id`.
 
@@ -50,6 +55,9 @@ async def fetch_people_for_organization(
     `entityRelationships` are always walked as well: former people live there, and without
     that walk `former_omitted` cannot tell an empty roster from a former-only one.
     `include_former` only controls whether those former people are returned.
+
+    With `relationships_cache`, a walk of `entityRelationships` it still vouches for stands in
+    for a fresh one. The fold is always redone, over this call's `/employees` side-loads.
     """
     org = quote(organization_id, safe="")
     page = await client.paginate(
@@ -62,12 +70,8 @@ async def fetch_people_for_organization(
         max_records=None,
         page_size=_PAGE_SIZE,
     )
-    org_page = await client.paginate(
-        f"/organizations/{org}/entityRelationships",
-        schema=RelationshipResource,
-        params={"include": EntityRelationshipRef.TYPE.value},
-        max_records=None,
-        page_size=_PAGE_SIZE,
+    walked = await _organization_relationships(
+        client, organization_id=organization_id, relationships_cache=relationships_cache
     )
     relationships = [
         *_resources(
@@ -76,7 +80,7 @@ async def fetch_people_for_organization(
             schema=EntityRelationshipAttributes,
             kind="entity-relationships",
         ),
-        *org_page.items,
+        *walked.relationships,
     ]
     relationship_types = [
         *_resources(
@@ -85,12 +89,7 @@ async def fetch_people_for_organization(
             schema=RelationshipTypeAttributes,
             kind="entity-relationship-types",
         ),
-        *_resources(
-            org_page.included,
-            resource_type=EntityRelationshipRef.TYPES_RESOURCE,
-            schema=RelationshipTypeAttributes,
-            kind="entity-relationship-types",
-        ),
+        *walked.relationship_types,
     ]
     index = factory.index(
         relationships=relationships,
@@ -122,6 +121,49 @@ async def fetch_people_for_organization(
     )
 
 
+async def _organization_relationships(
+    client: BackstopClient,
+    *,
+    organization_id: str,
+    relationships_cache: OrganizationRelationshipsCache | None,
+) -> OrganizationRelationshipsDto:
+    """The organization's relationships and their types, kept or walked afresh."""
+    if relationships_cache is not None:
+        kept = await relationships_cache.get(client, organization_id=organization_id)
+        if kept is not None:
+            return kept
+    org_page = await client.paginate(
+        f"/organizations/{quote(organization_id, safe='')}/entityRelationships",
+        schema=RelationshipResource,
+        params={"include": EntityRelationshipRef.TYPE.value},
+        max_records=None,
+        page_size=_PAGE_SIZE,
+    )
+    walked = OrganizationRelationshipsDto(
+        relationships=tuple(org_page.items),
+        relationship_types=tuple(
+            _resources(
+                org_page.included,
+                resource_type=EntityRelationshipRef.TYPES_RESOURCE,
+                schema=RelationshipTypeAttributes,
+                kind="entity-relationship-types",
+            )
+        ),
+        newest_relationship_modified=max(
+            (
+                resource.attributes.modified_timestamp
+                for resource in org_page.items
+                if resource.attributes.modified_timestamp is not None
+            ),
+            default=None,
+        ),
+        relationship_count=len(org_page.items),
+    )
+    if relationships_cache is not None:
+        relationships_cache.remember(client, organization_id=organization_id, walked=walked)
+    return walked
+
+
 def _resources[AttrT](
     included: list[dict[str, object]],
     *,
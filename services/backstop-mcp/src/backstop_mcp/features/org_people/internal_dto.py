@@ -1,13 +1,36 @@
-"""Internal listing result for people linked to one organization."""
+"""Internal listing result for people linked to one organization, and the walk behind it."""
 
+from datetime import datetime
 from typing import ClassVar
 
 from pydantic import BaseModel, ConfigDict
 
-from backstop_mcp.features.data_hygiene import EmploymentLinkResponse
+from backstop_mcp.backstop_client import BackstopApiResource
+from backstop_mcp.features.data_hygiene import (
+    EmploymentLinkResponse,
+    EntityRelationshipAttributes,
+    RelationshipTypeAttributes,
+)
 from backstop_mcp.features.includes import ContactCardResponse
 
-__all__ = ["OrgPeopleListingDto", "PersonAtOrganizationDto"]
+__all__ = ["OrgPeopleListingDto", "OrganizationRelationshipsDto", "PersonAtOrganizationDto"]
+
+
+class OrganizationRelationshipsDto(BaseModel):
+    """One walk of an organization's `entityRelationships`, and the version it was read at.
+
+    `relationships` and `relationship_types` are what the walk returned, ready to fold into
+    `EmploymentIndex` again. The last two fields are what `OrganizationRelationshipsCache`
+    compares to tell whether a fresh walk would differ: the newest `modifiedTimestamp` among the
+    relationships, and how many there were.
+    """
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True)
+
+    relationships: tuple[BackstopApiResource[EntityRelationshipAttributes], ...]
+    relationship_types: tuple[BackstopApiResource[RelationshipTypeAttributes], ...]
+    newest_relationship_modified: datetime | None = None
+    relationship_count: int = 0
 
 
 class PersonAtOrganizationDto(BaseModel):
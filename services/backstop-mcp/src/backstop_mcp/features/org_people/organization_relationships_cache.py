@@ -0,0 +1,166 @@
+"""A per-user memory of each organization's `entityRelationships` walk, checked before reuse.
+
+`fetch_people_for_organization` walks the organization's whole `entityRelationships`
+sub-collection, with their types, on every listing — former staff live only there, and an
+organization accumulates them for as long as it is in the CRM. For a large organization that
+walk is most of the call, and it returns the same rows until someone edits one. So
+`OrganizationRelationshipsCache` keeps the walk as an `OrganizationRelationshipsDto` and, before
+serving it, has the caller make two one-row reads that say whether a fresh walk could differ:
+
+- the relationships filtered to `modifiedTimestamp` after the newest one kept — any row at all
+  is an edit or an addition;
+- their unfiltered `meta.totalResourceCount`, which is what catches a deletion.
+
+Both are the caller's own reads of the organization, so a user who has since lost access gets
+the error the full walk would have raised. Entries are keyed by username first, like
+`PartyResolutionCache`: what a user's walk returns depends on what they may see, so one user's
+rows are never another's answer. Only the walk is kept, not the verdicts folded from it: the
+fold also takes the people-side relationships side-loaded on `/employees`, which is still
+walked every time, and it is redone each call, so an `endDate` that has just passed counts.
+
+Nothing documents a modified-time filter on this sub-collection, so it is trusted the way
+`CustomFieldsService` trusts its delta: a 400 for the filter, or a filtered read whose row was
+not modified after the cut-off, means it is not honoured, and the cache stops serving for the
+life of the process. A count could not tell: an edit to an organization's only relationship
+returns every row too. An entry also lapses at `ttl`, which bounds what neither read can
+see — a relationship type renamed into or out of the employment vocabulary.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+from urllib.parse import quote
+
+from backstop_mcp.backstop_client import (
+    BackstopApiError,
+    BackstopApiResource,
+    BackstopClient,
+    SinglePage,
+)
+from backstop_mcp.features.data_hygiene import EntityRelationshipAttributes
+from backstop_mcp.features.org_people.internal_dto import OrganizationRelationshipsDto
+from backstop_mcp.metrics import ORG_RELATIONSHIPS_CACHE_LOOKUPS
+
+logger = logging.getLogger(__name__)
+
+type _Key = tuple[str, str]
+
+_MODIFIED_SINCE_PARAM = "filter[modifiedTimestamp][gt]"
+_VERSION_FIELDS = {"fields[entity-relationships]": "modifiedTimestamp"}
+
+
+class OrganizationRelationshipsCache:
+    """Bounded LRU of relationship walks by (user, organization). See the module docstring."""
+
+    def __init__(self, *, max_entries: int, ttl: timedelta) -> None:
+        self._max_entries: int = max_entries
+        self._ttl_seconds: float = ttl.total_seconds()
+        self._entries: OrderedDict[_Key, tuple[float, OrganizationRelationshipsDto]] = OrderedDict()
+        self._serving: bool = True
+
+    async def get(
+        self, client: BackstopClient, *, organization_id: str
+    ) -> OrganizationRelationshipsDto | None:
+        """The kept walk, once the caller's reads show nothing changed; else `None`."""
+        key = (client.username, organization_id)
+        entry = self._entries.get(key)
+        if not self._serving or entry is None:
+            ORG_RELATIONSHIPS_CACHE_LOOKUPS.add(1, {"outcome": "miss"})
+            return None
+        stored_at, walked = entry
+        if time.monotonic() - stored_at > self._ttl_seconds:
+            del self._entries[key]
+            ORG_RELATIONSHIPS_CACHE_LOOKUPS.add(1, {"outcome": "expired"})
+            return None
+        if await self._changed(client, organization_id=organization_id, walked=walked):
+            _ = self._entries.pop(key, None)
+            ORG_RELATIONSHIPS_CACHE_LOOKUPS.add(1, {"outcome": "changed"})
+            return None
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        ORG_RELATIONSHIPS_CACHE_LOOKUPS.add(1, {"outcome": "hit"})
+        return walked
+
+    def remember(
+        self,
+        client: BackstopClient,
+        *,
+        organization_id: str,
+        walked: OrganizationRelationshipsDto,
+    ) -> None:
+        """Keep a fresh walk — unless it has relationships but no timestamp to check them by."""
+        if not self._serving:
+            return
+        if walked.relationship_count and walked.newest_relationship_modified is None:
+            return
+        key = (client.username, organization_id)
+        self._entries[key] = (time.monotonic(), walked)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            _ = self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def _changed(
+        self,
+        client: BackstopClient,
+        *,
+        organization_id: str,
+        walked: OrganizationRelationshipsDto,
+    ) -> bool:
+        newest = walked.newest_relationship_modified
+        if newest is None:
+            # The walk was empty, so only the count can have moved.
+            counted = await _relationship_versions(client, organization_id=organization_id)
+            return counted.total_count != walked.relationship_count
+        try:
+            counted, modified_since = await asyncio.gather(
+                _relationship_versions(client, organization_id=organization_id),
+                _relationship_versions(
+                    client, organization_id=organization_id, modified_after=newest
+                ),
+            )
+        except BackstopApiError as exc:
+            if exc.status_code == 400:
+                self._stop_serving("filter_rejected")
+                return True
+            raise
+        if modified_since.items:
+            edited = modified_since.items[0].attributes.modified_timestamp
+            if edited is None or _as_utc(edited) <= _as_utc(newest):
+                self._stop_serving("filter_ignored")
+            return True
+        total = counted.total_count
+        return total is None or total != walked.relationship_count
+
+    def _stop_serving(self, reason: str) -> None:
+        self._serving = False
+        self._entries.clear()
+        logger.warning("org_people.relationships_cache.unsupported", extra={"reason": reason})
+
+
+def _as_utc(moment: datetime) -> datetime:
+    # Backstop sends some timestamps without an offset; those are UTC.
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=UTC)
+
+
+async def _relationship_versions(
+    client: BackstopClient,
+    *,
+    organization_id: str,
+    modified_after: datetime | None = None,
+) -> SinglePage[BackstopApiResource[EntityRelationshipAttributes]]:
+    """One row of the organization's relationships — all of them, or those edited after
+    `modified_after` — for its `meta.totalResourceCount`."""
+    params: dict[str, object] = dict(_VERSION_FIELDS)
+    if modified_after is not None:
+        params[_MODIFIED_SINCE_PARAM] = modified_after.isoformat()
+    return await client.fetch_page(
+        f"/organizations/{quote(organization_id, safe='')}/entityRelationships",
+        schema=BackstopApiResource[EntityRelationshipAttributes],
+        params=params,
+        page_size=1,
+    )
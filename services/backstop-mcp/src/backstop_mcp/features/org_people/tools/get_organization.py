@@ -19,7 +19,11 @@ from backstop_mcp.features.includes import OrganizationInclude, OrganizationIncl
 from backstop_mcp.features.org_people import OrganizationRecordResponse, fetch_organization
 from backstop_mcp.features.party_resolver import (
     PartyAmbiguousResponse,
+    PartyNameIndex,
+    PartyResolutionCache,
     ResolvedPartyResponse,
+    get_party_name_index,
+    get_party_resolution_cache,
     resolve_party,
     unresolved_party_response,
 )
@@ -189,6 +193,8 @@ async def get_organization(
     ] = (),
     client: BackstopClient = Depends(get_backstop_client),
     custom_fields: CustomFieldsService = Depends(get_custom_fields_service),
+    party_resolutions: PartyResolutionCache | None = Depends(get_party_resolution_cache),
+    party_names: PartyNameIndex | None = Depends(get_party_name_index),
 ) -> GetOrganizationResponse:
     """Fetch one Backstop organization by trusted Party ID or by name/email search.
 
@@ -225,6 +231,8 @@ async def get_organization(
         search_type=search_type if search_type is not None else "organizations",
         party_id=party_id,
         search=search,
+        cache=party_resolutions,
+        names=party_names,
     )
     if not isinstance(result, Resolved):
         return unresolved_party_response(result)
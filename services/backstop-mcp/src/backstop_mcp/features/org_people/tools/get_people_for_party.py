@@ -24,12 +24,18 @@ from backstop_mcp.features.data_hygiene import (
     get_employment_index_factory,
 )
 from backstop_mcp.features.org_people import (
+    OrganizationRelationshipsCache,
     OrgPeopleResolvedResponse,
     fetch_people_for_organization,
+    get_organization_relationships_cache,
 )
 from backstop_mcp.features.party_resolver import (
     PartyAmbiguousResponse,
+    PartyNameIndex,
+    PartyResolutionCache,
     ResolvedPartyResponse,
+    get_party_name_index,
+    get_party_resolution_cache,
     resolve_party,
     unresolved_party_response,
 )
@@ -94,6 +100,11 @@ async def get_people_for_party(
     ] = False,
     client: BackstopClient = Depends(get_backstop_client),
     employment_index_factory: EmploymentIndexFactory = Depends(get_employment_index_factory),
+    party_resolutions: PartyResolutionCache | None = Depends(get_party_resolution_cache),
+    party_names: PartyNameIndex | None = Depends(get_party_name_index),
+    relationships_cache: OrganizationRelationshipsCache | None = Depends(
+        get_organization_relationships_cache
+    ),
 ) -> GetPeopleForPartyResponse:
     """List the people Backstop links to an organization, with employment status at that org.
 
@@ -119,6 +130,8 @@ async def get_people_for_party(
         search_type=search_type if search_type is not None else "organizations",
         party_id=party_id,
         search=search,
+        cache=party_resolutions,
+        names=party_names,
     )
     if not isinstance(result, Resolved):
         return unresolved_party_response(result)
@@ -133,6 +146,7 @@ async def get_people_for_party(
         employment_index_factory,
         organization_id=party.id,
         include_former=include_former,
+        relationships_cache=relationships_cache,
     )
     logger.info(
         "org_people.completed",
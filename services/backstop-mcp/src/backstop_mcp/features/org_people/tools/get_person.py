@@ -24,7 +24,11 @@ from backstop_mcp.features.includes import PersonInclude, PersonIncludesResponse
 from backstop_mcp.features.org_people import PersonRecordResponse, fetch_person
 from backstop_mcp.features.party_resolver import (
     PartyAmbiguousResponse,
+    PartyNameIndex,
+    PartyResolutionCache,
     ResolvedPartyResponse,
+    get_party_name_index,
+    get_party_resolution_cache,
     resolve_party,
     unresolved_party_response,
 )
@@ -201,6 +205,8 @@ async def get_person(
     client: BackstopClient = Depends(get_backstop_client),
     custom_fields: CustomFieldsService = Depends(get_custom_fields_service),
     employment_index_factory: EmploymentIndexFactory = Depends(get_employment_index_factory),
+    party_resolutions: PartyResolutionCache | None = Depends(get_party_resolution_cache),
+    party_names: PartyNameIndex | None = Depends(get_party_name_index),
 ) -> GetPersonResponse:
     """Fetch one Backstop person by trusted Party ID or by name/email search.
 
@@ -241,6 +247,8 @@ async def get_person(
         search_type=search_type if search_type is not None else "people",
         party_id=party_id,
         search=search,
+        cache=party_resolutions,
+        names=party_names,
     )
     if not isinstance(result, Resolved):
         return unresolved_party_response(result)
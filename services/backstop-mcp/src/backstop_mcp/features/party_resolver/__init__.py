@@ -1,5 +1,9 @@
 from backstop_mcp.features.entity_types import SearchType
 from backstop_mcp.features.party_resolver.api_responses import PartyAttributes
+from backstop_mcp.features.party_resolver.dependencies import (
+    get_party_name_index,
+    get_party_resolution_cache,
+)
 from backstop_mcp.features.party_resolver.fetch_party_name import fetch_party_name
 from backstop_mcp.features.party_resolver.internal_dto import (
     BatchPartyResolution,
@@ -9,6 +13,8 @@ from backstop_mcp.features.party_resolver.internal_dto import (
     QuickSearchOptionsDto,
     ResolvedPartyDto,
 )
+from backstop_mcp.features.party_resolver.party_name_index import PartyNameIndex
+from backstop_mcp.features.party_resolver.party_resolution_cache import PartyResolutionCache
 from backstop_mcp.features.party_resolver.resolve_party import resolve_parties, resolve_party
 from backstop_mcp.features.party_resolver.responses import (
     PartyAmbiguousResponse,
@@ -24,13 +30,17 @@ __all__ = [
     "PartyAttributes",
     "PartyCandidate",
     "PartyCandidateResponse",
+    "PartyNameIndex",
     "PartyResolution",
+    "PartyResolutionCache",
     "PartyResolveItemDto",
     "QuickSearchOptionsDto",
     "ResolvedPartyDto",
     "ResolvedPartyResponse",
     "SearchType",
     "fetch_party_name",
+    "get_party_name_index",
+    "get_party_resolution_cache",
     "resolve_parties",
     "resolve_party",
     "unresolved_parties_response",
@@ -113,14 +113,23 @@ def _candidate_from_resource(
     # SearchType (shouldn't happen for `/quick-search` hits, but keep a usable candidate).
     resource_type = resource.type or "resource"
     resolved_search_type = party_search_type(resource_type) or search_type
-    name = resource.attributes.display_name()
-    party_id = _party_id(resource)
+    return party_candidate(
+        ResolvedPartyDto(
+            id=_party_id(resource),
+            search_type=resolved_search_type,
+            name=resource.attributes.display_name(),
+        )
+    )
+
+
+def party_candidate(party: ResolvedPartyDto) -> PartyCandidate:
+    """One party as a resolution candidate, however it was found."""
     # Backstop ids are not unique across collections. Namespace the elicit key by
     # search_type so `enhance_search_types` hits that share an id stay distinct options.
     return Candidate(
-        key=f"{resolved_search_type}:{party_id}",
-        label=_candidate_label(name=name, search_type=resolved_search_type, party_id=party_id),
-        value=ResolvedPartyDto(id=party_id, search_type=resolved_search_type, name=name),
+        key=f"{party.search_type}:{party.id}",
+        label=_candidate_label(name=party.name, search_type=party.search_type, party_id=party.id),
+        value=party,
     )
 
 
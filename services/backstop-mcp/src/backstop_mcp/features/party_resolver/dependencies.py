@@ -0,0 +1,30 @@
+from datetime import timedelta
+from functools import lru_cache
+
+from backstop_mcp.dependencies import get_backstop_config
+from backstop_mcp.features.party_resolver.party_name_index import PartyNameIndex
+from backstop_mcp.features.party_resolver.party_resolution_cache import PartyResolutionCache
+
+
+@lru_cache(maxsize=1)
+def get_party_resolution_cache() -> PartyResolutionCache | None:
+    """The process-wide resolution cache, or `None` while its TTL is 0 (the default)."""
+    config = get_backstop_config()
+    if not config.party_resolution_cache_ttl_seconds:
+        return None
+    return PartyResolutionCache(
+        max_entries=config.party_resolution_cache_max_entries,
+        ttl=timedelta(seconds=config.party_resolution_cache_ttl_seconds),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_party_name_index() -> PartyNameIndex | None:
+    """The process-wide party-name index, or `None` unless it is enabled."""
+    config = get_backstop_config()
+    if not config.party_name_index_enabled:
+        return None
+    return PartyNameIndex(
+        max_names=config.party_name_index_max_names,
+        sweep_interval=timedelta(minutes=config.party_name_index_sweep_minutes),
+    )
@@ -0,0 +1,259 @@
+"""An in-memory index of a tenant's party names, for searches quick-search's prefix match misses.
+
+`/quick-search` is prefix-anchored, so `Dispersion` misses `Capstone Dispersion` and resolution
+falls back to `search_by_like` — a collection read, and the slowest step a resolution can take.
+`PartyNameIndex` holds every organization and person name, walked in a background sweep
+(`start_sweep`) and kept current by every named party resolution sees afterwards, and answers
+substring and near-miss queries over them from trigrams instead of that read.
+
+The index only answers for a search type it holds completely: swept within the sweep interval,
+and nothing of that type evicted since. Until then resolution runs as if it were not there, so an
+index still warming costs no request. A complete index is still only as new as its sweep — a party
+created since is missed until the next one, or until quick-search or `like` returns it.
+
+The index is shared by every user of a tenant — one per process, and a process talks to one
+Backstop base URL — but nothing it holds is handed out as-is. Each hit is re-read by id with the
+caller's own client, so a party the caller cannot see, or that was deleted, is dropped, and one
+that was renamed is matched against its current name. Only verified hits become candidates, and a
+query with none falls back to `like`.
+
+Matching folds case and whitespace. A query's trigrams must all occur in a name for a substring
+hit; failing any, names sharing at least `_FUZZY_CONTAINMENT` of them are near misses — a typo or
+a transposed word. Queries shorter than a trigram are left to quick-search. Bounded by name count
+and evicted least-recently-seen; an eviction ends its type's completeness until the next sweep.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from functools import partial
+
+from backstop_mcp.backstop_client import (
+    BackstopApiError,
+    BackstopApiResource,
+    BackstopClient,
+    RequestPriority,
+)
+from backstop_mcp.features.entity_types import SearchType
+from backstop_mcp.features.party_resolver._party_search_types import (
+    PARTY_SPARSE_FIELDS,
+    candidates_from_resources,
+    party_candidate,
+)
+from backstop_mcp.features.party_resolver.api_responses import PartyAttributes
+from backstop_mcp.features.party_resolver.fetch_party_name import fetch_party_name
+from backstop_mcp.features.party_resolver.internal_dto import PartyCandidate, ResolvedPartyDto
+from backstop_mcp.metrics import PARTY_NAME_INDEX_LOOKUPS
+
+logger = logging.getLogger(__name__)
+
+# Share of a query's trigrams a name must contain to count as a near miss.
+_FUZZY_CONTAINMENT = 0.7
+# Hits re-read per query. More than this is already ambiguous, and each one is a request.
+_MAX_VERIFIED = 5
+# The collections a sweep walks — the ones whose quick-search misses fall back to `like`.
+_SWEPT_TYPES: frozenset[SearchType] = frozenset({"organizations", "people"})
+_SWEEP_PAGE_SIZE = 1000
+
+type _Key = tuple[SearchType, str]
+
+# Plain assignment — `schema=` needs a real class object; a PEP 695 alias is not `type[T]`.
+_PartyResource = BackstopApiResource[PartyAttributes]
+
+
+def _folded(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+def _trigrams(folded: str) -> frozenset[str]:
+    return frozenset(folded[index : index + 3] for index in range(len(folded) - 2))
+
+
+def names_within(party: ResolvedPartyDto, search: str) -> bool:
+    """Whether `party`'s name contains `search`, up to case and whitespace."""
+    return party.name is not None and _folded(search) in _folded(party.name)
+
+
+class PartyNameIndex:
+    """Trigram index over `(search_type, party id) -> name`. See the module docstring."""
+
+    def __init__(self, *, max_names: int, sweep_interval: timedelta) -> None:
+        self._max_names: int = max_names
+        self._sweep_interval: timedelta = sweep_interval
+        self._names: OrderedDict[_Key, str] = OrderedDict()
+        self._postings: dict[str, set[_Key]] = {}
+        # When each search type's last sweep started; dropped when a name of that type is evicted.
+        self._swept_at: dict[SearchType, datetime] = {}
+        self._sweeps: dict[SearchType, asyncio.Task[None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def remember(self, parties: Iterable[ResolvedPartyDto]) -> None:
+        """Index each named party, replacing whatever name it had before."""
+        for party in parties:
+            if party.name is not None:
+                self._put((party.search_type, party.id), _folded(party.name))
+
+    def forget(self, search_type: SearchType, party_id: str) -> None:
+        self._drop((search_type, party_id))
+
+    def complete(self, search_type: SearchType) -> bool:
+        """Whether the index holds every `search_type` name as of a sweep inside the interval."""
+        swept_at = self._swept_at.get(search_type)
+        return swept_at is not None and datetime.now(UTC) - swept_at < self._sweep_interval
+
+    def start_sweep(self, client: BackstopClient, search_type: SearchType) -> None:
+        """Walk every `search_type` name in the background, unless it is complete or walking.
+
+        The walk reads as `client`'s user, like `CachedCatalog`'s revalidation; hits are still
+        re-read as each later caller, so the sweeping user's view never reaches anyone else.
+        """
+        if search_type not in _SWEPT_TYPES or self.complete(search_type):
+            return
+        running = self._sweeps.get(search_type)
+        if running is not None and not running.done():
+            return
+        task = asyncio.create_task(
+            self.sweep(client, search_type), name=f"party_name_index.sweep.{search_type}"
+        )
+        task.add_done_callback(partial(self._swept, search_type))
+        self._sweeps[search_type] = task
+
+    def matches(self, search_type: SearchType, search: str) -> tuple[ResolvedPartyDto, ...]:
+        """Indexed parties of `search_type` whose name contains `search`, else near misses."""
+        query = _folded(search)
+        grams = _trigrams(query)
+        if not grams:
+            return ()
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        if postings[0]:
+            shared = postings[0].intersection(*postings[1:])
+            exact = [key for key in shared if key[0] == search_type and query in self._names[key]]
+            if exact:
+                # The tightest names first: "Dispersion" is likelier "Capstone Dispersion" than
+                # "Dispersion Capital Partners Fund III".
+                exact.sort(key=lambda key: len(self._names[key]))
+                return self._parties(exact)
+        overlap: dict[_Key, int] = {}
+        for posting in postings:
+            for key in posting:
+                if key[0] == search_type:
+                    overlap[key] = overlap.get(key, 0) + 1
+        near = [key for key, count in overlap.items() if count / len(grams) >= _FUZZY_CONTAINMENT]
+        near.sort(key=lambda key: overlap[key], reverse=True)
+        return self._parties(near)
+
+    async def verified_matches(
+        self, client: BackstopClient, *, search_type: SearchType, search: str
+    ) -> tuple[PartyCandidate, ...]:
+        """`matches`, each re-read by id as the caller, keeping those that still match.
+
+        A hit the caller cannot read is dropped rather than failing the resolution: the `like`
+        fallback is still there to answer it the slow way. At most `_MAX_VERIFIED` reads, and
+        none for a query the index has no hit for.
+        """
+        hits = self.matches(search_type, search)[:_MAX_VERIFIED]
+        if not hits:
+            PARTY_NAME_INDEX_LOOKUPS.add(1, {"search_type": search_type, "outcome": "miss"})
+            return ()
+        names = await asyncio.gather(*(self._current_name(client, hit) for hit in hits))
+        current = [
+            ResolvedPartyDto(id=hit.id, search_type=hit.search_type, name=name)
+            for hit, name in zip(hits, names, strict=True)
+            if name is not None
+        ]
+        self.remember(current)
+        still = {(party.search_type, party.id) for party in self.matches(search_type, search)}
+        verified = tuple(
+            party_candidate(party) for party in current if (party.search_type, party.id) in still
+        )
+        PARTY_NAME_INDEX_LOOKUPS.add(
+            1, {"search_type": search_type, "outcome": "hit" if verified else "unverified"}
+        )
+        return verified
+
+    async def sweep(self, client: BackstopClient, search_type: SearchType) -> None:
+        """Walk every `search_type` name into the index; `start_sweep` runs this unawaited."""
+        started = datetime.now(UTC)
+        page = await client.paginate(
+            f"/{search_type}",
+            schema=_PartyResource,
+            params={f"fields[{search_type}]": PARTY_SPARSE_FIELDS[search_type]},
+            max_records=None,
+            page_size=_SWEEP_PAGE_SIZE,
+            # Nobody is waiting on this walk, so none of it goes ahead of a caller's first page.
+            priority=RequestPriority.LATER_PAGE,
+        )
+        # Marked before the names go in, so a sweep that overflows `max_names` unmarks itself.
+        self._swept_at[search_type] = started
+        self.remember(
+            candidate.value
+            for candidate in candidates_from_resources(page.items, search_type=search_type)
+        )
+        logger.info(
+            "party_name_index.swept",
+            extra={
+                "search_type": search_type,
+                "names": len(page.items),
+                "complete": self.complete(search_type),
+            },
+        )
+
+    def _swept(self, search_type: SearchType, task: asyncio.Task[None]) -> None:
+        # The supervision: nothing awaits a sweep, so its failure is logged here or nowhere.
+        if self._sweeps.get(search_type) is task:
+            del self._sweeps[search_type]
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.warning(
+                "party_name_index.sweep_failed", extra={"search_type": search_type}, exc_info=error
+            )
+
+    async def _current_name(self, client: BackstopClient, party: ResolvedPartyDto) -> str | None:
+        try:
+            name = await fetch_party_name(client, search_type=party.search_type, party_id=party.id)
+        except BackstopApiError as exc:
+            if exc.status_code == 404:
+                self.forget(party.search_type, party.id)
+            logger.info(
+                "party_name_index.unverified",
+                extra={"search_type": party.search_type, "status_code": exc.status_code},
+            )
+            return None
+        if name is None:
+            self.forget(party.search_type, party.id)
+        return name
+
+    def _parties(self, keys: Iterable[_Key]) -> tuple[ResolvedPartyDto, ...]:
+        parties: list[ResolvedPartyDto] = []
+        for key in keys:
+            self._names.move_to_end(key)
+            search_type, party_id = key
+            parties.append(ResolvedPartyDto(id=party_id, search_type=search_type, name=None))
+        return tuple(parties)
+
+    def _put(self, key: _Key, folded: str) -> None:
+        self._drop(key)
+        self._names[key] = folded
+        for gram in _trigrams(folded):
+            self._postings.setdefault(gram, set()).add(key)
+        while len(self._names) > self._max_names:
+            evicted = next(iter(self._names))
+            self._swept_at.pop(evicted[0], None)
+            self._drop(evicted)
+
+    def _drop(self, key: _Key) -> None:
+        folded = self._names.pop(key, None)
+        if folded is None:
+            return
+        for gram in _trigrams(folded):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[gram]
@@ -0,0 +1,100 @@
+"""A short-lived, per-user memory of which party a search resolved to.
+
+Models repeat the same names constantly — within a conversation, and across `get_person`,
+`get_activity_history` and `search_activities` for the same counterparty — and every repeat
+costs `/quick-search` plus, when that comes back empty, the `like` fallback before the tool's
+own request can start. `PartyResolutionCache` keeps the outcome of a search for `ttl`, so the
+second and later mentions resolve without a round trip.
+
+Keyed by the caller's username first: what a search finds depends on what that user may see,
+so one user's answer is never a candidate for another's. Then by search type, the query folded
+for case and whitespace (Backstop's search ignores both), and the quick-search options, which
+change what comes back.
+
+Only `Resolved` and `Ambiguous` are kept. A miss is not — the party may be created a minute
+later, and `NotFound` is the answer a user fixes by adding the record — and a failed search
+raises before there is anything to keep. Bounded by entry count and evicted least-recently-
+used across all users, like the transport's response cache; `ttl` bounds how long a renamed or
+merged party can still resolve the old way, which is why it is meant to be minutes.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+
+from backstop_mcp.backstop_client import BackstopClient
+from backstop_mcp.features.entity_types import SearchType
+from backstop_mcp.features.party_resolver.internal_dto import (
+    PartyResolution,
+    QuickSearchOptionsDto,
+)
+from backstop_mcp.features.resolution import Ambiguous, NotFound
+from backstop_mcp.metrics import PARTY_RESOLUTION_CACHE_LOOKUPS
+
+type _Key = tuple[str, SearchType, str, str]
+
+
+class PartyResolutionCache:
+    """Bounded LRU of search outcomes with a TTL. See the module docstring for what is kept."""
+
+    def __init__(self, *, max_entries: int, ttl: timedelta) -> None:
+        self._max_entries: int = max_entries
+        self._ttl_seconds: float = ttl.total_seconds()
+        self._entries: OrderedDict[_Key, tuple[float, PartyResolution]] = OrderedDict()
+
+    async def resolve(
+        self,
+        client: BackstopClient,
+        *,
+        search_type: SearchType,
+        search: str,
+        options: QuickSearchOptionsDto | None,
+        search_upstream: Callable[[], Awaitable[PartyResolution]],
+    ) -> PartyResolution:
+        """The kept outcome for this search, or `search_upstream()`'s — kept when it is worth it."""
+        key = _key(client, search_type=search_type, search=search, options=options)
+        cached = self._get(key)
+        if cached is not None:
+            PARTY_RESOLUTION_CACHE_LOOKUPS.add(1, {"search_type": search_type, "outcome": "hit"})
+            # The echo is the caller's own spelling, not whichever one first filled the entry.
+            if isinstance(cached, Ambiguous):
+                return cached.model_copy(update={"query": search})
+            return cached
+        PARTY_RESOLUTION_CACHE_LOOKUPS.add(1, {"search_type": search_type, "outcome": "miss"})
+        outcome = await search_upstream()
+        if not isinstance(outcome, NotFound):
+            self._store(key, outcome)
+        return outcome
+
+    def _get(self, key: _Key) -> PartyResolution | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, outcome = entry
+        if time.monotonic() - stored_at > self._ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return outcome
+
+    def _store(self, key: _Key, outcome: PartyResolution) -> None:
+        self._entries[key] = (time.monotonic(), outcome)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            _ = self._entries.popitem(last=False)
+
+
+def _key(
+    client: BackstopClient,
+    *,
+    search_type: SearchType,
+    search: str,
+    options: QuickSearchOptionsDto | None,
+) -> _Key:
+    return (
+        client.username,
+        search_type,
+        " ".join(search.split()).casefold(),
+        options.model_dump_json() if options is not None else "",
+    )
@@ -14,6 +14,8 @@ from backstop_mcp.features.party_resolver.internal_dto import (
     QuickSearchOptionsDto,
     ResolvedPartyDto,
 )
+from backstop_mcp.features.party_resolver.party_name_index import PartyNameIndex, names_within
+from backstop_mcp.features.party_resolver.party_resolution_cache import PartyResolutionCache
 from backstop_mcp.features.party_resolver.quick_search import quick_search
 from backstop_mcp.features.party_resolver.search_by_email import search_by_email
 from backstop_mcp.features.party_resolver.search_by_like import search_by_like
@@ -33,6 +35,8 @@ async def _resolve_one(
     item: PartyResolveItemDto,
     confirm_name: bool = False,
     quick_search_options: QuickSearchOptionsDto | None = None,
+    cache: PartyResolutionCache | None = None,
+    names: PartyNameIndex | None = None,
 ) -> PartyResolution:
     if item.party_id is not None:
         resolved_name = item.name
@@ -40,25 +44,79 @@ async def _resolve_one(
             resolved_name = await fetch_party_name(
                 client, search_type=search_type, party_id=item.party_id
             )
+            if names is not None:
+                names.remember(
+                    [
+                        ResolvedPartyDto(
+                            id=item.party_id, search_type=search_type, name=resolved_name
+                        )
+                    ]
+                )
         return Resolved(
             value=ResolvedPartyDto(id=item.party_id, search_type=search_type, name=resolved_name)
         )
 
-    assert item.search is not None
-    email = normalized_email(item.search)
-    if email is not None:
-        candidates = await search_by_email(client, search_type=search_type, email=email)
-    else:
-        candidates = await quick_search(
-            client,
-            search_type=search_type,
-            search=item.search,
-            options=quick_search_options,
-        )
-        if not candidates:
-            candidates = await search_by_like(client, search_type=search_type, search=item.search)
+    search = item.search
+    assert search is not None
 
-    return from_candidates(candidates, query=item.search, scope=search_type)
+    async def search_upstream() -> PartyResolution:
+        email = normalized_email(search)
+        if email is not None:
+            candidates = await search_by_email(client, search_type=search_type, email=email)
+        else:
+            candidates = await quick_search(
+                client,
+                search_type=search_type,
+                search=search,
+                options=quick_search_options,
+            )
+            if not candidates and names is not None and names.complete(search_type):
+                # Quick-search is prefix-anchored; a swept name may still be a substring.
+                return await _search_past_quick_search(
+                    client, search_type=search_type, search=search, names=names
+                )
+            if not candidates and names is not None:
+                names.start_sweep(client, search_type)
+            if not candidates:
+                candidates = await search_by_like(client, search_type=search_type, search=search)
+        if names is not None:
+            names.remember(candidate.value for candidate in candidates)
+        return from_candidates(candidates, query=search, scope=search_type)
+
+    if cache is None:
+        return await search_upstream()
+    return await cache.resolve(
+        client,
+        search_type=search_type,
+        search=search,
+        options=quick_search_options,
+        search_upstream=search_upstream,
+    )
+
+
+async def _search_past_quick_search(
+    client: BackstopClient,
+    *,
+    search_type: SearchType,
+    search: str,
+    names: PartyNameIndex,
+) -> PartyResolution:
+    """Quick-search's miss, answered from a complete names index in place of `like`.
+
+    Verified substring hits answer alone, as `like` would have. Failing those, verified near
+    misses — a typo `like` cannot match either — come back `Ambiguous` even when there is one,
+    since the caller did not type that name. Only a query the index cannot vouch for any hit of
+    falls through to `like`.
+    """
+    indexed = await names.verified_matches(client, search_type=search_type, search=search)
+    within = tuple(candidate for candidate in indexed if names_within(candidate.value, search))
+    if within:
+        return from_candidates(within, query=search, scope=search_type)
+    if indexed:
+        return Ambiguous(query=search, scope=search_type, candidates=indexed)
+    found = await search_by_like(client, search_type=search_type, search=search)
+    names.remember(candidate.value for candidate in found)
+    return from_candidates(found, query=search, scope=search_type)
 
 
 async def resolve_party(
@@ -71,6 +129,8 @@ async def resolve_party(
     name: str | None = None,
     confirm_name: bool = False,
     quick_search_options: QuickSearchOptionsDto | None = None,
+    cache: PartyResolutionCache | None = None,
+    names: PartyNameIndex | None = None,
 ) -> PartyResolution:
     """Resolve one party from a name, an email, or a trusted Party ID.
 
@@ -78,6 +138,13 @@ async def resolve_party(
     one extra `fields=name` request on the trusted-`party_id` path, and buys the echo that
     makes a wrong id visible instead of silent. Callers that fetch the record anyway (e.g.
     `get_organization`) leave it off and backfill from their own response.
+
+    With a `cache`, a search this user already resolved recently is answered from it; an
+    ambiguous one still elicits, since which candidate was meant can differ per call. With
+    `names`, a search quick-search misses is answered from the swept names index, verified by
+    id, instead of the `like` fallback — once the index is complete; until then the miss starts
+    its sweep. A lone near match comes back ambiguous without eliciting — there is nothing to
+    choose between, only something to confirm, which is the model's to ask.
     """
     item = PartyResolveItemDto(party_id=party_id, search=search, name=name)
     outcome = await _resolve_one(
@@ -86,8 +153,10 @@ async def resolve_party(
         item=item,
         confirm_name=confirm_name,
         quick_search_options=quick_search_options,
+        cache=cache,
+        names=names,
     )
-    if isinstance(outcome, Ambiguous):
+    if isinstance(outcome, Ambiguous) and len(outcome.candidates) > 1:
         return await elicit_choice(
             ctx,
             outcome,
@@ -103,6 +172,8 @@ async def resolve_parties(
     items: Sequence[PartyResolveItemDto],
     confirm_name: bool = False,
     quick_search_options: QuickSearchOptionsDto | None = None,
+    cache: PartyResolutionCache | None = None,
+    names: PartyNameIndex | None = None,
 ) -> BatchPartyResolution:
     """Resolve several parties, returning one combined payload if anything is unresolved.
 
@@ -121,6 +192,8 @@ async def resolve_parties(
                 item=item,
                 confirm_name=confirm_name,
                 quick_search_options=quick_search_options,
+                cache=cache,
+                names=names,
             )
             for item in items
         )
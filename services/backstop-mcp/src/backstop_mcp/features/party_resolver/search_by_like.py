@@ -1,6 +1,6 @@
 from collections.abc import Mapping
 
-from backstop_mcp.backstop_client import BackstopApiResource, BackstopClient
+from backstop_mcp.backstop_client import BackstopApiResource, BackstopClient, RequestPriority
 from backstop_mcp.features.entity_types import SearchType
 from backstop_mcp.features.party_resolver._party_search_types import (
     PARTY_SPARSE_FIELDS,
@@ -49,5 +49,7 @@ async def search_by_like(
         },
         page_size=_LIKE_PAGE_SIZE,
         max_records=_LIKE_MAX_RECORDS,
+        # A resolution step the caller is blocked on, not a walk: one page by construction.
+        priority=RequestPriority.INTERACTIVE,
     )
     return candidates_from_resources(page.items, search_type=search_type)
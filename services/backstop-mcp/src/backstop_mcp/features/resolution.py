@@ -286,7 +286,10 @@ class AmbiguousResponse[CandidateT: CandidateResponse](BaseModel):
 
     status: Literal["ambiguous"] = Field(
         default="ambiguous",
-        description="Always 'ambiguous': more than one record matched and none was chosen.",
+        description=(
+            "Always 'ambiguous': more than one record matched, or the only one is a near match "
+            "to confirm with the user, and none was chosen."
+        ),
     )
     query: str = Field(description="The search text that produced these candidates.")
     scope: str = Field(
@@ -1,6 +1,6 @@
 from functools import lru_cache
 
-from backstop_mcp.dependencies import get_backstop_config
+from backstop_mcp.dependencies import catalog_snapshot_store, get_backstop_config
 from backstop_mcp.features.system_users.system_users_service import SystemUsersService
 
 
@@ -14,4 +14,6 @@ def get_system_users_service() -> SystemUsersService:
     return SystemUsersService.with_ttl_minutes(
         ttl_minutes=config.system_user_ttl_minutes,
         caching_enabled=config.system_user_cache_enabled,
+        snapshots=catalog_snapshot_store(config),
+        revalidate_window_minutes=config.catalog_revalidate_window_minutes,
     )
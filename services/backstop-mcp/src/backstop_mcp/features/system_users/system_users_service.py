@@ -1,6 +1,7 @@
 from datetime import timedelta
 from typing import Self
 
+from backstop_mcp.catalog_snapshot_store import CatalogSnapshotStore
 from backstop_mcp.features.cached_catalog import CachedCatalog
 from backstop_mcp.features.system_users.fetch_system_users import fetch_system_users
 from backstop_mcp.features.system_users.internal_dto import SystemUserDto
@@ -19,15 +20,37 @@ class SystemUsersService(CachedCatalog[SystemUserDto]):
     The TTL, single-flight and serve-stale protocol behind `get` is `CachedCatalog`.
     """
 
-    def __init__(self, *, ttl: timedelta, caching_enabled: bool = True) -> None:
+    def __init__(
+        self,
+        *,
+        ttl: timedelta,
+        caching_enabled: bool = True,
+        snapshots: CatalogSnapshotStore | None = None,
+        revalidate_window: timedelta = timedelta(0),
+    ) -> None:
         super().__init__(
             ttl=ttl,
             fetch=fetch_system_users,
+            item_type=SystemUserDto,
             log_prefix="system_users",
             subject="system-user",
             caching_enabled=caching_enabled,
+            snapshots=snapshots,
+            revalidate_window=revalidate_window,
         )
 
     @classmethod
-    def with_ttl_minutes(cls, *, ttl_minutes: int, caching_enabled: bool = True) -> Self:
-        return cls(ttl=timedelta(minutes=ttl_minutes), caching_enabled=caching_enabled)
+    def with_ttl_minutes(
+        cls,
+        *,
+        ttl_minutes: int,
+        caching_enabled: bool = True,
+        snapshots: CatalogSnapshotStore | None = None,
+        revalidate_window_minutes: int = 0,
+    ) -> Self:
+        return cls(
+            ttl=timedelta(minutes=ttl_minutes),
+            caching_enabled=caching_enabled,
+            snapshots=snapshots,
+            revalidate_window=timedelta(minutes=revalidate_window_minutes),
+        )
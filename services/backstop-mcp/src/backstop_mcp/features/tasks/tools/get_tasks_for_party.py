@@ -14,7 +14,11 @@ from backstop_mcp.dependencies import get_backstop_client
 from backstop_mcp.features.entity_types import SearchType
 from backstop_mcp.features.party_resolver import (
     PartyAmbiguousResponse,
+    PartyNameIndex,
+    PartyResolutionCache,
     ResolvedPartyResponse,
+    get_party_name_index,
+    get_party_resolution_cache,
     resolve_party,
     unresolved_party_response,
 )
@@ -122,6 +126,8 @@ async def get_tasks_for_party(
         ),
     ] = "all",
     client: BackstopClient = Depends(get_backstop_client),
+    party_resolutions: PartyResolutionCache | None = Depends(get_party_resolution_cache),
+    party_names: PartyNameIndex | None = Depends(get_party_name_index),
 ) -> GetTasksForPartyResponse:
     """List a party's CRM tasks.
 
@@ -131,7 +137,13 @@ async def get_tasks_for_party(
     not filterable on the wire; open vs completed is split here.
     """
     result = await resolve_party(
-        ctx, client, search_type=search_type, party_id=party_id, search=search
+        ctx,
+        client,
+        search_type=search_type,
+        party_id=party_id,
+        search=search,
+        cache=party_resolutions,
+        names=party_names,
     )
     if not isinstance(result, Resolved):
         return unresolved_party_response(result)
@@ -39,6 +39,14 @@ CATALOG_DURATION_VIEW = View(
     aggregation=ExplicitBucketHistogramAggregation(_CATALOG_DURATION_BUCKETS),
 )
 
+# Response-body sizes run from a one-record page (a few KiB) to an unbounded holdings table, so
+# the buckets are powers of four from 4 KiB to 256 MiB rather than the default's 0..10000.
+_RESPONSE_PEAK_BUCKETS = tuple(1024 * 4.0**exponent for exponent in range(1, 10))
+RESPONSE_PEAK_VIEW = View(
+    instrument_name="backstop_response_peak_chars",
+    aggregation=ExplicitBucketHistogramAggregation(_RESPONSE_PEAK_BUCKETS),
+)
+
 
 def configure_metrics(config: AppConfig) -> MeterProvider:
     """Install the OTel→Prometheus reader so domain instruments land on the default REGISTRY.
@@ -52,7 +60,9 @@ def configure_metrics(config: AppConfig) -> MeterProvider:
     resource = Resource.create({SERVICE_NAME: "backstop-mcp", SERVICE_VERSION: config.version})
     reader = PrometheusMetricReader()
     provider = MeterProvider(
-        resource=resource, metric_readers=[reader], views=[CATALOG_DURATION_VIEW]
+        resource=resource,
+        metric_readers=[reader],
+        views=[CATALOG_DURATION_VIEW, RESPONSE_PEAK_VIEW],
     )
     metrics.set_meter_provider(provider)
     _provider = provider
@@ -65,6 +75,9 @@ def configure_metrics(config: AppConfig) -> MeterProvider:
 # nothing needs a lazy accessor.
 _meter = metrics.get_meter("backstop_mcp")
 
+# With the response cache on, GETs also carry `cache`: `miss` (a full response), `revalidated` (a
+# 304 answered from the cache) or `hit` (served from the cache without going upstream at all, so
+# not strictly an upstream request — counted here so one series shows what the cache saves).
 BACKSTOP_REQUESTS = _meter.create_counter(
     "backstop_requests_total",
     description="Upstream Backstop API requests, by method/outcome.",
@@ -83,9 +96,142 @@ BACKSTOP_CONCURRENCY_WAIT = _meter.create_histogram(
     unit="s",
     description="Time spent waiting on the per-user concurrency gate before a request ran.",
 )
+# GETs that found an identical request (same user, same URL and params) already in flight and
+# waited for its response instead of sending their own: each one is a gate slot not taken.
+BACKSTOP_COALESCED_REQUESTS = _meter.create_counter(
+    "backstop_coalesced_requests_total",
+    description="GETs answered by an identical in-flight request for the same user, by route.",
+)
+# The per-user gate's own view of waiting, split by where the slot is counted. Unlike
+# `BACKSTOP_CONCURRENCY_WAIT`, which the client records per route, this says what a backend costs:
+# with `backend="postgres"` it includes the lease round trips and any wait on another replica.
+# `lane` is the request's `RequestPriority`: `interactive` waiting anywhere near as long as
+# `later_page` means the lanes are not doing their job.
+BACKSTOP_GATE_WAIT = _meter.create_histogram(
+    "backstop_gate_wait_seconds",
+    unit="s",
+    description="Time a request waited for its per-user slot, by gate backend and priority lane.",
+)
+# One record per attempt to take a cross-replica lease: `acquired`, `busy` (every slot is leased
+# somewhere, so the caller polls again) or `unavailable` (the backend could not be reached and the
+# request ran under the local gate alone). A steady `busy` rate is the gate absorbing what would
+# otherwise have been concurrency 429s.
+BACKSTOP_GATE_LEASES = _meter.create_counter(
+    "backstop_gate_leases_total",
+    description="Cross-replica gate lease attempts, by backend and outcome.",
+)
+# The adaptive per-user window (see `GateRegistry`), aggregated across tracked users so no
+# username becomes a label: `stat="min"` is the most-throttled user, `stat="mean"` the fleet. A
+# floor held below `max_concurrent_requests_per_user` is a tenant Backstop won't run at the
+# documented cap. Only moves while `adaptive_concurrency_enabled` is on.
+BACKSTOP_GATE_WINDOW = _meter.create_gauge(
+    "backstop_gate_window",
+    description="Adaptive per-user concurrency window, min and mean across tracked users.",
+)
+# The shared connection pool, from `backstop_client/pool.py`. `connection="opened"` is a request
+# that paid for a TCP connect (and TLS handshake) before it could send; `reused` found a pooled
+# connection. A high opened share under steady load means keep-alive slots are too few or expire
+# too soon, which is what `max_keepalive_connections` / `keepalive_expiry_seconds` tune.
+BACKSTOP_POOL_REQUESTS = _meter.create_counter(
+    "backstop_pool_requests_total",
+    description="Upstream requests by whether their connection was opened or reused.",
+)
+# Time from handing the request to the pool to sending its headers: pool queueing when every
+# connection is busy, plus connect and handshake when one had to be opened.
+BACKSTOP_POOL_ACQUIRE = _meter.create_histogram(
+    "backstop_pool_acquire_seconds",
+    unit="s",
+    description="Time for an upstream request to get a connection, by opened/reused.",
+)
+BACKSTOP_POOL_CONNECTIONS = _meter.create_gauge(
+    "backstop_pool_connections",
+    description="Connections in the shared Backstop pool, by state (idle/active).",
+)
+# The most of one response body held at once while parsing it, in decoded characters (bytes, for
+# the ASCII Backstop sends). `mode="buffered"` is the whole body, which is what reading it in one
+# piece holds; `mode="streamed"` is what `streaming_parse_enabled` held instead — about one item
+# plus the envelope. Recorded for `.paginate()` pages and `.get_document()` reads only.
+BACKSTOP_RESPONSE_PEAK = _meter.create_histogram(
+    "backstop_response_peak_chars",
+    unit="{char}",
+    description="Most of one response body held at once while parsing it, by route and mode.",
+)
+# How long one response body took to parse and validate, by route and `where` it ran: `loop`
+# (blocking every other request on the worker for the duration) or `thread` (on the
+# `parse_worker_threads` pool). Streamed reads parse as they download and are not recorded here.
+BACKSTOP_PARSE_DURATION = _meter.create_histogram(
+    "backstop_parse_duration_seconds",
+    unit="s",
+    description="Time to parse and validate one Backstop response body, by route and where.",
+)
+# How late the event loop ran a callback scheduled just as a body was handed to be parsed, by the
+# route whose body it was. Parsing on the loop puts the whole parse into this number, which is the
+# stall every other request on the worker saw; parsing on a thread should leave only the loop's
+# ordinary backlog.
+BACKSTOP_EVENT_LOOP_LAG = _meter.create_histogram(
+    "backstop_event_loop_lag_seconds",
+    unit="s",
+    description="Delay before the event loop ran a callback scheduled at a parse, by route.",
+)
+# Serial `links.next` walks that request the next page by offset before the link arrives (see
+# `speculative_prefetch_enabled`), by route and whether the link then named that page (`hit`)
+# or not (`wasted`, a request spent for nothing). A route with a low hit rate is one whose links
+# do not stride by offset, and not worth speculating on.
+BACKSTOP_PAGE_PREFETCHES = _meter.create_counter(
+    "backstop_page_prefetches_total",
+    description="Speculatively prefetched pages of a serial walk, by route and outcome.",
+)
+# Party searches answered from `PartyResolutionCache` (`hit`) or sent to Backstop (`miss`), by
+# search type. Misses are what resolution still costs upstream; a hit rate that stays low says
+# the TTL is shorter than the gap between repeat mentions.
+PARTY_RESOLUTION_CACHE_LOOKUPS = _meter.create_counter(
+    "party_resolution_cache_lookups_total",
+    description="Party searches looked up in the resolution cache, by search type and outcome.",
+)
+# Searches quick-search missed that the local party-name index was asked before the `like`
+# fallback, by search type and outcome: `hit` (a verified match, no `like` read), `unverified`
+# (matches the caller could not read, or that no longer match), or `miss` (nothing indexed).
+PARTY_NAME_INDEX_LOOKUPS = _meter.create_counter(
+    "party_name_index_lookups_total",
+    description="Party-name index lookups before the like fallback, by search type and outcome.",
+)
+# Access-token and credential lookups on the per-call auth path, by kind (`token`, `credential`)
+# and outcome: `hit` is a Postgres read — and, for a credential, a decrypt — avoided; `miss` went
+# to the database; `bypass` was refused because the invalidation listener was down.
+AUTH_CACHE_LOOKUPS = _meter.create_counter(
+    "auth_cache_lookups_total",
+    description="Auth-path lookups answered in process or sent to Postgres, by kind and outcome.",
+)
+# Invalidations `AuthCache` applied, by origin: `local` from this replica's own revoke or login,
+# `notify` from a Postgres NOTIFY (another replica's, or this one's echo), and `resync` when the
+# listener (re)connected and everything cached was dropped.
+AUTH_CACHE_INVALIDATIONS = _meter.create_counter(
+    "auth_cache_invalidations_total",
+    description="Auth-cache invalidations applied, by origin (local, notify, resync).",
+)
+# `get_activity_detail` bodies looked up by version, by outcome: `memory` or `store` (the tier
+# that answered — the heavy detail read and the HTML conversion avoided), `miss` (read and
+# converted, then kept), or `unversioned` (the record carried no timestamp to key it by).
+ACTIVITY_BODY_CACHE_LOOKUPS = _meter.create_counter(
+    "activity_body_cache_lookups_total",
+    description="Activity-detail body lookups by version, by the tier that answered or miss.",
+)
+# `get_people_for_party` listings that asked for an organization's kept relationship walk, by
+# outcome: `hit` (the `entityRelationships` walk skipped), `changed` (a relationship was
+# edited, added or removed since), `expired` (past the TTL), or `miss` (never kept).
+ORG_RELATIONSHIPS_CACHE_LOOKUPS = _meter.create_counter(
+    "org_relationships_cache_lookups_total",
+    description="Kept organization entity-relationship walk lookups, by outcome.",
+)
+# `get_accounts_for_party` fallback series reads that asked for a kept account figure, by
+# outcome: `hit` (the series read skipped), `expired` (past the TTL), or `miss` (never kept).
+HOLDING_FIGURES_CACHE_LOOKUPS = _meter.create_counter(
+    "holding_figures_cache_lookups_total",
+    description="Kept account latest-figure lookups on the holdings fallback, by outcome.",
+)
 CUSTOM_FIELD_SCHEMA_LOADS = _meter.create_counter(
     "custom_field_schema_loads_total",
-    description="Custom-field schema loads, by source (backstop refresh, stale reuse).",
+    description="Custom-field schema loads, by source (backstop, shared snapshot, stale reuse).",
 )
 # The demand half of the pair. Every `CachedCatalog.get` records here exactly once, whatever
 # answered it, so `_count` is the question "how many walks would there be with no cache at all?"
@@ -101,6 +247,14 @@ CATALOG_GET_DURATION = _meter.create_histogram(
         "`_count` is total demand — the walks there would be with no cache and no coalescing."
     ),
 )
+# One record per catalog per startup warm-up (see `catalog_warmup.py`), by outcome: `ok`, `error`,
+# `timeout` when the budget ran out first, or `cancelled` by a shutdown. Its buckets also come
+# from `CATALOG_DURATION_VIEW`.
+CATALOG_WARMUP_DURATION = _meter.create_histogram(
+    "catalog_warmup_duration_seconds",
+    unit="s",
+    description="Wall-clock duration of warming one catalog at startup, by catalog and outcome.",
+)
 # The walk half. `catalog_get_duration_seconds_count - catalog_fetch_duration_seconds_count` is
 # the requests already avoided; splitting the former by `served` says which mechanism avoided
 # them. Buckets for both come from `CATALOG_DURATION_VIEW`.
@@ -15,6 +15,7 @@ from typing import Protocol
 from backstop_mcp.dependencies import (
     get_activity_history_config,
     get_app_config,
+    get_auth_cache,
     get_auth_config,
     get_auth_provider,
     get_backstop_client_factory,
@@ -25,7 +26,11 @@ from backstop_mcp.dependencies import (
     get_engine,
     get_session_factory,
 )
-from backstop_mcp.features.activity_history import get_activity_history_settings
+from backstop_mcp.features.accounts import get_holding_figures_cache
+from backstop_mcp.features.activity_history import (
+    get_activity_body_cache,
+    get_activity_history_settings,
+)
 from backstop_mcp.features.activity_tags import get_activity_tags_service
 from backstop_mcp.features.custom_fields import (
     get_custom_field_groups_service,
@@ -33,6 +38,8 @@ from backstop_mcp.features.custom_fields import (
 )
 from backstop_mcp.features.data_hygiene import get_employment_index_factory
 from backstop_mcp.features.opportunities import get_opportunity_stages_service
+from backstop_mcp.features.org_people import get_organization_relationships_cache
+from backstop_mcp.features.party_resolver import get_party_name_index, get_party_resolution_cache
 from backstop_mcp.features.system_users import get_system_users_service
 
 
@@ -52,27 +59,50 @@ PROVIDERS: tuple[CachedProvider, ...] = (
     get_engine,
     get_session_factory,
     get_encryption_key,
+    get_auth_cache,
     get_backstop_client_factory,
     get_auth_provider,
     get_activity_history_settings,
+    get_activity_body_cache,
     get_activity_tags_service,
     get_system_users_service,
     get_custom_fields_service,
     get_custom_field_groups_service,
     get_employment_index_factory,
+    get_organization_relationships_cache,
+    get_holding_figures_cache,
     get_opportunity_stages_service,
+    get_party_resolution_cache,
+    get_party_name_index,
 )
 
 
 async def close_singletons() -> None:
-    """Release the pooled resources, then drop every cached provider."""
+    """Stop background catalog refreshes, release the pools, then drop every cached provider."""
     try:
+        await _stop_revalidations()
         await _release_pools()
     finally:
         for provider in PROVIDERS:
             provider.cache_clear()
 
 
+async def _stop_revalidations() -> None:
+    """Cancel each built catalog's background refresh before the pool it walks over closes.
+
+    Only catalogs that were built are asked: building one here just to close it would read
+    configuration a test may never have set, as `_release_pools` says of the factory.
+    """
+    if get_activity_tags_service.cache_info().currsize:
+        await get_activity_tags_service().aclose()
+    if get_system_users_service.cache_info().currsize:
+        await get_system_users_service().aclose()
+    if get_custom_fields_service.cache_info().currsize:
+        await get_custom_fields_service().aclose()
+    if get_custom_field_groups_service.cache_info().currsize:
+        await get_custom_field_groups_service().aclose()
+
+
 async def _release_pools() -> None:
     """Close the client factory's connection pool, then the engine's.
 
@@ -2,10 +2,12 @@
 
 The interesting behaviour here is entirely about *when* the fallback fires. An empty table and an
 auth failure must not trigger it — the first because it is a real answer, the second because the
-documented walk would fail identically but slower.
+documented walk would fail identically but slower. Once it fires, its series reads stop at the
+request budget — shares before balances — and a kept figure is served without a read.
 """
 
-from datetime import date
+import asyncio
+from datetime import date, timedelta
 
 import httpx
 import pytest
@@ -16,8 +18,14 @@ from backstop_mcp.backstop_client import (
     BackstopClient,
     BackstopRateLimitError,
 )
-from backstop_mcp.features.accounts import FALLBACK_OMITTED_FIELDS, fetch_holdings
-from tests.helpers import BASE_URL
+from backstop_mcp.features.accounts import (
+    FALLBACK_OMITTED_FIELDS,
+    HoldingFiguresCache,
+    HoldingsFallbackProgressDto,
+    HoldingsSettings,
+    fetch_holdings,
+)
+from tests.helpers import BASE_URL, client_factory, credential
 
 _ORG = "341764767"
 _ACCOUNT = "27871657"
@@ -58,8 +66,8 @@ def _table(*rows: dict[str, object]) -> httpx.Response:
     )
 
 
-def _accounts_page(*, closed: bool = False) -> httpx.Response:
-    """One `/accounts` page carrying a single account owned by `_ORG`."""
+def _accounts_page(*account_ids: str, closed: bool = False) -> httpx.Response:
+    """One `/accounts` page of accounts owned by `_ORG` — `_ACCOUNT` unless ids are given."""
     attributes: dict[str, object] = {
         "name": "Row",
         "currency": "USD",
@@ -72,11 +80,12 @@ def _accounts_page(*, closed: bool = False) -> httpx.Response:
         json={
             "data": [
                 {
-                    "id": _ACCOUNT,
+                    "id": account_id,
                     "type": "accounts",
                     "attributes": attributes,
                     "relationships": {"owner": {"data": {"id": _ORG, "type": "contacts"}}},
                 }
+                for account_id in account_ids or (_ACCOUNT,)
             ],
             "included": [
                 {
@@ -88,7 +97,7 @@ def _accounts_page(*, closed: bool = False) -> httpx.Response:
                     },
                 }
             ],
-            "meta": {"totalResourceCount": 1},
+            "meta": {"totalResourceCount": len(account_ids or (_ACCOUNT,))},
         },
     )
 
@@ -415,3 +424,136 @@ class TestFallbackContent:
         assert row.balance.amount == 7.0
         assert row.balance_as_of == date(2026, 2, 28)
         assert row.balance_status == "ACTUAL"
+
+
+class TestFallbackSeriesReads:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_reads_every_balance_before_any_share_and_stops_at_the_budget(
+        self, client: BackstopClient
+    ) -> None:
+        respx.get(_TABLE_URL).mock(return_value=httpx.Response(500, json={"errors": []}))
+        respx.get(_ACCOUNTS_URL).mock(return_value=_accounts_page("a1", "a2", "a3"))
+        values = respx.get(url__regex=rf"{BASE_URL}/accounts/a\d/values").mock(
+            return_value=_series(100.0)
+        )
+        shares = respx.get(url__regex=rf"{BASE_URL}/accounts/a\d/percentageOfFundHistory").mock(
+            return_value=_series(0.25)
+        )
+
+        result = await fetch_holdings(
+            client,
+            owner_id=_ORG,
+            settings=HoldingsSettings(fallback_series_workers=2, fallback_series_budget=4),
+        )
+
+        assert values.call_count == 3
+        assert shares.call_count == 1
+        assert result.fallback_progress == HoldingsFallbackProgressDto(
+            figures=6, requested=4, skipped=2, budget=4
+        )
+        unread = {
+            row.account_id: [error.figure for error in row.figure_errors] for row in result.rows
+        }
+        assert unread == {
+            "a1": [],
+            "a2": ["percentage_of_product"],
+            "a3": ["percentage_of_product"],
+        }
+        assert all(row.balance is not None for row in result.rows)
+        assert "budget of 4" in result.rows[2].figure_errors[0].message
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_an_auth_failure_leaves_no_read_running(self, client: BackstopClient) -> None:
+        respx.get(_TABLE_URL).mock(return_value=httpx.Response(500, json={"errors": []}))
+        respx.get(_ACCOUNTS_URL).mock(return_value=_accounts_page("a1", "a2"))
+        respx.get(f"{BASE_URL}/accounts/a1/values").mock(
+            return_value=httpx.Response(401, json={"errors": []})
+        )
+        stopped: list[str] = []
+
+        async def held(request: httpx.Request) -> httpx.Response:
+            try:
+                _ = await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                stopped.append(request.url.path)
+                raise
+            raise AssertionError("unreachable")
+
+        respx.get(f"{BASE_URL}/accounts/a2/values").mock(side_effect=held)
+
+        with pytest.raises(BackstopAuthError):
+            await fetch_holdings(
+                client,
+                owner_id=_ORG,
+                settings=HoldingsSettings(fallback_series_workers=2, fallback_series_budget=4),
+            )
+
+        assert stopped == ["/accounts/a2/values"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_counts_a_failed_read_in_progress_and_on_its_row(
+        self, client: BackstopClient
+    ) -> None:
+        respx.get(_TABLE_URL).mock(return_value=httpx.Response(500, json={"errors": []}))
+        respx.get(_ACCOUNTS_URL).mock(return_value=_accounts_page())
+        respx.get(f"{BASE_URL}/accounts/{_ACCOUNT}/values").mock(
+            return_value=httpx.Response(500, json={"errors": []})
+        )
+        respx.get(f"{BASE_URL}/accounts/{_ACCOUNT}/percentageOfFundHistory").mock(
+            return_value=_series(0.25)
+        )
+
+        result = await fetch_holdings(client, owner_id=_ORG)
+
+        assert result.fallback_progress == HoldingsFallbackProgressDto(
+            figures=2, requested=2, failed=1, budget=400
+        )
+        assert [error.figure for error in result.rows[0].figure_errors] == ["balance"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_kept_figure_is_served_without_a_read_and_only_to_the_same_user(
+        self, client: BackstopClient
+    ) -> None:
+        respx.get(_TABLE_URL).mock(return_value=httpx.Response(500, json={"errors": []}))
+        respx.get(_ACCOUNTS_URL).mock(return_value=_accounts_page())
+        values = respx.get(f"{BASE_URL}/accounts/{_ACCOUNT}/values").mock(
+            return_value=_series(100.0)
+        )
+        shares = respx.get(f"{BASE_URL}/accounts/{_ACCOUNT}/percentageOfFundHistory").mock(
+            return_value=_series(None)
+        )
+        cache = HoldingFiguresCache(max_entries=10, ttl=timedelta(minutes=1))
+
+        _ = await fetch_holdings(client, owner_id=_ORG, figures_cache=cache)
+        again = await fetch_holdings(client, owner_id=_ORG, figures_cache=cache)
+
+        # The empty share series is not kept: its first number may be about to land.
+        assert (values.call_count, shares.call_count) == (1, 2)
+        assert again.fallback_progress == HoldingsFallbackProgressDto(
+            figures=2, requested=1, cached=1, budget=400
+        )
+        assert again.rows[0].balance is not None
+        assert again.rows[0].balance.amount == 100.0
+
+        factory = client_factory()
+        try:
+            other = factory.for_credential(credential(username="alice.jones"))
+            _ = await fetch_holdings(other, owner_id=_ORG, figures_cache=cache)
+        finally:
+            await factory.aclose()
+        assert values.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_the_table_path_reports_no_fallback_progress(
+        self, client: BackstopClient
+    ) -> None:
+        respx.get(_TABLE_URL).mock(return_value=_table(_table_row(_ACCOUNT)))
+
+        result = await fetch_holdings(client, owner_id=_ORG)
+
+        assert result.fallback_progress is None
@@ -5,7 +5,9 @@ rows under `data[0].attributes.accounts`, a `null` element id, `meta.totalResour
 and `included` empty.
 """
 
+from collections.abc import AsyncGenerator
 from datetime import date
+from typing import cast
 
 import httpx
 import pytest
@@ -21,7 +23,7 @@ from backstop_mcp.features.accounts import (
     HoldingsTableShapeError,
     fetch_holdings_table,
 )
-from tests.helpers import BASE_URL
+from tests.helpers import BASE_URL, client_factory, credential
 
 # Envelope shapes that must fail rather than read as "this party owns nothing".
 _BROKEN_ENVELOPES: tuple[dict[str, object], ...] = (
@@ -107,6 +109,17 @@ def _table(*rows: dict[str, object], **counts: object) -> httpx.Response:
     )
 
 
+@pytest.fixture(params=[False, True], ids=["buffered", "streamed"])
+async def client(request: pytest.FixtureRequest) -> AsyncGenerator[BackstopClient]:
+    """Every case runs twice: the table read whole, and read row by row as it downloads.
+
+    The two must not be told apart — same rows, same counts check, same envelope failures.
+    """
+    factory = client_factory(streaming_parse_enabled=cast(bool, request.param))
+    yield factory.for_credential(credential())
+    await factory.aclose()
+
+
 async def _fetch(client: BackstopClient, *, include_closed: bool = False) -> HoldingListingDto:
     return await fetch_holdings_table(client, entity_id=_ORG, include_closed=include_closed)
 
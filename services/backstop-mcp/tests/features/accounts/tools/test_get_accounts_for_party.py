@@ -13,7 +13,7 @@ from fastmcp.decorators import get_fastmcp_meta
 from fastmcp.tools.function_tool import ToolMeta
 
 from backstop_mcp.backstop_client import BackstopClient
-from backstop_mcp.features.accounts import PartyAccountsResolvedResponse
+from backstop_mcp.features.accounts import HoldingsSettings, PartyAccountsResolvedResponse
 from backstop_mcp.features.accounts.tools.get_accounts_for_party import get_accounts_for_party
 from backstop_mcp.features.resolution import NotFoundResponse
 from backstop_mcp.server.tools import TOOLS
@@ -169,6 +169,10 @@ async def _call(client: BackstopClient, *, include_closed: bool = False) -> obje
         party_id=_ORG_ID,
         include_closed=include_closed,
         client=client,
+        party_resolutions=None,
+        party_names=None,
+        holdings=HoldingsSettings(),
+        figures_cache=None,
     )
 
 
@@ -204,6 +208,7 @@ class TestFigures:
 
         assert "no as-of date" in result.data_caveat
         assert result.holdings[0].balance_as_of is None
+        assert result.fallback_progress is None
 
     @pytest.mark.asyncio
     @respx.mock
@@ -224,6 +229,8 @@ class TestFigures:
         assert row.balance.amount == 500.0
         # The fallback dates its figure; the fast path cannot.
         assert row.balance_as_of is not None
+        assert result.fallback_progress is not None
+        assert (result.fallback_progress.figures, result.fallback_progress.skipped) == (2, 0)
 
     @pytest.mark.asyncio
     @respx.mock
@@ -264,6 +271,10 @@ class TestOwnsNothingIsVerified:
                 search_type="organizations",
                 party_id=_ORG_ID,
                 client=client,
+                party_resolutions=None,
+                party_names=None,
+                holdings=HoldingsSettings(),
+                figures_cache=None,
             ),
             PartyAccountsResolvedResponse,
         )
@@ -286,6 +297,10 @@ class TestOwnsNothingIsVerified:
                 search_type="organizations",
                 party_id=_ORG_ID,
                 client=client,
+                party_resolutions=None,
+                party_names=None,
+                holdings=HoldingsSettings(),
+                figures_cache=None,
             ),
             NotFoundResponse,
         )
@@ -309,6 +324,10 @@ class TestOwnsNothingIsVerified:
                 search_type="organizations",
                 search="PSP Investments",
                 client=client,
+                party_resolutions=None,
+                party_names=None,
+                holdings=HoldingsSettings(),
+                figures_cache=None,
             ),
             PartyAccountsResolvedResponse,
         )
@@ -330,6 +349,10 @@ class TestOwnsNothingIsVerified:
             search_type="organizations",
             party_id=_ORG_ID,
             client=client,
+            party_resolutions=None,
+            party_names=None,
+            holdings=HoldingsSettings(),
+            figures_cache=None,
         )
 
         assert not confirm.called
@@ -349,6 +372,10 @@ class TestOwnsNothingIsVerified:
                 search_type="organizations",
                 party_id=_ORG_ID,
                 client=client,
+                party_resolutions=None,
+                party_names=None,
+                holdings=HoldingsSettings(),
+                figures_cache=None,
             ),
             PartyAccountsResolvedResponse,
         )
@@ -391,6 +418,10 @@ class TestResolution:
                 search_type="organizations",
                 search="No Such Org",
                 client=client,
+                party_resolutions=None,
+                party_names=None,
+                holdings=HoldingsSettings(),
+                figures_cache=None,
             ),
             NotFoundResponse,
         )
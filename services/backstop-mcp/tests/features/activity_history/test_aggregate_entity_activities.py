@@ -5,6 +5,7 @@ from backstop_mcp.features.activity_history import (
     ActivityTagChipDto,
     EntityActivityDto,
     aggregate_entity_activities,
+    entity_activities_tally,
 )
 
 
@@ -109,3 +110,23 @@ class TestAggregateEntityActivities:
 
         assert [bucket.key for bucket in forwards] == ["Alpha", "Zebra"]
         assert [bucket.key for bucket in backwards] == ["Alpha", "Zebra"]
+
+    def test_a_tally_counts_every_dimension_across_pages(self) -> None:
+        tag = ActivityTagChipDto(id="t1", name="Diligence")
+        tally = entity_activities_tally(("type", "tag"))
+
+        tally.add([_row("1", tags=(tag,)), _row("2", type="Note")])
+        tally.add([_row("3", type="Note", tags=(tag,))])
+
+        assert tally.rows_counted == 3
+        assert [(bucket.key, bucket.count) for bucket in tally.buckets("type")] == [
+            ("Note", 2),
+            ("Meeting", 1),
+        ]
+        assert [(bucket.key, bucket.count) for bucket in tally.buckets("tag")] == [
+            ("t1", 2),
+            ("(untagged)", 1),
+        ]
+        assert tally.buckets("type") == aggregate_entity_activities(
+            [_row("1"), _row("2", type="Note"), _row("3", type="Note")], group_by="type"
+        )
@@ -1,16 +1,18 @@
+import json
 from datetime import date
+from typing import cast
 
 import httpx
 import pytest
 import respx
 
-from backstop_mcp.backstop_client import BackstopApiError, BackstopClient
+from backstop_mcp.backstop_client import BackstopApiError, BackstopClient, RequestPriority
 from backstop_mcp.features.activity_history import (
     entity_activities_request_body,
     fetch_entity_activities,
     party_bean,
 )
-from tests.helpers import BASE_URL, recorded_json_bodies
+from tests.helpers import BASE_URL, recorded_json_bodies, recorded_lanes
 from tests.server.tools.helpers import object_dict
 
 _URL = f"{BASE_URL}/entity-activities"
@@ -311,3 +313,158 @@ class TestFetchEntityActivities:
             )
 
         assert raised.value.status_code == 404
+
+
+def _numbered_pages(total: int, page_size: int, *, failing: int | None = None) -> respx.Route:
+    """Answer each POST by its `pageNum`, as the live search does, whatever order they arrive in."""
+
+    def page(request: httpx.Request) -> httpx.Response:
+        body = cast("dict[str, object]", json.loads(request.content))
+        page_num = cast(int, _body_attributes(body)["pageNum"])
+        if page_num == failing:
+            return httpx.Response(500, json={"errors": [{"title": "InternalServerException"}]})
+        first = (page_num - 1) * page_size
+        rows = [_meeting(index) for index in range(first, min(first + page_size, total))]
+        return _page(*rows, total=total)
+
+    return respx.post(_URL).mock(side_effect=page)
+
+
+class TestParallelFetchEntityActivities:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_reads_the_same_rows_as_the_serial_walk(self, client: BackstopClient) -> None:
+        route = _numbered_pages(total=9, page_size=2)
+
+        result = await fetch_entity_activities(
+            client,
+            start_date=date(2024, 1, 1),
+            end_date=date(2026, 8, 20),
+            page_size=2,
+            parallel=True,
+        )
+
+        assert route.call_count == 5
+        assert [row.id for row in result.rows] == [str(index) for index in range(9)]
+        assert result.pages_fetched == 5
+        assert result.pages_in_flight == 4
+        assert result.ceiling_clamped is False
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_only_page_one_waits_in_the_first_page_lane(
+        self, client: BackstopClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _ = _numbered_pages(total=5, page_size=2)
+        lanes = recorded_lanes(client, monkeypatch)
+
+        _ = await fetch_entity_activities(
+            client,
+            start_date=date(2024, 1, 1),
+            end_date=date(2026, 8, 20),
+            page_size=2,
+            parallel=True,
+        )
+
+        assert lanes == [
+            RequestPriority.FIRST_PAGE,
+            RequestPriority.LATER_PAGE,
+            RequestPriority.LATER_PAGE,
+        ]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_never_plans_a_page_past_the_clamp(self, client: BackstopClient) -> None:
+        route = _numbered_pages(total=100, page_size=10)
+
+        result = await fetch_entity_activities(
+            client,
+            start_date=date(2000, 1, 1),
+            end_date=date(2026, 12, 31),
+            page_size=10,
+            max_retrievable=30,
+            parallel=True,
+        )
+
+        page_nums = [_body_attributes(body)["pageNum"] for body in recorded_json_bodies(route)]
+        assert sorted(cast("list[int]", page_nums)) == [1, 2, 3]
+        assert result.ceiling_clamped is True
+        assert len(result.rows) == 30
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_failed_page_keeps_only_the_pages_before_it(
+        self, client: BackstopClient
+    ) -> None:
+        _ = _numbered_pages(total=8, page_size=2, failing=3)
+
+        result = await fetch_entity_activities(
+            client,
+            start_date=date(2024, 1, 1),
+            end_date=date(2026, 8, 20),
+            page_size=2,
+            parallel=True,
+        )
+
+        assert [row.id for row in result.rows] == ["0", "1", "2", "3"]
+        assert result.partial_due_to_error is True
+        assert result.pages_fetched == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_finishes_serially_when_dropped_rows_leave_max_rows_short(
+        self, client: BackstopClient
+    ) -> None:
+        rows: list[dict[str, object]] = [{"title": "no id"}]
+        rows += [_meeting(index) for index in range(1, 8)]
+        route = respx.post(_URL).mock(
+            side_effect=[_page(*rows[i : i + 2], total=8) for i in range(0, 8, 2)]
+        )
+
+        result = await fetch_entity_activities(
+            client,
+            start_date=date(2024, 1, 1),
+            end_date=date(2026, 8, 20),
+            max_rows=6,
+            page_size=2,
+            parallel=True,
+        )
+
+        # Page one's `totalCount` plans pages 2 and 3 for six rows, but one row was unreadable.
+        assert route.call_count == 4
+        assert [row.id for row in result.rows] == [str(index) for index in range(1, 7)]
+        assert result.pages_in_flight == 2
+        assert result.truncated_by_row_cap is True
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_on_rows_gets_every_page_in_order_and_nothing_is_kept(
+        self, client: BackstopClient
+    ) -> None:
+        _ = _numbered_pages(total=9, page_size=2)
+        pages: list[list[str]] = []
+
+        result = await fetch_entity_activities(
+            client,
+            start_date=date(2024, 1, 1),
+            end_date=date(2026, 8, 20),
+            page_size=2,
+            parallel=True,
+            on_rows=lambda rows: pages.append([row.id for row in rows]),
+        )
+
+        assert pages == [["0", "1"], ["2", "3"], ["4", "5"], ["6", "7"], ["8"]]
+        assert result.rows == ()
+        assert result.rows_received == 9
+        assert result.truncated_by_row_cap is False
+
+    @pytest.mark.asyncio
+    async def test_on_rows_takes_no_row_cap(self, client: BackstopClient) -> None:
+        with pytest.raises(ValueError, match="max_rows"):
+            _ = await fetch_entity_activities(
+                client,
+                start_date=date(2024, 1, 1),
+                end_date=date(2026, 8, 20),
+                max_rows=5,
+                on_rows=lambda rows: None,
+            )
@@ -0,0 +1,187 @@
+"""`merge_activity_streams`: the k-way merge behind `get_activity_history`'s merged timeline.
+
+Each stream is served by a respx route that slices a fixed newest-first list by the request's
+`page[limit]`/`page[offset]`, so the tests see exactly which pages the merge asked for. Each test
+targets one behaviour: exactly `limit` records interleaved newest-first from one page per stream,
+further pages read only from the stream that ran dry, a resumed merge re-reading from the page
+boundary and skipping what it already returned, exhausted streams dropping out of `next`, and a
+403 stream reported in `errors` while the rest still merge.
+"""
+
+from collections.abc import Callable, Sequence
+from datetime import date
+
+import httpx
+import pytest
+import respx
+
+from backstop_mcp.backstop_client import BackstopApiError, BackstopClient
+from backstop_mcp.features.activity_history import (
+    ActivityItemDto,
+    ActivityTimelineContinuationResponse,
+    DateRangeResponse,
+    EmailItemDto,
+    merge_activity_streams,
+)
+from tests.helpers import BASE_URL, collection, recorded_params, resource
+
+
+def _serve(records: Sequence[dict[str, object]]) -> Callable[[httpx.Request], httpx.Response]:
+    def side_effect(request: httpx.Request) -> httpx.Response:
+        limit = int(request.url.params["page[limit]"])
+        offset = int(request.url.params["page[offset]"])
+        return httpx.Response(200, json=collection(*records[offset : offset + limit]))
+
+    return side_effect
+
+
+def _activities(activity_type: str, *dates: str) -> respx.Route:
+    records = [
+        resource(f"{activity_type[0]}{i}", "activities", effectiveDate=day)
+        for i, day in enumerate(dates)
+    ]
+    return respx.get(
+        f"{BASE_URL}/organizations/o42/activities",
+        params={"filter[activityType][eq]": activity_type},
+    ).mock(side_effect=_serve(records))
+
+
+def _emails(*timestamps: str) -> respx.Route:
+    records = [resource(f"e{i}", "emails", sentTimestamp=sent) for i, sent in enumerate(timestamps)]
+    return respx.get(f"{BASE_URL}/organizations/o42/emails").mock(side_effect=_serve(records))
+
+
+def _offsets(route: respx.Route) -> list[tuple[str, str]]:
+    return [(params["page[offset]"], params["page[limit]"]) for params in recorded_params(route)]
+
+
+def _ids(items: Sequence[ActivityItemDto | EmailItemDto]) -> list[str]:
+    return [item.id for item in items]
+
+
+class TestMergeActivityStreams:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_interleaves_exactly_limit_records_newest_first_and_reads_only_dry_streams(
+        self, client: BackstopClient
+    ) -> None:
+        meetings = _activities("meetings", "2026-03-10", "2026-03-01", "2026-02-01")
+        notes = _activities("notes", "2026-03-05", "2026-02-20", "2026-01-01")
+        emails = _emails("2026-03-08T09:00:00Z", "2026-02-25T09:00:00Z", "2026-01-15T09:00:00Z")
+
+        timeline = await merge_activity_streams(
+            client,
+            segment="organizations",
+            entity_id="o42",
+            continuation=ActivityTimelineContinuationResponse(
+                limit=6, offsets={"meeting": 0, "note": 0, "email": 0}
+            ),
+        )
+
+        assert _ids(timeline.items) == ["m0", "e0", "n0", "m1", "e1", "n1"]
+        assert timeline.date_range == DateRangeResponse(
+            start=date(2026, 2, 20), end=date(2026, 3, 10)
+        )
+        assert _offsets(meetings) == [("0", "2"), ("2", "2")]
+        assert _offsets(notes) == [("0", "2")]
+        assert _offsets(emails) == [("0", "2"), ("2", "2")]
+        assert timeline.next == ActivityTimelineContinuationResponse(
+            limit=6, offsets={"meeting": 2, "note": 2, "email": 2}
+        )
+        assert timeline.errors is None
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_reads_further_pages_only_from_the_stream_that_ran_dry(
+        self, client: BackstopClient
+    ) -> None:
+        meetings = _activities(
+            "meetings", "2026-03-06", "2026-03-05", "2026-03-04", "2026-03-03", "2026-03-02"
+        )
+        notes = _activities("notes", "2025-01-02", "2025-01-01", "2024-12-31")
+
+        timeline = await merge_activity_streams(
+            client,
+            segment="organizations",
+            entity_id="o42",
+            continuation=ActivityTimelineContinuationResponse(
+                limit=4, offsets={"meeting": 0, "note": 0}
+            ),
+        )
+
+        assert _ids(timeline.items) == ["m0", "m1", "m2", "m3"]
+        assert _offsets(meetings) == [("0", "2"), ("2", "2")]
+        assert _offsets(notes) == [("0", "2")]
+        assert timeline.next is not None
+        assert timeline.next.offsets == {"meeting": 4, "note": 0}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_resumes_from_the_page_boundary_and_skips_returned_records(
+        self, client: BackstopClient
+    ) -> None:
+        meetings = _activities(
+            "meetings", "2026-03-06", "2026-03-05", "2026-03-04", "2026-03-03", "2026-03-02"
+        )
+        notes = _activities("notes", "2026-03-07", "2026-02-01")
+
+        timeline = await merge_activity_streams(
+            client,
+            segment="organizations",
+            entity_id="o42",
+            continuation=ActivityTimelineContinuationResponse(
+                limit=4, offsets={"meeting": 3, "note": 1}
+            ),
+        )
+
+        assert _ids(timeline.items) == ["m3", "m4", "n1"]
+        assert _offsets(meetings) == [("2", "2"), ("4", "2")]
+        assert _offsets(notes) == [("0", "2"), ("2", "2")]
+        assert timeline.next is None
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_forbidden_stream_is_reported_and_the_rest_still_merge(
+        self, client: BackstopClient
+    ) -> None:
+        _activities("meetings", "2026-03-06", "2026-03-05")
+        respx.get(f"{BASE_URL}/organizations/o42/emails").mock(
+            return_value=httpx.Response(
+                403,
+                json={"errors": [{"title": "You don't have permission to operate the entity 7"}]},
+            )
+        )
+
+        timeline = await merge_activity_streams(
+            client,
+            segment="organizations",
+            entity_id="o42",
+            continuation=ActivityTimelineContinuationResponse(
+                limit=2, offsets={"meeting": 0, "email": 0}
+            ),
+        )
+
+        assert _ids(timeline.items) == ["m0", "m1"]
+        assert timeline.errors is not None
+        assert "entity 7" in timeline.errors["email"]
+        assert timeline.next == ActivityTimelineContinuationResponse(
+            limit=2, offsets={"meeting": 2}
+        )
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_server_error_on_a_stream_propagates(self, client: BackstopClient) -> None:
+        _activities("meetings", "2026-03-06")
+        respx.get(f"{BASE_URL}/organizations/o42/emails").mock(
+            return_value=httpx.Response(500, json={"errors": [{"detail": "boom"}]})
+        )
+
+        with pytest.raises(BackstopApiError):
+            await merge_activity_streams(
+                client,
+                segment="organizations",
+                entity_id="o42",
+                continuation=ActivityTimelineContinuationResponse(
+                    limit=2, offsets={"meeting": 0, "email": 0}
+                ),
+            )
@@ -0,0 +1,248 @@
+"""An effective-date window read past the 10000 wall as sub-windows, each under it.
+
+The fake endpoint below keeps the two measured behaviours the planner relies on: `totalCount`
+saturates at the wall, and a page past it is a 500. Tests shrink the wall to a handful of rows so
+a saturated window is cheap to build.
+"""
+
+import asyncio
+import json
+from collections.abc import Callable, Sequence
+from datetime import date, timedelta
+from typing import cast
+
+import httpx
+import pytest
+import respx
+
+from backstop_mcp.backstop_client import BackstopApiError, BackstopClient, RequestPriority
+from backstop_mcp.features.activity_history import (
+    EntityActivitiesFetchDto,
+    EntityActivityDto,
+    scan_entity_activities,
+)
+from tests.helpers import BASE_URL, recorded_lanes
+from tests.server.tools.helpers import object_dict
+
+_URL = f"{BASE_URL}/entity-activities"
+_WALL = 4
+_START = date(2026, 1, 1)
+
+
+class _Firm:
+    """`POST /entity-activities` over `days`: one activity id per entry, on that day.
+
+    `everywhere` ids are answered by every window, as a row straddling a boundary might be.
+    """
+
+    def __init__(self, days: list[date], *, everywhere: tuple[int, ...] = ()) -> None:
+        self.days: list[date] = days
+        self.everywhere: tuple[int, ...] = everywhere
+        self.requests: int = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        body = cast("dict[str, object]", json.loads(request.content))
+        attributes = object_dict(object_dict(body["data"])["attributes"])
+        window = object_dict(object_dict(attributes["filters"])["effectiveDate"])
+        since = date.fromisoformat(str(window["startTimestamp"])[:10])
+        until = date.fromisoformat(str(window["endTimestamp"])[:10])
+        page_num, page_size = int(str(attributes["pageNum"])), int(str(attributes["pageSize"]))
+        if page_num * page_size > _WALL:
+            return httpx.Response(500, json={"errors": [{"title": "InternalServerException"}]})
+        matching = [
+            _row(row_id, day)
+            for row_id, day in sorted(enumerate(self.days), key=lambda item: item[1], reverse=True)
+            if since <= day <= until
+        ]
+        matching += [_row(row_id, until) for row_id in self.everywhere]
+        page = matching[(page_num - 1) * page_size : page_num * page_size]
+        return httpx.Response(
+            201,
+            json={
+                "data": {
+                    "id": -1,
+                    "type": "entity-activities",
+                    "attributes": {"totalCount": min(len(matching), _WALL), "results": page},
+                }
+            },
+        )
+
+
+def _row(row_id: int, day: date) -> dict[str, object]:
+    return {
+        "id": row_id,
+        "type": "Meeting",
+        "title": "Meeting",
+        "effectiveDate": f"{day.month}/{day.day}/{day.year}",
+    }
+
+
+def _days(count: int, *, per_day: int = 1) -> list[date]:
+    return [_START + timedelta(days=index // per_day) for index in range(count)]
+
+
+async def _scan(
+    client: BackstopClient,
+    *,
+    days: int,
+    max_windows: int = 16,
+    on_rows: Callable[[Sequence[EntityActivityDto]], None] | None = None,
+) -> EntityActivitiesFetchDto:
+    return await scan_entity_activities(
+        client,
+        start_date=_START,
+        end_date=_START + timedelta(days=days - 1),
+        max_windows=max_windows,
+        page_size=2,
+        max_retrievable=_WALL,
+        on_rows=on_rows,
+    )
+
+
+class TestScanEntityActivities:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_window_past_the_wall_is_counted_exactly(self, client: BackstopClient) -> None:
+        respx.post(_URL).mock(side_effect=_Firm(_days(10)))
+
+        result = await _scan(client, days=10)
+
+        assert sorted(int(row.id) for row in result.rows) == list(range(10))
+        assert result.total_count == 10
+        assert result.windows > 1
+        assert result.ceiling_clamped is False
+        assert result.partial_due_to_error is False
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_window_under_the_wall_is_one_walk(self, client: BackstopClient) -> None:
+        firm = _Firm(_days(3))
+        respx.post(_URL).mock(side_effect=firm)
+
+        result = await _scan(client, days=10)
+
+        assert result.windows == 1
+        assert result.total_count == 3
+        assert sorted(int(row.id) for row in result.rows) == [0, 1, 2]
+        # Page one is both the probe and the walk's first page; only page two is read after it.
+        assert firm.requests == 2
+        assert result.pages_fetched == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_row_answered_by_two_windows_counts_once(self, client: BackstopClient) -> None:
+        respx.post(_URL).mock(side_effect=_Firm(_days(6), everywhere=(99,)))
+
+        result = await _scan(client, days=6)
+
+        ids = [row.id for row in result.rows]
+        assert len(ids) == len(set(ids))
+        assert sorted(int(row_id) for row_id in ids) == [*range(6), 99]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_rows_come_newest_window_first(self, client: BackstopClient) -> None:
+        respx.post(_URL).mock(side_effect=_Firm(_days(8)))
+
+        result = await _scan(client, days=8)
+
+        dates = [row.effective_date for row in result.rows]
+        assert dates == sorted(dates, key=lambda day: day or date.min, reverse=True)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_spent_budget_leaves_a_floor(self, client: BackstopClient) -> None:
+        respx.post(_URL).mock(side_effect=_Firm(_days(20)))
+
+        result = await _scan(client, days=20, max_windows=2)
+
+        assert result.windows == 2
+        assert result.ceiling_clamped is True
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_single_day_at_the_wall_is_a_floor(self, client: BackstopClient) -> None:
+        respx.post(_URL).mock(side_effect=_Firm(_days(6, per_day=6)))
+
+        result = await _scan(client, days=1)
+
+        assert result.windows == 1
+        assert result.ceiling_clamped is True
+        assert result.total_count == _WALL
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_only_a_window_that_is_split_reads_a_page_it_does_not_keep(
+        self, client: BackstopClient
+    ) -> None:
+        firm = _Firm(_days(6))
+        respx.post(_URL).mock(side_effect=firm)
+
+        result = await _scan(client, days=6)
+
+        # Six days at the wall split once into two windows of three rows: the whole window's
+        # page one, then each half's two pages.
+        assert result.windows == 2
+        assert firm.requests == 5
+        assert result.pages_fetched == 5
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_streamed_rows_are_handed_over_once_and_not_kept(
+        self, client: BackstopClient
+    ) -> None:
+        respx.post(_URL).mock(side_effect=_Firm(_days(6), everywhere=(99,)))
+        handed: list[str] = []
+
+        result = await _scan(
+            client, days=6, on_rows=lambda rows: handed.extend(row.id for row in rows)
+        )
+
+        assert sorted(int(row_id) for row_id in handed) == [*range(6), 99]
+        assert result.rows == ()
+        assert result.windows > 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_only_the_first_probe_waits_in_the_first_page_lane(
+        self, client: BackstopClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        respx.post(_URL).mock(side_effect=_Firm(_days(10)))
+        lanes = recorded_lanes(client, monkeypatch)
+
+        _ = await _scan(client, days=10)
+
+        assert lanes[0] == RequestPriority.FIRST_PAGE
+        assert len(lanes) > 1
+        assert set(lanes[1:]) == {RequestPriority.LATER_PAGE}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_failed_window_stops_the_rest_of_the_scan(self, client: BackstopClient) -> None:
+        firm = _Firm(_days(10))
+        handed: list[str] = []
+
+        async def older_half_fails(request: httpx.Request) -> httpx.Response:
+            response = firm(request)
+            if firm.requests == 1:
+                return response
+            body = cast("dict[str, object]", json.loads(request.content))
+            attributes = object_dict(object_dict(body["data"])["attributes"])
+            window = object_dict(object_dict(attributes["filters"])["effectiveDate"])
+            if str(window["startTimestamp"]).startswith(_START.isoformat()):
+                return httpx.Response(500, json={"errors": [{"title": "InternalServerException"}]})
+            await asyncio.sleep(0.05)
+            return response
+
+        respx.post(_URL).mock(side_effect=older_half_fails)
+
+        with pytest.raises(BackstopApiError):
+            _ = await _scan(
+                client, days=10, on_rows=lambda rows: handed.extend(row.id for row in rows)
+            )
+        sent = firm.requests
+        await asyncio.sleep(0.2)
+
+        assert firm.requests == sent
+        assert handed == []
@@ -19,7 +19,7 @@ import respx
 from fastmcp.exceptions import ToolError
 
 from backstop_mcp.backstop_client import BackstopApiError, BackstopClient
-from backstop_mcp.features.activity_history import ActivityDetailResponse
+from backstop_mcp.features.activity_history import ActivityBodyCache, ActivityDetailResponse
 from backstop_mcp.features.activity_history.tools.get_activity_detail import get_activity_detail
 from tests.features.party_resolver.helpers import BASE_URL, collection, ctx_never_elicit
 from tests.helpers import resource
@@ -47,6 +47,17 @@ def _attendees_route(resource_id: str) -> respx.Route:
     return respx.get(f"{BASE_URL}/meeting-or-calls/{resource_id}/attendees")
 
 
+def _version_route(resource_type: str, resource_id: str) -> respx.Route:
+    """`/{resource_type}/{id}?fields=modifiedTimestamp` — the caller's read of the version."""
+    return respx.get(f"{BASE_URL}/{resource_type}/{resource_id}")
+
+
+def _version_document(
+    resource_type: str, resource_id: str, **attributes: object
+) -> dict[str, object]:
+    return {"data": {"type": resource_type, "id": resource_id, "attributes": attributes}}
+
+
 def _specifics_document(resource_id: str, **attributes: object) -> dict[str, object]:
     return {"data": {"type": "meeting-or-calls", "id": resource_id, "attributes": attributes}}
 
@@ -108,7 +119,9 @@ class TestMeetingOrCall:
         )
 
         result = tool_model(
-            await get_activity_detail(ctx_never_elicit(), activity_id=activity_id, client=client),
+            await get_activity_detail(
+                ctx_never_elicit(), activity_id=activity_id, client=client, bodies=None
+            ),
             ActivityDetailResponse,
         )
 
@@ -131,9 +144,10 @@ class TestMeetingOrCall:
             ("att-1", "deck.pdf"),
             (None, "notes.docx"),
         ]
-        # Only the four fields that actually live on this endpoint are requested.
+        # Only the four fields that actually live on this endpoint are requested, plus the
+        # record's version for the body cache.
         assert specifics.calls.last.request.url.params["fields"] == (
-            "startTimestamp,stopTimestamp,location,timeZone"
+            "startTimestamp,stopTimestamp,location,timeZone,modifiedTimestamp"
         )
 
     @pytest.mark.asyncio
@@ -156,7 +170,9 @@ class TestMeetingOrCall:
         _attendees_route("99999").mock(return_value=httpx.Response(200, json=collection()))
 
         result = tool_model(
-            await get_activity_detail(ctx_never_elicit(), activity_id=activity_id, client=client),
+            await get_activity_detail(
+                ctx_never_elicit(), activity_id=activity_id, client=client, bodies=None
+            ),
             ActivityDetailResponse,
         )
 
@@ -193,7 +209,9 @@ class TestNoteOrDocument:
         )
 
         result = tool_model(
-            await get_activity_detail(ctx_never_elicit(), activity_id=activity_id, client=client),
+            await get_activity_detail(
+                ctx_never_elicit(), activity_id=activity_id, client=client, bodies=None
+            ),
             ActivityDetailResponse,
         )
 
@@ -230,7 +248,9 @@ class TestErrorPropagation:
         _attendees_route("missing").mock(return_value=httpx.Response(200, json=collection()))
 
         with pytest.raises(BackstopApiError):
-            await get_activity_detail(ctx_never_elicit(), activity_id=activity_id, client=client)
+            await get_activity_detail(
+                ctx_never_elicit(), activity_id=activity_id, client=client, bodies=None
+            )
 
     @pytest.mark.asyncio
     @respx.mock
@@ -242,7 +262,9 @@ class TestErrorPropagation:
         _details_route("404404").mock(return_value=httpx.Response(200, json={"data": None}))
 
         with pytest.raises(BackstopApiError) as exc_info:
-            await get_activity_detail(ctx_never_elicit(), activity_id="notes_404404", client=client)
+            await get_activity_detail(
+                ctx_never_elicit(), activity_id="notes_404404", client=client, bodies=None
+            )
 
         assert exc_info.value.status_code == 404
 
@@ -272,7 +294,9 @@ class TestErrorPropagation:
         )
 
         result = tool_model(
-            await get_activity_detail(ctx_never_elicit(), activity_id=activity_id, client=client),
+            await get_activity_detail(
+                ctx_never_elicit(), activity_id=activity_id, client=client, bodies=None
+            ),
             ActivityDetailResponse,
         )
 
@@ -323,7 +347,9 @@ class TestErrorPropagation:
         )
 
         result = tool_model(
-            await get_activity_detail(ctx_never_elicit(), activity_id=activity_id, client=client),
+            await get_activity_detail(
+                ctx_never_elicit(), activity_id=activity_id, client=client, bodies=None
+            ),
             ActivityDetailResponse,
         )
 
@@ -340,7 +366,9 @@ class TestErrorPropagation:
     ) -> None:
 
         with pytest.raises(ToolError, match="not a valid activity_id"):
-            await get_activity_detail(ctx_never_elicit(), activity_id="   ", client=client)
+            await get_activity_detail(
+                ctx_never_elicit(), activity_id="   ", client=client, bodies=None
+            )
 
         assert len(respx.calls) == 0
 
@@ -352,7 +380,9 @@ class TestErrorPropagation:
     ) -> None:
 
         with pytest.raises(ToolError, match="email handle"):
-            await get_activity_detail(ctx_never_elicit(), activity_id=activity_id, client=client)
+            await get_activity_detail(
+                ctx_never_elicit(), activity_id=activity_id, client=client, bodies=None
+            )
 
         assert len(respx.calls) == 0
 
@@ -400,7 +430,9 @@ class TestDefensiveParsing:
         )
 
         result = tool_model(
-            await get_activity_detail(ctx_never_elicit(), activity_id=activity_id, client=client),
+            await get_activity_detail(
+                ctx_never_elicit(), activity_id=activity_id, client=client, bodies=None
+            ),
             ActivityDetailResponse,
         )
 
@@ -437,7 +469,9 @@ class TestDefensiveParsing:
         )
 
         result = tool_model(
-            await get_activity_detail(ctx_never_elicit(), activity_id=activity_id, client=client),
+            await get_activity_detail(
+                ctx_never_elicit(), activity_id=activity_id, client=client, bodies=None
+            ),
             ActivityDetailResponse,
         )
 
@@ -471,7 +505,9 @@ class TestDefensiveParsing:
         )
 
         result = tool_model(
-            await get_activity_detail(ctx_never_elicit(), activity_id=activity_id, client=client),
+            await get_activity_detail(
+                ctx_never_elicit(), activity_id=activity_id, client=client, bodies=None
+            ),
             ActivityDetailResponse,
         )
 
@@ -496,7 +532,9 @@ class TestDefensiveParsing:
         )
 
         result = tool_model(
-            await get_activity_detail(ctx_never_elicit(), activity_id=activity_id, client=client),
+            await get_activity_detail(
+                ctx_never_elicit(), activity_id=activity_id, client=client, bodies=None
+            ),
             ActivityDetailResponse,
         )
 
@@ -504,3 +542,151 @@ class TestDefensiveParsing:
         assert details.call_count == 1
         assert attendees.call_count == 0
         assert "/entity-activity-details/1%2F..%2F2" in str(details.calls.last.request.url)
+
+
+class TestBodyCache:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_repeat_open_reads_only_the_version(self, client: BackstopClient) -> None:
+        bodies = ActivityBodyCache(max_bytes=10_000)
+        details = _details_route("555").mock(
+            return_value=httpx.Response(
+                200,
+                json=_detail_document(
+                    "555", type="note", title="Follow-up", description="<p>Renewal.</p>"
+                ),
+            )
+        )
+        version = _version_route("notes", "555").mock(
+            return_value=httpx.Response(
+                200,
+                json=_version_document("notes", "555", modifiedTimestamp="2026-03-01T09:30:00Z"),
+            )
+        )
+
+        first, second = [
+            tool_model(
+                await get_activity_detail(
+                    ctx_never_elicit(), activity_id="notes_555", client=client, bodies=bodies
+                ),
+                ActivityDetailResponse,
+            )
+            for _ in range(2)
+        ]
+
+        assert first == second
+        assert second.body == "Renewal."
+        assert details.call_count == 1
+        assert version.call_count == 2
+        assert version.calls.last.request.url.params["fields"] == "modifiedTimestamp"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_caller_who_cannot_read_the_record_is_not_served_it(
+        self, client: BackstopClient
+    ) -> None:
+        bodies = ActivityBodyCache(max_bytes=10_000)
+        _ = _details_route("555").mock(
+            return_value=httpx.Response(200, json=_detail_document("555", description="Secret"))
+        )
+        _ = _version_route("notes", "555").mock(
+            side_effect=[
+                httpx.Response(
+                    200,
+                    json=_version_document(
+                        "notes", "555", modifiedTimestamp="2026-03-01T09:30:00Z"
+                    ),
+                ),
+                httpx.Response(403, json={"errors": [{"detail": "forbidden"}]}),
+            ]
+        )
+        _ = await get_activity_detail(
+            ctx_never_elicit(), activity_id="notes_555", client=client, bodies=bodies
+        )
+
+        with pytest.raises(BackstopApiError):
+            await get_activity_detail(
+                ctx_never_elicit(), activity_id="notes_555", client=client, bodies=bodies
+            )
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_meeting_takes_its_version_from_the_specifics_read(
+        self, client: BackstopClient
+    ) -> None:
+        bodies = ActivityBodyCache(max_bytes=10_000)
+        details = _details_route("777").mock(
+            return_value=httpx.Response(
+                200, json=_detail_document("777", type="meeting", description="<p>Agenda</p>")
+            )
+        )
+        specifics = _specifics_route("777").mock(
+            return_value=httpx.Response(
+                200,
+                json=_specifics_document(
+                    "777", modifiedTimestamp="2026-03-01T09:30:00Z", location="HQ"
+                ),
+            )
+        )
+        _ = _attendees_route("777").mock(
+            return_value=httpx.Response(
+                200, json=collection(resource("att1", "people", name="Jane Doe"))
+            )
+        )
+
+        for _ in range(2):
+            result = tool_model(
+                await get_activity_detail(
+                    ctx_never_elicit(),
+                    activity_id="meeting-or-calls_777",
+                    client=client,
+                    bodies=bodies,
+                ),
+                ActivityDetailResponse,
+            )
+            assert result.body == "Agenda"
+            assert result.location == "HQ"
+            assert [attendee.name for attendee in result.attendees] == ["Jane Doe"]
+
+        # Detail once; the specifics read, which carries the version, once per open.
+        assert details.call_count == 1
+        assert specifics.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_an_unknown_collection_never_reaches_a_path(self, client: BackstopClient) -> None:
+        bodies = ActivityBodyCache(max_bytes=10_000)
+        details = _details_route("888").mock(
+            return_value=httpx.Response(
+                200, json=_detail_document("888", type="task", description="Body")
+            )
+        )
+
+        result = tool_model(
+            await get_activity_detail(
+                ctx_never_elicit(), activity_id="tasks_888", client=client, bodies=bodies
+            ),
+            ActivityDetailResponse,
+        )
+
+        assert result.body == "Body"
+        assert details.call_count == 1
+        assert len(bodies) == 0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_search_row_id_has_no_version_to_read(self, client: BackstopClient) -> None:
+        bodies = ActivityBodyCache(max_bytes=10_000)
+        details = _details_route("1659094659").mock(
+            return_value=httpx.Response(
+                200, json=_detail_document("1659094659", type="note", description="Body")
+            )
+        )
+
+        for _ in range(2):
+            _ = await get_activity_detail(
+                ctx_never_elicit(), activity_id="1659094659", client=client, bodies=bodies
+            )
+
+        assert details.call_count == 2
+        assert len(bodies) == 0
@@ -3,11 +3,12 @@
 Each test targets one behaviour from the task: the default-stream fan-out (all five streams,
 including `document`), that a resumed call (`type="next"`) skips resolution and only re-fetches
 streams present in `next`, that invalid `next` inputs raise pydantic `ValidationError`, that a
-5xx on one stream fails the whole call, and that a 403 on one stream is reported on that group
-without discarding the others.
+5xx on one stream fails the whole call, that a 403 on one stream is reported on that group
+without discarding the others, and that a `merged` first page plus `type="timeline_next"` walk
+one interleaved timeline.
 """
 
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from datetime import date
 
 import httpx
@@ -20,6 +21,7 @@ from backstop_mcp.features.activity_history import (
     ActivityContinuationResponse,
     ActivityHistoryResolvedResponse,
     ActivityHistorySettings,
+    ActivityHistoryTimelineResponse,
     ActivityRecordResponse,
     ActivityType,
     EmailRecordResponse,
@@ -29,6 +31,7 @@ from backstop_mcp.features.activity_history import (
 from backstop_mcp.features.activity_history.tools.get_activity_history import (
     ActivityHistoryFirstPageInput,
     ActivityHistoryNextPageInput,
+    ActivityHistoryTimelineNextPageInput,
     get_activity_history,
 )
 from backstop_mcp.features.data_hygiene import AsOfResponse
@@ -146,6 +149,8 @@ class TestFirstCallByTrustedPartyId:
                 _first(search_type="organizations", party_id="o42"),
                 client=client,
                 activity_history=_SETTINGS,
+                party_resolutions=None,
+                party_names=None,
             ),
             ActivityHistoryResolvedResponse,
         )
@@ -202,6 +207,8 @@ class TestFirstCallBySearch:
                 ),
                 client=client,
                 activity_history=_SETTINGS,
+                party_resolutions=None,
+                party_names=None,
             ),
             ActivityHistoryResolvedResponse,
         )
@@ -239,6 +246,8 @@ class TestFirstCallBySearch:
                 _first(search_type="organizations", search="Capstone"),
                 client=client,
                 activity_history=_SETTINGS,
+                party_resolutions=None,
+                party_names=None,
             ),
             PartyAmbiguousResponse,
         )
@@ -280,6 +289,8 @@ class TestFirstCallBySearch:
                 _first(search_type="people", search="Nope"),
                 client=client,
                 activity_history=_SETTINGS,
+                party_resolutions=None,
+                party_names=None,
             ),
             ActivityHistoryResolvedResponse | PartyAmbiguousResponse | NotFoundResponse,
         )
@@ -333,6 +344,8 @@ class TestFirstCallBySearch:
                 _first(search_type="people", search="Jane Contact", activity_types=["meeting"]),
                 client=client,
                 activity_history=_SETTINGS,
+                party_resolutions=None,
+                party_names=None,
             ),
             ActivityHistoryResolvedResponse,
         )
@@ -386,6 +399,8 @@ class TestFirstCallBySearch:
                 ),
                 client=client,
                 activity_history=_SETTINGS,
+                party_resolutions=None,
+                party_names=None,
             ),
             ActivityHistoryResolvedResponse,
         )
@@ -428,6 +443,8 @@ class TestResumedCall:
                 ),
                 client=client,
                 activity_history=_SETTINGS,
+                party_resolutions=None,
+                party_names=None,
             ),
             ActivityHistoryResolvedResponse,
         )
@@ -479,6 +496,8 @@ class TestResumedCall:
                 ),
                 client=client,
                 activity_history=_SETTINGS,
+                party_resolutions=None,
+                party_names=None,
             ),
             ActivityHistoryResolvedResponse,
         )
@@ -527,6 +546,8 @@ class TestResumedCall:
             _first(search_type="organizations", party_id="o42"),
             client=client,
             activity_history=_SETTINGS,
+            party_resolutions=None,
+            party_names=None,
         )
         first_payload = tool_payload(first_result)
 
@@ -552,6 +573,8 @@ class TestResumedCall:
             ),
             client=client,
             activity_history=_SETTINGS,
+            party_resolutions=None,
+            party_names=None,
         )
         second_payload = tool_payload(second_result)
         second = tool_model(second_result, ActivityHistoryResolvedResponse)
@@ -569,6 +592,86 @@ class TestResumedCall:
         assert second.groups["email"].next is None
 
 
+class TestMergedTimeline:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_merged_first_page_then_timeline_next_walks_one_interleaved_timeline(
+        self, client: BackstopClient
+    ) -> None:
+        def serve(*records: dict[str, object]) -> Callable[[httpx.Request], httpx.Response]:
+            def side_effect(request: httpx.Request) -> httpx.Response:
+                limit = int(request.url.params["page[limit]"])
+                offset = int(request.url.params["page[offset]"])
+                return httpx.Response(200, json=collection(*records[offset : offset + limit]))
+
+            return side_effect
+
+        respx.get(f"{BASE_URL}/organizations/o42").mock(
+            return_value=httpx.Response(200, json=_org_document())
+        )
+        _activities_route("organizations", "o42", "meetings").mock(
+            side_effect=serve(
+                _activity("m1", "2026-03-10"),
+                _activity("m2", "2026-02-01"),
+                _activity("m3", "2026-01-10"),
+            )
+        )
+        _emails_route("organizations", "o42").mock(
+            side_effect=serve(
+                _email("e1", "2026-03-05T09:00:00.000-0500"),
+                _email("e2", "2026-03-01T09:00:00.000-0500"),
+                _email("e3", "2026-01-20T09:00:00.000-0500"),
+            )
+        )
+
+        first_result = await get_activity_history(
+            ctx_never_elicit(),
+            _first(
+                search_type="organizations",
+                party_id="o42",
+                activity_types=["meeting", "email"],
+                limit=4,
+                merged=True,
+            ),
+            client=client,
+            activity_history=_SETTINGS,
+            party_resolutions=None,
+            party_names=None,
+        )
+        first = tool_model(first_result, ActivityHistoryTimelineResponse)
+        assert first.resolved.name == "Capstone"
+        assert _record_keys(first.timeline.items) == [
+            ("meeting", "m1"),
+            ("email", "e1"),
+            ("email", "e2"),
+            ("meeting", "m2"),
+        ]
+        assert first.timeline.errors is None
+
+        timeline = object_dict(tool_payload(first_result)["timeline"])
+        second = tool_model(
+            await get_activity_history(
+                ctx_never_elicit(),
+                ActivityHistoryTimelineNextPageInput.model_validate(
+                    {
+                        "type": "timeline_next",
+                        "search_type": "organizations",
+                        "entity_id": "o42",
+                        "next": timeline["next"],
+                    }
+                ),
+                client=client,
+                activity_history=_SETTINGS,
+                party_resolutions=None,
+                party_names=None,
+            ),
+            ActivityHistoryTimelineResponse,
+        )
+
+        assert _record_keys(second.timeline.items) == [("email", "e3"), ("meeting", "m3")]
+        assert second.timeline.next is None
+
+
 class TestRequestShape:
     def test_first_page_input_requires_search_type(self) -> None:
         with pytest.raises(ValidationError):
@@ -641,6 +744,26 @@ class TestRequestShape:
                 }
             )
 
+    def test_timeline_next_input_requires_at_least_one_open_stream(self) -> None:
+        with pytest.raises(ValidationError):
+            ActivityHistoryTimelineNextPageInput.model_validate(
+                {
+                    "type": "timeline_next",
+                    "search_type": "organizations",
+                    "entity_id": "o42",
+                    "next": {"limit": 10, "offsets": {}},
+                }
+            )
+        with pytest.raises(ValidationError):
+            ActivityHistoryTimelineNextPageInput.model_validate(
+                {
+                    "type": "timeline_next",
+                    "search_type": "organizations",
+                    "entity_id": "o42",
+                    "next": {"limit": 10, "offsets": {"meeting": -1}},
+                }
+            )
+
     def test_next_page_input_rejects_since_after_until(self) -> None:
         with pytest.raises(ValidationError):
             ActivityHistoryNextPageInput.model_validate(
@@ -685,6 +808,8 @@ class TestPartialFailurePropagates:
                 ),
                 client=client,
                 activity_history=_SETTINGS,
+                party_resolutions=None,
+                party_names=None,
             )
 
     @pytest.mark.asyncio
@@ -726,6 +851,8 @@ class TestPartialFailurePropagates:
                 ),
                 client=client,
                 activity_history=_SETTINGS,
+                party_resolutions=None,
+                party_names=None,
             ),
             ActivityHistoryResolvedResponse,
         )
@@ -759,6 +886,8 @@ class TestDocumentInclusion:
                 ),
                 client=client,
                 activity_history=_SETTINGS,
+                party_resolutions=None,
+                party_names=None,
             ),
             ActivityHistoryResolvedResponse,
         )
@@ -788,6 +917,8 @@ class TestWireOmitsNone:
                 _first(search_type="organizations", party_id="o42", activity_types=["meeting"]),
                 client=client,
                 activity_history=_SETTINGS,
+                party_resolutions=None,
+                party_names=None,
             )
         )
 
@@ -1,4 +1,6 @@
+import json
 from datetime import date
+from typing import cast
 
 import httpx
 import pytest
@@ -8,6 +10,7 @@ from fastmcp.tools.function_tool import ToolMeta
 
 from backstop_mcp.backstop_client import BackstopAuthError, BackstopClient
 from backstop_mcp.features.activity_history import (
+    ActivityHistorySettings,
     EntityActivitiesFetchDto,
     EntityActivityDto,
     SearchActivitiesResolvedResponse,
@@ -24,6 +27,7 @@ from tests.server.tools.helpers import object_dict, object_list, tool_model, too
 
 _URL = f"{BASE_URL}/entity-activities"
 _PARTY_ID = "354566359"
+_SETTINGS = ActivityHistorySettings(page_size=10, gist_max_chars=300)
 
 
 def _page(*rows: dict[str, object], total: int | None = None) -> httpx.Response:
@@ -89,6 +93,9 @@ class TestSearchActivities:
                 party_id=_PARTY_ID,
                 activity_tag_ids=["474963", "455289"],
                 client=client,
+                party_resolutions=None,
+                party_names=None,
+                activity_history=_SETTINGS,
             ),
             SearchActivitiesResolvedResponse,
         )
@@ -125,6 +132,9 @@ class TestSearchActivities:
                 start_date=date(2020, 1, 1),
                 end_date=date(2020, 1, 2),
                 client=client,
+                party_resolutions=None,
+                party_names=None,
+                activity_history=_SETTINGS,
             ),
             SearchActivitiesResolvedResponse,
         )
@@ -145,6 +155,9 @@ class TestSearchActivities:
                 start_date=date(2024, 1, 1),
                 end_date=date(2026, 8, 20),
                 client=client,
+                party_resolutions=None,
+                party_names=None,
+                activity_history=_SETTINGS,
             ),
             SearchActivitiesUnavailableResponse,
         )
@@ -170,6 +183,9 @@ class TestSearchActivities:
                 start_date=date(2024, 1, 1),
                 end_date=date(2026, 8, 20),
                 client=client,
+                party_resolutions=None,
+                party_names=None,
+                activity_history=_SETTINGS,
             ),
             SearchActivitiesUnavailableResponse,
         )
@@ -188,6 +204,9 @@ class TestSearchActivities:
                 start_date=date(2024, 1, 1),
                 end_date=date(2026, 8, 20),
                 client=client,
+                party_resolutions=None,
+                party_names=None,
+                activity_history=_SETTINGS,
             )
 
     @pytest.mark.asyncio
@@ -201,6 +220,9 @@ class TestSearchActivities:
                 end_date=date(2026, 8, 20),
                 include_description=True,
                 client=client,
+                party_resolutions=None,
+                party_names=None,
+                activity_history=_SETTINGS,
             )
 
     @pytest.mark.asyncio
@@ -213,8 +235,52 @@ class TestSearchActivities:
                 mode="aggregate",
                 group_by="type",
                 client=client,
+                party_resolutions=None,
+                party_names=None,
+                activity_history=_SETTINGS,
             )
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_windowed_aggregate_runs_wide_and_counts_past_the_wall(
+        self, client: BackstopClient
+    ) -> None:
+        def by_window(request: httpx.Request) -> httpx.Response:
+            # The two-day window reports the wall; each day alone holds one meeting.
+            body = cast("dict[str, object]", json.loads(request.content))
+            attributes = object_dict(object_dict(body["data"])["attributes"])
+            window = object_dict(object_dict(attributes["filters"])["effectiveDate"])
+            day = str(window["startTimestamp"])[:10]
+            if day != str(window["endTimestamp"])[:10]:
+                return _page(_row(1), total=10_000)
+            return _page(_row(int(day[-2:]), type="Meeting"), total=1)
+
+        route = respx.post(_URL).mock(side_effect=by_window)
+
+        result = tool_model(
+            await search_activities(
+                ctx_never_elicit(),
+                start_date=date(2026, 8, 19),
+                end_date=date(2026, 8, 20),
+                mode="aggregate",
+                group_by="type",
+                client=client,
+                party_resolutions=None,
+                party_names=None,
+                activity_history=ActivityHistorySettings(
+                    page_size=10, gist_max_chars=300, search_max_windows=4
+                ),
+            ),
+            SearchActivitiesResolvedResponse,
+        )
+
+        payload = [object_dict(item) for item in object_list(tool_payload(result)["aggregates"])]
+        assert {item["key"]: item["count"] for item in payload} == {"Meeting": 2}
+        assert result.coverage.visible_count == 2
+        assert result.coverage.ceiling_hit is False
+        # The two-day window's page one, then each day's page one — which is also its whole walk.
+        assert route.call_count == 3
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_aggregate_counts_without_row_bodies(self, client: BackstopClient) -> None:
@@ -236,6 +302,9 @@ class TestSearchActivities:
                 mode="aggregate",
                 group_by="type",
                 client=client,
+                party_resolutions=None,
+                party_names=None,
+                activity_history=_SETTINGS,
             ),
             SearchActivitiesResolvedResponse,
         )
@@ -246,6 +315,47 @@ class TestSearchActivities:
         by_key = {item["key"]: item["count"] for item in payload}
         assert by_key == {"Meeting": 2, "Call": 1}
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_several_group_bys_come_back_as_breakdowns_from_one_walk(
+        self, client: BackstopClient
+    ) -> None:
+        route = respx.post(_URL).mock(
+            return_value=_page(
+                _row(1, type="Meeting"),
+                _row(2, type="Call", effectiveDate="7/2/2026"),
+                _row(3, type="Meeting"),
+                total=3,
+            )
+        )
+
+        result = tool_model(
+            await search_activities(
+                ctx_never_elicit(),
+                start_date=date(2024, 1, 1),
+                end_date=date(2026, 8, 20),
+                activity_tag_ids=["474963"],
+                mode="aggregate",
+                group_by=["type", "period"],
+                client=client,
+                party_resolutions=None,
+                party_names=None,
+                activity_history=_SETTINGS,
+            ),
+            SearchActivitiesResolvedResponse,
+        )
+
+        assert route.call_count == 1
+        by_dimension = {
+            breakdown.group_by: {bucket.key: bucket.count for bucket in breakdown.buckets}
+            for breakdown in result.breakdowns
+        }
+        assert by_dimension == {
+            "type": {"Meeting": 2, "Call": 1},
+            "period": {"2026-08": 2, "2026-07": 1},
+        }
+        assert result.aggregates == result.breakdowns[0].buckets
+
     @pytest.mark.asyncio
     async def test_include_description_in_aggregate_mode_is_refused(
         self, client: BackstopClient
@@ -260,6 +370,9 @@ class TestSearchActivities:
                 mode="aggregate",
                 group_by="type",
                 client=client,
+                party_resolutions=None,
+                party_names=None,
+                activity_history=_SETTINGS,
             )
 
     @pytest.mark.asyncio
@@ -273,6 +386,9 @@ class TestSearchActivities:
                 start_date=date(2024, 1, 1),
                 end_date=date(2026, 8, 20),
                 client=client,
+                party_resolutions=None,
+                party_names=None,
+                activity_history=_SETTINGS,
             ),
             SearchActivitiesResolvedResponse,
         )
@@ -296,6 +412,9 @@ class TestSearchActivities:
                 end_date=date(2026, 8, 20),
                 fields=["id", "title"],
                 client=client,
+                party_resolutions=None,
+                party_names=None,
+                activity_history=_SETTINGS,
             ),
             SearchActivitiesResolvedResponse,
         )
@@ -325,6 +444,9 @@ class TestSearchActivities:
                 activity_tag_ids=["474963"],
                 include_description=True,
                 client=client,
+                party_resolutions=None,
+                party_names=None,
+                activity_history=_SETTINGS,
             ),
             SearchActivitiesResolvedResponse,
         )
@@ -360,6 +482,9 @@ class TestSearchActivities:
             end_date=date(2024, 12, 31),
             max_rows=1000,
             client=client,
+            party_resolutions=None,
+            party_names=None,
+            activity_history=_SETTINGS,
         )
 
         filters = object_dict(object_dict(recorded_json_bodies(route)[0]["data"])["attributes"])
@@ -375,6 +500,9 @@ class TestSearchActivities:
                 start_date=date(2026, 8, 21),
                 end_date=date(2026, 8, 20),
                 client=client,
+                party_resolutions=None,
+                party_names=None,
+                activity_history=_SETTINGS,
             )
 
     def test_from_fetch_marks_a_mid_scan_failure_as_partial(self) -> None:
@@ -0,0 +1,206 @@
+"""The in-process cache of access tokens and credentials on the per-call auth path.
+
+What matters is that it never answers with something a revoke should have removed: not past a
+token's own expiry, not for a read that raced an invalidation, and not while the listener that
+hears other replicas' invalidations is down.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from datetime import timedelta
+
+import pytest
+from fastmcp.server.auth import AccessToken
+from pydantic import SecretStr
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from backstop_mcp.backstop_client import BackstopCredentialSecret
+from backstop_mcp.features.auth.auth_cache import AuthCache, auth_cache_lifespan
+
+type DatabaseFixture = tuple[AsyncEngine, async_sessionmaker[AsyncSession]]
+
+
+class _StubCounter:
+    """Stands in for `auth_cache_lookups_total`, capturing each add's attributes."""
+
+    def __init__(self) -> None:
+        self.records: list[dict[str, object]] = []
+
+    def add(self, amount: int, attributes: dict[str, object] | None = None) -> None:
+        assert amount == 1
+        self.records.append(dict(attributes or {}))
+
+
+def _cache(*, ttl: timedelta = timedelta(minutes=1)) -> AuthCache:
+    return AuthCache(ttl=ttl, max_entries=10)
+
+
+def _token(subject: str, *, expires_in: float = 900) -> AccessToken:
+    return AccessToken(
+        token="access-token",
+        client_id="client-1",
+        scopes=[],
+        expires_at=int(time.time() + expires_in),
+        subject=subject,
+    )
+
+
+def _credential(username: str) -> BackstopCredentialSecret:
+    return BackstopCredentialSecret(username=username, api_token=SecretStr("token-1"))
+
+
+async def _until(condition: Callable[[], bool]) -> None:
+    async with asyncio.timeout(5):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+class TestLookups:
+    def test_what_was_remembered_is_served(self) -> None:
+        cache = _cache()
+        cache.remember_access_token("hash-1", _token("user-1"), stamp=cache.stamp())
+        cache.remember_credential("user-1", _credential("bob"), stamp=cache.stamp())
+
+        assert cache.access_token("hash-1") == _token("user-1")
+        assert cache.credential("user-1") == _credential("bob")
+
+    def test_a_token_is_never_served_past_its_own_expiry(self) -> None:
+        cache = _cache()
+        cache.remember_access_token("hash-1", _token("user-1", expires_in=-1), stamp=cache.stamp())
+
+        assert cache.access_token("hash-1") is None
+
+    def test_an_entry_past_the_ttl_is_not_served(self) -> None:
+        cache = _cache(ttl=timedelta(0))
+        cache.remember_credential("user-1", _credential("bob"), stamp=cache.stamp())
+
+        assert cache.credential("user-1") is None
+
+    def test_a_read_that_raced_an_invalidation_is_not_kept(self) -> None:
+        cache = _cache()
+        stamp = cache.stamp()
+        cache.apply("subject:user-1")
+
+        cache.remember_credential("user-1", _credential("bob"), stamp=stamp)
+
+        assert cache.credential("user-1") is None
+
+    def test_lookups_are_counted_by_kind_and_outcome(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        lookups = _StubCounter()
+        monkeypatch.setattr("backstop_mcp.features.auth.auth_cache.AUTH_CACHE_LOOKUPS", lookups)
+        cache = _cache()
+        cache.remember_access_token("hash-1", _token("user-1"), stamp=cache.stamp())
+
+        _ = cache.access_token("hash-1")
+        _ = cache.credential("user-1")
+        cache.suspend()
+        _ = cache.access_token("hash-1")
+
+        assert lookups.records == [
+            {"kind": "token", "outcome": "hit"},
+            {"kind": "credential", "outcome": "miss"},
+            {"kind": "token", "outcome": "bypass"},
+        ]
+
+
+class TestInvalidation:
+    def test_a_token_invalidation_drops_only_that_token(self) -> None:
+        cache = _cache()
+        cache.remember_access_token("hash-1", _token("user-1"), stamp=cache.stamp())
+        cache.remember_access_token("hash-2", _token("user-1"), stamp=cache.stamp())
+
+        cache.apply("token:hash-1")
+
+        assert cache.access_token("hash-1") is None
+        assert cache.access_token("hash-2") is not None
+
+    def test_a_subject_invalidation_drops_its_credential_and_every_token(self) -> None:
+        cache = _cache()
+        cache.remember_access_token("hash-1", _token("user-1"), stamp=cache.stamp())
+        cache.remember_access_token("hash-2", _token("user-2"), stamp=cache.stamp())
+        cache.remember_credential("user-1", _credential("bob"), stamp=cache.stamp())
+
+        cache.apply("subject:user-1")
+
+        assert cache.access_token("hash-1") is None
+        assert cache.credential("user-1") is None
+        assert cache.access_token("hash-2") is not None
+
+    def test_an_unrecognised_payload_drops_everything(self) -> None:
+        cache = _cache()
+        cache.remember_access_token("hash-1", _token("user-1"), stamp=cache.stamp())
+
+        cache.apply("family:f-1")
+
+        assert cache.access_token("hash-1") is None
+        assert cache.serving
+
+    def test_a_suspended_cache_neither_answers_nor_keeps(self) -> None:
+        cache = _cache()
+        cache.remember_credential("user-1", _credential("bob"), stamp=cache.stamp())
+
+        cache.suspend()
+        cache.remember_credential("user-2", _credential("ann"), stamp=cache.stamp())
+        cache.resume()
+
+        assert cache.credential("user-1") is None
+        assert cache.credential("user-2") is None
+
+
+class TestListener:
+    @pytest.mark.asyncio
+    async def test_it_serves_only_once_listening(self, db: DatabaseFixture) -> None:
+        engine, _ = db
+        cache = _cache()
+
+        async with auth_cache_lifespan(engine, cache):
+            assert not cache.serving
+            await _until(lambda: cache.serving)
+
+        assert not cache.serving
+
+    @pytest.mark.asyncio
+    async def test_a_committed_invalidation_reaches_every_listener(
+        self, db: DatabaseFixture
+    ) -> None:
+        engine, session_factory = db
+        here, there = _cache(), _cache()
+
+        async with auth_cache_lifespan(engine, there):
+            await _until(lambda: there.serving)
+            there.remember_credential("cache-user-1", _credential("bob"), stamp=there.stamp())
+            async with session_factory() as session:
+                await here.forget_subject(session, "cache-user-1")
+                await session.commit()
+
+            await _until(lambda: there.credential("cache-user-1") is None)
+
+    @pytest.mark.asyncio
+    async def test_a_rolled_back_invalidation_is_never_heard(self, db: DatabaseFixture) -> None:
+        engine, session_factory = db
+        here, there = _cache(), _cache()
+
+        async with auth_cache_lifespan(engine, there):
+            await _until(lambda: there.serving)
+            there.remember_credential("cache-user-2", _credential("bob"), stamp=there.stamp())
+            async with session_factory() as session:
+                await here.forget_subject(session, "cache-user-2")
+                await session.rollback()
+            # A committed marker behind it: once that is heard, the rollback would have been too.
+            there.remember_credential("cache-user-3", _credential("ann"), stamp=there.stamp())
+            async with session_factory() as session:
+                await here.forget_subject(session, "cache-user-3")
+                await session.commit()
+            await _until(lambda: there.credential("cache-user-3") is None)
+
+            assert there.credential("cache-user-2") == _credential("bob")
+
+    @pytest.mark.asyncio
+    async def test_without_a_cache_there_is_nothing_to_listen_for(
+        self, db: DatabaseFixture
+    ) -> None:
+        engine, _ = db
+
+        async with auth_cache_lifespan(engine, None):
+            pass
@@ -9,6 +9,7 @@ from backstop_mcp.config import AuthConfig
 from backstop_mcp.db import (
     AuthorizationCode,
     LoginAttempt,
+    LoginFailureBucket,
     OAuthClient,
     OAuthToken,
     PendingAuthorization,
@@ -328,6 +329,46 @@ class TestPurgeLoginAttempts:
         assert await self._remaining(session_factory, username) == 1
 
 
+class TestPurgeLoginFailureBuckets:
+    """The throttle's counters age out on the same schedule as the audit rows."""
+
+    @staticmethod
+    async def _seed(
+        session_factory: async_sessionmaker[AsyncSession], username: str, *, age: timedelta
+    ) -> None:
+        async with transaction(session_factory) as session:
+            session.add(
+                LoginFailureBucket(
+                    username=username, bucket_start=datetime.now(UTC) - age, failures=3
+                )
+            )
+
+    @staticmethod
+    async def _remaining(session_factory: async_sessionmaker[AsyncSession], username: str) -> int:
+        async with read_session(session_factory) as session:
+            result = await session.execute(
+                select(LoginFailureBucket).where(LoginFailureBucket.username == username)
+            )
+            return len(result.scalars().all())
+
+    @pytest.mark.asyncio
+    async def test_drops_only_buckets_older_than_two_windows(self, db: DatabaseFixture) -> None:
+        _, session_factory = db
+        username = "cleanup-buckets"
+        window = AUTH_CONFIG.login_attempt_window
+        await self._seed(session_factory, username, age=2 * window + timedelta(minutes=1))
+        await self._seed(session_factory, username, age=timedelta(minutes=1))
+
+        await purge_expired_auth_rows(
+            session_factory,
+            token_retention=AUTH_CONFIG.token_retention,
+            login_attempt_window=window,
+            unused_client_retention=AUTH_CONFIG.unused_client_retention,
+        )
+
+        assert await self._remaining(session_factory, username) == 1
+
+
 class TestPurgeUnreferencedClients:
     """Dynamic client registration is open, so `oauth_clients` is the one table an
     unauthenticated caller can grow directly — and nothing used to remove a row from it."""
@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 import pytest
 from cryptography.fernet import Fernet
 from mcp.server.auth.provider import AccessToken
@@ -5,6 +7,7 @@ from pydantic import SecretStr
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from backstop_mcp.backstop_client import BackstopCredentialSecret
+from backstop_mcp.features.auth.auth_cache import AuthCache
 from backstop_mcp.features.auth.context import BackstopAuthContext, NotConnectedError
 from backstop_mcp.features.auth.credential_store import save_credential
 
@@ -20,15 +23,32 @@ def _access_token(subject: str | None) -> AccessToken:
 
 
 def _auth(
-    session_factory: async_sessionmaker[AsyncSession], key: bytes | None = None
+    session_factory: async_sessionmaker[AsyncSession],
+    key: bytes | None = None,
+    *,
+    cache: AuthCache | None = None,
 ) -> BackstopAuthContext:
     return BackstopAuthContext(
         session_factory=session_factory,
         encryption_key=key if key is not None else Fernet.generate_key(),
         revoke_tokens_for_subject=_noop_revoke,
+        cache=cache,
     )
 
 
+async def _store(
+    session_factory: async_sessionmaker[AsyncSession], user_id: str, api_token: str, key: bytes
+) -> None:
+    async with session_factory() as session:
+        await save_credential(
+            session,
+            user_id,
+            BackstopCredentialSecret(username=f"{user_id}.bob", api_token=SecretStr(api_token)),
+            key,
+        )
+        await session.commit()
+
+
 class TestCurrentCredential:
     """`BackstopAuthContext` is injected, not installed globally — each test builds its own."""
 
@@ -93,6 +113,54 @@ class TestCurrentCredential:
             await _auth(session_factory).current_credential()
 
 
+class TestCachedCredential:
+    """With an `AuthCache`, a repeat call neither reads the row nor decrypts it again."""
+
+    @pytest.mark.asyncio
+    async def test_a_repeat_call_is_served_from_the_cache(
+        self, db: DatabaseFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _, session_factory = db
+        key = Fernet.generate_key()
+        auth = _auth(
+            session_factory, key, cache=AuthCache(ttl=timedelta(minutes=1), max_entries=10)
+        )
+        await _store(session_factory, "user-context-cache-1", "token-1", key)
+        monkeypatch.setattr(
+            "backstop_mcp.features.auth.context.get_access_token",
+            lambda: _access_token("user-context-cache-1"),
+        )
+        _ = await auth.current_credential()
+
+        # Changed behind the provider's back, so only a fresh read would see it.
+        await _store(session_factory, "user-context-cache-1", "token-2", key)
+
+        credential = await auth.current_credential()
+        assert credential.api_token.get_secret_value() == "token-1"
+
+    @pytest.mark.asyncio
+    async def test_forgetting_the_subject_reads_the_new_credential(
+        self, db: DatabaseFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _, session_factory = db
+        key = Fernet.generate_key()
+        cache = AuthCache(ttl=timedelta(minutes=1), max_entries=10)
+        auth = _auth(session_factory, key, cache=cache)
+        await _store(session_factory, "user-context-cache-2", "token-1", key)
+        monkeypatch.setattr(
+            "backstop_mcp.features.auth.context.get_access_token",
+            lambda: _access_token("user-context-cache-2"),
+        )
+        _ = await auth.current_credential()
+
+        await _store(session_factory, "user-context-cache-2", "token-2", key)
+        async with session_factory() as session:
+            await cache.forget_subject(session, "user-context-cache-2")
+
+        credential = await auth.current_credential()
+        assert credential.api_token.get_secret_value() == "token-2"
+
+
 class TestRevokeCurrentSubjectTokens:
     @pytest.mark.asyncio
     async def test_revokes_for_the_active_subject(
@@ -1,4 +1,6 @@
 import asyncio
+import hashlib
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from urllib.parse import parse_qs, urlparse
 
@@ -7,7 +9,7 @@ from cryptography.fernet import Fernet
 from mcp.server.auth.provider import AuthorizationParams, TokenError
 from mcp.shared.auth import OAuthClientInformationFull, OAuthToken
 from pydantic import AnyUrl
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from starlette.requests import Request
 
@@ -16,6 +18,7 @@ from backstop_mcp.db import AuthorizationCode as AuthorizationCodeRow
 from backstop_mcp.db import BackstopCredential, PendingAuthorization
 from backstop_mcp.db import LoginAttempt as LoginAttemptRow
 from backstop_mcp.db import OAuthToken as OAuthTokenRow
+from backstop_mcp.features.auth.auth_cache import AuthCache, auth_cache_lifespan
 from backstop_mcp.features.auth.login_csrf import csrf_cookie_name
 from backstop_mcp.features.auth.provider import BackstopOAuthProvider
 from backstop_mcp.features.auth.throttle import (
@@ -31,7 +34,10 @@ _REDIRECT_URI = "https://client.example/callback"
 
 
 def _make_provider(
-    db: DatabaseFixture, *, throttle: ThrottleConfig | None = None
+    db: DatabaseFixture,
+    *,
+    throttle: ThrottleConfig | None = None,
+    auth_cache: AuthCache | None = None,
 ) -> BackstopOAuthProvider:
     _, factory = db
     # The provider verifies submitted credentials through the shared client factory, so it
@@ -47,6 +53,7 @@ def _make_provider(
         throttle=throttle
         if throttle is not None
         else ThrottleConfig(max_attempts=1_000_000, window=timedelta(minutes=15)),
+        auth_cache=auth_cache,
     )
 
 
@@ -576,6 +583,10 @@ class TestLoginThrottling:
                 select(LoginAttemptRow).where(LoginAttemptRow.username == username)
             )
             assert result.scalars().all() == []
+        assert (
+            await count_recent_failures(session_factory, username, window=timedelta(minutes=15))
+            == 0
+        )
 
 
 class TestTokenLifecycle:
@@ -857,6 +868,132 @@ class TestTokenLifecycle:
         assert await provider.load_access_token(tokens.access_token) is None
 
 
+def _auth_cache() -> AuthCache:
+    return AuthCache(ttl=timedelta(minutes=1), max_entries=100)
+
+
+async def _issue_tokens(
+    provider: BackstopOAuthProvider, client_id: str, username: str
+) -> tuple[OAuthClientInformationFull, OAuthToken, str]:
+    """Register, log in and exchange the code: the client, its token pair, and the subject."""
+    client_info = await _register_client(provider, client_id)
+    redirect_url = await provider.authorize(client_info, _authorization_params())
+    request_id = parse_qs(urlparse(redirect_url).query)["request_id"][0]
+    login_response = await provider.handle_login_post(
+        _login_post_request(request_id, username, "token-cache")
+    )
+    code = parse_qs(urlparse(login_response.headers["location"]).query)["code"][0]
+    auth_code = await provider.load_authorization_code(client_info, code)
+    assert auth_code is not None and auth_code.subject is not None
+    tokens = await provider.exchange_authorization_code(client_info, auth_code)
+    return client_info, tokens, auth_code.subject
+
+
+async def _revoke_behind_the_providers_back(db: DatabaseFixture, access_token: str) -> None:
+    """Revoke a row directly, so only a database read can notice."""
+    _, factory = db
+    async with factory() as session:
+        _ = await session.execute(
+            update(OAuthTokenRow)
+            .where(OAuthTokenRow.access_token_hash == _hashed(access_token))
+            .values(revoked_at=datetime.now(UTC))
+        )
+        await session.commit()
+
+
+class TestAccessTokenCache:
+    """With an `AuthCache`, a repeat load skips Postgres — and every revoke is still seen."""
+
+    @pytest.mark.asyncio
+    async def test_a_repeat_load_is_served_without_a_read(
+        self, db: DatabaseFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(BackstopClientFactory, "verify_credential", _always_valid)
+        provider = _make_provider(db, auth_cache=_auth_cache())
+        _, tokens, _ = await _issue_tokens(provider, "provider-cache-1", "pv-cache.anna")
+        assert await provider.load_access_token(tokens.access_token) is not None
+
+        await _revoke_behind_the_providers_back(db, tokens.access_token)
+
+        assert await provider.load_access_token(tokens.access_token) is not None
+
+    @pytest.mark.asyncio
+    async def test_revoke_token_drops_the_cached_token(
+        self, db: DatabaseFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(BackstopClientFactory, "verify_credential", _always_valid)
+        provider = _make_provider(db, auth_cache=_auth_cache())
+        _, tokens, _ = await _issue_tokens(provider, "provider-cache-2", "pv-cache.ben")
+        access_info = await provider.load_access_token(tokens.access_token)
+        assert access_info is not None
+
+        await provider.revoke_token(access_info)
+
+        assert await provider.load_access_token(tokens.access_token) is None
+
+    @pytest.mark.asyncio
+    async def test_revoking_a_subject_drops_its_cached_tokens(
+        self, db: DatabaseFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(BackstopClientFactory, "verify_credential", _always_valid)
+        provider = _make_provider(db, auth_cache=_auth_cache())
+        _, tokens, subject = await _issue_tokens(provider, "provider-cache-3", "pv-cache.cleo")
+        assert await provider.load_access_token(tokens.access_token) is not None
+
+        await provider.revoke_all_tokens_for_subject(subject)
+
+        assert await provider.load_access_token(tokens.access_token) is None
+
+    @pytest.mark.asyncio
+    async def test_a_refresh_rotation_drops_the_old_access_token(
+        self, db: DatabaseFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(BackstopClientFactory, "verify_credential", _always_valid)
+        provider = _make_provider(db, auth_cache=_auth_cache())
+        client_info, tokens, _ = await _issue_tokens(provider, "provider-cache-4", "pv-cache.dara")
+        assert tokens.refresh_token is not None
+        assert await provider.load_access_token(tokens.access_token) is not None
+
+        refresh = await provider.load_refresh_token(client_info, tokens.refresh_token)
+        assert refresh is not None
+        rotated = await provider.exchange_refresh_token(client_info, refresh, [])
+
+        assert await provider.load_access_token(tokens.access_token) is None
+        assert await provider.load_access_token(rotated.access_token) is not None
+
+    @pytest.mark.asyncio
+    async def test_another_replicas_revoke_arrives_through_notify(
+        self, db: DatabaseFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(BackstopClientFactory, "verify_credential", _always_valid)
+        engine, _ = db
+        here_cache, there_cache = _auth_cache(), _auth_cache()
+        here = _make_provider(db, auth_cache=here_cache)
+        there = _make_provider(db, auth_cache=there_cache)
+
+        async with auth_cache_lifespan(engine, there_cache):
+            _, tokens, _ = await _issue_tokens(here, "provider-cache-5", "pv-cache.eli")
+            await _until(lambda: there_cache.serving)
+            access_info = await there.load_access_token(tokens.access_token)
+            assert access_info is not None
+            assert there_cache.access_token(_hashed(tokens.access_token)) is not None
+
+            await here.revoke_token(access_info)
+            await _until(lambda: there_cache.access_token(_hashed(tokens.access_token)) is None)
+
+            assert await there.load_access_token(tokens.access_token) is None
+
+
+def _hashed(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+async def _until(condition: Callable[[], bool]) -> None:
+    async with asyncio.timeout(5):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
 async def _always_valid(_self: BackstopClientFactory, _username: str, _api_token: str) -> bool:
     return True
 
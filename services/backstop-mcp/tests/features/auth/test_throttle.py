@@ -8,15 +8,17 @@ budget is spent.
 from datetime import UTC, datetime, timedelta
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
-from backstop_mcp.db import LoginAttempt, transaction
+from backstop_mcp.db import LoginAttempt, LoginFailureBucket, read_session, transaction
 from backstop_mcp.features.auth.throttle import (
     MAX_USERNAME_LENGTH,
     ThrottleConfig,
     clear_failures,
     count_recent_failures,
+    failure_bucket,
     is_throttled,
     record_failure,
 )
@@ -26,22 +28,39 @@ type DatabaseFixture = tuple[AsyncEngine, async_sessionmaker[AsyncSession]]
 _WINDOW = timedelta(minutes=15)
 
 
-def _config(max_attempts: int = 3, window: timedelta = _WINDOW) -> ThrottleConfig:
-    return ThrottleConfig(max_attempts=max_attempts, window=window)
+def _config(
+    max_attempts: int = 3, window: timedelta = _WINDOW, *, audit_attempts: bool = False
+) -> ThrottleConfig:
+    return ThrottleConfig(max_attempts=max_attempts, window=window, audit_attempts=audit_attempts)
 
 
 async def _seed_attempt(
     session_factory: async_sessionmaker[AsyncSession], username: str, *, age: timedelta
 ) -> None:
-    """Record one failed attempt `age` in the past, to place it inside or outside the window."""
+    """Count one failed attempt `age` in the past, to place it inside or outside the window."""
     async with transaction(session_factory) as session:
-        session.add(
-            LoginAttempt(
+        _ = await session.execute(
+            pg_insert(LoginFailureBucket)
+            .values(
                 username=username,
-                source_ip=None,
-                attempted_at=datetime.now(UTC) - age,
+                bucket_start=failure_bucket(datetime.now(UTC) - age, _WINDOW),
+                failures=1,
             )
+            .on_conflict_do_update(
+                index_elements=[LoginFailureBucket.username, LoginFailureBucket.bucket_start],
+                set_={"failures": LoginFailureBucket.failures + 1},
+            )
+        )
+
+
+async def _bucket_rows(session_factory: async_sessionmaker[AsyncSession], username: str) -> int:
+    async with read_session(session_factory) as session:
+        result = await session.execute(
+            select(func.count())
+            .select_from(LoginFailureBucket)
+            .where(LoginFailureBucket.username == username)
         )
+        return result.scalar_one()
 
 
 class TestFailureCounting:
@@ -51,8 +70,8 @@ class TestFailureCounting:
         username = "throttle-window-user"
         await _seed_attempt(session_factory, username, age=timedelta(minutes=1))
         await _seed_attempt(session_factory, username, age=timedelta(minutes=14))
-        # Outside a 15-minute window, so it must not count toward the limit.
-        await _seed_attempt(session_factory, username, age=timedelta(minutes=16))
+        # Outside a 15-minute window and the 90-second slice it slides by, so it must not count.
+        await _seed_attempt(session_factory, username, age=timedelta(minutes=17))
 
         assert await count_recent_failures(session_factory, username, window=_WINDOW) == 2
 
@@ -77,11 +96,11 @@ class TestThrottleDecision:
         config = _config(max_attempts=3)
 
         for _ in range(2):
-            await record_failure(session_factory, username, source_ip="10.0.0.1")
+            await record_failure(session_factory, username, source_ip="10.0.0.1", config=config)
         # Two failures against a limit of three: the third attempt is still allowed.
         assert not await is_throttled(session_factory, username, config=config)
 
-        await record_failure(session_factory, username, source_ip="10.0.0.1")
+        await record_failure(session_factory, username, source_ip="10.0.0.1", config=config)
         assert await is_throttled(session_factory, username, config=config)
 
     @pytest.mark.asyncio
@@ -89,8 +108,8 @@ class TestThrottleDecision:
         _, session_factory = db
         username = "throttle-cleared-user"
         config = _config(max_attempts=2)
-        await record_failure(session_factory, username, source_ip=None)
-        await record_failure(session_factory, username, source_ip=None)
+        await record_failure(session_factory, username, source_ip=None, config=config)
+        await record_failure(session_factory, username, source_ip=None, config=config)
         assert await is_throttled(session_factory, username, config=config)
 
         await clear_failures(session_factory, username)
@@ -100,8 +119,12 @@ class TestThrottleDecision:
     @pytest.mark.asyncio
     async def test_clearing_one_username_leaves_others_alone(self, db: DatabaseFixture) -> None:
         _, session_factory = db
-        await record_failure(session_factory, "throttle-keep-user", source_ip=None)
-        await record_failure(session_factory, "throttle-drop-user", source_ip=None)
+        await record_failure(
+            session_factory, "throttle-keep-user", source_ip=None, config=_config()
+        )
+        await record_failure(
+            session_factory, "throttle-drop-user", source_ip=None, config=_config()
+        )
 
         await clear_failures(session_factory, "throttle-drop-user")
 
@@ -123,12 +146,40 @@ class TestThrottleDecision:
 
         assert not await is_throttled(session_factory, username, config=config)
 
+    @pytest.mark.asyncio
+    async def test_a_burst_is_one_counter_not_a_row_per_attempt(self, db: DatabaseFixture) -> None:
+        """What keeps the check O(1) per submit, however many attempts an attack makes."""
+        _, session_factory = db
+        username = "throttle-burst-user"
+        config = _config(max_attempts=1_000)
+
+        for _ in range(25):
+            await record_failure(session_factory, username, source_ip=None, config=config)
+
+        assert await count_recent_failures(session_factory, username, window=_WINDOW) == 25
+        # One slice, or two if the burst straddled a boundary.
+        assert await _bucket_rows(session_factory, username) <= 2
+
+    @pytest.mark.asyncio
+    async def test_the_audit_trail_is_off_by_default(self, db: DatabaseFixture) -> None:
+        _, session_factory = db
+        username = "throttle-unaudited-user"
+        await record_failure(session_factory, username, source_ip="203.0.113.7", config=_config())
+
+        async with session_factory() as session:
+            result = await session.execute(
+                select(LoginAttempt).where(LoginAttempt.username == username)
+            )
+            assert result.scalars().all() == []
+
     @pytest.mark.asyncio
     async def test_records_the_source_ip_for_diagnosis(self, db: DatabaseFixture) -> None:
         """Stored but never enforced on — see `throttle.py` on why IP is not the key."""
         _, session_factory = db
         username = "throttle-ip-user"
-        await record_failure(session_factory, username, source_ip="203.0.113.7")
+        await record_failure(
+            session_factory, username, source_ip="203.0.113.7", config=_config(audit_attempts=True)
+        )
 
         async with session_factory() as session:
             result = await session.execute(
@@ -137,6 +188,19 @@ class TestThrottleDecision:
             assert result.scalars().all() == ["203.0.113.7"]
 
 
+class TestFailureBucket:
+    def test_buckets_slice_the_window_in_ten(self) -> None:
+        at = datetime(2026, 1, 1, 12, 5, 59, tzinfo=UTC)
+
+        # 90-second slices of the 15-minute window.
+        assert failure_bucket(at, _WINDOW) == datetime(2026, 1, 1, 12, 4, 30, tzinfo=UTC)
+
+    def test_a_boundary_starts_its_own_bucket(self) -> None:
+        at = datetime(2026, 1, 1, 12, 4, 30, tzinfo=UTC)
+
+        assert failure_bucket(at, _WINDOW) == at
+
+
 class TestUsernameLengthGuard:
     def test_the_cap_admits_a_full_length_email(self) -> None:
         """320 = 64-char local part + '@' + 255-char domain, the practical email maximum."""
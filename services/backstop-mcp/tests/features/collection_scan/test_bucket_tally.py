@@ -0,0 +1,87 @@
+from collections.abc import Iterable
+from typing import Literal
+
+from backstop_mcp.features.collection_scan import BucketKey, BucketTally, MeasureValue
+
+type _By = Literal["word", "letter"]
+
+
+def _buckets(row: str, group_by: _By) -> Iterable[BucketKey]:
+    if group_by == "word":
+        return ((row, row.upper()),)
+    return tuple((letter, letter) for letter in sorted(set(row)))
+
+
+def _lengths(row: str) -> Iterable[MeasureValue]:
+    # Rows ending in "!" are counted in another currency.
+    yield ("length", "EUR" if row.endswith("!") else "USD", float(len(row)))
+
+
+class TestBucketTally:
+    def test_counts_each_dimension_in_one_pass(self) -> None:
+        tally: BucketTally[str, _By] = BucketTally(("word", "letter"), buckets=_buckets)
+
+        tally.add(["ab", "b"])
+        tally.add(["ab"])
+
+        assert tally.rows_counted == 3
+        assert [(bucket.key, bucket.label, bucket.count) for bucket in tally.buckets("word")] == [
+            ("ab", "AB", 2),
+            ("b", "B", 1),
+        ]
+        # A row counts toward every key its dimension gives it.
+        assert [(bucket.key, bucket.count) for bucket in tally.buckets("letter")] == [
+            ("b", 3),
+            ("a", 2),
+        ]
+
+    def test_ties_are_broken_by_label_not_by_arrival(self) -> None:
+        forwards: BucketTally[str, _By] = BucketTally(("word",), buckets=_buckets)
+        backwards: BucketTally[str, _By] = BucketTally(("word",), buckets=_buckets)
+
+        forwards.add(["x", "y"])
+        backwards.add(["y", "x"])
+
+        assert forwards.buckets("word") == backwards.buckets("word")
+        assert [bucket.label for bucket in forwards.buckets("word")] == ["X", "Y"]
+
+    def test_breakdowns_follow_the_order_asked_and_a_repeat_counts_once(self) -> None:
+        tally: BucketTally[str, _By] = BucketTally(("letter", "word", "letter"), buckets=_buckets)
+
+        tally.add(["a"])
+
+        assert tally.groupings == (("letter",), ("word",))
+        assert [breakdown.group_by for breakdown in tally.breakdowns()] == ["letter", "word"]
+        assert tally.breakdowns()[0].buckets[0].count == 1
+
+    def test_a_tuple_is_one_compound_key_per_combination(self) -> None:
+        tally: BucketTally[str, _By] = BucketTally((("word", "letter"),), buckets=_buckets)
+
+        tally.add(["ab", "b"])
+
+        buckets = tally.buckets(("word", "letter"))
+        assert [(bucket.key, bucket.label, bucket.count) for bucket in buckets] == [
+            ("ab|a", "AB × a", 1),
+            ("ab|b", "AB × b", 1),
+            ("b|b", "B × b", 1),
+        ]
+        assert [breakdown.group_by for breakdown in tally.breakdowns()] == ["word×letter"]
+
+    def test_measures_are_kept_per_bucket_and_never_across_currencies(self) -> None:
+        tally: BucketTally[str, _By] = BucketTally(("word",), buckets=_buckets, measures=_lengths)
+
+        tally.add(["abc", "abc", "abc!", "x"])
+
+        by_key = {bucket.key: bucket.measures for bucket in tally.buckets("word")}
+        (usd,) = by_key["abc"]
+        assert (usd.currency, usd.count, usd.total, usd.mean) == ("USD", 2, 6.0, 3.0)
+        (eur,) = by_key["abc!"]
+        assert (eur.currency, eur.minimum, eur.maximum) == ("EUR", 4.0, 4.0)
+        assert by_key["x"][0].total == 1.0
+
+    def test_no_measures_means_none_are_published(self) -> None:
+        tally: BucketTally[str, _By] = BucketTally(("word",), buckets=_buckets)
+
+        tally.add(["a"])
+
+        assert tally.buckets("word")[0].measures == ()
@@ -5,6 +5,7 @@ this service among the others in `tests/features/test_cached_catalog.py`.
 """
 
 from collections.abc import AsyncGenerator, Callable, Sequence
+from datetime import UTC, datetime
 from typing import Protocol, cast
 
 import httpx
@@ -233,3 +234,201 @@ class TestCatalogGet:
         assert definition.group_name == "Status"
         assert definition.layout_name == "Organization"
         assert definition.resource_type == "organizations"
+
+
+class _Schema:
+    """A mocked `/custom-field-definitions` that answers full walks, count probes and deltas.
+
+    One route with one side effect, so the three request shapes cannot shadow each other. A
+    definition in `changed` is stamped as modified now; every other one long ago.
+    """
+
+    _LONG_AGO: str = "2020-01-01T00:00:00Z"
+
+    def __init__(self, base_url: str, names: dict[str, str]) -> None:
+        self.names: dict[str, str] = dict(names)
+        self.changed: set[str] = set()
+        self.delta_status: int = 200
+        self.filter_ignored: bool = False
+        self.route: respx.Route = respx.get(f"{base_url}/custom-field-definitions").mock(
+            side_effect=self._answer
+        )
+
+    def _answer(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        if params.get("page[limit]") == "1":
+            ids = sorted(self.names)[:1]
+        elif "filter[modifiedTimestamp][gt]" in params and not self.filter_ignored:
+            if self.delta_status != 200:
+                return httpx.Response(self.delta_status, json={"errors": [{"detail": "bad"}]})
+            ids = sorted(self.changed)
+        else:
+            ids = sorted(self.names)
+        now = datetime.now(UTC).isoformat()
+        return httpx.Response(
+            200,
+            json={
+                "data": [
+                    resource(
+                        definition_id,
+                        "custom-field-definitions",
+                        name=self.names[definition_id],
+                        entityType="OrganizationBean",
+                        modifiedTimestamp=now if definition_id in self.changed else self._LONG_AGO,
+                    )
+                    for definition_id in ids
+                ],
+                "meta": {"totalResourceCount": len(self.names)},
+                "links": {"next": None},
+            },
+        )
+
+    def requests(self) -> list[str]:
+        """Each request as `full`, `count` or `delta`, in order."""
+        kinds: list[str] = []
+        for call in cast("Sequence[_RecordedCall]", self.route.calls):
+            params = call.request.url.params
+            if params.get("page[limit]") == "1":
+                kinds.append("count")
+            elif "filter[modifiedTimestamp][gt]" in params:
+                kinds.append("delta")
+            else:
+                kinds.append("full")
+        return kinds
+
+
+class _StubCounter:
+    def __init__(self) -> None:
+        self.sources: list[object] = []
+
+    def add(self, amount: int, attributes: dict[str, object] | None = None) -> None:
+        _ = amount
+        self.sources.append((attributes or {}).get("source"))
+
+
+class TestDeltaRefresh:
+    @pytest.fixture
+    def loads(self, monkeypatch: pytest.MonkeyPatch) -> _StubCounter:
+        counter = _StubCounter()
+        monkeypatch.setattr(
+            "backstop_mcp.features.custom_fields.custom_fields_service.CUSTOM_FIELD_SCHEMA_LOADS",
+            counter,
+        )
+        return counter
+
+    @staticmethod
+    def _delta_service() -> CustomFieldsService:
+        return CustomFieldsService.with_ttl_minutes(ttl_minutes=60, delta_refresh=True)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_refresh_merges_only_what_changed(
+        self, clients: ClientBuilder, loads: _StubCounter
+    ) -> None:
+        base_url = f"{BASE_URL}/delta-merge"
+        schema = _Schema(base_url, {"1": "Grade", "2": "Region"})
+        service = self._delta_service()
+        _ = await service.get(clients(base_url))
+        schema.names.update({"2": "Territory", "3": "Tier"})
+        schema.changed = {"2", "3"}
+
+        definitions, _status = await service.get(clients(base_url), refresh=True)
+
+        assert {key: entry.name for key, entry in definitions.items()} == {
+            "1": "Grade",
+            "2": "Territory",
+            "3": "Tier",
+        }
+        assert schema.requests() == ["full", "count", "delta"]
+        assert loads.sources == ["backstop", "delta"]
+        delta_params = schema.route.calls.last.request.url.params
+        assert delta_params["filter[modifiedTimestamp][gt]"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_deletion_the_delta_cannot_see_forces_a_full_walk(
+        self, clients: ClientBuilder, loads: _StubCounter
+    ) -> None:
+        base_url = f"{BASE_URL}/delta-deletion"
+        schema = _Schema(base_url, {"1": "Grade", "2": "Region"})
+        service = self._delta_service()
+        _ = await service.get(clients(base_url))
+        del schema.names["2"]
+
+        definitions, _status = await service.get(clients(base_url), refresh=True)
+
+        assert list(definitions) == ["1"]
+        assert schema.requests() == ["full", "count", "delta", "full"]
+        assert loads.sources == ["backstop", "backstop"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_rejected_filter_turns_deltas_off(
+        self, clients: ClientBuilder, loads: _StubCounter
+    ) -> None:
+        base_url = f"{BASE_URL}/delta-rejected"
+        schema = _Schema(base_url, {"1": "Grade"})
+        schema.delta_status = 400
+        service = self._delta_service()
+        _ = await service.get(clients(base_url))
+
+        _ = await service.get(clients(base_url), refresh=True)
+        _ = await service.get(clients(base_url), refresh=True)
+
+        assert schema.requests() == ["full", "count", "delta", "full", "full"]
+        assert loads.sources == ["backstop", "backstop", "backstop"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_an_ignored_filter_turns_deltas_off(
+        self, clients: ClientBuilder, loads: _StubCounter
+    ) -> None:
+        base_url = f"{BASE_URL}/delta-ignored"
+        schema = _Schema(base_url, {"1": "Grade", "2": "Region"})
+        schema.filter_ignored = True
+        service = self._delta_service()
+        _ = await service.get(clients(base_url))
+        schema.changed = {"2"}
+
+        _ = await service.get(clients(base_url), refresh=True)
+        _ = await service.get(clients(base_url), refresh=True)
+
+        assert schema.requests() == ["full", "count", "delta", "full", "full"]
+        assert loads.sources == ["backstop", "backstop", "backstop"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_delta_that_touched_every_definition_keeps_deltas_on(
+        self, clients: ClientBuilder, loads: _StubCounter
+    ) -> None:
+        base_url = f"{BASE_URL}/delta-all-touched"
+        schema = _Schema(base_url, {"1": "Grade", "2": "Region"})
+        service = self._delta_service()
+        _ = await service.get(clients(base_url))
+        schema.names.update({"1": "Band", "2": "Territory"})
+        schema.changed = {"1", "2"}
+
+        definitions, _status = await service.get(clients(base_url), refresh=True)
+        _ = await service.get(clients(base_url), refresh=True)
+
+        assert {key: entry.name for key, entry in definitions.items()} == {
+            "1": "Band",
+            "2": "Territory",
+        }
+        assert schema.requests() == ["full", "count", "delta", "count", "delta"]
+        assert loads.sources == ["backstop", "delta", "delta"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_deltas_are_off_by_default(
+        self, clients: ClientBuilder, loads: _StubCounter
+    ) -> None:
+        base_url = f"{BASE_URL}/delta-off"
+        schema = _Schema(base_url, {"1": "Grade"})
+        service = _service()
+
+        _ = await service.get(clients(base_url))
+        _ = await service.get(clients(base_url), refresh=True)
+
+        assert schema.requests() == ["full", "full"]
+        assert loads.sources == ["backstop", "backstop"]
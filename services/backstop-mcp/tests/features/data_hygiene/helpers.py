@@ -48,6 +48,7 @@ def person_org(
     end_date: str | None = None,
     start_date: str | None = None,
     created_timestamp: str | None = None,
+    modified_timestamp: str | None = None,
     source_type: str | None = "people",
     source_id: str | None = "p1",
     dest_type: str | None = "organizations",
@@ -72,6 +73,8 @@ def person_org(
         attributes["startDate"] = start_date
     if created_timestamp is not None:
         attributes["createdTimestamp"] = created_timestamp
+    if modified_timestamp is not None:
+        attributes["modifiedTimestamp"] = modified_timestamp
     relationships: dict[str, object] = {}
     if type_id is not None:
         relationships["entityRelationshipType"] = {
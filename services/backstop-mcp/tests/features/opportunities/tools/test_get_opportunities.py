@@ -129,6 +129,8 @@ class TestGetOpportunities:
                 party_id=_ORG_ID,
                 client=client,
                 opportunity_stages=opportunity_stages_service(),
+                party_resolutions=None,
+                party_names=None,
             ),
             OpportunitiesResolvedResponse,
         )
@@ -165,6 +167,8 @@ class TestGetOpportunities:
                 search="Koch",
                 client=client,
                 opportunity_stages=opportunity_stages_service(),
+                party_resolutions=None,
+                party_names=None,
             ),
             OpportunitiesResolvedResponse,
         )
@@ -190,6 +194,8 @@ class TestGetOpportunities:
                 party_id="p9",
                 client=client,
                 opportunity_stages=opportunity_stages_service(),
+                party_resolutions=None,
+                party_names=None,
             ),
             OpportunitiesResolvedResponse,
         )
@@ -215,6 +221,8 @@ class TestGetOpportunities:
                 party_id="c7",
                 client=client,
                 opportunity_stages=opportunity_stages_service(),
+                party_resolutions=None,
+                party_names=None,
             ),
             OpportunitiesResolvedResponse,
         )
@@ -243,6 +251,8 @@ class TestGetOpportunities:
                 status="open",
                 client=client,
                 opportunity_stages=opportunity_stages_service(),
+                party_resolutions=None,
+                party_names=None,
             ),
             OpportunitiesResolvedResponse,
         )
@@ -279,6 +289,8 @@ class TestGetOpportunities:
                 party_id=_ORG_ID,
                 client=client,
                 opportunity_stages=opportunity_stages_service(),
+                party_resolutions=None,
+                party_names=None,
             )
         )
 
@@ -307,6 +319,8 @@ class TestGetOpportunities:
                 search="NoSuchOrg",
                 client=client,
                 opportunity_stages=opportunity_stages_service(),
+                party_resolutions=None,
+                party_names=None,
             ),
             GetOpportunitiesResponse,
         )
@@ -335,6 +349,8 @@ class TestGetOpportunities:
                 search="Koch",
                 client=client,
                 opportunity_stages=opportunity_stages_service(),
+                party_resolutions=None,
+                party_names=None,
             ),
             GetOpportunitiesResponse,
         )
@@ -361,6 +377,8 @@ class TestGetOpportunities:
                 party_id=_ORG_ID,
                 client=client,
                 opportunity_stages=opportunity_stages_service(),
+                party_resolutions=None,
+                party_names=None,
             )
 
     @pytest.mark.asyncio
@@ -379,6 +397,8 @@ class TestGetOpportunities:
                 party_id=_ORG_ID,
                 client=client,
                 opportunity_stages=opportunity_stages_service(),
+                party_resolutions=None,
+                party_names=None,
             )
 
     def test_docstring_says_there_is_no_cursor_and_names_previous_stage(self) -> None:
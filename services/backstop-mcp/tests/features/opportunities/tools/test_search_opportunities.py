@@ -228,6 +228,131 @@ class TestSearchOpportunities:
         assert buckets[0]["label"] == "IDD"
         assert buckets[0]["count"] == 2
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_several_group_bys_are_counted_page_by_page_in_one_walk(self) -> None:
+        base_url = tenant("so-agg-multi")
+        walk = respx.get(f"{base_url}/opportunities", params={"page[offset]": "0"}).mock(
+            return_value=_page(
+                _deal("1", name="a", stage_id="42482"),
+                _deal("2", name="b", stage_id="42482", is_open=False),
+                included=_included(),
+                total=3,
+            )
+        )
+        later = respx.get(f"{base_url}/opportunities", params={"page[offset]": "2"}).mock(
+            return_value=_page(
+                _deal("3", name="c", stage_id="42478", product_id=None),
+                included=_included() + [resource("42478", "opportunity-stages", name="Prospect")],
+                total=3,
+            )
+        )
+        respx.get(f"{base_url}/opportunity-stages").mock(return_value=_stages_page())
+
+        async with tool_client(base_url) as client:
+            result = tool_model(
+                await search_opportunities(
+                    is_open=True,
+                    mode="aggregate",
+                    group_by=["stage", "product"],
+                    client=client,
+                    opportunity_stages=opportunity_stages_service(),
+                ),
+                SearchOpportunitiesResolvedResponse,
+            )
+
+        assert walk.call_count == 1
+        assert later.call_count == 1
+        assert result.rows == ()
+        assert result.coverage.rows_scanned == 3
+        assert [breakdown.group_by for breakdown in result.breakdowns] == ["stage", "product"]
+        stage, product = result.breakdowns
+        assert [(bucket.label, bucket.count) for bucket in stage.buckets] == [
+            ("IDD", 1),
+            ("Prospect", 1),
+        ]
+        assert [(bucket.label, bucket.count) for bucket in product.buckets] == [
+            ("(unattributed)", 1),
+            ("CATS Select", 1),
+        ]
+        # The first dimension is also the flat `aggregates`, as for a single `group_by`.
+        assert result.aggregates == stage.buckets
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_pipeline_value_by_stage_per_quarter_is_one_walk(self) -> None:
+        base_url = tenant("so-agg-value")
+        route = respx.get(f"{base_url}/opportunities").mock(
+            return_value=_page(
+                _deal(
+                    "1",
+                    name="a",
+                    stage_id="42482",
+                    weightedValue=100.0,
+                    currencyCode="USD",
+                    expectedInvestmentDate="2026-02-01",
+                ),
+                _deal(
+                    "2",
+                    name="b",
+                    stage_id="42482",
+                    weightedValue=300.0,
+                    currencyCode="USD",
+                    expectedInvestmentDate="2026-03-15",
+                ),
+                _deal(
+                    "3",
+                    name="c",
+                    stage_id="42482",
+                    weightedValue=50.0,
+                    currencyCode="EUR",
+                    expectedInvestmentDate="2026-03-20",
+                ),
+                _deal("4", name="d", stage_id="42482", expectedInvestmentDate="2026-07-01"),
+                included=_included(),
+                total=4,
+            )
+        )
+        respx.get(f"{base_url}/opportunity-stages").mock(return_value=_stages_page())
+
+        async with tool_client(base_url) as client:
+            result = tool_model(
+                await search_opportunities(
+                    mode="aggregate",
+                    group_by=["stage", "quarter"],
+                    cross_group_by=True,
+                    measures=["weighted_value"],
+                    client=client,
+                    opportunity_stages=opportunity_stages_service(),
+                ),
+                SearchOpportunitiesResolvedResponse,
+            )
+
+        assert route.call_count == 1
+        assert result.breakdowns == ()
+        by_label = {bucket.label: bucket for bucket in result.aggregates}
+        assert set(by_label) == {"IDD × 2026-Q1", "IDD × 2026-Q3"}
+        first_quarter = by_label["IDD × 2026-Q1"]
+        assert first_quarter.count == 3
+        assert first_quarter.measures is not None
+        totals = {
+            measure.currency: (measure.total, measure.mean, measure.maximum)
+            for measure in first_quarter.measures
+        }
+        assert totals == {"EUR": (50.0, 50.0, 50.0), "USD": (400.0, 200.0, 300.0)}
+        # A deal with no amount is counted but adds nothing to the statistics.
+        assert by_label["IDD × 2026-Q3"].measures is None
+
+    @pytest.mark.asyncio
+    async def test_measures_in_rows_mode_are_refused(self) -> None:
+        async with tool_client(tenant("so-rows-measures")) as client:
+            with pytest.raises(ValueError, match="aggregate mode"):
+                _ = await search_opportunities(
+                    measures=["requested_amount"],
+                    client=client,
+                    opportunity_stages=opportunity_stages_service(),
+                )
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_unreadable_row_is_dropped_not_raised(self) -> None:
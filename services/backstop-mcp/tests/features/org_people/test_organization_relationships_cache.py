@@ -0,0 +1,322 @@
+"""An organization's `entityRelationships` walk kept per user, and checked before it is reused.
+
+What matters is that an unchanged organization is listed without walking its relationships
+again, that an edit, an addition or a deletion is never answered from the kept walk, that one
+user's walk is never another's, and that a modified-time filter Backstop does not honour turns
+the cache off instead of serving what it can no longer check.
+"""
+
+from collections.abc import AsyncGenerator
+from datetime import timedelta
+
+import httpx
+import pytest
+import respx
+
+from backstop_mcp.backstop_client import BackstopApiError, BackstopClient
+from backstop_mcp.features.org_people import (
+    OrganizationRelationshipsCache,
+    OrgPeopleListingDto,
+    fetch_people_for_organization,
+)
+from tests.features.data_hygiene.helpers import EMPLOYEE_TYPE, person_org, relationship_types
+from tests.helpers import (
+    BASE_URL,
+    build_employment_index_factory,
+    client_factory,
+    credential,
+    recorded_requests,
+)
+
+_ORG = "o1"
+_ER_URL = f"{BASE_URL}/organizations/{_ORG}/entityRelationships"
+_EMPLOYEES_URL = f"{BASE_URL}/organizations/{_ORG}/employees"
+_MODIFIED_SINCE = "filter[modifiedTimestamp][gt]"
+_LOOKUPS_COUNTER = (
+    "backstop_mcp.features.org_people.organization_relationships_cache."
+    + "ORG_RELATIONSHIPS_CACHE_LOOKUPS"
+)
+
+
+class _StubCounter:
+    """Stands in for `org_relationships_cache_lookups_total`, capturing each add's outcome."""
+
+    def __init__(self) -> None:
+        self.outcomes: list[object] = []
+
+    def add(self, amount: int, attributes: dict[str, object] | None = None) -> None:
+        assert amount == 1
+        self.outcomes.append((attributes or {})["outcome"])
+
+
+class _Organization:
+    """The organization's `entityRelationships`: the full walk and the one-row version reads.
+
+    `modified_since` is what a filtered read returns; `ignore_filter` answers it as if the
+    filter were not there, and `reject_filter` with a 400.
+    """
+
+    def __init__(self, *rows: dict[str, object]) -> None:
+        self.rows: list[dict[str, object]] = list(rows)
+        self.modified_since: list[dict[str, object]] = []
+        self.ignore_filter: bool = False
+        self.reject_filter: bool = False
+        self.walks: int = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        if "include" in params:
+            self.walks += 1
+            return httpx.Response(
+                200, json={"data": self.rows, "included": relationship_types(EMPLOYEE_TYPE)}
+            )
+        assert params["page[limit]"] == "1"
+        assert params["fields[entity-relationships]"] == "modifiedTimestamp"
+        rows = self.rows
+        if _MODIFIED_SINCE in params and not self.ignore_filter:
+            if self.reject_filter:
+                return httpx.Response(400, json={"errors": [{"detail": "unknown filter"}]})
+            rows = self.modified_since
+        return httpx.Response(
+            200, json={"data": rows[:1], "meta": {"totalResourceCount": len(rows)}}
+        )
+
+
+def _former(er_id: str, *, person_id: str, modified: str | None) -> dict[str, object]:
+    return person_org(
+        er_id,
+        source_type="organizations",
+        source_id=_ORG,
+        dest_type="people",
+        dest_id=person_id,
+        end_date="2020-01-31",
+        modified_timestamp=modified,
+    )
+
+
+def _cache(*, ttl: timedelta = timedelta(minutes=5)) -> OrganizationRelationshipsCache:
+    return OrganizationRelationshipsCache(max_entries=100, ttl=ttl)
+
+
+def _mock(organization: _Organization) -> None:
+    _ = respx.get(_EMPLOYEES_URL).mock(
+        return_value=httpx.Response(200, json={"data": [], "included": []})
+    )
+    _ = respx.get(_ER_URL).mock(side_effect=organization)
+
+
+async def _list(
+    client: BackstopClient, cache: OrganizationRelationshipsCache
+) -> OrgPeopleListingDto:
+    return await fetch_people_for_organization(
+        client,
+        build_employment_index_factory(),
+        organization_id=_ORG,
+        include_former=True,
+        relationships_cache=cache,
+    )
+
+
+@pytest.fixture
+async def other_user() -> AsyncGenerator[BackstopClient]:
+    factory = client_factory()
+    yield factory.for_credential(credential("alice.jones"))
+    await factory.aclose()
+
+
+class TestOrganizationRelationshipsCache:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_an_unchanged_organization_is_not_walked_again(
+        self, client: BackstopClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        lookups = _StubCounter()
+        monkeypatch.setattr(_LOOKUPS_COUNTER, lookups)
+        organization = _Organization(
+            _former("er-1", person_id="p1", modified="2026-03-01T09:30:00Z")
+        )
+        _mock(organization)
+        cache = _cache()
+
+        first = await _list(client, cache)
+        second = await _list(client, cache)
+
+        assert second == first
+        assert [row.employment.person_id for row in second.people] == ["p1"]
+        assert organization.walks == 1
+        assert lookups.outcomes == ["miss", "hit"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_the_version_read_filters_after_the_newest_relationship_kept(
+        self, client: BackstopClient
+    ) -> None:
+        organization = _Organization(
+            _former("er-1", person_id="p1", modified="2026-03-01T09:30:00Z"),
+            _former("er-2", person_id="p2", modified="2026-03-04T10:00:00Z"),
+        )
+        _mock(organization)
+        cache = _cache()
+
+        _ = await _list(client, cache)
+        _ = await _list(client, cache)
+
+        filtered = [
+            request.url.params[_MODIFIED_SINCE]
+            for request in recorded_requests(respx.calls)
+            if _MODIFIED_SINCE in request.url.params
+        ]
+        assert filtered == ["2026-03-04T10:00:00+00:00"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_an_edited_relationship_is_walked_again(
+        self, client: BackstopClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        lookups = _StubCounter()
+        monkeypatch.setattr(_LOOKUPS_COUNTER, lookups)
+        organization = _Organization(
+            _former("er-1", person_id="p1", modified="2026-03-01T09:30:00Z")
+        )
+        _mock(organization)
+        cache = _cache()
+        _ = await _list(client, cache)
+
+        organization.rows = [person_org("er-1", source_id="p1", modified_timestamp="2026-03-02")]
+        organization.modified_since = organization.rows
+        listing = await _list(client, cache)
+
+        assert organization.walks == 2
+        assert [row.employment.status for row in listing.people] == ["current"]
+        assert lookups.outcomes == ["miss", "changed"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_an_edit_to_the_only_relationship_keeps_the_cache_on(
+        self, client: BackstopClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        lookups = _StubCounter()
+        monkeypatch.setattr(_LOOKUPS_COUNTER, lookups)
+        organization = _Organization(
+            _former("er-1", person_id="p1", modified="2026-03-01T09:30:00Z")
+        )
+        _mock(organization)
+        cache = _cache()
+        _ = await _list(client, cache)
+
+        organization.rows = [_former("er-1", person_id="p1", modified="2026-03-02T10:00:00Z")]
+        organization.modified_since = organization.rows
+        _ = await _list(client, cache)
+        organization.modified_since = []
+        _ = await _list(client, cache)
+
+        assert organization.walks == 2
+        assert lookups.outcomes == ["miss", "changed", "hit"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_deleted_relationship_is_walked_again(self, client: BackstopClient) -> None:
+        organization = _Organization(
+            _former("er-1", person_id="p1", modified="2026-03-01T09:30:00Z"),
+            _former("er-2", person_id="p2", modified="2026-03-01T09:30:00Z"),
+        )
+        _mock(organization)
+        cache = _cache()
+        _ = await _list(client, cache)
+
+        organization.rows = organization.rows[:1]
+        listing = await _list(client, cache)
+
+        assert organization.walks == 2
+        assert [row.employment.person_id for row in listing.people] == ["p1"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_one_users_walk_is_never_anothers(
+        self, client: BackstopClient, other_user: BackstopClient
+    ) -> None:
+        organization = _Organization(
+            _former("er-1", person_id="p1", modified="2026-03-01T09:30:00Z")
+        )
+        _mock(organization)
+        cache = _cache()
+
+        _ = await _list(client, cache)
+        _ = await _list(other_user, cache)
+
+        assert organization.walks == 2
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_walk_past_the_ttl_is_not_reused(self, client: BackstopClient) -> None:
+        organization = _Organization(
+            _former("er-1", person_id="p1", modified="2026-03-01T09:30:00Z")
+        )
+        _mock(organization)
+        cache = _cache(ttl=timedelta(0))
+
+        _ = await _list(client, cache)
+        _ = await _list(client, cache)
+
+        assert organization.walks == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_relationships_without_timestamps_are_not_kept(
+        self, client: BackstopClient
+    ) -> None:
+        organization = _Organization(_former("er-1", person_id="p1", modified=None))
+        _mock(organization)
+        cache = _cache()
+
+        _ = await _list(client, cache)
+
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_an_ignored_filter_turns_the_cache_off(self, client: BackstopClient) -> None:
+        organization = _Organization(
+            _former("er-1", person_id="p1", modified="2026-03-01T09:30:00Z")
+        )
+        organization.ignore_filter = True
+        _mock(organization)
+        cache = _cache()
+
+        for _ in range(3):
+            _ = await _list(client, cache)
+
+        assert organization.walks == 3
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_rejected_filter_turns_the_cache_off(self, client: BackstopClient) -> None:
+        organization = _Organization(
+            _former("er-1", person_id="p1", modified="2026-03-01T09:30:00Z")
+        )
+        organization.reject_filter = True
+        _mock(organization)
+        cache = _cache()
+
+        listings = [await _list(client, cache) for _ in range(3)]
+
+        assert organization.walks == 3
+        assert len(cache) == 0
+        assert listings[0] == listings[2]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_caller_who_lost_access_gets_the_error(self, client: BackstopClient) -> None:
+        organization = _Organization(
+            _former("er-1", person_id="p1", modified="2026-03-01T09:30:00Z")
+        )
+        _mock(organization)
+        cache = _cache()
+        _ = await _list(client, cache)
+
+        _ = respx.get(_ER_URL).mock(return_value=httpx.Response(404))
+
+        with pytest.raises(BackstopApiError):
+            _ = await _list(client, cache)
@@ -134,7 +134,12 @@ class TestGetOrganization:
 
         result = tool_model(
             await get_organization(
-                ctx_never_elicit(), search="Capstone", client=client, custom_fields=_catalog()
+                ctx_never_elicit(),
+                search="Capstone",
+                client=client,
+                custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             ),
             OrganizationResolvedResponse,
         )
@@ -179,7 +184,12 @@ class TestGetOrganization:
 
         result = tool_model(
             await get_organization(
-                ctx_decline(), search="Capstone", client=client, custom_fields=_catalog()
+                ctx_decline(),
+                search="Capstone",
+                client=client,
+                custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             ),
             PartyAmbiguousResponse,
         )
@@ -233,6 +243,8 @@ class TestGetOrganization:
                 search_type="organizations",
                 client=client,
                 custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             ),
             OrganizationResolvedResponse,
         )
@@ -268,7 +280,12 @@ class TestGetOrganization:
 
         result = tool_model(
             await get_organization(
-                ctx_never_elicit(), party_id="trusted 9", client=client, custom_fields=_catalog()
+                ctx_never_elicit(),
+                party_id="trusted 9",
+                client=client,
+                custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             ),
             OrganizationResolvedResponse,
         )
@@ -284,7 +301,12 @@ class TestGetOrganization:
 
         with pytest.raises(ValueError, match="must not contain '/'"):
             await get_organization(
-                ctx_never_elicit(), party_id="../admin", client=client, custom_fields=_catalog()
+                ctx_never_elicit(),
+                party_id="../admin",
+                client=client,
+                custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             )
 
     @pytest.mark.asyncio
@@ -304,7 +326,12 @@ class TestGetOrganization:
 
         with pytest.raises(BackstopResponseSchemaError) as exc_info:
             await get_organization(
-                ctx_never_elicit(), party_id="trusted-9", client=client, custom_fields=_catalog()
+                ctx_never_elicit(),
+                party_id="trusted-9",
+                client=client,
+                custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             )
 
         assert exc_info.value.path == "/organizations/trusted-9"
@@ -326,7 +353,12 @@ class TestGetOrganization:
 
         result = tool_model_union(
             await get_organization(
-                ctx_never_elicit(), search="Capstoen", client=client, custom_fields=_catalog()
+                ctx_never_elicit(),
+                search="Capstoen",
+                client=client,
+                custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             ),
             GetOrganizationResponse,
         )
@@ -366,7 +398,12 @@ class TestGetOrganization:
 
         result = tool_model(
             await get_organization(
-                ctx_never_elicit(), search="Capstone", client=client, custom_fields=_catalog()
+                ctx_never_elicit(),
+                search="Capstone",
+                client=client,
+                custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             ),
             OrganizationResolvedResponse,
         )
@@ -411,6 +448,8 @@ class TestGetOrganizationIncludes:
                 include=["locations"],
                 client=client,
                 custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             ),
             OrganizationResolvedResponse,
         )
@@ -456,6 +495,8 @@ class TestGetOrganizationIncludes:
                 include=["email_addresses"],
                 client=client,
                 custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             )
         )
 
@@ -512,6 +553,8 @@ class TestGetOrganizationIncludes:
                 include=["primary_contact"],
                 client=client,
                 custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             ),
             OrganizationResolvedResponse,
         )
@@ -574,6 +617,8 @@ class TestGetOrganizationIncludes:
                 include=["representative"],
                 client=client,
                 custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             ),
             OrganizationResolvedResponse,
         )
@@ -609,6 +654,8 @@ class TestGetOrganizationIncludes:
                 party_id="o42",
                 client=client,
                 custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             )
         )
 
@@ -633,6 +680,8 @@ class TestGetOrganizationIncludes:
                 include=["locations", "email_addresses", "primary_contact", "representative"],
                 client=client,
                 custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             )
         )
 
@@ -663,6 +712,8 @@ class TestGetOrganizationIncludes:
                 include=["primary_contact"],
                 client=client,
                 custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             )
         )
 
@@ -702,6 +753,8 @@ class TestGetOrganizationOmitsNullsFromTheWire:
                 party_id="o42",
                 client=client,
                 custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             )
         )
 
@@ -737,6 +790,8 @@ class TestGetOrganizationOmitsNullsFromTheWire:
                 party_id="o42",
                 client=client,
                 custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             )
         )
 
@@ -764,6 +819,8 @@ class TestGetOrganizationOmitsNullsFromTheWire:
                 party_id="o42",
                 client=client,
                 custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             )
         )
 
@@ -788,6 +845,8 @@ class TestGetOrganizationOmitsNullsFromTheWire:
                 party_id="o42",
                 client=client,
                 custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             )
         )
 
@@ -935,6 +994,8 @@ async def _organization_custom_fields(
             custom_field_group_ids=custom_field_group_ids,
             custom_field_definition_ids=cast(Sequence[CoercedId], custom_field_definition_ids),
             custom_field_names=custom_field_names,
+            party_resolutions=None,
+            party_names=None,
         )
     )
     return [object_dict(item) for item in object_list(payload["custom_field_values"])]
@@ -1163,6 +1224,8 @@ class TestGetOrganizationCustomFields:
                 party_id="o42",
                 client=client,
                 custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             )
         )
 
@@ -1194,6 +1257,8 @@ class TestGetOrganizationCustomFields:
                 party_id="o42",
                 client=client,
                 custom_fields=_catalog(),
+                party_resolutions=None,
+                party_names=None,
             ),
             OrganizationResolvedResponse,
         )
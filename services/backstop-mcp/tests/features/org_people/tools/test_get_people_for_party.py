@@ -71,6 +71,9 @@ class TestGetPeopleForParty:
                 party_id=_ORG,
                 client=client,
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
+                relationships_cache=None,
             ),
             OrgPeopleResolvedResponse,
         )
@@ -102,6 +105,9 @@ class TestGetPeopleForParty:
                 party_id=_ORG,
                 client=client,
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
+                relationships_cache=None,
             ),
             OrgPeopleResolvedResponse,
         )
@@ -139,6 +145,9 @@ class TestGetPeopleForParty:
                 party_id=_ORG,
                 client=client,
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
+                relationships_cache=None,
             ),
             OrgPeopleResolvedResponse,
         )
@@ -164,6 +173,9 @@ class TestGetPeopleForParty:
                 search="No Such Org",
                 client=client,
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
+                relationships_cache=None,
             ),
             NotFoundResponse,
         )
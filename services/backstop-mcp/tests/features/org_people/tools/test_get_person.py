@@ -138,6 +138,8 @@ class TestGetPerson:
                 client=client,
                 custom_fields=_catalog(),
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
             ),
             PersonResolvedResponse,
         )
@@ -193,6 +195,8 @@ class TestGetPerson:
                 client=client,
                 custom_fields=_catalog(),
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
             ),
             PersonResolvedResponse,
         )
@@ -239,6 +243,8 @@ class TestGetPerson:
                 client=client,
                 custom_fields=_catalog(),
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
             ),
             PersonResolvedResponse,
         )
@@ -281,6 +287,8 @@ class TestGetPerson:
                 client=client,
                 custom_fields=_catalog(),
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
             ),
             PersonResolvedResponse,
         )
@@ -315,6 +323,8 @@ class TestGetPerson:
                 client=client,
                 custom_fields=_catalog(),
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
             ),
             PartyAmbiguousResponse,
         )
@@ -367,6 +377,8 @@ class TestGetPerson:
                 client=client,
                 custom_fields=_catalog(),
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
             ),
             PersonResolvedResponse,
         )
@@ -409,6 +421,8 @@ class TestGetPersonIncludes:
                 client=client,
                 custom_fields=_catalog(),
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
             ),
             PersonResolvedResponse,
         )
@@ -465,6 +479,8 @@ class TestGetPersonIncludes:
                 client=client,
                 custom_fields=_catalog(),
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
             ),
             PersonResolvedResponse,
         )
@@ -497,6 +513,8 @@ class TestGetPersonIncludes:
                 client=client,
                 custom_fields=_catalog(),
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
             )
         )
 
@@ -561,6 +579,8 @@ class TestGetPersonIncludes:
                 client=client,
                 custom_fields=_catalog(),
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
             ),
             PersonResolvedResponse,
         )
@@ -612,6 +632,8 @@ class TestGetPersonOmitsNullsFromTheWire:
                 client=client,
                 custom_fields=_catalog(),
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
             )
         )
 
@@ -649,6 +671,8 @@ class TestGetPersonOmitsNullsFromTheWire:
                 client=client,
                 custom_fields=_catalog(),
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
             )
         )
 
@@ -676,6 +700,8 @@ class TestGetPersonOmitsNullsFromTheWire:
                 client=client,
                 custom_fields=_catalog(),
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
             )
         )
 
@@ -707,6 +733,8 @@ class TestGetPersonOmitsNullsFromTheWire:
                 client=client,
                 custom_fields=_catalog(),
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
             )
         )
 
@@ -766,6 +794,8 @@ class TestGetPersonCustomFields:
                 client=client,
                 custom_fields=_catalog(),
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
             )
         )
 
@@ -793,6 +823,8 @@ class TestGetPersonCustomFields:
                 client=client,
                 custom_fields=_catalog(),
                 employment_index_factory=_INDEX,
+                party_resolutions=None,
+                party_names=None,
             )
         )
         assert [
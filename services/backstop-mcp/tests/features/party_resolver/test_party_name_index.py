@@ -0,0 +1,460 @@
+"""The swept party-name index quick-search misses are answered from in place of `like`.
+
+What matters is that an index not yet complete costs no request beyond the `like` read it would
+have replaced, that a complete one answers a substring without that read, and that nothing the
+index holds reaches a caller unverified: a hit is re-read by id as that caller, and one they
+cannot read, or that no longer matches, is dropped in favour of the slow path.
+"""
+
+import asyncio
+from collections.abc import Sequence
+from datetime import timedelta
+from typing import Protocol, cast
+
+import httpx
+import pytest
+import respx
+
+from backstop_mcp.backstop_client import BackstopClient
+from backstop_mcp.features.party_resolver import (
+    PartyNameIndex,
+    ResolvedPartyDto,
+    resolve_party,
+)
+from backstop_mcp.features.resolution import Ambiguous, Resolved
+from tests.features.party_resolver.helpers import (
+    BASE_URL,
+    collection,
+    ctx_decline,
+    ctx_never_elicit,
+    resource,
+)
+
+
+class _RecordedCall(Protocol):
+    @property
+    def request(self) -> httpx.Request: ...
+
+
+_LOOKUPS_COUNTER = "backstop_mcp.features.party_resolver.party_name_index.PARTY_NAME_INDEX_LOOKUPS"
+
+
+class _StubCounter:
+    """Stands in for `party_name_index_lookups_total`, capturing each add's outcome."""
+
+    def __init__(self) -> None:
+        self.outcomes: list[object] = []
+
+    def add(self, amount: int, attributes: dict[str, object] | None = None) -> None:
+        assert amount == 1
+        self.outcomes.append((attributes or {})["outcome"])
+
+
+def _org(party_id: str, name: str) -> ResolvedPartyDto:
+    return ResolvedPartyDto(id=party_id, search_type="organizations", name=name)
+
+
+def _index(*, max_names: int = 100) -> PartyNameIndex:
+    return PartyNameIndex(max_names=max_names, sweep_interval=timedelta(hours=1))
+
+
+async def _swept(client: BackstopClient, *names: str, max_names: int = 100) -> PartyNameIndex:
+    """An index whose organizations sweep walked `names`, as `o1`, `o2`, ... in order."""
+    index = _index(max_names=max_names)
+    sweep = respx.get(f"{BASE_URL}/organizations").mock(
+        return_value=httpx.Response(
+            200,
+            json=collection(
+                *(
+                    resource(f"o{number}", "organizations", name=name)
+                    for number, name in enumerate(names, start=1)
+                )
+            ),
+        )
+    )
+    await index.sweep(client, "organizations")
+    # A test's own `/organizations` route takes this one over; it should count only its calls.
+    sweep.reset()
+    return index
+
+
+async def _sweeps_finished() -> None:
+    running = [
+        task for task in asyncio.all_tasks() if task.get_name().startswith("party_name_index.")
+    ]
+    _ = await asyncio.gather(*running, return_exceptions=True)
+
+
+def _ids(parties: tuple[ResolvedPartyDto, ...]) -> list[str]:
+    return [party.id for party in parties]
+
+
+def _name_document(party_id: str, name: str) -> httpx.Response:
+    return httpx.Response(200, json={"data": resource(party_id, "organizations", name=name)})
+
+
+class TestMatches:
+    def test_a_substring_matches_anywhere_in_the_name(self) -> None:
+        index = _index()
+        index.remember([_org("o1", "Capstone Dispersion"), _org("o2", "Dispersal Partners")])
+
+        assert _ids(index.matches("organizations", "dispersion")) == ["o1"]
+
+    def test_the_tightest_name_comes_first(self) -> None:
+        index = _index()
+        index.remember(
+            [_org("o1", "Dispersion Capital Partners Fund III"), _org("o2", "Capstone Dispersion")]
+        )
+
+        assert _ids(index.matches("organizations", "Dispersion")) == ["o2", "o1"]
+
+    def test_a_typo_is_a_near_miss(self) -> None:
+        index = _index()
+        index.remember([_org("o1", "Capstone Dispersion")])
+
+        assert _ids(index.matches("organizations", "Dispresion Capstone")) == []
+        assert _ids(index.matches("organizations", "Capstone Dispersoin")) == ["o1"]
+
+    def test_matches_are_per_search_type(self) -> None:
+        index = _index()
+        index.remember([ResolvedPartyDto(id="p1", search_type="people", name="Dispersion, Ann")])
+
+        assert index.matches("organizations", "Dispersion") == ()
+
+    def test_a_query_shorter_than_a_trigram_is_left_to_quick_search(self) -> None:
+        index = _index()
+        index.remember([_org("o1", "AB Capital")])
+
+        assert index.matches("organizations", "AB") == ()
+
+    def test_a_renamed_party_matches_only_its_new_name(self) -> None:
+        index = _index()
+        index.remember([_org("o1", "Capstone Dispersion")])
+        index.remember([_org("o1", "Capstone Holdings")])
+
+        assert index.matches("organizations", "Dispersion") == ()
+        assert len(index) == 1
+
+    def test_the_least_recently_seen_name_is_evicted(self) -> None:
+        index = _index(max_names=2)
+        index.remember([_org("o1", "Capstone Dispersion"), _org("o2", "Blackrock Dispersion")])
+        _ = index.matches("organizations", "Capstone")
+        index.remember([_org("o3", "Vanguard Dispersion")])
+
+        assert sorted(_ids(index.matches("organizations", "Dispersion"))) == ["o1", "o3"]
+
+
+class TestSweep:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_sweep_makes_its_search_type_complete(self, client: BackstopClient) -> None:
+        index = await _swept(client, "Capstone Dispersion")
+
+        assert index.complete("organizations")
+        assert not index.complete("people")
+        assert _ids(index.matches("organizations", "Dispersion")) == ["o1"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_sweep_past_max_names_leaves_the_index_incomplete(
+        self, client: BackstopClient
+    ) -> None:
+        index = await _swept(client, "Capstone", "Blackrock", "Vanguard", max_names=2)
+
+        assert not index.complete("organizations")
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_an_eviction_ends_completeness(self, client: BackstopClient) -> None:
+        index = await _swept(client, "Capstone Dispersion", max_names=1)
+
+        index.remember([_org("o9", "Vanguard Holdings")])
+
+        assert not index.complete("organizations")
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_sweep_older_than_the_interval_is_incomplete(
+        self, client: BackstopClient
+    ) -> None:
+        index = PartyNameIndex(max_names=100, sweep_interval=timedelta(0))
+        _ = respx.get(f"{BASE_URL}/organizations").mock(
+            return_value=httpx.Response(200, json=collection())
+        )
+
+        await index.sweep(client, "organizations")
+
+        assert not index.complete("organizations")
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_contacts_are_never_swept(self, client: BackstopClient) -> None:
+        index = _index()
+
+        index.start_sweep(client, "contacts")
+        await _sweeps_finished()
+
+        assert not index.complete("contacts")
+        assert len(respx.calls) == 0
+
+
+class TestResolveParty:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_an_incomplete_index_costs_no_request_and_starts_a_sweep(
+        self, client: BackstopClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        lookups = _StubCounter()
+        monkeypatch.setattr(_LOOKUPS_COUNTER, lookups)
+        index = _index()
+        index.remember([_org("o1", "Capstone Dispersion")])
+        _ = respx.get(f"{BASE_URL}/quick-search").mock(
+            return_value=httpx.Response(200, json=collection())
+        )
+        verify = respx.get(f"{BASE_URL}/organizations/o1").mock(
+            return_value=_name_document("o1", "Capstone Dispersion")
+        )
+        organizations = respx.get(f"{BASE_URL}/organizations").mock(
+            return_value=httpx.Response(
+                200,
+                json=collection(resource("o1", "organizations", name="Capstone Dispersion")),
+            )
+        )
+
+        result = await resolve_party(
+            ctx_never_elicit(),
+            client,
+            search_type="organizations",
+            search="Dispersion",
+            names=index,
+        )
+        await _sweeps_finished()
+
+        assert isinstance(result, Resolved)
+        assert verify.call_count == 0
+        assert lookups.outcomes == []
+        recorded = cast("Sequence[_RecordedCall]", organizations.calls)
+        like_params = ["filter[name][like]" in call.request.url.params for call in recorded]
+        assert sorted(like_params) == [False, True]
+        assert index.complete("organizations")
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_swept_substring_skips_the_like_read(
+        self, client: BackstopClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        lookups = _StubCounter()
+        monkeypatch.setattr(_LOOKUPS_COUNTER, lookups)
+        index = await _swept(client, "Capstone Dispersion")
+        _ = respx.get(f"{BASE_URL}/quick-search").mock(
+            return_value=httpx.Response(200, json=collection())
+        )
+        verify = respx.get(f"{BASE_URL}/organizations/o1").mock(
+            return_value=_name_document("o1", "Capstone Dispersion")
+        )
+        like = respx.get(f"{BASE_URL}/organizations").mock(
+            return_value=httpx.Response(200, json=collection())
+        )
+
+        result = await resolve_party(
+            ctx_never_elicit(),
+            client,
+            search_type="organizations",
+            search="dispersion",
+            names=index,
+        )
+
+        assert isinstance(result, Resolved)
+        assert result.value == _org("o1", "Capstone Dispersion")
+        assert verify.call_count == 1
+        assert like.call_count == 0
+        assert lookups.outcomes == ["hit"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_query_the_index_has_no_hit_for_goes_to_like_unverified(
+        self, client: BackstopClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        lookups = _StubCounter()
+        monkeypatch.setattr(_LOOKUPS_COUNTER, lookups)
+        index = await _swept(client, "Capstone Dispersion")
+        _ = respx.get(f"{BASE_URL}/quick-search").mock(
+            return_value=httpx.Response(200, json=collection())
+        )
+        like = respx.get(f"{BASE_URL}/organizations").mock(
+            return_value=httpx.Response(
+                200, json=collection(resource("o7", "organizations", name="New Vanguard Fund"))
+            )
+        )
+
+        result = await resolve_party(
+            ctx_never_elicit(),
+            client,
+            search_type="organizations",
+            search="Vanguard",
+            names=index,
+        )
+
+        assert isinstance(result, Resolved)
+        assert result.value.id == "o7"
+        assert like.call_count == 1
+        assert lookups.outcomes == ["miss"]
+        assert _ids(index.matches("organizations", "Vanguard")) == ["o7"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_hit_the_caller_cannot_read_falls_back_to_like(
+        self, client: BackstopClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        lookups = _StubCounter()
+        monkeypatch.setattr(_LOOKUPS_COUNTER, lookups)
+        index = await _swept(client, "Capstone Dispersion")
+        _ = respx.get(f"{BASE_URL}/quick-search").mock(
+            return_value=httpx.Response(200, json=collection())
+        )
+        _ = respx.get(f"{BASE_URL}/organizations/o1").mock(
+            return_value=httpx.Response(403, json={"errors": [{"detail": "forbidden"}]})
+        )
+        like = respx.get(f"{BASE_URL}/organizations").mock(
+            return_value=httpx.Response(200, json=collection())
+        )
+
+        result = await resolve_party(
+            ctx_never_elicit(),
+            client,
+            search_type="organizations",
+            search="Dispersion",
+            names=index,
+        )
+
+        assert not isinstance(result, Resolved)
+        assert like.call_count == 1
+        assert lookups.outcomes == ["unverified"]
+        # Forbidden to this caller is not gone for everyone: the name stays indexed.
+        assert len(index) == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_deleted_party_is_forgotten(self, client: BackstopClient) -> None:
+        index = await _swept(client, "Capstone Dispersion")
+        _ = respx.get(f"{BASE_URL}/quick-search").mock(
+            return_value=httpx.Response(200, json=collection())
+        )
+        _ = respx.get(f"{BASE_URL}/organizations/o1").mock(
+            return_value=httpx.Response(404, json={"errors": [{"detail": "not found"}]})
+        )
+        _ = respx.get(f"{BASE_URL}/organizations").mock(
+            return_value=httpx.Response(200, json=collection())
+        )
+
+        _ = await resolve_party(
+            ctx_never_elicit(),
+            client,
+            search_type="organizations",
+            search="Dispersion",
+            names=index,
+        )
+
+        assert len(index) == 0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_hit_renamed_since_is_not_offered(self, client: BackstopClient) -> None:
+        index = await _swept(client, "Capstone Dispersion")
+        _ = respx.get(f"{BASE_URL}/quick-search").mock(
+            return_value=httpx.Response(200, json=collection())
+        )
+        _ = respx.get(f"{BASE_URL}/organizations/o1").mock(
+            return_value=_name_document("o1", "Capstone Holdings")
+        )
+        like = respx.get(f"{BASE_URL}/organizations").mock(
+            return_value=httpx.Response(200, json=collection())
+        )
+
+        result = await resolve_party(
+            ctx_never_elicit(),
+            client,
+            search_type="organizations",
+            search="Dispersion",
+            names=index,
+        )
+
+        assert not isinstance(result, Resolved)
+        assert like.call_count == 1
+        assert index.matches("organizations", "Holdings") != ()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_several_verified_hits_are_ambiguous(self, client: BackstopClient) -> None:
+        index = await _swept(client, "Capstone Dispersion", "Dispersion Partners")
+        _ = respx.get(f"{BASE_URL}/quick-search").mock(
+            return_value=httpx.Response(200, json=collection())
+        )
+        _ = respx.get(f"{BASE_URL}/organizations/o1").mock(
+            return_value=_name_document("o1", "Capstone Dispersion")
+        )
+        _ = respx.get(f"{BASE_URL}/organizations/o2").mock(
+            return_value=_name_document("o2", "Dispersion Partners")
+        )
+        like = respx.get(f"{BASE_URL}/organizations").mock(
+            return_value=httpx.Response(200, json=collection())
+        )
+
+        result = await resolve_party(
+            ctx_decline(),
+            client,
+            search_type="organizations",
+            search="Dispersion",
+            names=index,
+        )
+
+        assert isinstance(result, Ambiguous)
+        assert sorted(candidate.value.id for candidate in result.candidates) == ["o1", "o2"]
+        assert like.call_count == 0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_lone_near_miss_is_ambiguous_not_resolved(self, client: BackstopClient) -> None:
+        index = await _swept(client, "Capstone Dispersion")
+        _ = respx.get(f"{BASE_URL}/quick-search").mock(
+            return_value=httpx.Response(200, json=collection())
+        )
+        _ = respx.get(f"{BASE_URL}/organizations/o1").mock(
+            return_value=_name_document("o1", "Capstone Dispersion")
+        )
+        like = respx.get(f"{BASE_URL}/organizations").mock(
+            return_value=httpx.Response(200, json=collection())
+        )
+
+        result = await resolve_party(
+            ctx_never_elicit(),
+            client,
+            search_type="organizations",
+            search="Capstone Dispersoin",
+            names=index,
+        )
+
+        assert isinstance(result, Ambiguous)
+        assert [candidate.value.id for candidate in result.candidates] == ["o1"]
+        assert like.call_count == 0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_search_results_feed_the_index(self, client: BackstopClient) -> None:
+        index = _index()
+        _ = respx.get(f"{BASE_URL}/quick-search").mock(
+            return_value=httpx.Response(
+                200,
+                json=collection(resource("o1", "organizations", name="Capstone Dispersion")),
+            )
+        )
+
+        _ = await resolve_party(
+            ctx_never_elicit(),
+            client,
+            search_type="organizations",
+            search="Capstone",
+            names=index,
+        )
+
+        assert _ids(index.matches("organizations", "Dispersion")) == ["o1"]
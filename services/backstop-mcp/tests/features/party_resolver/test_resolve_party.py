@@ -1,4 +1,5 @@
 import asyncio
+from datetime import timedelta
 
 import httpx
 import pytest
@@ -7,8 +8,13 @@ from fastmcp.server.elicitation import AcceptedElicitation
 from mcp.shared.exceptions import McpError
 from mcp.types import METHOD_NOT_FOUND, ClientCapabilities, ErrorData
 
-from backstop_mcp.backstop_client import BackstopClient, BackstopResponseSchemaError
+from backstop_mcp.backstop_client import (
+    BackstopApiError,
+    BackstopClient,
+    BackstopResponseSchemaError,
+)
 from backstop_mcp.features.party_resolver import (
+    PartyResolutionCache,
     PartyResolveItemDto,
     QuickSearchOptionsDto,
     ResolvedPartyDto,
@@ -40,6 +46,7 @@ from tests.features.party_resolver.helpers import (
     ctx_unsupported,
     resource,
 )
+from tests.helpers import client_factory, credential, recorded_params
 
 
 class TestTrustedPartyId:
@@ -912,6 +919,264 @@ class TestLikeFallback:
         assert like.call_count == 0
 
 
+# Where `PartyResolutionCache` bound the counter, which is what a stub has to replace.
+_LOOKUPS_COUNTER = (
+    "backstop_mcp.features.party_resolver.party_resolution_cache.PARTY_RESOLUTION_CACHE_LOOKUPS"
+)
+
+
+class _StubCounter:
+    """Stands in for `party_resolution_cache_lookups_total`, capturing each add's attributes."""
+
+    def __init__(self) -> None:
+        self.adds: list[dict[str, object]] = []
+
+    def add(self, amount: int, attributes: dict[str, object] | None = None) -> None:
+        assert amount == 1
+        self.adds.append(dict(attributes or {}))
+
+    def outcomes(self) -> list[object]:
+        return [attributes["outcome"] for attributes in self.adds]
+
+
+def _cache(
+    *, max_entries: int = 100, ttl: timedelta = timedelta(minutes=5)
+) -> PartyResolutionCache:
+    return PartyResolutionCache(max_entries=max_entries, ttl=ttl)
+
+
+class TestResolutionCache:
+    """A repeated search resolves without a round trip; only answers worth repeating are kept."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_repeated_search_is_answered_without_a_request(
+        self, client: BackstopClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        lookups = _StubCounter()
+        monkeypatch.setattr(_LOOKUPS_COUNTER, lookups)
+        quick = respx.get(f"{BASE_URL}/quick-search").mock(
+            return_value=httpx.Response(
+                200, json=collection(resource("o1", "organizations", name="Capstone"))
+            )
+        )
+        cache = _cache()
+
+        first = await resolve_party(
+            ctx_never_elicit(), client, search_type="organizations", search="Capstone", cache=cache
+        )
+        # Backstop's search ignores case and spacing, so the cache does too.
+        second = await resolve_party(
+            ctx_never_elicit(),
+            client,
+            search_type="organizations",
+            search=" capstone ",
+            cache=cache,
+        )
+
+        assert isinstance(first, Resolved)
+        assert second == first
+        assert quick.call_count == 1
+        assert lookups.outcomes() == ["miss", "hit"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_an_ambiguous_search_is_kept_and_echoes_the_callers_spelling(
+        self, client: BackstopClient
+    ) -> None:
+        quick = respx.get(f"{BASE_URL}/quick-search").mock(
+            return_value=httpx.Response(200, json=_two_org_hits())
+        )
+        cache = _cache()
+
+        _ = await resolve_party(
+            ctx_decline(), client, search_type="organizations", search="Capstone", cache=cache
+        )
+        again = await resolve_party(
+            ctx_decline(), client, search_type="organizations", search="CAPSTONE", cache=cache
+        )
+
+        assert isinstance(again, Ambiguous)
+        assert again.query == "CAPSTONE"
+        assert len(again.candidates) == 2
+        assert quick.call_count == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_not_found_is_searched_again(self, client: BackstopClient) -> None:
+        """The party may be created a minute later; a kept miss would hide it for the TTL."""
+        quick = respx.get(f"{BASE_URL}/quick-search").mock(
+            return_value=httpx.Response(200, json=collection())
+        )
+        like = respx.get(f"{BASE_URL}/organizations").mock(
+            return_value=httpx.Response(200, json=collection())
+        )
+        cache = _cache()
+
+        for _ in range(2):
+            result = await resolve_party(
+                ctx_never_elicit(),
+                client,
+                search_type="organizations",
+                search="New Co",
+                cache=cache,
+            )
+            assert isinstance(result, NotFound)
+
+        assert quick.call_count == 2
+        assert like.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_failed_search_is_not_kept(self, client: BackstopClient) -> None:
+        quick = respx.get(f"{BASE_URL}/quick-search").mock(
+            side_effect=[
+                httpx.Response(400, json={"errors": [{"detail": "bad request"}]}),
+                httpx.Response(
+                    200, json=collection(resource("o1", "organizations", name="Capstone"))
+                ),
+            ]
+        )
+        cache = _cache()
+
+        with pytest.raises(BackstopApiError):
+            _ = await resolve_party(
+                ctx_never_elicit(),
+                client,
+                search_type="organizations",
+                search="Capstone",
+                cache=cache,
+            )
+        result = await resolve_party(
+            ctx_never_elicit(), client, search_type="organizations", search="Capstone", cache=cache
+        )
+
+        assert isinstance(result, Resolved)
+        assert quick.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_one_users_answer_is_not_anothers(self) -> None:
+        """What a search finds depends on what the user may see."""
+        quick = respx.get(f"{BASE_URL}/quick-search").mock(
+            return_value=httpx.Response(
+                200, json=collection(resource("o1", "organizations", name="Capstone"))
+            )
+        )
+        cache = _cache()
+        factory = client_factory()
+        try:
+            for username in ("alice", "bob"):
+                _ = await resolve_party(
+                    ctx_never_elicit(),
+                    factory.for_credential(credential(username)),
+                    search_type="organizations",
+                    search="Capstone",
+                    cache=cache,
+                )
+        finally:
+            await factory.aclose()
+
+        assert quick.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_options_and_search_type_are_part_of_the_key(
+        self, client: BackstopClient
+    ) -> None:
+        quick = respx.get(f"{BASE_URL}/quick-search").mock(
+            return_value=httpx.Response(
+                200, json=collection(resource("o1", "organizations", name="Capstone"))
+            )
+        )
+        cache = _cache()
+
+        _ = await resolve_party(
+            ctx_never_elicit(), client, search_type="organizations", search="Capstone", cache=cache
+        )
+        _ = await resolve_party(
+            ctx_never_elicit(),
+            client,
+            search_type="organizations",
+            search="Capstone",
+            quick_search_options=QuickSearchOptionsDto(limit=25),
+            cache=cache,
+        )
+        _ = await resolve_party(
+            ctx_never_elicit(), client, search_type="contacts", search="Capstone", cache=cache
+        )
+
+        assert quick.call_count == 3
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_an_entry_past_its_ttl_is_searched_again(self, client: BackstopClient) -> None:
+        quick = respx.get(f"{BASE_URL}/quick-search").mock(
+            return_value=httpx.Response(
+                200, json=collection(resource("o1", "organizations", name="Capstone"))
+            )
+        )
+        cache = _cache(ttl=timedelta(milliseconds=10))
+
+        _ = await resolve_party(
+            ctx_never_elicit(), client, search_type="organizations", search="Capstone", cache=cache
+        )
+        await asyncio.sleep(0.05)
+        _ = await resolve_party(
+            ctx_never_elicit(), client, search_type="organizations", search="Capstone", cache=cache
+        )
+
+        assert quick.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_the_least_recently_used_entry_is_evicted_first(
+        self, client: BackstopClient
+    ) -> None:
+        quick = respx.get(f"{BASE_URL}/quick-search").mock(
+            return_value=httpx.Response(
+                200, json=collection(resource("o1", "organizations", name="Capstone"))
+            )
+        )
+        cache = _cache(max_entries=2)
+
+        for search in ("Capstone", "Blackrock", "Capstone", "Vanguard", "Capstone", "Blackrock"):
+            _ = await resolve_party(
+                ctx_never_elicit(), client, search_type="organizations", search=search, cache=cache
+            )
+
+        # Capstone stays warm throughout; Blackrock is evicted by Vanguard and searched again.
+        assert [params["filter[searchText][eq]"] for params in recorded_params(quick)] == [
+            "Capstone",
+            "Blackrock",
+            "Vanguard",
+            "Blackrock",
+        ]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_batch_items_share_the_cache(self, client: BackstopClient) -> None:
+        quick = respx.get(f"{BASE_URL}/quick-search").mock(
+            return_value=httpx.Response(
+                200, json=collection(resource("o1", "organizations", name="Capstone"))
+            )
+        )
+        cache = _cache()
+        _ = await resolve_party(
+            ctx_never_elicit(), client, search_type="organizations", search="Capstone", cache=cache
+        )
+
+        result = await resolve_parties(
+            client,
+            search_type="organizations",
+            items=[PartyResolveItemDto(search="Capstone"), PartyResolveItemDto(party_id="o9")],
+            cache=cache,
+        )
+
+        assert isinstance(result, BatchResolved)
+        assert quick.call_count == 1
+
+
 class TestBatchResolve:
     @pytest.mark.asyncio
     @respx.mock
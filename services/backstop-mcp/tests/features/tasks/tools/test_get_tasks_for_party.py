@@ -63,6 +63,8 @@ class TestGetTasksForParty:
                     search_type="organizations",
                     party_id=_ORG_ID,
                     client=client,
+                    party_resolutions=None,
+                    party_names=None,
                 ),
                 TasksResolvedResponse,
             )
@@ -98,6 +100,8 @@ class TestGetTasksForParty:
                     party_id=_ORG_ID,
                     status="open",
                     client=client,
+                    party_resolutions=None,
+                    party_names=None,
                 ),
                 TasksResolvedResponse,
             )
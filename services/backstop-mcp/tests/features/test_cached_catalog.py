@@ -610,6 +610,123 @@ class _StubHistogram:
         return [attributes[key] for _duration, attributes in self.records]
 
 
+class TestRevalidation:
+    """Past its TTL but inside the revalidate window, a catalog is served while it refreshes.
+
+    One catalog is enough, as for the telemetry below: the soft TTL lives in `CachedCatalog`.
+    """
+
+    _CATALOG: ClassVar[_CatalogUnderTest] = _CATALOGS[0]
+
+    def _service(self) -> _Catalog:
+        service = self._CATALOG.service()
+        service._revalidate_window = timedelta(minutes=60)  # pyright: ignore[reportPrivateUsage]
+        return service
+
+    def _route(self, base_url: str, release: asyncio.Event) -> respx.Route:
+        """The first walk answers at once; every later one waits for `release`."""
+        walks = 0
+
+        async def walk(_request: httpx.Request) -> httpx.Response:
+            nonlocal walks
+            walks += 1
+            if walks == 1:
+                return self._CATALOG.page(("old-1", "Held Entry"))
+            await release.wait()
+            return self._CATALOG.page(("new-1", "Fresh Entry"))
+
+        return respx.get(f"{base_url}{self._CATALOG.path}").mock(side_effect=walk)
+
+    @staticmethod
+    async def _settled(service: _Catalog) -> None:
+        task = service._revalidation  # pyright: ignore[reportPrivateUsage]
+        if task is not None:
+            _ = await asyncio.wait_for(asyncio.wait({task}), timeout=2)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_read_past_the_soft_ttl_is_answered_without_waiting_for_the_walk(
+        self, clients: ClientBuilder, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        histogram = _StubHistogram()
+        monkeypatch.setattr("backstop_mcp.features.cached_catalog.CATALOG_GET_DURATION", histogram)
+        base_url = self._CATALOG.base_url("revalidate-serves-held")
+        service = self._service()
+        release = asyncio.Event()
+        route = self._route(base_url, release)
+        await service.get(clients(base_url))
+        _age_past_ttl(service)
+
+        entries, status = await asyncio.wait_for(service.get(clients(base_url)), timeout=1)
+        release.set()
+        await self._settled(service)
+        refreshed, _status = await service.get(clients(base_url))
+
+        assert status == "ok"
+        assert _names(entries) == ["Held Entry"]
+        assert _names(refreshed) == ["Fresh Entry"]
+        assert route.call_count == 2
+        assert histogram.labels("served") == ["backstop", "revalidating", "cache"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_reads_during_one_revalidation_start_no_second_walk(
+        self, clients: ClientBuilder
+    ) -> None:
+        base_url = self._CATALOG.base_url("revalidate-once")
+        service = self._service()
+        release = asyncio.Event()
+        route = self._route(base_url, release)
+        await service.get(clients(base_url))
+        _age_past_ttl(service)
+
+        for _ in range(3):
+            _ = await service.get(clients(base_url))
+            await asyncio.sleep(0)
+        release.set()
+        await self._settled(service)
+
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_catalog_past_the_window_is_walked_inline(self, clients: ClientBuilder) -> None:
+        base_url = self._CATALOG.base_url("revalidate-hard-ttl")
+        service = self._service()
+        release = asyncio.Event()
+        release.set()
+        _ = self._route(base_url, release)
+        await service.get(clients(base_url))
+        past_window = datetime.now(UTC) - timedelta(hours=3)
+        service._freshness.mark(past_window)  # pyright: ignore[reportPrivateUsage]
+
+        entries, status = await service.get(clients(base_url))
+
+        assert status == "ok"
+        assert _names(entries) == ["Fresh Entry"]
+        assert service._revalidation is None  # pyright: ignore[reportPrivateUsage]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_aclose_cancels_a_running_revalidation_and_unpins_it(
+        self, clients: ClientBuilder
+    ) -> None:
+        base_url = self._CATALOG.base_url("revalidate-aclose")
+        service = self._service()
+        _ = self._route(base_url, asyncio.Event())
+        await service.get(clients(base_url))
+        _age_past_ttl(service)
+        _ = await service.get(clients(base_url))
+        task = service._revalidation  # pyright: ignore[reportPrivateUsage]
+        await asyncio.sleep(0.05)
+
+        await asyncio.wait_for(service.aclose(), timeout=2)
+
+        assert task is not None
+        assert task.cancelled()
+        assert service._in_flight is None  # pyright: ignore[reportPrivateUsage]
+
+
 class TestFetchTelemetry:
     """`catalog_fetch_duration_seconds` — the evidence for whether to re-enable caching.
 
@@ -12,6 +12,7 @@ from datetime import date
 from typing import Protocol, cast
 
 import httpx
+import pytest
 import respx
 from pydantic import SecretStr
 
@@ -19,6 +20,7 @@ from backstop_mcp.backstop_client import (
     BackstopClient,
     BackstopClientFactory,
     BackstopCredentialSecret,
+    RequestPriority,
 )
 from backstop_mcp.config import BackstopConfig
 from backstop_mcp.dependencies import retry_settings, transport_settings
@@ -159,6 +161,27 @@ def recorded_json_bodies(route: respx.Route) -> list[dict[str, object]]:
     return [json.loads(request.content) for request in recorded_requests(route.calls)]
 
 
+def recorded_lanes(
+    client: BackstopClient, monkeypatch: pytest.MonkeyPatch
+) -> list[RequestPriority]:
+    """The gate lane of every request `client` sends from here on, in the order sent."""
+    lanes: list[RequestPriority] = []
+    raw_request = client.raw_request
+
+    async def recording(
+        method: str,
+        path: str,
+        *,
+        json: dict[str, object] | None = None,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+    ) -> httpx.Response:
+        lanes.append(priority)
+        return await raw_request(method, path, json=json, priority=priority)
+
+    monkeypatch.setattr(client, "raw_request", recording)
+    return lanes
+
+
 def resource(id: str, type: str, name: str | None = None, **attrs: object) -> dict[str, object]:
     attributes: dict[str, object] = {**attrs}
     if name is not None:
@@ -7,6 +7,7 @@ testing `create_app` itself, which is where the wiring lives that is easiest to
 These tests drive the app through Starlette's `TestClient` so the lifespan actually runs.
 """
 
+import time
 from collections.abc import Iterator
 from typing import Protocol, cast
 
@@ -244,6 +245,28 @@ class TestRoutes:
         assert issuer.rstrip("/") == "https://backstop-mcp.example"
 
 
+class TestReadyWaitsForCatalogWarmup:
+    def test_ready_reports_the_warmup_once_it_has_ended(
+        self, postgres_container: PostgresContainer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Backstop is unreachable from here, so the budget is what ends warm-up — and `/ready`."""
+        _set_app_env(monkeypatch, postgres_container)
+        monkeypatch.setenv("BACKSTOP_CATALOG_WARMUP_USERNAME", "svc-warmup")
+        monkeypatch.setenv("BACKSTOP_CATALOG_WARMUP_API_TOKEN", "token")
+        monkeypatch.setenv("BACKSTOP_CATALOG_WARMUP_BUDGET_SECONDS", "0.2")
+        app = create_app()
+
+        with TestClient(app) as client:
+            deadline = time.monotonic() + 5
+            response = _get(client, "/ready")
+            while response.status_code == 503 and time.monotonic() < deadline:
+                time.sleep(0.05)
+                response = _get(client, "/ready")
+
+        assert response.status_code == 200
+        assert _checks(response.json()) == {"database": True, "catalogs_warmed": True}
+
+
 class TestReadyReportsDatabaseUnreachable:
     def test_ready_is_503_when_postgres_is_unreachable(
         self, monkeypatch: pytest.MonkeyPatch
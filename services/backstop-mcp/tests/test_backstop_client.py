@@ -1,7 +1,9 @@
 import asyncio
 import base64
+import json
 import time
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from typing import cast
 
 import httpx
@@ -19,11 +21,19 @@ from backstop_mcp.backstop_client import (
     BackstopUnreachableError,
     BackstopUntrustedUrlError,
     PageResult,
+    RequestPriority,
     SinglePage,
 )
 from backstop_mcp.config import BackstopConfig
+from backstop_mcp.dependencies import retry_settings, transport_settings
 from tests.helpers import BASE_URL as _BASE_URL
-from tests.helpers import client_factory, credential, recorded_params
+from tests.helpers import (
+    backstop_config,
+    client_factory,
+    credential,
+    recorded_params,
+    recorded_requests,
+)
 
 _BASIC_AUTH = "Basic " + base64.b64encode(b"bob.smith:p@55W0rd321!").decode()
 
@@ -331,6 +341,878 @@ class TestGateRegistryEviction:
             await built.aclose()
 
 
+class _RecordingSharedGate:
+    """A `SharedGate` that counts the leases it hands out, across every replica it stands for."""
+
+    backend: str = "fake"
+    held: int
+    max_held: int
+
+    def __init__(self) -> None:
+        self.leased: list[str] = []
+        self.held = 0
+        self.max_held = 0
+
+    @asynccontextmanager
+    async def lease(self, username: str) -> AsyncGenerator[None]:
+        self.leased.append(username)
+        self.held += 1
+        self.max_held = max(self.max_held, self.held)
+        try:
+            yield
+        finally:
+            self.held -= 1
+
+
+class TestSharedGate:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_every_request_takes_one_lease_inside_its_local_slot(self) -> None:
+        """The shared backend is asked only by requests that already hold a local slot.
+
+        So a replica never queues more than the cap's worth of waiters on the backend — a fan-out
+        past the limit waits on the local semaphore, where waiting is free.
+        """
+        tracker = _InFlightTracker()
+        respx.get(f"{_BASE_URL}/system-info").mock(side_effect=tracker.handle)
+        shared = _RecordingSharedGate()
+        config = backstop_config()
+        built = BackstopClientFactory(
+            transport_settings(config), retry_settings(config), shared_gate=shared
+        )
+        client = built.for_credential(_credential(username="shared.user"))
+
+        async def fan_out() -> list[httpx.Response]:
+            return await asyncio.gather(
+                *(client.raw_request("GET", "/system-info") for _ in range(8))
+            )
+
+        try:
+            task = asyncio.create_task(fan_out())
+            await asyncio.sleep(0.05)
+
+            assert shared.held == 5
+            assert len(shared.leased) == 5
+
+            tracker.release.set()
+            await task
+        finally:
+            await built.aclose()
+
+        assert shared.leased == ["shared.user"] * 8
+        assert shared.max_held == 5
+        assert shared.held == 0
+
+    def test_slots_are_counted_in_process_unless_a_shared_gate_is_supplied(self) -> None:
+        built = client_factory()
+
+        assert built._gates.backend == "memory"  # pyright: ignore[reportPrivateUsage]
+
+
+_CONCURRENCY_429 = {"errors": [{"detail": "Concurrency limit exceeded", "code": "concurrency"}]}
+
+
+def _window(built: BackstopClientFactory, username: str) -> float:
+    return built._gates._gates[username].window  # pyright: ignore[reportPrivateUsage]
+
+
+class TestAdaptiveWindow:
+    @pytest.fixture
+    async def adaptive(self) -> AsyncGenerator[BackstopClientFactory]:
+        # One attempt, so each 429 surfaces rather than being retried into the next test step.
+        built = client_factory(adaptive_concurrency_enabled=True, max_retry_attempts=1)
+        yield built
+        await built.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_concurrency_429_narrows_what_the_next_fan_out_may_run(
+        self, adaptive: BackstopClientFactory
+    ) -> None:
+        route = respx.get(f"{_BASE_URL}/system-info")
+        route.mock(return_value=httpx.Response(429, json=_CONCURRENCY_429))
+        client = adaptive.for_credential(_credential(username="narrowed.user"))
+
+        with pytest.raises(BackstopRateLimitError):
+            await client.raw_request("GET", "/system-info")
+        assert _window(adaptive, "narrowed.user") == 2.5
+
+        tracker = _InFlightTracker()
+        route.mock(side_effect=tracker.handle)
+
+        async def fan_out() -> list[httpx.Response]:
+            return await asyncio.gather(
+                *(client.raw_request("GET", "/system-info") for _ in range(6))
+            )
+
+        task = asyncio.create_task(fan_out())
+        await asyncio.sleep(0.05)
+        assert tracker.max_in_flight == 2
+
+        tracker.release.set()
+        await task
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_one_burst_of_429s_halves_the_window_once(
+        self, adaptive: BackstopClientFactory
+    ) -> None:
+        """Five requests in flight together all hit the same overload; it is one signal."""
+        release = asyncio.Event()
+
+        async def rejected(_request: httpx.Request) -> httpx.Response:
+            await release.wait()
+            return httpx.Response(429, json=_CONCURRENCY_429)
+
+        respx.get(f"{_BASE_URL}/system-info").mock(side_effect=rejected)
+        client = adaptive.for_credential(_credential(username="burst.user"))
+
+        async def fan_out() -> list[httpx.Response | BaseException]:
+            return await asyncio.gather(
+                *(client.raw_request("GET", "/system-info") for _ in range(5)),
+                return_exceptions=True,
+            )
+
+        task = asyncio.create_task(fan_out())
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await task
+
+        assert all(isinstance(result, BackstopRateLimitError) for result in results)
+        assert _window(adaptive, "burst.user") == 2.5
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_healthy_responses_grow_the_window_back_to_the_cap_and_no_further(
+        self, adaptive: BackstopClientFactory
+    ) -> None:
+        respx.get(f"{_BASE_URL}/system-info").mock(
+            side_effect=[
+                httpx.Response(429, json=_CONCURRENCY_429),
+                *[httpx.Response(200, json={})] * 30,
+            ]
+        )
+        client = adaptive.for_credential(_credential(username="recovering.user"))
+        with pytest.raises(BackstopRateLimitError):
+            await client.raw_request("GET", "/system-info")
+
+        for _ in range(30):
+            await client.raw_request("GET", "/system-info")
+
+        assert _window(adaptive, "recovering.user") == 5.0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_latency_spike_trims_the_window(self, adaptive: BackstopClientFactory) -> None:
+        async def slow(_request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.2)
+            return httpx.Response(200, json={})
+
+        route = respx.get(f"{_BASE_URL}/system-info")
+        route.mock(return_value=httpx.Response(200, json={}))
+        client = adaptive.for_credential(_credential(username="slowed.user"))
+        for _ in range(5):
+            await client.raw_request("GET", "/system-info")
+
+        route.mock(side_effect=slow)
+        await client.raw_request("GET", "/system-info")
+
+        assert _window(adaptive, "slowed.user") == 4.0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_quota_429s_leave_the_window_alone(self, adaptive: BackstopClientFactory) -> None:
+        """Running fewer requests at once does nothing for a daily quota."""
+        respx.get(f"{_BASE_URL}/system-info").mock(
+            return_value=httpx.Response(
+                429, json={"errors": [{"detail": "Daily quota exceeded", "code": "day"}]}
+            )
+        )
+        with pytest.raises(BackstopRateLimitError):
+            await adaptive.for_credential(_credential(username="quota.user")).raw_request(
+                "GET", "/system-info"
+            )
+
+        assert _window(adaptive, "quota.user") == 5.0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_the_window_holds_at_the_cap_when_disabled(self) -> None:
+        respx.get(f"{_BASE_URL}/system-info").mock(
+            return_value=httpx.Response(429, json=_CONCURRENCY_429)
+        )
+        built = client_factory(max_retry_attempts=1)
+        try:
+            with pytest.raises(BackstopRateLimitError):
+                await built.for_credential(_credential(username="fixed.user")).raw_request(
+                    "GET", "/system-info"
+                )
+
+            assert _window(built, "fixed.user") == 5.0
+        finally:
+            await built.aclose()
+
+
+class TestPriorityLanes:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_freed_slot_goes_to_an_interactive_request_before_queued_pages(
+        self, factory: BackstopClientFactory
+    ) -> None:
+        """A lookup fired behind a queued walk runs next, not after the walk drains."""
+        release = asyncio.Event()
+        admitted: list[str] = []
+
+        async def blocker(_request: httpx.Request) -> httpx.Response:
+            await release.wait()
+            return httpx.Response(200, json={})
+
+        def record(request: httpx.Request) -> httpx.Response:
+            admitted.append(request.url.path)
+            return httpx.Response(200, json={})
+
+        respx.get(f"{_BASE_URL}/blocker").mock(side_effect=blocker)
+        respx.get(f"{_BASE_URL}/pages").mock(side_effect=record)
+        respx.get(f"{_BASE_URL}/lookup").mock(side_effect=record)
+        client = factory.for_credential(_credential(username="laned.user"))
+
+        async def fan_out() -> None:
+            await asyncio.gather(
+                *(client.raw_request("GET", "/blocker") for _ in range(5)),
+                *(
+                    client.raw_request("GET", "/pages", priority=RequestPriority.LATER_PAGE)
+                    for _ in range(3)
+                ),
+            )
+
+        walk = asyncio.create_task(fan_out())
+        await asyncio.sleep(0.05)
+        lookup = asyncio.create_task(client.raw_request("GET", "/lookup"))
+        await asyncio.sleep(0.05)
+        assert admitted == []
+
+        release.set()
+        await asyncio.gather(walk, lookup)
+
+        assert admitted == ["/lookup", "/pages", "/pages", "/pages"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_walk_queues_its_first_page_ahead_of_the_rest(
+        self, factory: BackstopClientFactory, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        lanes: list[RequestPriority] = []
+        registry = factory._gates  # pyright: ignore[reportPrivateUsage]
+        hold = registry.hold
+
+        def recording_hold(
+            username: str, priority: RequestPriority
+        ) -> AbstractAsyncContextManager[object]:
+            lanes.append(priority)
+            return hold(username, priority)
+
+        monkeypatch.setattr(registry, "hold", recording_hold)
+        respx.get(f"{_BASE_URL}/records").mock(
+            side_effect=[
+                httpx.Response(
+                    200, json={"data": [{"id": "1"}], "meta": {"totalResourceCount": 3}}
+                ),
+                httpx.Response(
+                    200, json={"data": [{"id": "2"}], "meta": {"totalResourceCount": 3}}
+                ),
+                httpx.Response(
+                    200, json={"data": [{"id": "3"}], "meta": {"totalResourceCount": 3}}
+                ),
+            ]
+        )
+        client = factory.for_credential(_credential())
+
+        await client.paginate("/records", schema=_Record, page_size=1, parallel=True)
+
+        assert lanes == [
+            RequestPriority.FIRST_PAGE,
+            RequestPriority.LATER_PAGE,
+            RequestPriority.LATER_PAGE,
+        ]
+
+
+class TestResponseCache:
+    @pytest.fixture
+    async def caching(self) -> AsyncGenerator[BackstopClientFactory]:
+        built = client_factory(response_cache_enabled=True)
+        yield built
+        await built.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_repeat_read_revalidates_and_a_304_returns_the_stored_body(
+        self, caching: BackstopClientFactory
+    ) -> None:
+        route = respx.get(f"{_BASE_URL}/people/7").mock(
+            side_effect=[
+                httpx.Response(200, json={"id": "7"}, headers={"ETag": '"v1"'}),
+                httpx.Response(304),
+            ]
+        )
+        client = caching.for_credential(_credential())
+
+        first = await client.get("/people/7", schema=_Record)
+        second = await client.get("/people/7", schema=_Record)
+
+        assert first == second == _Record(id="7")
+        assert route.call_count == 2
+        first_sent, second_sent = recorded_requests(route.calls)
+        assert "If-None-Match" not in first_sent.headers
+        assert second_sent.headers["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_changed_document_replaces_the_stored_one(
+        self, caching: BackstopClientFactory
+    ) -> None:
+        route = respx.get(f"{_BASE_URL}/people/7").mock(
+            side_effect=[
+                httpx.Response(200, json={"id": "7"}, headers={"Last-Modified": "day one"}),
+                httpx.Response(200, json={"id": "8"}, headers={"Last-Modified": "day two"}),
+                httpx.Response(304),
+            ]
+        )
+        client = caching.for_credential(_credential())
+
+        await client.get("/people/7", schema=_Record)
+        changed = await client.get("/people/7", schema=_Record)
+        revalidated = await client.get("/people/7", schema=_Record)
+
+        assert changed == revalidated == _Record(id="8")
+        assert recorded_requests(route.calls)[2].headers["If-Modified-Since"] == "day two"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_without_validators_a_repeat_read_within_the_ttl_stays_local(
+        self, caching: BackstopClientFactory
+    ) -> None:
+        route = respx.get(f"{_BASE_URL}/people/7").mock(
+            return_value=httpx.Response(200, json={"id": "7"})
+        )
+        client = caching.for_credential(_credential())
+
+        await client.get("/people/7", schema=_Record)
+        cached = await client.get("/people/7", schema=_Record)
+
+        assert cached == _Record(id="7")
+        assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_one_users_cached_body_is_never_served_to_another(
+        self, caching: BackstopClientFactory
+    ) -> None:
+        route = respx.get(f"{_BASE_URL}/people/7").mock(
+            return_value=httpx.Response(200, json={"id": "7"})
+        )
+
+        await caching.for_credential(_credential(username="first.user")).get(
+            "/people/7", schema=_Record
+        )
+        await caching.for_credential(_credential(username="second.user")).get(
+            "/people/7", schema=_Record
+        )
+
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_replaced_token_does_not_inherit_the_old_ones_bodies(
+        self, caching: BackstopClientFactory
+    ) -> None:
+        route = respx.get(f"{_BASE_URL}/people/7").mock(
+            return_value=httpx.Response(200, json={"id": "7"})
+        )
+
+        await caching.for_credential(_credential(api_token="old-token")).get(
+            "/people/7", schema=_Record
+        )
+        await caching.for_credential(_credential(api_token="new-token")).get(
+            "/people/7", schema=_Record
+        )
+
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_the_least_recently_used_body_is_evicted_past_the_byte_budget(self) -> None:
+        # Ten-byte bodies against an 80-byte budget: eight fit, the ninth evicts the first.
+        def numbered(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=f'{{"id":"{request.url.path[-1]}"}}'.encode())
+
+        respx.get(url__regex=rf"{_BASE_URL}/r/\d").mock(side_effect=numbered)
+        built = client_factory(response_cache_enabled=True, response_cache_max_bytes=80)
+        client = built.for_credential(_credential())
+        try:
+            for index in range(9):
+                await client.raw_request("GET", f"/r/{index}")
+            calls_before = len(respx.calls)
+
+            await client.raw_request("GET", "/r/8")
+            assert len(respx.calls) == calls_before
+            await client.raw_request("GET", "/r/0")
+            assert len(respx.calls) == calls_before + 1
+        finally:
+            await built.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_every_read_goes_upstream_when_disabled(
+        self, factory: BackstopClientFactory
+    ) -> None:
+        route = respx.get(f"{_BASE_URL}/people/7").mock(
+            return_value=httpx.Response(200, json={"id": "7"}, headers={"ETag": '"v1"'})
+        )
+        client = factory.for_credential(_credential())
+
+        await client.get("/people/7", schema=_Record)
+        await client.get("/people/7", schema=_Record)
+
+        assert route.call_count == 2
+        assert "If-None-Match" not in recorded_requests(route.calls)[1].headers
+
+
+class TestRequestCoalescing:
+    @pytest.fixture
+    async def coalescing(self) -> AsyncGenerator[BackstopClientFactory]:
+        built = client_factory(request_coalescing_enabled=True)
+        yield built
+        await built.aclose()
+
+    @staticmethod
+    def _held_route(release: asyncio.Event, response: httpx.Response) -> respx.Route:
+        async def held(_request: httpx.Request) -> httpx.Response:
+            await release.wait()
+            return response
+
+        return respx.get(f"{_BASE_URL}/people/7").mock(side_effect=held)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_identical_concurrent_gets_share_one_upstream_request(
+        self, coalescing: BackstopClientFactory
+    ) -> None:
+        release = asyncio.Event()
+        route = self._held_route(release, httpx.Response(200, json={"id": "7"}))
+        client = coalescing.for_credential(_credential())
+
+        async def fan_out() -> list[_Record]:
+            return await asyncio.gather(
+                *(client.get("/people/7", schema=_Record) for _ in range(3))
+            )
+
+        task = asyncio.create_task(fan_out())
+        await asyncio.sleep(0.05)
+        release.set()
+        records = await task
+
+        assert records == [_Record(id="7")] * 3
+        assert route.call_count == 1
+        # Each caller parsed its own copy, so none can mutate what another holds.
+        assert records[0] is not records[1]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_different_users_are_never_coalesced(
+        self, coalescing: BackstopClientFactory
+    ) -> None:
+        release = asyncio.Event()
+        route = self._held_route(release, httpx.Response(200, json={"id": "7"}))
+
+        async def fan_out() -> list[_Record]:
+            return await asyncio.gather(
+                *(
+                    coalescing.for_credential(_credential(username=username)).get(
+                        "/people/7", schema=_Record
+                    )
+                    for username in ("first.user", "second.user")
+                )
+            )
+
+        task = asyncio.create_task(fan_out())
+        await asyncio.sleep(0.05)
+        release.set()
+        await task
+
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_two_tokens_of_one_user_are_never_coalesced(
+        self, coalescing: BackstopClientFactory
+    ) -> None:
+        release = asyncio.Event()
+        route = self._held_route(release, httpx.Response(200, json={"id": "7"}))
+
+        async def fan_out() -> list[_Record]:
+            return await asyncio.gather(
+                *(
+                    coalescing.for_credential(_credential(api_token=token)).get(
+                        "/people/7", schema=_Record
+                    )
+                    for token in ("old-token", "new-token")
+                )
+            )
+
+        task = asyncio.create_task(fan_out())
+        await asyncio.sleep(0.05)
+        release.set()
+        await task
+
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_shared_failure_reaches_every_caller(
+        self, coalescing: BackstopClientFactory
+    ) -> None:
+        release = asyncio.Event()
+        route = self._held_route(
+            release, httpx.Response(404, json={"errors": [{"detail": "Not found"}]})
+        )
+        client = coalescing.for_credential(_credential())
+
+        async def fan_out() -> list[_Record | BaseException]:
+            return await asyncio.gather(
+                *(client.get("/people/7", schema=_Record) for _ in range(2)),
+                return_exceptions=True,
+            )
+
+        task = asyncio.create_task(fan_out())
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await task
+
+        assert all(isinstance(result, BackstopApiError) for result in results)
+        assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_cancelled_waiter_leaves_the_request_running_for_the_owner(
+        self, coalescing: BackstopClientFactory
+    ) -> None:
+        release = asyncio.Event()
+        self._held_route(release, httpx.Response(200, json={"id": "7"}))
+        client = coalescing.for_credential(_credential())
+
+        owner = asyncio.create_task(client.get("/people/7", schema=_Record))
+        await asyncio.sleep(0.05)
+        waiter = asyncio.create_task(client.get("/people/7", schema=_Record))
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        release.set()
+
+        assert await owner == _Record(id="7")
+        assert waiter.cancelled()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_only_requests_in_flight_together_are_merged(
+        self, coalescing: BackstopClientFactory
+    ) -> None:
+        route = respx.get(f"{_BASE_URL}/people/7").mock(
+            return_value=httpx.Response(200, json={"id": "7"})
+        )
+        client = coalescing.for_credential(_credential())
+
+        await client.get("/people/7", schema=_Record)
+        await client.get("/people/7", schema=_Record)
+
+        assert route.call_count == 2
+
+
+class _StubHistogram:
+    def __init__(self) -> None:
+        self.recorded: list[tuple[float, dict[str, object]]] = []
+
+    def record(self, amount: float, attributes: dict[str, object] | None = None) -> None:
+        self.recorded.append((amount, dict(attributes or {})))
+
+
+def _chunked(body: bytes, size: int) -> httpx.Response:
+    async def chunks() -> AsyncIterator[bytes]:
+        for start in range(0, len(body), size):
+            yield body[start : start + size]
+
+    return httpx.Response(200, content=chunks())
+
+
+class TestStreamingParse:
+    @pytest.fixture
+    async def streaming(self) -> AsyncGenerator[BackstopClientFactory]:
+        built = client_factory(streaming_parse_enabled=True)
+        yield built
+        await built.aclose()
+
+    @pytest.fixture
+    def peaks(self, monkeypatch: pytest.MonkeyPatch) -> _StubHistogram:
+        histogram = _StubHistogram()
+        # Patched on `client`, where the histogram is bound at import.
+        monkeypatch.setattr("backstop_mcp.backstop_client.client.BACKSTOP_RESPONSE_PEAK", histogram)
+        return histogram
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_chunked_walk_reads_the_same_as_a_buffered_one(
+        self, streaming: BackstopClientFactory, peaks: _StubHistogram
+    ) -> None:
+        first = json.dumps(
+            {
+                "data": [{"id": str(n)} for n in range(50)],
+                "links": {"next": f"{_BASE_URL}/people?page[offset]=50"},
+                "meta": {"totalResourceCount": 60},
+            }
+        ).encode()
+        second = json.dumps({"data": [{"id": str(n)} for n in range(50, 60)]}).encode()
+        respx.get(f"{_BASE_URL}/people", params={"page[offset]": "0"}).mock(
+            return_value=_chunked(first, 64)
+        )
+        respx.get(f"{_BASE_URL}/people", params={"page[offset]": "50"}).mock(
+            return_value=_chunked(second, 64)
+        )
+
+        result = await streaming.for_credential(_credential()).paginate(
+            "/people", schema=_Record, max_records=None
+        )
+
+        assert [record.id for record in result.items] == [str(n) for n in range(60)]
+        assert result.total_count == 60
+        assert result.request_count == 2
+        assert [attributes for _, attributes in peaks.recorded] == [
+            {"route": "/people", "mode": "streamed"}
+        ] * 2
+        # One record plus the envelope, rather than the 50-record page.
+        assert peaks.recorded[0][0] < len(first) // 4
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_buffered_walk_records_the_whole_body(
+        self, factory: BackstopClientFactory, peaks: _StubHistogram
+    ) -> None:
+        body = json.dumps({"data": [{"id": "1"}]}).encode()
+        respx.get(f"{_BASE_URL}/people").mock(return_value=httpx.Response(200, content=body))
+
+        _ = await factory.for_credential(_credential()).paginate("/people", schema=_Record)
+
+        assert peaks.recorded == [(len(body), {"route": "/people", "mode": "buffered"})]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_parallel_walk_streams_every_page(
+        self, streaming: BackstopClientFactory
+    ) -> None:
+        def page(request: httpx.Request) -> httpx.Response:
+            offset = int(request.url.params["page[offset]"])
+            body = {
+                "data": [{"id": str(offset + n)} for n in range(2)],
+                "meta": {"totalResourceCount": 6},
+            }
+            return _chunked(json.dumps(body).encode(), 5)
+
+        respx.get(f"{_BASE_URL}/people").mock(side_effect=page)
+
+        result = await streaming.for_credential(_credential()).paginate(
+            "/people", schema=_Record, page_size=2, parallel=True
+        )
+
+        assert [record.id for record in result.items] == ["0", "1", "2", "3", "4", "5"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_an_error_status_is_still_mapped(self, streaming: BackstopClientFactory) -> None:
+        respx.get(f"{_BASE_URL}/people").mock(
+            return_value=httpx.Response(404, json={"errors": [{"detail": "Not found"}]})
+        )
+
+        with pytest.raises(BackstopApiError) as raised:
+            _ = await streaming.for_credential(_credential()).paginate("/people", schema=_Record)
+
+        assert raised.value.detail == "Not found"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_malformed_item_fails_the_walk(self, streaming: BackstopClientFactory) -> None:
+        respx.get(f"{_BASE_URL}/people").mock(
+            return_value=_chunked(b'{"data": [{"id": "1"}, {"name": "no id"}]}', 8)
+        )
+
+        with pytest.raises(BackstopResponseSchemaError):
+            _ = await streaming.for_credential(_credential()).paginate("/people", schema=_Record)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_streamed_reads_bypass_the_response_cache(self) -> None:
+        """A streamed body is never held whole, so there is nothing to store."""
+        built = client_factory(streaming_parse_enabled=True, response_cache_enabled=True)
+        route = respx.get(f"{_BASE_URL}/people").mock(
+            return_value=httpx.Response(200, json={"data": [{"id": "1"}]})
+        )
+        client = built.for_credential(_credential())
+        try:
+            _ = await client.paginate("/people", schema=_Record)
+            _ = await client.paginate("/people", schema=_Record)
+        finally:
+            await built.aclose()
+
+        assert route.call_count == 2
+
+
+class TestParseOffLoop:
+    @pytest.fixture
+    async def threaded(self) -> AsyncGenerator[BackstopClientFactory]:
+        built = client_factory(parse_worker_threads=2)
+        yield built
+        await built.aclose()
+
+    @pytest.fixture
+    def durations(self, monkeypatch: pytest.MonkeyPatch) -> _StubHistogram:
+        histogram = _StubHistogram()
+        monkeypatch.setattr(
+            "backstop_mcp.backstop_client.client.BACKSTOP_PARSE_DURATION", histogram
+        )
+        return histogram
+
+    @pytest.fixture
+    def lags(self, monkeypatch: pytest.MonkeyPatch) -> _StubHistogram:
+        histogram = _StubHistogram()
+        monkeypatch.setattr(
+            "backstop_mcp.backstop_client.client.BACKSTOP_EVENT_LOOP_LAG", histogram
+        )
+        return histogram
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_pages_parse_on_the_pool(
+        self, threaded: BackstopClientFactory, durations: _StubHistogram
+    ) -> None:
+        def page(request: httpx.Request) -> httpx.Response:
+            offset = int(request.url.params["page[offset]"])
+            body = {
+                "data": [{"id": str(offset + n)} for n in range(2)],
+                "meta": {"totalResourceCount": 6},
+            }
+            return httpx.Response(200, json=body)
+
+        respx.get(f"{_BASE_URL}/people").mock(side_effect=page)
+
+        result = await threaded.for_credential(_credential()).paginate(
+            "/people", schema=_Record, page_size=2, parallel=True
+        )
+
+        assert [record.id for record in result.items] == ["0", "1", "2", "3", "4", "5"]
+        assert [attributes for _, attributes in durations.recorded] == [
+            {"route": "/people", "where": "thread"}
+        ] * 3
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_typed_verbs_parse_on_the_pool(
+        self, threaded: BackstopClientFactory, durations: _StubHistogram
+    ) -> None:
+        respx.get(f"{_BASE_URL}/people/7").mock(return_value=httpx.Response(200, json={"id": "7"}))
+
+        record = await threaded.for_credential(_credential()).get("/people/7", schema=_Record)
+
+        assert record.id == "7"
+        assert durations.recorded[0][1] == {"route": "/people/:id", "where": "thread"}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_without_a_pool_pages_parse_on_the_loop(
+        self, factory: BackstopClientFactory, durations: _StubHistogram, lags: _StubHistogram
+    ) -> None:
+        respx.get(f"{_BASE_URL}/people").mock(
+            return_value=httpx.Response(200, json={"data": [{"id": "1"}]})
+        )
+
+        _ = await factory.for_credential(_credential()).paginate("/people", schema=_Record)
+        # The lag probe runs at the loop's next turn, which the walk may have finished before.
+        await asyncio.sleep(0)
+
+        assert durations.recorded[0][1] == {"route": "/people", "where": "loop"}
+        assert [attributes for _, attributes in lags.recorded] == [{"route": "/people"}]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_malformed_page_still_fails_the_walk(
+        self, threaded: BackstopClientFactory
+    ) -> None:
+        respx.get(f"{_BASE_URL}/people").mock(
+            return_value=httpx.Response(200, json={"data": [{"name": "no id"}]})
+        )
+
+        with pytest.raises(BackstopResponseSchemaError):
+            _ = await threaded.for_credential(_credential()).paginate("/people", schema=_Record)
+
+    @pytest.mark.asyncio
+    async def test_aclose_shuts_the_pool_down(self) -> None:
+        built = client_factory(parse_worker_threads=1)
+        pool = built._parse_executor()  # pyright: ignore[reportPrivateUsage]
+
+        await built.aclose()
+
+        with pytest.raises(RuntimeError):
+            _ = pool.submit(int)
+
+
+class TestSpeculativePrefetch:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_serial_walk_prefetches_what_its_links_name(self) -> None:
+        def page(request: httpx.Request) -> httpx.Response:
+            offset = int(request.url.params["page[offset]"])
+            following = f"{_BASE_URL}/people?page[limit]=2&page[offset]={offset + 2}"
+            body = {
+                "data": [{"id": str(offset + n)} for n in range(2)],
+                "links": {"next": following if offset < 4 else None},
+            }
+            return httpx.Response(200, json=body)
+
+        respx.get(f"{_BASE_URL}/people").mock(side_effect=page)
+        built = client_factory(speculative_prefetch_enabled=True)
+        try:
+            result = await built.for_credential(_credential()).paginate(
+                "/people", schema=_Record, page_size=2, max_records=None
+            )
+        finally:
+            await built.aclose()
+
+        assert [record.id for record in result.items] == [str(n) for n in range(6)]
+        assert result.prefetch_hits == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_link_under_the_api_prefix_names_the_prefetch(self) -> None:
+        base_url = f"{_BASE_URL}/backstop/api"
+
+        def page(request: httpx.Request) -> httpx.Response:
+            offset = int(request.url.params["page[offset]"])
+            following = f"{base_url}/people?page[limit]=2&page[offset]={offset + 2}"
+            body = {
+                "data": [{"id": str(offset + n)} for n in range(2)],
+                "links": {"next": following if offset < 4 else None},
+            }
+            return httpx.Response(200, json=body)
+
+        respx.get(f"{base_url}/people").mock(side_effect=page)
+        built = client_factory(base_url, speculative_prefetch_enabled=True)
+        try:
+            result = await built.for_credential(_credential()).paginate(
+                "/people", schema=_Record, page_size=2, max_records=None
+            )
+        finally:
+            await built.aclose()
+
+        assert [record.id for record in result.items] == [str(n) for n in range(6)]
+        # The third page was the prefetch; only the one past the last page was wasted.
+        assert (result.prefetch_hits, result.prefetch_wasted) == (1, 1)
+
+
 class TestRetryIntegration:
     @pytest.mark.asyncio
     @respx.mock
@@ -464,6 +1346,7 @@ class TestPaginate:
             truncated=False,
             # Two pages fetched, which is what a tool publishing its cost has to be told.
             request_count=2,
+            item_count=2,
         )
 
     @pytest.mark.asyncio
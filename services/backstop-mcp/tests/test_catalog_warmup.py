@@ -0,0 +1,179 @@
+"""Startup warm-up of the cached catalogs.
+
+What matters is that warm-up always ends — a failing catalog or one still walking when the budget
+runs out is left to fill on first use, never holding `/ready` at 503 — and that each catalog's
+outcome is recorded so a slow walk is visible before anyone waits on it.
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from datetime import timedelta
+
+import pytest
+from pydantic import SecretStr
+
+from backstop_mcp.backstop_client import BackstopClient, BackstopClientFactory
+from backstop_mcp.catalog_warmup import CatalogWarmup, WarmCatalog, catalog_warmup
+from backstop_mcp.config import BackstopConfig
+from tests.helpers import BASE_URL, client_factory, credential
+
+
+class _StubHistogram:
+    """Stands in for `catalog_warmup_duration_seconds`, capturing each record's attributes."""
+
+    def __init__(self) -> None:
+        self.records: list[dict[str, object]] = []
+
+    def record(self, amount: float, attributes: dict[str, object] | None = None) -> None:
+        assert amount >= 0
+        self.records.append(dict(attributes or {}))
+
+
+@pytest.fixture
+def histogram(monkeypatch: pytest.MonkeyPatch) -> _StubHistogram:
+    stub = _StubHistogram()
+    monkeypatch.setattr("backstop_mcp.catalog_warmup.CATALOG_WARMUP_DURATION", stub)
+    return stub
+
+
+@pytest.fixture
+async def factory() -> AsyncGenerator[BackstopClientFactory]:
+    factory = client_factory(BASE_URL)
+    yield factory
+    await factory.aclose()
+
+
+def _warmup(
+    factory: BackstopClientFactory,
+    catalogs: dict[str, WarmCatalog],
+    *,
+    budget: timedelta = timedelta(seconds=5),
+) -> CatalogWarmup:
+    return CatalogWarmup(
+        catalogs=catalogs,
+        client=lambda: factory.for_credential(credential("warmup-bob")),
+        budget=budget,
+    )
+
+
+async def _loads(_client: BackstopClient) -> object:
+    return {}
+
+
+async def _fails(_client: BackstopClient) -> object:
+    raise RuntimeError("Backstop is down")
+
+
+async def _hangs(_client: BackstopClient) -> object:
+    await asyncio.Event().wait()
+    return {}
+
+
+class TestRun:
+    @pytest.mark.asyncio
+    async def test_each_catalogs_outcome_is_reported_and_recorded(
+        self, factory: BackstopClientFactory, histogram: _StubHistogram
+    ) -> None:
+        warmup = _warmup(factory, {"activity-tag": _loads, "system-user": _fails})
+
+        outcomes = await warmup.run()
+
+        assert outcomes == {"activity-tag": "ok", "system-user": "error"}
+        assert sorted(histogram.records, key=lambda record: str(record["catalog"])) == [
+            {"catalog": "activity-tag", "outcome": "ok"},
+            {"catalog": "system-user", "outcome": "error"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_the_budget_cancels_what_is_still_walking(
+        self, factory: BackstopClientFactory, histogram: _StubHistogram
+    ) -> None:
+        warmup = _warmup(
+            factory,
+            {"activity-tag": _loads, "custom-field": _hangs},
+            budget=timedelta(milliseconds=50),
+        )
+
+        outcomes = await asyncio.wait_for(warmup.run(), timeout=2)
+
+        assert outcomes == {"activity-tag": "ok", "custom-field": "timeout"}
+        assert {"catalog": "custom-field", "outcome": "timeout"} in histogram.records
+        assert warmup.finished
+
+    @pytest.mark.asyncio
+    async def test_it_is_finished_only_once_every_catalog_has_ended(
+        self, factory: BackstopClientFactory, histogram: _StubHistogram
+    ) -> None:
+        release = asyncio.Event()
+
+        async def held(_client: BackstopClient) -> object:
+            await release.wait()
+            return {}
+
+        warmup = _warmup(factory, {"custom-field": held})
+        running = asyncio.create_task(warmup.run())
+        await asyncio.sleep(0.01)
+        assert not warmup.finished
+
+        release.set()
+        _ = await running
+
+        assert warmup.finished
+        assert histogram.records == [{"catalog": "custom-field", "outcome": "ok"}]
+
+    @pytest.mark.asyncio
+    async def test_a_warmup_that_cannot_build_its_client_still_finishes(
+        self, histogram: _StubHistogram
+    ) -> None:
+        def broken() -> BackstopClient:
+            raise RuntimeError("no factory")
+
+        warmup = CatalogWarmup(
+            catalogs={"activity-tag": _loads}, client=broken, budget=timedelta(seconds=5)
+        )
+
+        assert await warmup.run() == {}
+        assert warmup.finished
+        assert histogram.records == []
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_a_warmup_still_running(
+        self, factory: BackstopClientFactory, histogram: _StubHistogram
+    ) -> None:
+        warmup = _warmup(factory, {"custom-field": _hangs})
+
+        async with warmup.running():
+            await asyncio.sleep(0.01)
+
+        assert warmup.finished
+        assert histogram.records == [{"catalog": "custom-field", "outcome": "cancelled"}]
+
+
+class TestFromConfig:
+    def test_without_a_service_credential_there_is_no_warmup(self) -> None:
+        assert catalog_warmup(BackstopConfig(base_url=BASE_URL)) is None
+
+    def test_a_username_alone_is_not_a_credential(self) -> None:
+        config = BackstopConfig(base_url=BASE_URL, catalog_warmup_username="svc-warmup")
+
+        assert catalog_warmup(config) is None
+
+    def test_only_catalogs_that_cache_are_warmed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Warming a catalog that doesn't cache would be a walk whose result nobody keeps.
+
+        The providers read their flags from the environment, as they do under `create_app`.
+        """
+        monkeypatch.setenv("BACKSTOP_BASE_URL", BASE_URL)
+        monkeypatch.setenv("BACKSTOP_CUSTOM_FIELD_SCHEMA_CACHE_ENABLED", "true")
+        config = BackstopConfig(
+            base_url=BASE_URL,
+            catalog_warmup_username="svc-warmup",
+            catalog_warmup_api_token=SecretStr("token"),
+        )
+
+        warmup = catalog_warmup(config)
+
+        assert warmup is not None
+        catalogs = warmup._catalogs  # pyright: ignore[reportPrivateUsage]
+        # Opportunity stages have always cached; the other three follow their own flags.
+        assert sorted(catalogs) == ["custom-field", "custom-field group", "opportunity-stage"]
@@ -12,6 +12,7 @@ from backstop_mcp.config import (
     BackstopConfig,
     DatabaseConfig,
     EncryptionConfig,
+    GateBackend,
     normalize_asyncpg_url,
 )
 
@@ -75,6 +76,22 @@ class TestBackstopConfigDefaults:
         assert config.default_timeout_seconds == 30.0
         assert config.reports_timeout_seconds == 120.0
         assert config.max_concurrent_requests_per_user == 5
+        assert config.concurrency_gate_backend is GateBackend.MEMORY
+        assert config.concurrency_gate_lease_seconds == 30.0
+        assert config.concurrency_gate_poll_ms == 50
+        assert config.adaptive_concurrency_enabled is False
+        assert config.adaptive_concurrency_latency_factor == 3.0
+        assert config.http2_enabled is False
+        assert config.max_connections == 100
+        assert config.max_keepalive_connections == 20
+        assert config.keepalive_expiry_seconds == 5.0
+        assert config.request_coalescing_enabled is False
+        assert config.response_cache_enabled is False
+        assert config.response_cache_max_bytes == 32 * 1024 * 1024
+        assert config.response_cache_ttl_seconds == 30.0
+        assert config.streaming_parse_enabled is False
+        assert config.parse_worker_threads == 0
+        assert config.speculative_prefetch_enabled is False
         assert config.max_retry_attempts == 5
         assert config.max_retry_wait_ms == 30_000
         assert config.default_page_size == 100
@@ -89,6 +106,23 @@ class TestBackstopConfigDefaults:
         assert config.custom_field_schema_cache_enabled is False
         assert config.activity_tag_cache_enabled is False
         assert config.system_user_cache_enabled is False
+        assert config.catalog_snapshot_enabled is False
+        assert config.catalog_snapshot_refresh_lease_seconds == 60.0
+        assert config.catalog_revalidate_window_minutes == 0
+        assert config.custom_field_delta_refresh_enabled is False
+        assert config.catalog_warmup_username is None
+        assert config.catalog_warmup_api_token is None
+        assert config.catalog_warmup_budget_seconds == 30.0
+        assert config.party_resolution_cache_ttl_seconds == 0.0
+        assert config.party_resolution_cache_max_entries == 10_000
+        assert config.party_name_index_enabled is False
+        assert config.party_name_index_max_names == 50_000
+        assert config.party_name_index_sweep_minutes == 360
+        assert config.org_relationships_cache_ttl_seconds == 0.0
+        assert config.org_relationships_cache_max_entries == 1_000
+        assert config.holdings_fallback_series_budget == 400
+        assert config.holding_figures_cache_ttl_seconds == 0.0
+        assert config.holding_figures_cache_max_entries == 20_000
         assert config.employment_relationship_type_ids == ()
         assert config.employment_relationship_type_markers == ("employ",)
         assert config.former_employment_relationship_type_ids == ()
@@ -116,6 +150,22 @@ class TestBackstopConfigDefaults:
         monkeypatch.setenv("BACKSTOP_DEFAULT_TIMEOUT_SECONDS", "45.5")
         monkeypatch.setenv("BACKSTOP_REPORTS_TIMEOUT_SECONDS", "90")
         monkeypatch.setenv("BACKSTOP_MAX_CONCURRENT_REQUESTS_PER_USER", "3")
+        monkeypatch.setenv("BACKSTOP_CONCURRENCY_GATE_BACKEND", "postgres")
+        monkeypatch.setenv("BACKSTOP_CONCURRENCY_GATE_LEASE_SECONDS", "12.5")
+        monkeypatch.setenv("BACKSTOP_CONCURRENCY_GATE_POLL_MS", "20")
+        monkeypatch.setenv("BACKSTOP_ADAPTIVE_CONCURRENCY_ENABLED", "true")
+        monkeypatch.setenv("BACKSTOP_ADAPTIVE_CONCURRENCY_LATENCY_FACTOR", "4")
+        monkeypatch.setenv("BACKSTOP_HTTP2_ENABLED", "true")
+        monkeypatch.setenv("BACKSTOP_MAX_CONNECTIONS", "40")
+        monkeypatch.setenv("BACKSTOP_MAX_KEEPALIVE_CONNECTIONS", "10")
+        monkeypatch.setenv("BACKSTOP_KEEPALIVE_EXPIRY_SECONDS", "30")
+        monkeypatch.setenv("BACKSTOP_REQUEST_COALESCING_ENABLED", "true")
+        monkeypatch.setenv("BACKSTOP_RESPONSE_CACHE_ENABLED", "true")
+        monkeypatch.setenv("BACKSTOP_RESPONSE_CACHE_MAX_BYTES", "1048576")
+        monkeypatch.setenv("BACKSTOP_RESPONSE_CACHE_TTL_SECONDS", "5")
+        monkeypatch.setenv("BACKSTOP_STREAMING_PARSE_ENABLED", "true")
+        monkeypatch.setenv("BACKSTOP_PARSE_WORKER_THREADS", "4")
+        monkeypatch.setenv("BACKSTOP_SPECULATIVE_PREFETCH_ENABLED", "true")
         monkeypatch.setenv("BACKSTOP_MAX_RETRY_ATTEMPTS", "2")
         monkeypatch.setenv("BACKSTOP_MAX_RETRY_WAIT_MS", "5000")
         monkeypatch.setenv("BACKSTOP_DEFAULT_PAGE_SIZE", "50")
@@ -127,12 +177,45 @@ class TestBackstopConfigDefaults:
         monkeypatch.setenv("BACKSTOP_CUSTOM_FIELD_SCHEMA_CACHE_ENABLED", "true")
         monkeypatch.setenv("BACKSTOP_ACTIVITY_TAG_CACHE_ENABLED", "1")
         monkeypatch.setenv("BACKSTOP_SYSTEM_USER_CACHE_ENABLED", "yes")
+        monkeypatch.setenv("BACKSTOP_CATALOG_SNAPSHOT_ENABLED", "true")
+        monkeypatch.setenv("BACKSTOP_CATALOG_SNAPSHOT_REFRESH_LEASE_SECONDS", "15")
+        monkeypatch.setenv("BACKSTOP_CATALOG_REVALIDATE_WINDOW_MINUTES", "30")
+        monkeypatch.setenv("BACKSTOP_CUSTOM_FIELD_DELTA_REFRESH_ENABLED", "true")
+        monkeypatch.setenv("BACKSTOP_CATALOG_WARMUP_USERNAME", "svc.warmup")
+        monkeypatch.setenv("BACKSTOP_CATALOG_WARMUP_API_TOKEN", "warmup-token")
+        monkeypatch.setenv("BACKSTOP_CATALOG_WARMUP_BUDGET_SECONDS", "12")
+        monkeypatch.setenv("BACKSTOP_PARTY_RESOLUTION_CACHE_TTL_SECONDS", "300")
+        monkeypatch.setenv("BACKSTOP_PARTY_RESOLUTION_CACHE_MAX_ENTRIES", "500")
+        monkeypatch.setenv("BACKSTOP_PARTY_NAME_INDEX_ENABLED", "true")
+        monkeypatch.setenv("BACKSTOP_PARTY_NAME_INDEX_MAX_NAMES", "2000")
+        monkeypatch.setenv("BACKSTOP_PARTY_NAME_INDEX_SWEEP_MINUTES", "90")
+        monkeypatch.setenv("BACKSTOP_ORG_RELATIONSHIPS_CACHE_TTL_SECONDS", "900")
+        monkeypatch.setenv("BACKSTOP_ORG_RELATIONSHIPS_CACHE_MAX_ENTRIES", "250")
+        monkeypatch.setenv("BACKSTOP_HOLDINGS_FALLBACK_SERIES_BUDGET", "120")
+        monkeypatch.setenv("BACKSTOP_HOLDING_FIGURES_CACHE_TTL_SECONDS", "60")
+        monkeypatch.setenv("BACKSTOP_HOLDING_FIGURES_CACHE_MAX_ENTRIES", "3000")
 
         config = BackstopConfig()
 
         assert config.default_timeout_seconds == 45.5
         assert config.reports_timeout_seconds == 90.0
         assert config.max_concurrent_requests_per_user == 3
+        assert config.concurrency_gate_backend is GateBackend.POSTGRES
+        assert config.concurrency_gate_lease_seconds == 12.5
+        assert config.concurrency_gate_poll_ms == 20
+        assert config.adaptive_concurrency_enabled is True
+        assert config.adaptive_concurrency_latency_factor == 4.0
+        assert config.http2_enabled is True
+        assert config.max_connections == 40
+        assert config.max_keepalive_connections == 10
+        assert config.keepalive_expiry_seconds == 30.0
+        assert config.request_coalescing_enabled is True
+        assert config.response_cache_enabled is True
+        assert config.response_cache_max_bytes == 1_048_576
+        assert config.response_cache_ttl_seconds == 5.0
+        assert config.streaming_parse_enabled is True
+        assert config.parse_worker_threads == 4
+        assert config.speculative_prefetch_enabled is True
         assert config.max_retry_attempts == 2
         assert config.max_retry_wait_ms == 5000
         assert config.default_page_size == 50
@@ -146,6 +229,24 @@ class TestBackstopConfigDefaults:
         assert config.custom_field_schema_cache_enabled is True
         assert config.activity_tag_cache_enabled is True
         assert config.system_user_cache_enabled is True
+        assert config.catalog_snapshot_enabled is True
+        assert config.catalog_snapshot_refresh_lease_seconds == 15.0
+        assert config.catalog_revalidate_window_minutes == 30
+        assert config.custom_field_delta_refresh_enabled is True
+        assert config.catalog_warmup_username == "svc.warmup"
+        assert config.catalog_warmup_api_token is not None
+        assert config.catalog_warmup_api_token.get_secret_value() == "warmup-token"
+        assert config.catalog_warmup_budget_seconds == 12.0
+        assert config.party_resolution_cache_ttl_seconds == 300.0
+        assert config.party_resolution_cache_max_entries == 500
+        assert config.party_name_index_enabled is True
+        assert config.party_name_index_max_names == 2000
+        assert config.party_name_index_sweep_minutes == 90
+        assert config.org_relationships_cache_ttl_seconds == 900.0
+        assert config.org_relationships_cache_max_entries == 250
+        assert config.holdings_fallback_series_budget == 120
+        assert config.holding_figures_cache_ttl_seconds == 60.0
+        assert config.holding_figures_cache_max_entries == 3000
 
     def test_employment_relationship_types_parse_csv(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setenv("BACKSTOP_EMPLOYMENT_RELATIONSHIP_TYPE_IDS", "1, 2,3")
@@ -209,20 +310,36 @@ class TestActivityHistoryConfig:
     def test_defaults(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.delenv("ACTIVITY_HISTORY_PAGE_SIZE", raising=False)
         monkeypatch.delenv("ACTIVITY_HISTORY_GIST_CHARS", raising=False)
+        monkeypatch.delenv("ACTIVITY_HISTORY_DETAIL_CACHE_MAX_BYTES", raising=False)
+        monkeypatch.delenv("ACTIVITY_HISTORY_DETAIL_STORE_ENABLED", raising=False)
+        monkeypatch.delenv("ACTIVITY_HISTORY_DETAIL_STORE_MAX_BYTES", raising=False)
+        monkeypatch.delenv("ACTIVITY_HISTORY_SEARCH_MAX_WINDOWS", raising=False)
 
         config = ActivityHistoryConfig()
 
         assert config.page_size == 10
         assert config.gist_chars == 300
+        assert config.detail_cache_max_bytes == 0
+        assert config.detail_store_enabled is False
+        assert config.detail_store_max_bytes == 256 * 1024 * 1024
+        assert config.search_max_windows == 1
 
     def test_env_vars_override_defaults(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setenv("ACTIVITY_HISTORY_PAGE_SIZE", "25")
         monkeypatch.setenv("ACTIVITY_HISTORY_GIST_CHARS", "500")
+        monkeypatch.setenv("ACTIVITY_HISTORY_DETAIL_CACHE_MAX_BYTES", "1048576")
+        monkeypatch.setenv("ACTIVITY_HISTORY_DETAIL_STORE_ENABLED", "true")
+        monkeypatch.setenv("ACTIVITY_HISTORY_DETAIL_STORE_MAX_BYTES", "2097152")
+        monkeypatch.setenv("ACTIVITY_HISTORY_SEARCH_MAX_WINDOWS", "16")
 
         config = ActivityHistoryConfig()
 
         assert config.page_size == 25
         assert config.gist_chars == 500
+        assert config.detail_cache_max_bytes == 1_048_576
+        assert config.detail_store_enabled is True
+        assert config.detail_store_max_bytes == 2_097_152
+        assert config.search_max_windows == 16
 
     def test_page_size_rejects_zero(self) -> None:
         with pytest.raises(ValueError, match="page_size"):
@@ -232,6 +349,10 @@ class TestActivityHistoryConfig:
         with pytest.raises(ValueError, match="gist_chars"):
             ActivityHistoryConfig(gist_chars=0)
 
+    def test_detail_store_max_bytes_rejects_zero(self) -> None:
+        with pytest.raises(ValueError, match="detail_store_max_bytes"):
+            ActivityHistoryConfig(detail_store_max_bytes=0)
+
 
 class TestAuthConfig:
     def test_defaults(self, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -244,15 +365,22 @@ class TestAuthConfig:
         assert config.token_retention == timedelta(days=30)
         assert config.cleanup_interval_hours == 6.0
         assert config.cleanup_interval == timedelta(hours=6)
+        assert config.access_cache_ttl == timedelta(0)
+        assert config.access_cache_max_entries == 10_000
+        assert config.login_attempt_audit_enabled is False
 
     def test_env_vars_override_defaults(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setenv("AUTH_TOKEN_RETENTION_DAYS", "7")
         monkeypatch.setenv("AUTH_CLEANUP_INTERVAL_HOURS", "0.5")
+        monkeypatch.setenv("AUTH_ACCESS_CACHE_TTL_SECONDS", "60")
+        monkeypatch.setenv("AUTH_ACCESS_CACHE_MAX_ENTRIES", "500")
 
         config = AuthConfig()
 
         assert config.token_retention == timedelta(days=7)
         assert config.cleanup_interval == timedelta(minutes=30)
+        assert config.access_cache_ttl == timedelta(minutes=1)
+        assert config.access_cache_max_entries == 500
 
     def test_zero_retention_is_rejected(self) -> None:
         """Retaining nothing would delete a token family the moment it expired."""
@@ -264,6 +392,11 @@ class TestAuthConfig:
         with pytest.raises(ValueError, match="cleanup_interval_hours"):
             AuthConfig(cleanup_interval_hours=0)
 
+    def test_an_access_cache_ttl_past_five_minutes_is_rejected(self) -> None:
+        """The TTL is the bound on a lost revoke, so it stays well under the token lifetime."""
+        with pytest.raises(ValueError, match="access_cache_ttl_seconds"):
+            AuthConfig(access_cache_ttl_seconds=301)
+
 
 class TestPublicBaseUrl:
     """The OAuth issuer clients are redirected to, so a leftover local default is a dead deploy."""
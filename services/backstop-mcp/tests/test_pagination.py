@@ -104,6 +104,7 @@ class TestPaginateAll:
             total_count=None,
             truncated=False,
             request_count=1,
+            item_count=2,
         )
 
     @pytest.mark.asyncio
@@ -487,3 +488,206 @@ class TestPaginateOffsets:
                 first_page_params={"page[limit]": 2, "page[offset]": 0},
                 offset_params=_offset_params,
             )
+
+
+class TestPaginateOnPage:
+    """`on_page` hands each page over as it is read; the result keeps only the counts."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_pages_are_handed_over_in_offset_order_and_not_kept(self) -> None:
+        first = _page([{"id": "1"}, {"id": "2"}], total_count=5)
+        first["included"] = [{"type": "products", "id": "9"}]
+        respx.get(f"{_BASE_URL}/records", params={"page[offset]": "0"}).mock(
+            return_value=httpx.Response(200, json=first)
+        )
+        respx.get(f"{_BASE_URL}/records", params={"page[offset]": "2"}).mock(
+            return_value=httpx.Response(200, json=_page([{"id": "3"}, {"id": "4"}], total_count=5))
+        )
+        respx.get(f"{_BASE_URL}/records", params={"page[offset]": "4"}).mock(
+            return_value=httpx.Response(200, json=_page([{"id": "5"}], total_count=5))
+        )
+        pages: list[SinglePage[_Record]] = []
+
+        result = await paginate_all(
+            fetch_page=_fetch_page,
+            first_path="/records",
+            schema=_Record,
+            max_records=None,
+            first_page_params={"page[limit]": 2, "page[offset]": 0},
+            offset_params=_offset_params,
+            on_page=pages.append,
+        )
+
+        assert [[record.id for record in page.items] for page in pages] == [
+            ["1", "2"],
+            ["3", "4"],
+            ["5"],
+        ]
+        assert pages[0].included == [{"type": "products", "id": "9"}]
+        assert result.items == []
+        assert result.included == []
+        assert result.item_count == 5
+        assert result.request_count == 3
+        assert result.total_count == 5
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_max_records_counts_the_items_handed_over(self) -> None:
+        route = respx.get(f"{_BASE_URL}/records").mock(
+            side_effect=[
+                httpx.Response(
+                    200, json=_page([{"id": "1"}, {"id": "2"}], next_path="/records?p=2")
+                ),
+                httpx.Response(
+                    200, json=_page([{"id": "3"}, {"id": "4"}], next_path="/records?p=3")
+                ),
+            ]
+        )
+        pages: list[SinglePage[_Record]] = []
+
+        result = await paginate_all(
+            fetch_page=_fetch_page,
+            first_path="/records",
+            schema=_Record,
+            max_records=3,
+            on_page=pages.append,
+        )
+
+        assert len(pages) == 2
+        assert result.item_count == 4
+        assert result.truncated is True
+        assert route.call_count == 2
+
+
+def _linked_pages(count: int, *, size: int = 2, failing_once: int | None = None) -> respx.Route:
+    """`count` pages of `size` whose `links.next` strides by offset, as most collections do."""
+    failed: list[int] = []
+
+    def page(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["page[offset]"])
+        if offset == failing_once and not failed:
+            failed.append(offset)
+            return httpx.Response(500, json={"errors": [{"detail": "boom"}]})
+        following = offset + size
+        next_path = (
+            f"/records?page[limit]={size}&page[offset]={following}"
+            if following < count * size
+            else None
+        )
+        data: list[dict[str, object]] = [{"id": str(offset + n)} for n in range(size)]
+        return httpx.Response(200, json=_page(data, next_path=next_path))
+
+    return respx.get(f"{_BASE_URL}/records").mock(side_effect=page)
+
+
+class _StubCounter:
+    def __init__(self) -> None:
+        self.added: list[dict[str, object]] = []
+
+    def add(self, amount: int, attributes: dict[str, object] | None = None) -> None:
+        self.added.extend([dict(attributes or {})] * amount)
+
+
+class TestPaginatePrefetch:
+    """`prefetch_params` requests the next serial page by offset before its link arrives."""
+
+    @pytest.fixture
+    def prefetches(self, monkeypatch: pytest.MonkeyPatch) -> _StubCounter:
+        counter = _StubCounter()
+        monkeypatch.setattr(
+            "backstop_mcp.backstop_client.pagination.BACKSTOP_PAGE_PREFETCHES", counter
+        )
+        return counter
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_uses_every_prefetch_the_links_agree_with(self, prefetches: _StubCounter) -> None:
+        route = _linked_pages(4)
+
+        result = await paginate_all(
+            fetch_page=_fetch_page,
+            first_path="/records",
+            schema=_Record,
+            max_records=None,
+            first_page_params={"page[limit]": 2, "page[offset]": 0},
+            prefetch_params=_offset_params,
+        )
+
+        assert [record.id for record in result.items] == [str(n) for n in range(8)]
+        # Page two follows the first link; three and four were already on their way. The
+        # prefetch past the last page is the walk's one wasted request.
+        assert (result.prefetch_hits, result.prefetch_wasted) == (2, 1)
+        assert result.request_count == 5
+        assert route.call_count == 5
+        assert [attributes["outcome"] for attributes in prefetches.added] == [
+            "hit",
+            "hit",
+            "wasted",
+        ]
+        assert prefetches.added[0]["route"] == "/records"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_link_that_disagrees_is_followed_and_the_prefetch_discarded(
+        self, prefetches: _StubCounter
+    ) -> None:
+        def page(request: httpx.Request) -> httpx.Response:
+            if "cursor" in request.url.params:
+                return httpx.Response(200, json=_page([{"id": "c"}]))
+            if request.url.params["page[offset]"] == "0":
+                first = _page([{"id": "a"}, {"id": "b"}], next_path="/records?cursor=xyz")
+                return httpx.Response(200, json=first)
+            return httpx.Response(200, json=_page([{"id": "offset page"}]))
+
+        _ = respx.get(f"{_BASE_URL}/records").mock(side_effect=page)
+
+        result = await paginate_all(
+            fetch_page=_fetch_page,
+            first_path="/records",
+            schema=_Record,
+            max_records=None,
+            first_page_params={"page[limit]": 2, "page[offset]": 0},
+            prefetch_params=_offset_params,
+        )
+
+        assert [record.id for record in result.items] == ["a", "b", "c"]
+        assert (result.prefetch_hits, result.prefetch_wasted) == (0, 1)
+        assert [attributes["outcome"] for attributes in prefetches.added] == ["wasted"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_a_failed_prefetch_is_retried_as_the_link(self) -> None:
+        route = _linked_pages(3, failing_once=4)
+
+        result = await paginate_all(
+            fetch_page=_fetch_page,
+            first_path="/records",
+            schema=_Record,
+            max_records=None,
+            first_page_params={"page[limit]": 2, "page[offset]": 0},
+            prefetch_params=_offset_params,
+        )
+
+        assert [record.id for record in result.items] == [str(n) for n in range(6)]
+        # The failed prefetch of page three, and the one past the last page.
+        assert (result.prefetch_hits, result.prefetch_wasted) == (0, 2)
+        assert sorted(_requested_offsets(route), key=int)[:4] == ["0", "2", "4", "4"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_prefetches_nothing_past_max_records(self) -> None:
+        route = _linked_pages(10)
+
+        result = await paginate_all(
+            fetch_page=_fetch_page,
+            first_path="/records",
+            schema=_Record,
+            max_records=4,
+            first_page_params={"page[limit]": 2, "page[offset]": 0},
+            prefetch_params=_offset_params,
+        )
+
+        assert len(result.items) == 4
+        assert result.truncated is True
+        assert sorted(_requested_offsets(route)) == ["0", "2"]
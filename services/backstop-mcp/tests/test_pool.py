@@ -0,0 +1,94 @@
+"""The instrumented transport under the shared pool, against a real local socket.
+
+respx replaces the connection pool outright, so it can say nothing about connection reuse; a
+one-route HTTP/1.1 server on a loopback port is the smallest thing that does.
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator, Callable
+from typing import cast
+
+import pytest
+
+from tests.helpers import client_factory, credential
+
+_RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 2\r\n\r\n{}"
+
+
+class _StubCounter:
+    def __init__(self, on_add: Callable[[int, dict[str, object] | None], None]) -> None:
+        self._on_add: Callable[[int, dict[str, object] | None], None] = on_add
+
+    def add(self, amount: int, attributes: dict[str, object] | None = None) -> None:
+        self._on_add(amount, attributes)
+
+
+@pytest.fixture
+async def base_url() -> AsyncGenerator[str]:
+    """A keep-alive server answering every request with `{}`, until the client hangs up."""
+
+    async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while await reader.readuntil(b"\r\n\r\n"):
+            writer.write(_RESPONSE)
+            await writer.drain()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            await serve(reader, writer)
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = cast(tuple[str, int], server.sockets[0].getsockname())[1]
+    async with server:
+        yield f"http://127.0.0.1:{port}"
+
+
+def _recorded(monkeypatch: pytest.MonkeyPatch) -> list[dict[str, object]]:
+    recorded: list[dict[str, object]] = []
+
+    def _add(_amount: int, attributes: dict[str, object] | None = None) -> None:
+        recorded.append(dict(attributes or {}))
+
+    # Patched on `pool`, where the counter is bound at import.
+    monkeypatch.setattr(
+        "backstop_mcp.backstop_client.pool.BACKSTOP_POOL_REQUESTS", _StubCounter(_add)
+    )
+    return recorded
+
+
+class TestConnectionReuse:
+    @pytest.mark.asyncio
+    async def test_the_second_request_reuses_the_first_ones_connection(
+        self, base_url: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        recorded = _recorded(monkeypatch)
+        built = client_factory(base_url)
+        client = built.for_credential(credential())
+        try:
+            await client.raw_request("GET", "/system-info")
+            await client.raw_request("GET", "/system-info")
+        finally:
+            await built.aclose()
+
+        assert recorded == [
+            {"connection": "opened", "http_version": "http11"},
+            {"connection": "reused", "http_version": "http11"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_without_keepalive_slots_every_request_opens_its_own(
+        self, base_url: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        recorded = _recorded(monkeypatch)
+        built = client_factory(base_url, max_keepalive_connections=0)
+        client = built.for_credential(credential())
+        try:
+            await client.raw_request("GET", "/system-info")
+            await client.raw_request("GET", "/system-info")
+        finally:
+            await built.aclose()
+
+        assert [attributes["connection"] for attributes in recorded] == ["opened", "opened"]
@@ -0,0 +1,184 @@
+"""`JsonItemSplitter` and `read_document`, fed bodies in every chunking a socket could produce.
+
+The splitter's whole job is to be indifferent to where chunk boundaries fall, so most cases here
+re-split one body at every offset — inside keys, strings, escapes, numbers and multi-byte
+characters — and require the same elements and envelope each time.
+"""
+
+import json
+from collections.abc import AsyncIterator
+
+import pytest
+from pydantic import BaseModel
+
+from backstop_mcp.backstop_client import (
+    BackstopResponseSchemaError,
+    ItemPath,
+    JsonItemSplitter,
+    parse_page,
+    parse_page_stream,
+    read_document,
+)
+
+
+class _Record(BaseModel):
+    id: str
+
+
+class _Envelope(BaseModel):
+    data: list[_Record]
+    meta: dict[str, object]
+
+
+def _split(body: bytes, items_at: ItemPath, *cuts: int) -> tuple[list[object], object]:
+    splitter = JsonItemSplitter(items_at)
+    elements: list[object] = []
+    start = 0
+    for cut in (*cuts, len(body)):
+        elements.extend(splitter.feed(body[start:cut]))
+        start = cut
+    return elements, json.loads(splitter.envelope())
+
+
+async def _chunks(body: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+_TRICKY_ITEMS: list[object] = [
+    {"id": "1", "text": 'brackets ] } [ { and "quotes" and \\ backslashes'},
+    {"id": "2", "nested": [[1, 2], {"a": []}], "unicode": "café ✓ 𝄞"},
+    12345,
+    -1.5e3,
+    "a bare string, with a comma",
+    True,
+    None,
+    [],
+]
+
+
+class TestSplitter:
+    @pytest.mark.parametrize("cut", range(0, 260, 1))
+    def test_any_single_cut_yields_the_same_elements_and_envelope(self, cut: int) -> None:
+        document = {"links": {"next": "/x?a=[1]"}, "data": _TRICKY_ITEMS, "meta": {"n": 8}}
+        body = json.dumps(document, ensure_ascii=False).encode()
+
+        elements, envelope = _split(body, ("data",), min(cut, len(body)))
+
+        assert elements == _TRICKY_ITEMS
+        assert envelope == {"links": {"next": "/x?a=[1]"}, "data": [], "meta": {"n": 8}}
+
+    def test_byte_at_a_time(self) -> None:
+        document = {"data": _TRICKY_ITEMS, "included": [{"type": "t", "id": "9"}]}
+        body = json.dumps(document, ensure_ascii=False).encode()
+
+        elements, envelope = _split(body, ("data",), *range(1, len(body)))
+
+        assert elements == _TRICKY_ITEMS
+        assert envelope == {"data": [], "included": [{"type": "t", "id": "9"}]}
+
+    def test_finds_a_nested_array_by_key_and_index(self) -> None:
+        """The holdings table's rows, which sit under the first `data` element."""
+        rows = [{"account": {"id": str(n)}} for n in range(3)]
+        document = {
+            "data": [{"id": None, "attributes": {"accounts": rows, "allCount": 3}}],
+            "included": [],
+        }
+        body = json.dumps(document).encode()
+
+        elements, envelope = _split(body, ("data", 0, "attributes", "accounts"), 40, 41)
+
+        assert elements == rows
+        assert envelope == {
+            "data": [{"id": None, "attributes": {"accounts": [], "allCount": 3}}],
+            "included": [],
+        }
+
+    def test_a_same_named_key_elsewhere_is_not_the_array(self) -> None:
+        document = {"meta": {"data": [1, 2]}, "data": [3]}
+
+        elements, envelope = _split(json.dumps(document).encode(), ("data",))
+
+        assert elements == [3]
+        assert envelope == {"meta": {"data": [1, 2]}, "data": []}
+
+    def test_a_missing_array_leaves_the_document_whole(self) -> None:
+        document = {"errors": [{"status": "500"}]}
+
+        elements, envelope = _split(json.dumps(document).encode(), ("data",))
+
+        assert elements == []
+        assert envelope == document
+
+    def test_holds_about_one_element_rather_than_the_body(self) -> None:
+        document = {"data": [{"id": str(n), "pad": "x" * 100} for n in range(1000)]}
+        body = json.dumps(document).encode()
+        splitter = JsonItemSplitter(("data",))
+
+        for start in range(0, len(body), 512):
+            _ = splitter.feed(body[start : start + 512])
+
+        assert splitter.peak_chars < 1024 < len(body) // 100
+
+
+class TestReadDocument:
+    @pytest.mark.asyncio
+    async def test_validates_and_projects_each_item(self) -> None:
+        body = json.dumps({"data": [{"id": "a"}, {"id": "b"}], "meta": {"k": 1}}).encode()
+
+        document = await read_document(
+            _chunks(body, 7),
+            envelope=_Envelope,
+            items_at=("data",),
+            item_schema=_Record,
+            project=lambda record: record.id.upper(),
+            path="/records",
+        )
+
+        assert document.items == ["A", "B"]
+        assert document.envelope == _Envelope(data=[], meta={"k": 1})
+
+    @pytest.mark.asyncio
+    async def test_an_invalid_item_is_a_schema_error(self) -> None:
+        body = json.dumps({"data": [{"id": "a"}, {"name": "no id"}], "meta": {}}).encode()
+
+        with pytest.raises(BackstopResponseSchemaError):
+            _ = await read_document(
+                _chunks(body, 5),
+                envelope=_Envelope,
+                items_at=("data",),
+                item_schema=_Record,
+                project=lambda record: record,
+                path="/records",
+            )
+
+    @pytest.mark.asyncio
+    async def test_a_body_cut_off_mid_array_is_a_schema_error_not_a_short_answer(self) -> None:
+        body = json.dumps({"data": [{"id": "a"}, {"id": "b"}], "meta": {}}).encode()
+
+        with pytest.raises(BackstopResponseSchemaError):
+            _ = await read_document(
+                _chunks(body[:20], 4),
+                envelope=_Envelope,
+                items_at=("data",),
+                item_schema=_Record,
+                project=lambda record: record,
+                path="/records",
+            )
+
+
+class TestParsePageStream:
+    @pytest.mark.asyncio
+    async def test_matches_parse_page(self) -> None:
+        body = json.dumps(
+            {
+                "data": [{"id": "1"}, {"id": "2"}],
+                "included": [{"type": "lov", "id": "7"}],
+                "links": {"next": "/records?page[offset]=2"},
+                "meta": {"totalResourceCount": 4},
+            }
+        ).encode()
+
+        streamed, _ = await parse_page_stream(_chunks(body, 3), _Record, path="/records")
+
+        assert streamed == parse_page(body, _Record, path="/records")
@@ -9,11 +9,13 @@ order-dependent flake somewhere else — the same gap rule 7 in `test_layering.p
 tools.
 """
 
+import asyncio
 import importlib
 import pathlib
 from typing import Protocol, cast, runtime_checkable
 
 from backstop_mcp import dependencies
+from backstop_mcp.features.activity_tags import get_activity_tags_service
 from backstop_mcp.teardown import PROVIDERS, close_singletons
 
 _SRC = pathlib.Path(__file__).parent.parent / "src" / "backstop_mcp"
@@ -92,3 +94,15 @@ async def test_close_singletons_is_safe_when_nothing_was_built() -> None:
 
     assert dependencies.get_engine.cache_info().currsize == 0
     assert dependencies.get_backstop_client_factory.cache_info().currsize == 0
+
+
+async def test_close_singletons_cancels_a_background_catalog_refresh() -> None:
+    """A revalidation walks over the client pool, so it has to stop before the pool closes."""
+    service = get_activity_tags_service()
+    refresh = asyncio.create_task(asyncio.sleep(60))
+    service._revalidation = refresh  # pyright: ignore[reportPrivateUsage]
+
+    await close_singletons()
+
+    assert refresh.cancelled()
+    assert get_activity_tags_service.cache_info().currsize == 0